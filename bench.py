@@ -7,6 +7,7 @@ Run chardet on a bunch of documents and see that we get the correct encodings.
 
 
 import argparse
+import subprocess
 import sys
 import time
 from collections import defaultdict
@@ -126,6 +127,59 @@ def benchmark(chardet_mod=chardet, verbose=False, num_iters=10):
     print(f"\nTotal time: {total_time}s ({calls_per_sec} calls per second)")
 
 
+def detect_fresh(byte_str):
+    """The way detect worked before it drew detectors from a pool"""
+    detector = chardet.UniversalDetector()
+    detector.feed(byte_str)
+    return detector.close()
+
+
+def benchmark_per_call(num_iters=10000):
+    """Times detect on tiny inputs, where per-call overhead dominates"""
+    print(
+        f"Per-call overhead of chardet {chardet.__version__} "
+        f"on {get_py_impl()} {sys.version}"
+    )
+    print("-" * 80)
+    inputs = {
+        "ascii": b"Hello, world!",
+        "latin-1": "Grüße aus Köln, Zürich und Genève".encode("latin-1"),
+    }
+    for name, input_bytes in inputs.items():
+        for label, detect_func in [
+            ("fresh UniversalDetector", detect_fresh),
+            ("DetectorPool", chardet.detect),
+        ]:
+            detect_func(input_bytes)
+            start = time.perf_counter()
+            for _ in range(num_iters):
+                detect_func(input_bytes)
+            per_call = (time.perf_counter() - start) / num_iters
+            print(f"{name} with {label}: {per_call * 1e6:.1f}us per call")
+
+
+def benchmark_import(num_iters=20):
+    """Times ``import chardet`` in fresh interpreters with ``-X importtime``"""
+    print(f"Import time of chardet {chardet.__version__} on {get_py_impl()} {sys.version}")
+    print("-" * 80)
+    totals = []
+    for _ in range(num_iters):
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import chardet"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=dirname(realpath(__file__)),
+        ).stderr
+        for line in stderr.splitlines():
+            _, cumulative, name = line.split("|")
+            if name.strip() == "chardet":
+                totals.append(int(cumulative))
+    totals.sort()
+    print(f"Fastest: {totals[0] / 1000:.1f}ms")
+    print(f"Median: {totals[len(totals) // 2] / 1000:.1f}ms")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Times how long it takes to process each file in test set "
@@ -151,8 +205,28 @@ def main():
         help="Prints out the timing for each individual file.",
         action="store_true",
     )
+    parser.add_argument(
+        "-p",
+        "--per-call",
+        help="Time the per-call overhead of detect on tiny inputs instead, "
+        "with and without reusing detectors.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--import-time",
+        help="Time how long importing chardet takes instead.",
+        action="store_true",
+    )
     args = parser.parse_args()
 
+    if args.import_time:
+        benchmark_import(num_iters=args.iterations * 2)
+        return
+
+    if args.per_call:
+        benchmark_per_call(num_iters=args.iterations * 1000)
+        return
+
     if args.cchardet and not HAVE_CCHARDET:
         print("You must pip install cchardet if you want to benchmark it.")
         sys.exit(1)
@@ -15,32 +15,250 @@
 # 02110-1301  USA
 ######################### END LICENSE BLOCK #########################
 
+import mmap
+
+from .batch import detect_many
+from .detectorpool import DetectorPool
 from .enums import InputState
+from .resultcache import ResultCache
+from .sampling import sample
 from .universaldetector import UniversalDetector
 from .version import VERSION, __version__
 
-__all__ = ["UniversalDetector", "detect", "detect_all", "__version__", "VERSION"]
+__all__ = [
+    "DetectorPool",
+    "UniversalDetector",
+    "cache_info",
+    "detect",
+    "detect_all",
+    "detect_file",
+    "detect_many",
+    "detect_stream",
+    "disable_cache",
+    "enable_cache",
+    "__version__",
+    "VERSION",
+]
+
+# How much detect_file and detect_stream hand to the detector at a time
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# The detectors behind detect, detect_all, detect_file and detect_stream
+_DETECTOR_POOL = DetectorPool()
+
+# The ResultCache used by detect and detect_all, if enable_cache was called
+_RESULT_CACHE = None
+
+
+def enable_cache(
+    max_entries=ResultCache.DEFAULT_MAX_ENTRIES, max_size=ResultCache.DEFAULT_MAX_SIZE
+):
+    """
+    Cache the results of ``detect`` and ``detect_all``, keyed on a hash of
+    the bytes they examine, so that repeated documents are only analyzed
+    once.  Replaces any cache that was already enabled.
+
+    :param max_entries:  The most results to keep.
+    :type max_entries:   ``int``
+    :param max_size:     Roughly how many bytes of memory the cached results
+                         may take up.
+    :type max_size:      ``int``
+    """
+    global _RESULT_CACHE
+    _RESULT_CACHE = ResultCache(max_entries, max_size)
+
+
+def disable_cache():
+    """
+    Stop caching results and drop the ones already cached.
+    """
+    global _RESULT_CACHE
+    _RESULT_CACHE = None
 
 
-def detect(byte_str):
+def cache_info():
+    """
+    Returns the hits, misses, evictions, entries, size, max_entries and
+    max_size of the result cache as a ``CacheInfo`` named tuple, or ``None``
+    if caching is not enabled.
+    """
+    cache = _RESULT_CACHE
+    return None if cache is None else cache.info()
+
+
+def detect(byte_str, max_bytes=None, strategy="head"):
     """
     Detect the encoding of the given byte string.
 
     :param byte_str:     The byte sequence to examine.
     :type byte_str:      ``bytes`` or ``bytearray``
+    :param max_bytes:    Only examine a sample of at most this many bytes,
+                         and report how many were used in the
+                         ``bytes_examined`` key of the result.
+    :type max_bytes:     ``int`` or ``None``
+    :param strategy:     How to take the sample: ``"head"`` for the start of
+                         ``byte_str``, ``"spread"`` for evenly spaced windows
+                         from its head, middle and tail.
+    :type strategy:      ``str``
+    """
+    byte_str = _check_input(byte_str, max_bytes)
+    windows = _examined_windows(byte_str, max_bytes, strategy)
+    cache = _RESULT_CACHE
+    if cache is not None:
+        key = cache.make_key("detect", windows, max_bytes is not None)
+        result = cache.get(key)
+        if result is not None:
+            return result
+    with _DETECTOR_POOL.detector() as detector:
+        result = _run_detect(detector, windows, max_bytes)
+    if cache is not None:
+        cache.put(key, result)
+    return result
+
+
+def _check_input(byte_str, max_bytes):
+    """
+    Raise ``TypeError`` unless ``byte_str`` is ``bytes`` or ``bytearray``, and
+    return it as a ``bytearray`` unless only a sample of it will be used.
     """
     if not isinstance(byte_str, bytearray):
         if not isinstance(byte_str, bytes):
             raise TypeError(
                 f"Expected object of type bytes or bytearray, got: {type(byte_str)}"
             )
-        byte_str = bytearray(byte_str)
-    detector = UniversalDetector()
-    detector.feed(byte_str)
-    return detector.close()
+        if max_bytes is None:
+            byte_str = bytearray(byte_str)
+    return byte_str
+
 
+def _examined_windows(byte_str, max_bytes, strategy):
+    """
+    Returns the windows of ``byte_str`` that ``detect`` looks at: all of it,
+    or the sample picked by ``strategy``.
+    """
+    if max_bytes is None:
+        return [byte_str]
+    return sample(byte_str, max_bytes, strategy)
+
+
+def _run_detect(detector, windows, max_bytes=None):
+    """
+    The body of ``detect``, run on a freshly reset ``detector``.
+    """
+    _feed_windows(detector, windows)
+    return _close(detector, max_bytes)
+
+
+def detect_file(path, chunk_size=DEFAULT_CHUNK_SIZE, max_bytes=None, strategy="head"):
+    """
+    Detect the encoding of the file at ``path`` without reading all of it
+    into memory.  Regular files are memory-mapped and fed to the detector
+    ``chunk_size`` bytes at a time until it reaches a verdict, and anything
+    that cannot be mapped is read as a stream.
 
-def detect_all(byte_str, ignore_threshold=False):
+    :param path:         The path of the file to examine.
+    :type path:          ``str`` or ``os.PathLike``
+    :param chunk_size:   How many bytes to feed the detector at a time.
+    :type chunk_size:    ``int``
+    :param max_bytes:    Only examine a sample of at most this many bytes,
+                         as in ``detect``.
+    :type max_bytes:     ``int`` or ``None``
+    :param strategy:     How to take the sample, as in ``detect``.  Files
+                         that cannot be mapped are always sampled from the
+                         head.
+    :type strategy:      ``str``
+    """
+    with open(path, "rb") as fp:
+        try:
+            mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files, pipes and character devices cannot be mapped
+            return detect_stream(fp, chunk_size=chunk_size, max_bytes=max_bytes)
+        with mapped:
+            if max_bytes is None:
+                windows = [memoryview(mapped)]
+            else:
+                windows = sample(mapped, max_bytes, strategy)
+            try:
+                with _DETECTOR_POOL.detector() as detector:
+                    _feed_chunks(detector, windows, chunk_size)
+                    return _close(detector, max_bytes)
+            finally:
+                # The map cannot be closed while views of it are alive
+                for window in windows:
+                    window.release()
+
+
+def detect_stream(fp, chunk_size=DEFAULT_CHUNK_SIZE, max_bytes=None):
+    """
+    Detect the encoding of the binary file object ``fp``, reading it
+    ``chunk_size`` bytes at a time and stopping as soon as the detector has
+    reached a verdict.
+
+    :param fp:           The binary file object to read from.
+    :type fp:            file object
+    :param chunk_size:   How many bytes to read and feed at a time.
+    :type chunk_size:    ``int``
+    :param max_bytes:    Stop after reading this many bytes, and report how
+                         many were used in the ``bytes_examined`` key of the
+                         result.
+    :type max_bytes:     ``int`` or ``None``
+    """
+    remaining = max_bytes
+    with _DETECTOR_POOL.detector() as detector:
+        while not detector.done:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            if size <= 0:
+                break
+            chunk = fp.read(size)
+            if not chunk:
+                break
+            if not isinstance(chunk, (bytes, bytearray)):
+                raise TypeError(
+                    f"Expected a binary file object, but read: {type(chunk)}"
+                )
+            detector.feed(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+        return _close(detector, max_bytes)
+
+
+def _close(detector, max_bytes):
+    """
+    Close ``detector`` and return its result, along with ``bytes_examined``
+    when only a sample was requested.
+    """
+    result = detector.close()
+    if max_bytes is None:
+        return result
+    return dict(result, bytes_examined=detector.bytes_examined)
+
+
+def _feed_chunks(detector, windows, chunk_size):
+    """
+    Feed ``detector`` each of the ``memoryview`` windows ``chunk_size`` bytes
+    at a time, stopping as soon as it is done.
+    """
+    for window in windows:
+        for start in range(0, len(window), chunk_size):
+            with window[start : start + chunk_size] as chunk:
+                detector.feed(chunk)
+            if detector.done:
+                return
+
+
+def _feed_windows(detector, windows):
+    """
+    Feed ``detector`` each of ``windows`` in turn, stopping as soon as it is
+    done.
+    """
+    for window in windows:
+        detector.feed(window)
+        if detector.done:
+            break
+
+
+def detect_all(byte_str, ignore_threshold=False, max_bytes=None, strategy="head"):
     """
     Detect all the possible encodings of the given byte string.
 
@@ -50,20 +268,39 @@ def detect_all(byte_str, ignore_threshold=False):
                               ``UniversalDetector.MINIMUM_THRESHOLD``
                               in results.
     :type ignore_threshold:   ``bool``
+    :param max_bytes:         Only examine a sample of at most this many
+                              bytes, as in ``detect``.
+    :type max_bytes:          ``int`` or ``None``
+    :param strategy:          How to take the sample, as in ``detect``.
+    :type strategy:           ``str``
     """
-    if not isinstance(byte_str, bytearray):
-        if not isinstance(byte_str, bytes):
-            raise TypeError(
-                f"Expected object of type bytes or bytearray, got: {type(byte_str)}"
-            )
-        byte_str = bytearray(byte_str)
+    byte_str = _check_input(byte_str, max_bytes)
+    windows = _examined_windows(byte_str, max_bytes, strategy)
+    cache = _RESULT_CACHE
+    if cache is not None:
+        key = cache.make_key(
+            "detect_all", windows, max_bytes is not None, bool(ignore_threshold)
+        )
+        results = cache.get(key)
+        if results is not None:
+            return results
+    with _DETECTOR_POOL.detector() as detector:
+        results = _run_detect_all(detector, windows, ignore_threshold, max_bytes)
+    if cache is not None:
+        cache.put(key, results)
+    return results
 
-    detector = UniversalDetector()
-    detector.feed(byte_str)
+
+def _run_detect_all(detector, windows, ignore_threshold=False, max_bytes=None):
+    """
+    The body of ``detect_all``, run on a freshly reset ``detector``.
+    """
+    _feed_windows(detector, windows)
     detector.close()
 
+    results = [detector.result]
     if detector.input_state == InputState.HIGH_BYTE:
-        results = []
+        prober_results = []
         probers = []
         for prober in detector.charset_probers:
             if hasattr(prober, "probers"):
@@ -80,14 +317,18 @@ def detect_all(byte_str, ignore_threshold=False):
                     charset_name = detector.ISO_WIN_MAP.get(
                         lower_charset_name, charset_name
                     )
-                results.append(
+                prober_results.append(
                     {
                         "encoding": charset_name,
                         "confidence": prober.get_confidence(),
                         "language": prober.language,
                     }
                 )
-        if len(results) > 0:
-            return sorted(results, key=lambda result: -result["confidence"])
+        if len(prober_results) > 0:
+            results = sorted(prober_results, key=lambda result: -result["confidence"])
 
-    return [detector.result]
+    if max_bytes is not None:
+        results = [
+            dict(result, bytes_examined=detector.bytes_examined) for result in results
+        ]
+    return results
@@ -0,0 +1,112 @@
+"""
+Encoding detection for asyncio code, reading from an ``asyncio.StreamReader``
+or any async iterator of ``bytes`` without blocking the event loop for long.
+"""
+import asyncio
+import time
+
+from . import _DETECTOR_POOL, DEFAULT_CHUNK_SIZE, _close
+
+# How long, in seconds, detection may hold up the event loop at a stretch.
+# Chunks expected to take longer are fed to the detector on an executor
+# thread instead.
+DEFAULT_TIME_BUDGET = 0.01
+# How long feeding a byte is expected to take before any feed has been
+# timed: the pure Python probers get through a few hundred KB of non-ASCII
+# text per second
+INITIAL_SECONDS_PER_BYTE = 1 / (400 * 1024)
+
+
+async def detect_stream(
+    reader,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    max_bytes=None,
+    time_budget=DEFAULT_TIME_BUDGET,
+    executor=None,
+):
+    """
+    Detect the encoding of what ``reader`` produces, stopping as soon as the
+    detector has reached a verdict.  This is the ``asyncio`` counterpart of
+    ``chardet.detect_stream``.
+
+    :param reader:        Where to read from.  Anything with an async
+                          ``read(n)`` method, such as an
+                          ``asyncio.StreamReader``, is read ``chunk_size``
+                          bytes at a time, and never past ``max_bytes``.
+                          Otherwise it must be an async iterable of byte
+                          strings.
+    :type reader:         ``asyncio.StreamReader`` or async iterable
+    :param chunk_size:    How many bytes to read and feed at a time.
+    :type chunk_size:     ``int``
+    :param max_bytes:     Stop after this many bytes, and report how many
+                          were used in the ``bytes_examined`` key of the
+                          result.
+    :type max_bytes:      ``int`` or ``None``
+    :param time_budget:   Chunks expected to take longer than this many
+                          seconds to feed are fed to the detector in
+                          ``executor`` so the event loop can carry on
+                          meanwhile.  The estimate comes from timing the
+                          earlier feeds of the same stream.  ``None`` never
+                          offloads.
+    :type time_budget:    ``float`` or ``None``
+    :param executor:      The executor to offload to, or ``None`` for the
+                          event loop's default one.
+    :type executor:       ``concurrent.futures.Executor``
+    """
+    loop = asyncio.get_running_loop()
+    with _DETECTOR_POOL.detector() as detector:
+        remaining = max_bytes
+        # The slowest rate seen so far, since the probers only get slower as
+        # a document moves from ASCII to high bytes
+        seconds_per_byte = None
+        async for chunk in _chunks(reader, chunk_size, max_bytes):
+            if not isinstance(chunk, (bytes, bytearray)):
+                raise TypeError(f"Expected a binary stream, but read: {type(chunk)}")
+            if remaining is not None:
+                chunk = chunk[:remaining]
+                remaining -= len(chunk)
+            expected = len(chunk) * (seconds_per_byte or INITIAL_SECONDS_PER_BYTE)
+            if time_budget is not None and expected > time_budget:
+                elapsed = await loop.run_in_executor(
+                    executor, _timed_feed, detector, chunk
+                )
+            else:
+                elapsed = _timed_feed(detector, chunk)
+                # Let other tasks run between chunks that arrive back to back
+                await asyncio.sleep(0)
+            if chunk:
+                seconds_per_byte = max(seconds_per_byte or 0, elapsed / len(chunk))
+            if detector.done or remaining == 0:
+                break
+        return _close(detector, max_bytes)
+
+
+def _timed_feed(detector, chunk):
+    """
+    Feed ``chunk`` to ``detector`` and return how many seconds that took.
+    """
+    start = time.perf_counter()
+    detector.feed(chunk)
+    return time.perf_counter() - start
+
+
+async def _chunks(reader, chunk_size, max_bytes=None):
+    """
+    Yields what ``reader`` produces, ``chunk_size`` bytes at a time and no
+    more than ``max_bytes`` in all if it has a ``read`` method, and in
+    whatever pieces it comes in otherwise.
+    """
+    if hasattr(reader, "read"):
+        remaining = max_bytes
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            chunk = await reader.read(size)
+            if not chunk:
+                return
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+    else:
+        async for chunk in reader:
+            if chunk:
+                yield chunk
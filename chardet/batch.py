@@ -0,0 +1,119 @@
+"""
+Detecting the encodings of many documents on a pool of worker processes.
+
+Each worker builds one ``UniversalDetector`` with all of its probers when it
+starts and resets it between documents, so the cost of constructing probers
+is paid once per worker instead of once per document.
+"""
+import os
+import threading
+
+from .universaldetector import UniversalDetector
+
+# How many chunks per worker may be read from the input but not yet handed
+# back to the consumer, which bounds how far ahead the input iterable is read
+CHUNKS_IN_FLIGHT = 4
+
+_worker_detector = None
+_worker_options = None
+
+
+def _init_worker(options):
+    global _worker_detector, _worker_options
+    _worker_detector = UniversalDetector()
+    _worker_detector.preload()
+    _worker_options = options
+
+
+def _detect_one(byte_str, detector, options):
+    # Imported here because the package imports this module
+    from . import _check_input, _examined_windows, _run_detect, _run_detect_all
+
+    all_encodings, ignore_threshold, max_bytes, strategy = options
+    byte_str = _check_input(byte_str, max_bytes)
+    windows = _examined_windows(byte_str, max_bytes, strategy)
+    detector.reset()
+    if all_encodings:
+        return _run_detect_all(detector, windows, ignore_threshold, max_bytes)
+    return _run_detect(detector, windows, max_bytes)
+
+
+def _detect_in_worker(item):
+    index, byte_str = item
+    return index, _detect_one(byte_str, _worker_detector, _worker_options)
+
+
+def detect_many(
+    documents,
+    workers=None,
+    chunksize=64,
+    ordered=True,
+    all_encodings=False,
+    ignore_threshold=False,
+    max_bytes=None,
+    strategy="head",
+):
+    """
+    Detect the encodings of many byte strings in parallel.
+
+    :param documents:         The byte strings to examine.
+    :type documents:          iterable of ``bytes`` or ``bytearray``
+    :param workers:           How many worker processes to use.  Defaults to
+                              the number of CPUs; with ``1`` everything runs
+                              in the calling process.
+    :type workers:            ``int`` or ``None``
+    :param chunksize:         How many documents to send to a worker at once.
+    :type chunksize:          ``int``
+    :param ordered:           Yield results in the order of ``documents``.
+                              Otherwise yield ``(index, result)`` pairs as
+                              soon as each document is done.
+    :type ordered:            ``bool``
+    :param all_encodings:     Produce ``detect_all`` style lists of results
+                              instead of ``detect`` style dicts.
+    :type all_encodings:      ``bool``
+    :param ignore_threshold:  As in ``detect_all``.
+    :type ignore_threshold:   ``bool``
+    :param max_bytes:         As in ``detect``.
+    :type max_bytes:          ``int`` or ``None``
+    :param strategy:          As in ``detect``.
+    :type strategy:           ``str``
+    """
+    options = (all_encodings, ignore_threshold, max_bytes, strategy)
+    workers = workers or os.cpu_count() or 1
+    items = enumerate(documents)
+    if workers == 1:
+        detector = UniversalDetector()
+        detector.preload()
+        for index, byte_str in items:
+            result = _detect_one(byte_str, detector, options)
+            yield result if ordered else (index, result)
+        return
+
+    # Only imported when needed, since it takes longer to import than the
+    # rest of chardet
+    import multiprocessing
+
+    # The pool reads the documents lazily on its task handler thread, which
+    # waits for a slot before taking each one and gets a slot back for every
+    # result the consumer takes, so workers never wait for a batch to drain
+    in_flight = threading.Semaphore(workers * chunksize * CHUNKS_IN_FLIGHT)
+    stopped = threading.Event()
+
+    def tasks():
+        for item in items:
+            in_flight.acquire()
+            if stopped.is_set():
+                return
+            yield item
+
+    with multiprocessing.Pool(workers, _init_worker, (options,)) as pool:
+        imap = pool.imap if ordered else pool.imap_unordered
+        try:
+            for index, result in imap(_detect_in_worker, tasks(), chunksize):
+                in_flight.release()
+                yield result if ordered else (index, result)
+        finally:
+            # Let the task handler finish if the consumer stopped early, as
+            # the pool joins it on the way out
+            stopped.set()
+            in_flight.release()
@@ -0,0 +1,302 @@
+"""
+A single versioned binary file holding the single-byte language models, the
+multi-byte frequency tables and byte pair indexes, and the compiled state
+machine tables, so that they can be mapped into memory with ``mmap`` instead
+of being built from Python source in every process.
+
+The file is laid out as::
+
+    magic | format version | index length | index CRC-32 | index | tables
+
+where the index is JSON giving the offset, size, item type and CRC-32 of
+every table, along with the scalar values and model descriptions that go
+with them.  Tables are aligned to 8 bytes.  Every table is checked against
+its CRC-32 when the bundle is opened, so a damaged bundle is rejected as a
+whole rather than failing part way through a detection, and every process
+using the bundle shares the same read-only pages.
+
+The Python modules stay the source of the data; rebuild the bundle after
+changing any of them with::
+
+    python -m chardet.bundle
+
+The bundle is tied to the chardet version, so it must be rebuilt for every
+release as well; the test suite fails if it is out of date.
+"""
+import importlib
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+from .version import __version__
+
+MAGIC = b"CHARDETB"
+FORMAT_VERSION = 1
+BUNDLE_PATH = os.path.join(os.path.dirname(__file__), "models.bin")
+_HEADER = struct.Struct("<8sIII")
+_ALIGNMENT = 8
+
+# Frequency table modules and the prefix of the names defined in them
+FREQUENCY_TABLES = {
+    "big5freq": "BIG5",
+    "euckrfreq": "EUCKR",
+    "euctwfreq": "EUCTW",
+    "gb2312freq": "GB2312",
+    "jisfreq": "JIS",
+}
+LANGUAGE_MODELS = (
+    "langbulgarianmodel",
+    "langgreekmodel",
+    "langhebrewmodel",
+    "langhungarianmodel",
+    "langrussianmodel",
+    "langthaimodel",
+    "langturkishmodel",
+)
+STATE_MACHINES = ("mbcssm", "escsm")
+
+
+def _module(name):
+    return importlib.import_module(f".{name}", __package__)
+
+
+def collect_tables():
+    """
+    Gather everything that goes into the bundle from the Python modules.
+
+    Returns ``(tables, values, models)``: ``tables`` maps names to ``array``
+    objects, ``values`` maps names to numbers, and ``models`` maps the names
+    of single-byte models to their fields, with the names of their tables in
+    place of the tables themselves.  State machine tables are named after
+    the model, as in ``'SJIS_SM_MODEL.transitions'``, and byte pair indexes
+    after the analyser, as in ``'SJISDistributionAnalysis.pair_freq_orders'``.
+    """
+    from .chardistribution import CharDistributionAnalysis, build_pair_index
+    from .codingstatemachine import compile_state_machine
+    from .sbcharsetprober import SingleByteCharSetModel
+
+    tables = {}
+    values = {}
+    models = {}
+    for module_name, prefix in FREQUENCY_TABLES.items():
+        module = _module(module_name)
+        tables[f"{prefix}_CHAR_TO_FREQ_ORDER"] = array(
+            "H", getattr(module, f"{prefix}_CHAR_TO_FREQ_ORDER")
+        )
+        for suffix in ("TABLE_SIZE", "TYPICAL_DISTRIBUTION_RATIO"):
+            values[f"{prefix}_{suffix}"] = getattr(module, f"{prefix}_{suffix}")
+    # Each distribution analyser gets its byte pair index, built from the
+    # frequency table in the Python module
+    for cls in CharDistributionAnalysis.__subclasses__():
+        module_name, prefix = cls.FREQUENCY_TABLE
+        module = _module(module_name)
+        tables[f"{cls.__name__}.pair_freq_orders"] = build_pair_index(
+            cls.get_order,
+            getattr(module, f"{prefix}_CHAR_TO_FREQ_ORDER"),
+            getattr(module, f"{prefix}_TABLE_SIZE"),
+        )
+    for module_name in LANGUAGE_MODELS:
+        namespace = vars(_module(module_name))
+        names = {
+            id(value): name
+            for name, value in namespace.items()
+            if isinstance(value, bytes)
+        }
+        for name, value in namespace.items():
+            if not isinstance(value, SingleByteCharSetModel):
+                continue
+            model = value._asdict()
+            for field in ("char_to_order_map", "language_model"):
+                table_name = names[id(model[field])]
+                tables[table_name] = array("B", model[field])
+                model[field] = table_name
+            models[name] = model
+    for module_name in STATE_MACHINES:
+        for name, value in vars(_module(module_name)).items():
+            if name.endswith("_SM_MODEL"):
+                # Compiled afresh, since the model may have been given the
+                # tables of an existing bundle
+                sm = compile_state_machine(
+                    {
+                        field: value[field]
+                        for field in (
+                            "class_table",
+                            "class_factor",
+                            "state_table",
+                            "char_len_table",
+                        )
+                    }
+                )
+                for field in ("transitions", "byte_char_len"):
+                    tables[f"{name}.{field}"] = array("B", sm[field])
+    return tables, values, models
+
+
+def write_bundle(path=BUNDLE_PATH):
+    """
+    Build the bundle from the Python modules and write it to ``path``.
+    """
+    tables, values, models = collect_tables()
+    index = {
+        "chardet_version": __version__,
+        "byteorder": sys.byteorder,
+        "tables": {},
+        "values": values,
+        "models": models,
+    }
+    payload = bytearray()
+    for name, table in sorted(tables.items()):
+        payload.extend(bytes(-len(payload) % _ALIGNMENT))
+        data = table.tobytes()
+        index["tables"][name] = [
+            len(payload),
+            len(data),
+            table.typecode,
+            zlib.crc32(data),
+        ]
+        payload.extend(data)
+    index_bytes = json.dumps(index, sort_keys=True).encode("ascii")
+    index_bytes += b" " * (-(_HEADER.size + len(index_bytes)) % _ALIGNMENT)
+    with open(path, "wb") as fp:
+        fp.write(
+            _HEADER.pack(
+                MAGIC, FORMAT_VERSION, len(index_bytes), zlib.crc32(index_bytes)
+            )
+        )
+        fp.write(index_bytes)
+        fp.write(payload)
+
+
+class ModelBundle:
+    """
+    A bundle file mapped read-only into memory.  Tables are returned as
+    ``memoryview`` objects over the mapping, so nothing is copied.
+
+    Raises ``ValueError`` if the file is not a bundle, was written by a
+    different version of chardet or on a machine with a different byte
+    order, or if any of its tables is corrupt.
+    """
+
+    def __init__(self, path=BUNDLE_PATH):
+        with open(path, "rb") as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views = {}
+        self._copies = {}
+        self._models = {}
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"{path} is not a chardet model bundle")
+        magic, version, index_size, index_crc = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(
+                f"{path} is not a version {FORMAT_VERSION} chardet model bundle"
+            )
+        index_bytes = self._mmap[_HEADER.size : _HEADER.size + index_size]
+        if zlib.crc32(index_bytes) != index_crc:
+            raise ValueError(f"The index of {path} is corrupt")
+        index = json.loads(index_bytes)
+        if (
+            index["chardet_version"] != __version__
+            or index["byteorder"] != sys.byteorder
+        ):
+            raise ValueError(
+                f'{path} was built for chardet {index["chardet_version"]} '
+                f'on a {index["byteorder"]} endian machine'
+            )
+        self.path = path
+        self._base = _HEADER.size + index_size
+        self._tables = index["tables"]
+        self._values = index["values"]
+        self._model_fields = index["models"]
+        for name, (offset, size, typecode, crc) in self._tables.items():
+            start = self._base + offset
+            if zlib.crc32(memoryview(self._mmap)[start : start + size]) != crc:
+                raise ValueError(f"Table {name} in {path} is corrupt")
+
+    def __contains__(self, name):
+        return name in self._tables
+
+    def table(self, name):
+        """
+        Returns the table called ``name`` as a ``memoryview`` of its items.
+        """
+        view = self._views.get(name)
+        if view is None:
+            offset, size, typecode, _ = self._tables[name]
+            start = self._base + offset
+            view = self._views[name] = memoryview(self._mmap)[
+                start : start + size
+            ].cast(typecode)
+        return view
+
+    def value(self, name):
+        """
+        Returns the number stored as ``name``.
+        """
+        return self._values[name]
+
+    def single_byte_model(self, name):
+        """
+        Returns the ``SingleByteCharSetModel`` called ``name``.  Its tables are
+        copied out as ``bytes``, since that is what the prober translates
+        with, but they are small and shared between models.
+        """
+        from .sbcharsetprober import SingleByteCharSetModel
+
+        model = self._models.get(name)
+        if model is None:
+            fields = dict(self._model_fields[name])
+            for field in ("char_to_order_map", "language_model"):
+                fields[field] = self._bytes(fields[field])
+            model = self._models[name] = SingleByteCharSetModel(**fields)
+        return model
+
+    def _bytes(self, name):
+        data = self._copies.get(name)
+        if data is None:
+            data = self._copies[name] = self.table(name).tobytes()
+        return data
+
+
+_BUNDLE = None
+_BUNDLE_LOADED = False
+
+
+def load_bundle():
+    """
+    Returns the ``ModelBundle`` shipped with chardet, mapping it the first
+    time this is called, or ``None`` if it is missing or cannot be used, in
+    which case callers fall back to the Python modules.
+    """
+    global _BUNDLE, _BUNDLE_LOADED
+    if not _BUNDLE_LOADED:
+        try:
+            _BUNDLE = ModelBundle(BUNDLE_PATH)
+        except (OSError, ValueError):
+            _BUNDLE = None
+        _BUNDLE_LOADED = True
+    return _BUNDLE
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Builds the binary bundle of chardet models and tables"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=BUNDLE_PATH,
+        help=f"Where to write the bundle. (default: {BUNDLE_PATH})",
+    )
+    args = parser.parse_args(argv)
+    write_bundle(args.output)
+    print(f"Wrote {os.path.getsize(args.output)} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,89 @@
-from .big5freq import BIG5_CHAR_TO_FREQ_ORDER, BIG5_TABLE_SIZE, BIG5_TYPICAL_DISTRIBUTION_RATIO
-from .euckrfreq import EUCKR_CHAR_TO_FREQ_ORDER, EUCKR_TABLE_SIZE, EUCKR_TYPICAL_DISTRIBUTION_RATIO
-from .euctwfreq import EUCTW_CHAR_TO_FREQ_ORDER, EUCTW_TABLE_SIZE, EUCTW_TYPICAL_DISTRIBUTION_RATIO
-from .gb2312freq import GB2312_CHAR_TO_FREQ_ORDER, GB2312_TABLE_SIZE, GB2312_TYPICAL_DISTRIBUTION_RATIO
-from .jisfreq import JIS_CHAR_TO_FREQ_ORDER, JIS_TABLE_SIZE, JIS_TYPICAL_DISTRIBUTION_RATIO
-from .johabfreq import JOHAB_TO_EUCKR_ORDER_TABLE
+import importlib
+from array import array
+from .lazyimport import lazy_attributes
+
+# The frequency tables are only loaded once an analyser that needs them is
+# created, from the model bundle if there is one, and their modules are only
+# imported when there is no bundle or when they are looked up here
+__getattr__ = lazy_attributes(__name__, {
+    'big5freq': ('BIG5_CHAR_TO_FREQ_ORDER', 'BIG5_TABLE_SIZE', 'BIG5_TYPICAL_DISTRIBUTION_RATIO'),
+    'euckrfreq': ('EUCKR_CHAR_TO_FREQ_ORDER', 'EUCKR_TABLE_SIZE', 'EUCKR_TYPICAL_DISTRIBUTION_RATIO'),
+    'euctwfreq': ('EUCTW_CHAR_TO_FREQ_ORDER', 'EUCTW_TABLE_SIZE', 'EUCTW_TYPICAL_DISTRIBUTION_RATIO'),
+    'gb2312freq': ('GB2312_CHAR_TO_FREQ_ORDER', 'GB2312_TABLE_SIZE', 'GB2312_TYPICAL_DISTRIBUTION_RATIO'),
+    'jisfreq': ('JIS_CHAR_TO_FREQ_ORDER', 'JIS_TABLE_SIZE', 'JIS_TYPICAL_DISTRIBUTION_RATIO'),
+    'johabfreq': ('JOHAB_TO_EUCKR_ORDER_TABLE',),
+})
+
+def load_frequency_table(module_name, prefix):
+    """
+    Returns the char-to-frequency-order table, table size and typical
+    distribution ratio defined with names starting with ``prefix`` in the
+    module ``module_name``, preferring the copy in the model bundle.
+    """
+    from .bundle import load_bundle
+    bundle = load_bundle()
+    if bundle is not None:
+        return (bundle.table(f'{prefix}_CHAR_TO_FREQ_ORDER'), bundle.value(f'{prefix}_TABLE_SIZE'),
+                bundle.value(f'{prefix}_TYPICAL_DISTRIBUTION_RATIO'))
+    module = importlib.import_module(f'.{module_name}', __package__)
+    return (getattr(module, f'{prefix}_CHAR_TO_FREQ_ORDER'), getattr(module, f'{prefix}_TABLE_SIZE'),
+            getattr(module, f'{prefix}_TYPICAL_DISTRIBUTION_RATIO'))
+
+# What the byte pair index holds for pairs whose order is past the end of the
+# frequency table: they are counted, but never as frequent characters
+NOT_IN_TABLE = 0x7FFF
+_PAIR_INDEXES = {}
+
+def build_pair_index(get_order, char_to_freq_order, table_size):
+    """
+    Returns an ``array('h')`` mapping every byte pair ``first << 8 | second``
+    to the frequency order of the character ``get_order`` gives it, to
+    ``NOT_IN_TABLE`` if that is past ``table_size``, or to -1 if the pair is
+    not a character the analyser counts.
+    """
+    index = array('h', [-1]) * 65536
+    for first in range(256):
+        for second in range(256):
+            order = get_order((first, second))
+            if order >= 0:
+                index[first << 8 | second] = char_to_freq_order[order] if order < table_size else NOT_IN_TABLE
+    return index
+
+def load_pair_index(analysis):
+    """
+    Returns the byte pair index for the class of ``analysis``, which is shared
+    by all its instances.  It is taken from the model bundle if it is there,
+    and built from the analyser's ``get_order`` and frequency table otherwise.
+    """
+    cls = type(analysis)
+    index = _PAIR_INDEXES.get(cls)
+    if index is None:
+        from .bundle import load_bundle
+        bundle = load_bundle()
+        name = f'{cls.__name__}.pair_freq_orders'
+        if bundle is not None and name in bundle:
+            index = bundle.table(name)
+        else:
+            index = build_pair_index(cls.get_order, analysis._char_to_freq_order, analysis._table_size)
+        _PAIR_INDEXES[cls] = index
+    return index
 
 class CharDistributionAnalysis:
     ENOUGH_DATA_THRESHOLD = 1024
     SURE_YES = 0.99
     SURE_NO = 0.01
     MINIMUM_DATA_THRESHOLD = 3
+    # Module and name prefix of the frequency table, or None for none
+    FREQUENCY_TABLE = None
 
     def __init__(self):
         self._char_to_freq_order = tuple()
-        self._table_size = None
+        self._table_size = 0
         self.typical_distribution_ratio = None
+        if self.FREQUENCY_TABLE is not None:
+            self._char_to_freq_order, self._table_size, self.typical_distribution_ratio = load_frequency_table(*self.FREQUENCY_TABLE)
+        # Frequency order of every byte pair, so a character costs one lookup
+        self._pair_freq_orders = load_pair_index(self)
         self._done = None
         self._total_chars = None
         self._freq_chars = None
@@ -28,14 +97,20 @@ class CharDistributionAnalysis:
 
     def feed(self, char, char_len):
         """feed a character with known length"""
+        if char_len == 2:
+            self.feed_pair(char[0], char[1], 2)
+
+    def feed_pair(self, first, second, char_len):
+        """
+        feed a character with known length, given as the ints of its last two
+        bytes, so that callers need not slice it out of their buffer
+        """
         if char_len == 2:
             # we only care about 2-bytes character in our distribution analysis
-            order = -1
-            if char[0] in self._char_to_freq_order:
-                order = self._char_to_freq_order[char[0]]
-            if order != -1 and order < self._table_size:
+            freq_order = self._pair_freq_orders[first << 8 | second]
+            if freq_order >= 0:
                 self._total_chars += 1
-                if order < 512:
+                if freq_order < 512:
                     self._freq_chars += 1
 
     def got_enough_data(self):
@@ -56,58 +131,115 @@ class CharDistributionAnalysis:
         # normalize confidence, (we don't want to be 100% sure)
         return self.SURE_YES
 
-class EUCTWDistributionAnalysis(CharDistributionAnalysis):
+    @staticmethod
+    def get_order(_):
+        # We do not handle characters based on the original encoding string,
+        # but convert this encoding string to a number, here called order.
+        # This allows multiple encodings of a language to share one frequency
+        # table.
+        return -1
 
-    def __init__(self):
-        super().__init__()
-        self._char_to_freq_order = EUCTW_CHAR_TO_FREQ_ORDER
-        self._table_size = EUCTW_TABLE_SIZE
-        self.typical_distribution_ratio = EUCTW_TYPICAL_DISTRIBUTION_RATIO
+class EUCTWDistributionAnalysis(CharDistributionAnalysis):
+    FREQUENCY_TABLE = ('euctwfreq', 'EUCTW')
+
+    @staticmethod
+    def get_order(byte_str):
+        # for euc-TW encoding, we are interested
+        #   first  byte range: 0xc4 -- 0xfe
+        #   second byte range: 0xa1 -- 0xfe
+        # no validation needed here. State machine has done that
+        first_char = byte_str[0]
+        if first_char >= 0xC4:
+            return 94 * (first_char - 0xC4) + byte_str[1] - 0xA1
+        return -1
 
 class EUCKRDistributionAnalysis(CharDistributionAnalysis):
-
-    def __init__(self):
-        super().__init__()
-        self._char_to_freq_order = EUCKR_CHAR_TO_FREQ_ORDER
-        self._table_size = EUCKR_TABLE_SIZE
-        self.typical_distribution_ratio = EUCKR_TYPICAL_DISTRIBUTION_RATIO
+    FREQUENCY_TABLE = ('euckrfreq', 'EUCKR')
+
+    @staticmethod
+    def get_order(byte_str):
+        # for euc-KR encoding, we are interested
+        #   first  byte range: 0xb0 -- 0xfe
+        #   second byte range: 0xa1 -- 0xfe
+        # no validation needed here. State machine has done that
+        first_char = byte_str[0]
+        if first_char >= 0xB0:
+            return 94 * (first_char - 0xB0) + byte_str[1] - 0xA1
+        return -1
 
 class JOHABDistributionAnalysis(CharDistributionAnalysis):
+    FREQUENCY_TABLE = ('euckrfreq', 'EUCKR')
 
-    def __init__(self):
-        super().__init__()
-        self._char_to_freq_order = EUCKR_CHAR_TO_FREQ_ORDER
-        self._table_size = EUCKR_TABLE_SIZE
-        self.typical_distribution_ratio = EUCKR_TYPICAL_DISTRIBUTION_RATIO
+    @staticmethod
+    def get_order(byte_str):
+        from .johabfreq import JOHAB_TO_EUCKR_ORDER_TABLE
+        first_char = byte_str[0]
+        if 0x88 <= first_char < 0xD4:
+            code = first_char * 256 + byte_str[1]
+            return JOHAB_TO_EUCKR_ORDER_TABLE.get(code, -1)
+        return -1
 
 class GB2312DistributionAnalysis(CharDistributionAnalysis):
-
-    def __init__(self):
-        super().__init__()
-        self._char_to_freq_order = GB2312_CHAR_TO_FREQ_ORDER
-        self._table_size = GB2312_TABLE_SIZE
-        self.typical_distribution_ratio = GB2312_TYPICAL_DISTRIBUTION_RATIO
+    FREQUENCY_TABLE = ('gb2312freq', 'GB2312')
+
+    @staticmethod
+    def get_order(byte_str):
+        # for GB2312 encoding, we are interested
+        #  first  byte range: 0xb0 -- 0xfe
+        #  second byte range: 0xa1 -- 0xfe
+        # no validation needed here. State machine has done that
+        first_char, second_char = byte_str[0], byte_str[1]
+        if (first_char >= 0xB0) and (second_char >= 0xA1):
+            return 94 * (first_char - 0xB0) + second_char - 0xA1
+        return -1
 
 class Big5DistributionAnalysis(CharDistributionAnalysis):
-
-    def __init__(self):
-        super().__init__()
-        self._char_to_freq_order = BIG5_CHAR_TO_FREQ_ORDER
-        self._table_size = BIG5_TABLE_SIZE
-        self.typical_distribution_ratio = BIG5_TYPICAL_DISTRIBUTION_RATIO
+    FREQUENCY_TABLE = ('big5freq', 'BIG5')
+
+    @staticmethod
+    def get_order(byte_str):
+        # for big5 encoding, we are interested
+        #   first  byte range: 0xa4 -- 0xfe
+        #   second byte range: 0x40 -- 0x7e , 0xa1 -- 0xfe
+        # no validation needed here. State machine has done that
+        first_char, second_char = byte_str[0], byte_str[1]
+        if first_char >= 0xA4:
+            if second_char >= 0xA1:
+                return 157 * (first_char - 0xA4) + second_char - 0xA1 + 63
+            return 157 * (first_char - 0xA4) + second_char - 0x40
+        return -1
 
 class SJISDistributionAnalysis(CharDistributionAnalysis):
-
-    def __init__(self):
-        super().__init__()
-        self._char_to_freq_order = JIS_CHAR_TO_FREQ_ORDER
-        self._table_size = JIS_TABLE_SIZE
-        self.typical_distribution_ratio = JIS_TYPICAL_DISTRIBUTION_RATIO
+    FREQUENCY_TABLE = ('jisfreq', 'JIS')
+
+    @staticmethod
+    def get_order(byte_str):
+        # for sjis encoding, we are interested
+        #   first  byte range: 0x81 -- 0x9f , 0xe0 -- 0xfe
+        #   second byte range: 0x40 -- 0x7e,  0x81 -- oxfe
+        # no validation needed here. State machine has done that
+        first_char, second_char = byte_str[0], byte_str[1]
+        if 0x81 <= first_char <= 0x9F:
+            order = 188 * (first_char - 0x81)
+        elif 0xE0 <= first_char <= 0xEF:
+            order = 188 * (first_char - 0xE0 + 31)
+        else:
+            return -1
+        order = order + second_char - 0x40
+        if second_char > 0x7F:
+            order = -1
+        return order
 
 class EUCJPDistributionAnalysis(CharDistributionAnalysis):
-
-    def __init__(self):
-        super().__init__()
-        self._char_to_freq_order = JIS_CHAR_TO_FREQ_ORDER
-        self._table_size = JIS_TABLE_SIZE
-        self.typical_distribution_ratio = JIS_TYPICAL_DISTRIBUTION_RATIO
\ No newline at end of file
+    FREQUENCY_TABLE = ('jisfreq', 'JIS')
+
+    @staticmethod
+    def get_order(byte_str):
+        # for euc-JP encoding, we are interested
+        #   first  byte range: 0xa0 -- 0xfe
+        #   second byte range: 0xa1 -- 0xfe
+        # no validation needed here. State machine has done that
+        char = byte_str[0]
+        if char >= 0xA0:
+            return 94 * (char - 0xA1) + byte_str[1] - 0xA1
+        return -1
@@ -19,12 +19,21 @@ class CharSetGroupProber(CharSetProber):
                 self._active_num += 1
         self._best_guess_prober = None
 
-    def get_charset_name(self):
+    @property
+    def charset_name(self):
         if not self._best_guess_prober:
             self.get_confidence()
             if not self._best_guess_prober:
                 return None
-        return self._best_guess_prober.get_charset_name()
+        return self._best_guess_prober.charset_name
+
+    @property
+    def language(self):
+        if not self._best_guess_prober:
+            self.get_confidence()
+            if not self._best_guess_prober:
+                return None
+        return self._best_guess_prober.language
 
     def feed(self, byte_str):
         for prober in self.probers:
@@ -32,11 +41,12 @@ class CharSetGroupProber(CharSetProber):
                 continue
             if not prober.active:
                 continue
-            state = prober.feed(byte_str)
+            state = self.feed_prober(prober, byte_str)
             if not state:
                 continue
             if state == ProbingState.FOUND_IT:
                 self._best_guess_prober = prober
+                self._state = ProbingState.FOUND_IT
                 return self.state
             elif state == ProbingState.NOT_ME:
                 prober.active = False
@@ -46,18 +56,30 @@ class CharSetGroupProber(CharSetProber):
                     return self.state
         return self.state
 
+    def feed_prober(self, prober, byte_str):
+        """
+        Feed ``byte_str`` to one active member of the group and return its
+        new state.  Subclasses override this to share work across members.
+        """
+        return prober.feed(byte_str)
+
     def get_confidence(self):
-        st = 0.0
-        if not self._best_guess_prober:
-            for prober in self.probers:
-                if not prober:
-                    continue
-                if not prober.active:
-                    continue
-                cf = prober.get_confidence()
-                if cf > st:
-                    st = cf
-                    self._best_guess_prober = prober
+        state = self.state
+        if state == ProbingState.FOUND_IT:
+            return 0.99
+        elif state == ProbingState.NOT_ME:
+            return 0.01
+        best_conf = 0.0
+        self._best_guess_prober = None
+        for prober in self.probers:
+            if not prober:
+                continue
+            if not prober.active:
+                continue
+            conf = prober.get_confidence()
+            if conf > best_conf:
+                best_conf = conf
+                self._best_guess_prober = prober
         if not self._best_guess_prober:
             return 0.0
-        return st
\ No newline at end of file
+        return best_conf
@@ -1,7 +1,37 @@
 import logging
 import re
+import sys
+from collections import Counter
 from .enums import ProbingState
 INTERNATIONAL_WORDS_PATTERN = re.compile(b'[a-zA-Z]*[\x80-\xff]+[a-zA-Z]*[^a-zA-Z\x80-\xff]?')
+MARKERS_TO_SPACE = bytes(byte if 65 <= byte <= 90 or 97 <= byte <= 122 or byte >= 128 else 32 for byte in range(256))
+ASCII_RUNS_PATTERN = re.compile(b'[\x00-\x7f]+')
+XML_TAG_PATTERN = re.compile(b'<[^>]*>?|[^<>]*>|([^<>]+<?)[^>]*>?')
+
+class FilteredChunk:
+    """
+    One chunk of input together with the filtered views of it that probers
+    have asked for.  Each distinct filter runs at most once per chunk, and
+    ``passes_saved`` counts the requests that were answered from the cache.
+    """
+
+    def __init__(self, byte_str):
+        self.byte_str = byte_str
+        self.passes_saved = 0
+        self._views = {}
+
+    def filtered(self, chunk_filter):
+        """
+        Return ``chunk_filter(byte_str)``, computing it only the first time
+        it is asked for.
+        """
+        view = self._views.get(chunk_filter)
+        if view is None:
+            view = chunk_filter(self.byte_str)
+            self._views[chunk_filter] = view
+        else:
+            self.passes_saved += 1
+        return view
 
 class CharSetProber:
     SHORTCUT_THRESHOLD = 0.95
@@ -12,6 +42,14 @@ class CharSetProber:
         self.logger = logging.getLogger(__name__)
         self.active = True
 
+    @staticmethod
+    def filter_high_byte_only(buf):
+        """
+        Returns a copy of ``buf`` with every run of ASCII bytes replaced by a
+        single space.
+        """
+        return ASCII_RUNS_PATTERN.sub(b' ', buf)
+
     @staticmethod
     def filter_international_words(buf):
         """
@@ -25,33 +63,12 @@ class CharSetProber:
         are replaced by a single space ascii character.
         This filter applies to all scripts which do not use English characters.
         """
-        filtered = bytearray()
-        in_word = False
-        prev_marker = True
-        for byte in buf:
-            # Get the byte value as an integer
-            byte_int = byte if isinstance(byte, int) else ord(byte)
-            
-            # Check if it's an alphabet character
-            is_alpha = (byte_int >= 65 and byte_int <= 90) or (byte_int >= 97 and byte_int <= 122)
-            # Check if it's an international character
-            is_international = byte_int >= 0x80 and byte_int <= 0xFF
-            
-            if is_alpha or is_international:
-                if prev_marker and not in_word:
-                    in_word = True
-                if in_word:
-                    filtered.append(byte_int)
-            else:  # it's a marker
-                if in_word:
-                    in_word = False
-                    if not prev_marker:
-                        filtered.append(32)  # ASCII space
-                prev_marker = True
-                continue
-            prev_marker = False
-            
-        return bytes(filtered)
+        # Each match is a word holding at least one international character,
+        # possibly followed by a single marker.  Markers only ever appear at
+        # the end of a match, so mapping them all to spaces at once replaces
+        # exactly those trailing markers.
+        words = INTERNATIONAL_WORDS_PATTERN.findall(buf)
+        return b''.join(words).translate(MARKERS_TO_SPACE)
 
     @staticmethod
     def remove_xml_tags(buf):
@@ -62,22 +79,30 @@ class CharSetProber:
         characters and extended ASCII characters, but is currently only used by
         ``Latin1Prober``.
         """
-        filtered = bytearray()
-        in_tag = False
-        for byte in buf:
-            byte_int = byte if isinstance(byte, int) else ord(byte)
-            
-            if byte_int == ord('<'):
-                in_tag = True
-                continue
-            elif byte_int == ord('>'):
-                in_tag = False
-                continue
-            
-            if not in_tag:
-                filtered.append(byte_int)
-                
-        return bytes(filtered)
+        # Tags and stray text ending in '>' match without the group; a kept
+        # stretch matches together with the '<' opening the tag after it,
+        # which then becomes the space delimiting that stretch.
+        stretches = XML_TAG_PATTERN.findall(buf)
+        return b''.join(stretches).replace(b'<', b' ')
+
+    @staticmethod
+    def count_pairs(buf):
+        """
+        Returns a ``Counter`` of every pair of adjacent bytes in ``buf``, keyed
+        by ``(first << 8) | second``.
+        The buffer is viewed twice as 16-bit words, once at even and once at
+        odd offsets, so the counting itself happens at C speed.
+        """
+        view = memoryview(buf)
+        size = len(view)
+        if size < 2:
+            return Counter()
+        counts = Counter(view[:size & ~1].cast('H'))
+        counts.update(view[1:1 + ((size - 1) & ~1)].cast('H'))
+        if sys.byteorder == 'little':
+            return Counter({(pair & 0xFF) << 8 | pair >> 8: count
+                            for pair, count in counts.items()})
+        return counts
 
     def reset(self):
         """
@@ -91,6 +116,13 @@ class CharSetProber:
         """
         raise NotImplementedError
 
+    def feed_chunk(self, chunk):
+        """
+        Feed a ``FilteredChunk`` to the prober.  Probers that filter their
+        input override this to share filtered views with other probers.
+        """
+        return self.feed(chunk.byte_str)
+
     def get_confidence(self):
         """
         Return confidence level of the prober.
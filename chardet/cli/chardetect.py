@@ -8,12 +8,20 @@ Example::
     somefile: windows-1252 with confidence 0.5
     someotherfile: ascii with confidence 1.0
 
-If no paths are provided, it takes its input from stdin.
+If no paths are provided, it takes its input from stdin.  Directories are
+searched for files with ``-r``, and ``--jobs`` spreads the files over that
+many worker processes.  With ``--json`` every result is printed as a JSON
+object on a line of its own, as soon as it is ready.
 
 """
 import argparse
+import json
+import multiprocessing
+import os
 import sys
-from .. import __version__
+import time
+from functools import partial
+from .. import DEFAULT_CHUNK_SIZE, __version__, detect_file, detect_stream
 from ..universaldetector import UniversalDetector
 
 def description_of(lines, name='stdin'):
@@ -26,7 +34,106 @@ def description_of(lines, name='stdin'):
     :param name: Name of file or collection of lines
     :type name: str
     """
-    pass
+    u = UniversalDetector()
+    for line in lines:
+        line = bytearray(line)
+        u.feed(line)
+        # shortcut out of the loop to save reading further - particularly useful if we read a BOM.
+        if u.done:
+            break
+    u.close()
+    return describe_result(dict(u.result, path=name))
+
+def describe_result(result):
+    """
+    Return the line ``main`` prints for one of the ``dict`` objects made by
+    ``detect_path``, without ``--json``.
+    """
+    if result.get('error'):
+        return f"{result['path']}: {result['error']}"
+    if result['encoding']:
+        return f"{result['path']}: {result['encoding']} with confidence {result['confidence']}"
+    return f"{result['path']}: no result"
+
+def detect_path(path, max_bytes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Detect the encoding of the file at ``path`` with ``chardet.detect_file``,
+    examining at most ``max_bytes`` of it.
+
+    Returns a ``dict`` with the ``path``, ``encoding``, ``confidence`` and
+    ``language``, the seconds ``elapsed``, and with ``max_bytes`` the number
+    of ``bytes_examined``.  If the file could not be read, there is an
+    ``error`` instead of a result.
+
+    :param path: The path of the file to examine.
+    :type path: str
+    :param max_bytes: Read at most this many bytes of the file.
+    :type max_bytes: int or None
+    """
+    start = time.perf_counter()
+    try:
+        result = detect_file(path, chunk_size=chunk_size, max_bytes=max_bytes)
+    except OSError as err:
+        return {'path': path, 'error': err.strerror or str(err)}
+    return _with_elapsed(path, result, start)
+
+def _with_elapsed(path, result, start):
+    return {'path': path, **result, 'elapsed': round(time.perf_counter() - start, 6)}
+
+def _detect_item(item, max_bytes=None):
+    """
+    ``detect_path`` for an item from ``iter_paths``, passing the ``(path,
+    error)`` pairs for paths that could not be examined straight through.
+    """
+    if isinstance(item, tuple):
+        return {'path': item[0], 'error': item[1]}
+    return detect_path(item, max_bytes=max_bytes)
+
+def iter_paths(paths, recursive=False):
+    """
+    Yield the files named by ``paths``, searching any directories among them
+    for files with ``os.scandir`` if ``recursive`` is set.  Symbolic links
+    to directories are not followed.  Directories that are given without
+    ``recursive``, or that cannot be listed, are yielded as ``(path,
+    error)`` pairs.
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+        elif not recursive:
+            yield path, 'Is a directory'
+        else:
+            yield from _walk(path)
+
+def _walk(top):
+    try:
+        with os.scandir(top) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError as err:
+        yield top, err.strerror or str(err)
+        return
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            is_dir = False
+        if is_dir:
+            yield from _walk(entry.path)
+        elif entry.is_file():
+            yield entry.path
+
+def iter_results(paths, max_bytes=None, jobs=1):
+    """
+    Yield ``detect_path`` results for each of ``paths``, as produced by
+    ``iter_paths``.  With more than one job the files are shared between
+    that many worker processes, and results come in the order they finish.
+    """
+    detect = partial(_detect_item, max_bytes=max_bytes)
+    if jobs == 1:
+        yield from map(detect, paths)
+        return
+    with multiprocessing.Pool(jobs) as pool:
+        yield from pool.imap_unordered(detect, paths, chunksize=16)
 
 def main(argv=None):
     """
@@ -36,6 +143,42 @@ def main(argv=None):
                  If None, ``sys.argv[1:]`` is used instead.
     :type argv: list of str
     """
-    pass
+    # Get command line arguments
+    parser = argparse.ArgumentParser(description='Takes one or more file paths and reports their detected encodings')
+    parser.add_argument('input', help='File whose encoding we would like to determine, or directory with -r. (default: stdin)', nargs='*', default=['-'])
+    parser.add_argument('-r', '--recursive', action='store_true', help='Search directories for files to examine.')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='How many worker processes to examine files with. 0 uses one per CPU.')
+    parser.add_argument('--max-bytes', type=int, default=None, help='Read at most this many bytes of each file.')
+    parser.add_argument('--json', action='store_true', help='Print each result as a JSON object on a line of its own.')
+    parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error('--jobs must not be negative')
+    if args.max_bytes is not None and args.max_bytes < 1:
+        parser.error('--max-bytes must be positive')
+    jobs = args.jobs or os.cpu_count() or 1
+
+    failed = False
+    paths = iter_paths((path for path in args.input if path != '-'), args.recursive)
+    results = iter_results(paths, args.max_bytes, jobs)
+    if '-' in args.input:
+        results = _with_stdin(results, args.max_bytes)
+    for result in results:
+        if result.get('error'):
+            failed = True
+            print(describe_result(result), file=sys.stderr)
+        elif args.json:
+            print(json.dumps(result), flush=True)
+        else:
+            print(describe_result(result), flush=True)
+    return 1 if failed else 0
+
+def _with_stdin(results, max_bytes):
+    stdin = sys.stdin.buffer
+    if stdin.isatty():
+        print('You are running chardetect interactively. Press CTRL-D twice at the start of a blank line to signal the end of your input. If you want help, run chardetect --help\n', file=sys.stderr)
+    start = time.perf_counter()
+    yield _with_elapsed('stdin', detect_stream(stdin, max_bytes=max_bytes), start)
+    yield from results
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -1,5 +1,94 @@
 import logging
+import re
+from collections import OrderedDict, namedtuple
+from itertools import compress
 from .enums import MachineState
+StateMachineRun = namedtuple('StateMachineRun', ['state', 'stop', 'char_ends', 'char_lens'])
+
+
+def compile_state_machine(sm):
+    """
+    Add flat ``bytes`` tables to the state machine model ``sm`` so that a
+    transition costs a single index operation:
+
+    ``transitions``  the next state for ``state << 8 | byte``
+    ``byte_char_len``  the character length implied by a first ``byte``
+
+    Models are compiled in place and only once, so this is cheap to call on
+    a model that has already been compiled.
+    """
+    if 'transitions' in sm:
+        return sm
+    class_table = sm['class_table']
+    class_factor = sm['class_factor']
+    state_table = sm['state_table']
+    transitions = bytearray()
+    for state in range(len(state_table) // class_factor):
+        row = state_table[state * class_factor:(state + 1) * class_factor]
+        transitions.extend(row[class_table[byte]] for byte in range(256))
+    sm['transitions'] = bytes(transitions)
+    sm['byte_char_len'] = bytes(sm['char_len_table'][class_table[byte]]
+                                for byte in range(256))
+    return sm
+
+
+def compile_state_machines(namespace):
+    """
+    Compile every ``*_SM_MODEL`` in the module ``namespace``, taking their
+    tables from the model bundle when it has them rather than building them.
+    """
+    from .bundle import load_bundle
+    bundle = load_bundle()
+    for name, sm in namespace.items():
+        if not name.endswith('_SM_MODEL'):
+            continue
+        if bundle is not None and f'{name}.transitions' in bundle:
+            sm['transitions'] = bundle.table(f'{name}.transitions')
+            sm['byte_char_len'] = bundle.table(f'{name}.byte_char_len')
+        compile_state_machine(sm)
+
+def _byte_class(byte_values):
+    return b'[' + b''.join(re.escape(bytes([byte])) for byte in byte_values) + b']'
+
+
+def compile_loop_patterns(sm):
+    """
+    Add ``loop_patterns`` to the compiled model ``sm``: for every state, a
+    regex matching stretches of bytes that lead from that state back to
+    itself, either one byte at a time or through one other state and back,
+    or ``None`` if there are none.  Whatever such a pattern matches leaves
+    the machine where it was, so it can be stepped over without looking up
+    a single transition.  Like ``compile_state_machine``, this only does any
+    work the first time it is called on a model.
+    """
+    if 'loop_patterns' in sm:
+        return sm
+    transitions = sm['transitions']
+    state_count = len(transitions) // 256
+    stopping = (MachineState.ERROR, MachineState.ITS_ME)
+    patterns = []
+    for state in range(state_count):
+        row = transitions[state << 8:(state + 1) << 8]
+        if state in stopping:
+            patterns.append(None)
+            continue
+        alternatives = []
+        loops = [byte for byte in range(256) if row[byte] == state]
+        if loops:
+            alternatives.append(_byte_class(loops) + b'+')
+        for other in range(state_count):
+            if other == state or other in stopping:
+                continue
+            there = [byte for byte in range(256) if row[byte] == other]
+            back = [byte for byte in range(256)
+                    if transitions[other << 8 | byte] == state]
+            if there and back:
+                alternatives.append(_byte_class(there) + _byte_class(back))
+        patterns.append(re.compile(b'(?:' + b'|'.join(alternatives) + b')*')
+                        if alternatives else None)
+    sm['loop_patterns'] = patterns
+    return sm
+
 
 class CodingStateMachine:
     """
@@ -25,7 +114,9 @@ class CodingStateMachine:
     """
 
     def __init__(self, sm):
-        self._model = sm
+        self._model = compile_state_machine(sm)
+        self._transitions = sm['transitions']
+        self._byte_char_len = sm['byte_char_len']
         self._curr_byte_pos = 0
         self._curr_char_len = 0
         self._curr_state = None
@@ -44,28 +135,295 @@ class CodingStateMachine:
         """
         Process one byte at a time and return the new state.
         """
-        # for each byte we get its class
-        byte_class = self._model['class_table'][c]
-        if byte_class == 'eError':  # we represent error class as None
-            self._curr_state = MachineState.ERROR
-            return self._curr_state
-
-        # for each byte class we get a state transition table
+        # if it is the first byte of a character, we also get its length
         if self._curr_state == MachineState.START:
             self._curr_byte_pos = 0
-            self._curr_char_len = self._model['char_len_table'][byte_class]
+            self._curr_char_len = self._byte_char_len[c]
+        self._curr_state = self._transitions[self._curr_state << 8 | c]
+        self._curr_byte_pos += 1
+        return self._curr_state
 
-        # from byte's class and state_table, we get its next state
-        curr_state = self._curr_state * self._model['class_factor'] + byte_class
-        self._curr_state = self._model['state_table'][curr_state]
+    def run(self, buf, start_state=None):
+        """
+        Process a whole buffer and return a ``StateMachineRun``, stopping
+        early at the first byte that leads to the ERROR or ITS_ME state.
 
-        # we increment the byte position counter
-        self._curr_byte_pos += 1
+        ``state`` is the state after the last byte processed, ``stop`` is the
+        offset of the byte that caused ERROR or ITS_ME (``None`` if there was
+        none), and ``char_ends``/``char_lens`` hold the offset of the last
+        byte and the length of every character completed along the way.
+        The machine is left in ``state``, so ``run`` and ``next_state`` can
+        be mixed freely.  ``start_state`` defaults to the current state.
+        """
+        transitions = self._transitions
+        byte_char_len = self._byte_char_len
+        start = MachineState.START
+        state = self._curr_state if start_state is None else start_state
+        char_len = self._curr_char_len
+        byte_pos = self._curr_byte_pos
+        char_ends = []
+        char_lens = []
+        stop = None
+        for i, byte in enumerate(buf):
+            if state == start:
+                byte_pos = 0
+                char_len = byte_char_len[byte]
+            state = transitions[state << 8 | byte]
+            byte_pos += 1
+            if state == start:
+                char_ends.append(i)
+                char_lens.append(char_len)
+            elif state == MachineState.ERROR or state == MachineState.ITS_ME:
+                stop = i
+                break
+        self._curr_state = state
+        self._curr_char_len = char_len
+        self._curr_byte_pos = byte_pos
+        return StateMachineRun(state, stop, char_ends, char_lens)
 
-        return self._curr_state
+    def scan(self, buf, end=None):
+        """
+        Process ``buf`` up to offset ``end`` like ``run``, but without keeping
+        track of characters, and return ``(state, stop)``.  Stretches that
+        lead back to the state the machine is in are matched with the
+        regexes from ``compile_loop_patterns`` and skipped, so the
+        transitions are only looked up for the bytes in between.  Worth it
+        for machines that spend almost all their time in one state, like
+        those for escape sequences.
+        """
+        loop_patterns = compile_loop_patterns(self._model)['loop_patterns']
+        transitions = self._transitions
+        if end is None:
+            end = len(buf)
+        state = self._curr_state
+        stop = None
+        pos = 0
+        while pos < end:
+            loop = loop_patterns[state]
+            if loop is not None:
+                pos = loop.match(buf, pos, end).end()
+                if pos == end:
+                    break
+            state = transitions[state << 8 | buf[pos]]
+            if state == MachineState.ERROR or state == MachineState.ITS_ME:
+                stop = pos
+                break
+            pos += 1
+        self._curr_state = state
+        return state, stop
 
     def get_current_charlen(self):
         """
         Return the length of the current character being detected.
         """
-        return self._curr_char_len
\ No newline at end of file
+        return self._curr_char_len
+
+    def get_coding_state_machine(self):
+        """
+        Return the name of the encoding this state machine is for.
+        """
+        return self._model['name']
+
+    @property
+    def language(self):
+        return self._model['language']
+
+
+class _ProductTable:
+    """
+    The product of several compiled state machines, built lazily: composite
+    states and their transitions are only computed the first time they are
+    reached, so only the reachable part of the product is ever stored.
+    Composite state ids are kept below ``MAX_STATES`` so that both the
+    transitions and a run can be recorded in a ``bytearray``, with
+    ``UNBUILT`` marking transitions not computed yet; ``step`` returns
+    ``None`` once that space is exhausted.
+    """
+    MAX_STATES = 255
+    UNBUILT = 255
+
+    def __init__(self, models):
+        self._machine_transitions = [sm['transitions'] for sm in models]
+        self.states = []
+        self.transitions = bytearray()
+        # Whether any machine is in ERROR or ITS_ME in a composite state
+        self.stopping = bytearray()
+        self._ids = {}
+        self._start_masks = {}
+
+    def intern(self, states):
+        cid = self._ids.get(states)
+        if cid is None:
+            if len(self.states) >= self.MAX_STATES:
+                return None
+            cid = len(self.states)
+            self._ids[states] = cid
+            self.states.append(states)
+            self.transitions.extend(bytes([self.UNBUILT]) * 256)
+            self.stopping.append(any(state == MachineState.ERROR or
+                                     state == MachineState.ITS_ME
+                                     for state in states))
+        return cid
+
+    def step(self, cid, byte):
+        states = self.states[cid]
+        next_cid = self.intern(tuple(
+            transitions[state << 8 | byte]
+            for transitions, state in zip(self._machine_transitions, states)))
+        if next_cid is not None:
+            self.transitions[cid << 8 | byte] = next_cid
+        return next_cid
+
+    def start_mask(self, slot):
+        """
+        A ``bytes.translate`` table from composite state id to 1 if machine
+        ``slot`` is in the START state in it, and 0 otherwise.
+        """
+        mask = self._start_masks.get(slot)
+        if mask is None or mask[1] != len(self.states):
+            table = bytearray(256)
+            for cid, states in enumerate(self.states):
+                table[cid] = states[slot] == MachineState.START
+            mask = self._start_masks[slot] = (bytes(table), len(self.states))
+        return mask[0]
+
+
+class ProductStateMachine:
+    """
+    Runs several ``CodingStateMachine`` instances over the same buffer at
+    once, advancing all of them with a single table lookup per byte.
+
+    The lookup is into the product of the machines that are still alive.
+    When one of them reaches ERROR or ITS_ME it is dropped and the run
+    continues on the (smaller) product of the remaining machines.  Only the
+    sequence of composite states is recorded per byte; the character
+    boundaries of each machine are then extracted from it with
+    ``bytes.translate`` and ``itertools.compress``.  Each instance builds
+    its product tables lazily and keeps the ``MAX_TABLES`` most recently
+    used ones; if one ever needs more than ``_ProductTable.MAX_STATES``
+    composite states, the rest of the buffer is run machine by machine.
+    """
+    MAX_TABLES = 8
+
+    def __init__(self):
+        self._tables = OrderedDict()
+
+    def _product(self, machines):
+        # Keyed on the machines themselves, which the key keeps alive
+        key = tuple(machines)
+        table = self._tables.get(key)
+        if table is None:
+            table = self._tables[key] = _ProductTable(
+                [machine._model for machine in machines])
+            if len(self._tables) > self.MAX_TABLES:
+                self._tables.popitem(last=False)
+        else:
+            self._tables.move_to_end(key)
+        return table
+
+    def run(self, machines, buf):
+        """
+        Run every machine in ``machines`` over ``buf`` and return their
+        ``StateMachineRun`` results, in the same order.  Each result and the
+        state each machine is left in are identical to calling
+        ``machine.run(buf)`` on the machines one after the other, stopping
+        at the first one that reaches ITS_ME; the machines after that one
+        are left untouched and get ``None`` instead of a result.
+        """
+        count = len(machines)
+        view = memoryview(buf)
+        states = [machine._curr_state for machine in machines]
+        char_len = [machine._curr_char_len for machine in machines]
+        char_ends = [[] for _ in range(count)]
+        char_lens = [[] for _ in range(count)]
+        stops = [None] * count
+        fed = [True] * count
+        alive = list(range(count))
+        pos = 0
+        while alive and pos < len(buf):
+            product = self._product([machines[index] for index in alive])
+            transitions = product.transitions
+            stopping = product.stopping
+            unbuilt = product.UNBUILT
+            cid = product.intern(tuple(states[index] for index in alive))
+            if cid is None:
+                break
+            trace = bytearray()
+            record = trace.append
+            for byte in view[pos:]:
+                next_cid = transitions[cid << 8 | byte]
+                if next_cid == unbuilt:
+                    next_cid = product.step(cid, byte)
+                    if next_cid is None:
+                        break
+                cid = next_cid
+                record(cid)
+                if stopping[cid]:
+                    break
+            if not trace:
+                break
+            end = pos + len(trace)
+            segment = view[pos:end]
+            for slot, index in enumerate(alive):
+                marks = trace.translate(product.start_mask(slot))
+                ends = list(compress(range(pos, end), marks))
+                # A byte starts a character when the machine was in START
+                # just before it
+                before = (b'\x01' if states[index] == MachineState.START
+                          else b'\x00') + marks[:-1]
+                started = bytes(compress(segment, before)).translate(
+                    machines[index]._byte_char_len)
+                if states[index] == MachineState.START:
+                    lens = list(started[:len(ends)])
+                elif ends:
+                    lens = [char_len[index]] + list(started[:len(ends) - 1])
+                else:
+                    lens = []
+                if started:
+                    char_len[index] = started[-1]
+                char_ends[index].extend(ends)
+                char_lens[index].extend(lens)
+                states[index] = product.states[trace[-1]][slot]
+            pos = end
+            if not stopping[trace[-1]]:
+                continue
+            stopped = [index for index in alive
+                       if states[index] == MachineState.ERROR or
+                       states[index] == MachineState.ITS_ME]
+            for index in stopped:
+                stops[index] = end - 1
+            alive = [index for index in alive if index not in stopped]
+            its_me = [index for index in stopped
+                      if states[index] == MachineState.ITS_ME]
+            if its_me:
+                # The machines after the first one to reach ITS_ME would not
+                # have been fed this chunk at all
+                cutoff = min(its_me)
+                alive = [index for index in alive if index < cutoff]
+                for index in range(cutoff + 1, count):
+                    fed[index] = False
+
+        runs = []
+        for index, machine in enumerate(machines):
+            if not fed[index]:
+                runs.append(None)
+                continue
+            machine._curr_state = states[index]
+            machine._curr_char_len = char_len[index]
+            if index in alive and pos < len(buf):
+                # The product grew too large, finish this one on its own
+                rest = machine.run(view[pos:])
+                if rest.stop is not None:
+                    stops[index] = pos + rest.stop
+                char_ends[index].extend(pos + end for end in rest.char_ends)
+                char_lens[index].extend(rest.char_lens)
+                states[index] = rest.state
+                if rest.state == MachineState.ITS_ME:
+                    runs.append(StateMachineRun(states[index], stops[index],
+                                                char_ends[index],
+                                                char_lens[index]))
+                    runs.extend([None] * (count - index - 1))
+                    break
+            runs.append(StateMachineRun(states[index], stops[index],
+                                        char_ends[index], char_lens[index]))
+        return runs
@@ -0,0 +1,79 @@
+"""
+A thread-safe pool of ``UniversalDetector`` objects, so that ``detect`` and
+friends can reuse detectors and their probers instead of building new ones
+for every call.
+"""
+from contextlib import contextmanager
+from queue import Empty, SimpleQueue
+
+from .enums import LanguageFilter
+from .universaldetector import UniversalDetector
+
+
+class DetectorPool:
+    """
+    Hands out ``UniversalDetector`` objects that are reset and ready to be
+    fed, and takes them back once their result has been read.
+
+    .. code::
+
+            pool = DetectorPool()
+            with pool.detector() as detector:
+                detector.feed(some_bytes)
+                detected = detector.close()
+
+    """
+
+    # How many idle detectors to keep around; any beyond that are dropped
+    MAX_IDLE = 8
+
+    def __init__(self, lang_filter=LanguageFilter.ALL, preload=False):
+        self.lang_filter = lang_filter
+        self.preload = preload
+        # SimpleQueue is safe to share between threads without a lock
+        self._idle = SimpleQueue()
+
+    def __len__(self):
+        return self._idle.qsize()
+
+    def acquire(self):
+        """
+        Check a detector out of the pool, creating one if none are idle.
+        """
+        try:
+            return self._idle.get_nowait()
+        except Empty:
+            pass
+        detector = UniversalDetector(self.lang_filter)
+        if self.preload:
+            detector.preload()
+        return detector
+
+    def release(self, detector):
+        """
+        Reset ``detector`` and check it back into the pool.  The ``dict``
+        in its ``result`` attribute is left alone, so it is safe to keep.
+        """
+        detector.reset()
+        if self._idle.qsize() < self.MAX_IDLE:
+            self._idle.put(detector)
+
+    def clear(self):
+        """
+        Drop every idle detector.
+        """
+        try:
+            while True:
+                self._idle.get_nowait()
+        except Empty:
+            pass
+
+    @contextmanager
+    def detector(self):
+        """
+        Context manager that checks a detector out for the duration of the
+        ``with`` block.  A detector that raised is not returned to the pool.
+        """
+        detector = self.acquire()
+        yield detector
+        self.release(detector)
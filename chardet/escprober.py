@@ -24,4 +24,52 @@ class EscCharSetProber(CharSetProber):
         self._detected_charset = None
         self._detected_language = None
         self._state = None
-        self.reset()
\ No newline at end of file
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        for coding_sm in self.coding_sm:
+            if not coding_sm:
+                continue
+            coding_sm.active = True
+            coding_sm.reset()
+        self.active_sm_count = len(self.coding_sm)
+        self._detected_charset = None
+        self._detected_language = None
+
+    @property
+    def charset_name(self):
+        return self._detected_charset
+
+    @property
+    def language(self):
+        return self._detected_language
+
+    def get_confidence(self):
+        return 0.99 if self._detected_charset else 0.00
+
+    def feed(self, byte_str):
+        # Each machine scans the buffer on its own, stepping over the plain
+        # text between escape and shift sequences.  The first machine to
+        # reach ITS_ME, by offset and then by order, is the one a byte by
+        # byte feed would have stopped at, so later machines only need to
+        # look at the bytes before it.
+        end = len(byte_str)
+        found = None
+        for coding_sm in self.coding_sm:
+            if not coding_sm or not coding_sm.active:
+                continue
+            coding_state, stop = coding_sm.scan(byte_str, end)
+            if coding_state == MachineState.ERROR:
+                coding_sm.active = False
+                self.active_sm_count -= 1
+            elif coding_state == MachineState.ITS_ME:
+                found = coding_sm
+                end = stop
+        if found is not None:
+            self._state = ProbingState.FOUND_IT
+            self._detected_charset = found.get_coding_state_machine()
+            self._detected_language = found.language
+        elif self.active_sm_count <= 0:
+            self._state = ProbingState.NOT_ME
+        return self.state
@@ -21,30 +21,24 @@ class EUCJPProber(MultiByteCharSetProber):
 
     @property
     def charset_name(self):
-        return self.context_analyzer.charset_name
+        return "EUC-JP"
 
     @property
     def language(self):
         return "Japanese"
 
-    def feed(self, byte_str):
-        for i in range(len(byte_str)):
-            coding_state = self.coding_sm.next_state(byte_str[i])
-            if coding_state == MachineState.ERROR:
-                self._state = ProbingState.NOT_ME
-                break
-            elif coding_state == MachineState.ITS_ME:
-                self._state = ProbingState.FOUND_IT
-                break
-            elif coding_state == MachineState.START:
-                char_len = self.coding_sm.get_current_charlen()
-                if i == 0:
-                    self._last_char[1] = byte_str[0]
-                    self.context_analyzer.feed(self._last_char, char_len)
-                    self.distribution_analyzer.feed(self._last_char, char_len)
-                else:
-                    self.context_analyzer.feed(byte_str[i-1:i+1], char_len)
-                    self.distribution_analyzer.feed(byte_str[i-1:i+1], char_len)
+    def feed_run(self, byte_str, run):
+        last_byte = self._last_char[0]
+        self.context_analyzer.feed_run(byte_str, run.char_ends, run.char_lens, last_byte)
+        distribution_feed = self.distribution_analyzer.feed_pair
+        for i, char_len in zip(run.char_ends, run.char_lens):
+            distribution_feed(byte_str[i - 1] if i else last_byte, byte_str[i], char_len)
+        if run.state == MachineState.ERROR:
+            self.logger.debug('%s %s prober hit error at byte %s',
+                              self.charset_name, self.language, run.stop)
+            self._state = ProbingState.NOT_ME
+        elif run.state == MachineState.ITS_ME:
+            self._state = ProbingState.FOUND_IT
 
         self._last_char[0] = byte_str[-1]
 
@@ -1,17 +1,46 @@
+import re
 from .charsetprober import CharSetProber
 from .enums import ProbingState
+# Final letter analysis for the logical-visual decision looks for evidence
+# that the text is either logical or visual Hebrew.  The following cases
+# are checked:
+# 1) A word longer than 1 letter, ending with a final letter.  This is an
+#    indication that the text is laid out "naturally" since the final letter
+#    really appears at the end.  +1 for logical score.
+# 2) A word longer than 1 letter, ending with a Non-Final letter.  In normal
+#    Hebrew, words ending with Kaf, Mem, Nun, Pe or Tsadi, should not end
+#    with the Non-Final form of that letter.  Exceptions to this rule are
+#    mentioned in HebrewProber.is_non_final.  This is an indication that the
+#    text is laid out backwards.  +1 for visual score.
+# 3) A word longer than 1 letter, starting with a final letter.  Final
+#    letters should not appear at the beginning of a word.  This is an
+#    indication that the text is laid out backwards.  +1 for visual score.
+# No checking for final letters in the middle of words is done since that
+# case is not an indication for either logical or visual text.
+#
+# All 7-bit characters are filtered out (replaced with spaces) first, so
+# words are runs of high bytes between single spaces.  Each pattern starts
+# with the letter it is about, so the regex engine can skip straight to
+# them, and looks behind and ahead of it without consuming anything, so
+# overlapping cases are all found.
+# Cases (1) and (2): the letter ending a word
+WORD_END_PATTERN = re.compile(b'[\xea\xed\xef\xf3\xf5\xeb\xee\xf0\xf4](?<=[^ ].)(?= )', re.DOTALL)
+# Case (3): a final letter starting a word
+WORD_START_PATTERN = re.compile(b'[\xea\xed\xef\xf3\xf5](?<= .)(?=[^ ])', re.DOTALL)
+NON_FINAL_LETTERS = b'\xeb\xee\xf0\xf4'
 
 class HebrewProber(CharSetProber):
-    FINAL_KAF = 234
-    NORMAL_KAF = 235
-    FINAL_MEM = 237
-    NORMAL_MEM = 238
-    FINAL_NUN = 239
-    NORMAL_NUN = 240
-    FINAL_PE = 243
-    NORMAL_PE = 244
-    FINAL_TSADI = 245
-    NORMAL_TSADI = 246
+    SPACE = 0x20
+    FINAL_KAF = 0xEA
+    NORMAL_KAF = 0xEB
+    FINAL_MEM = 0xED
+    NORMAL_MEM = 0xEE
+    FINAL_NUN = 0xEF
+    NORMAL_NUN = 0xF0
+    FINAL_PE = 0xF3
+    NORMAL_PE = 0xF4
+    FINAL_TSADI = 0xF5
+    NORMAL_TSADI = 0xF6
     MIN_FINAL_CHAR_DISTANCE = 5
     MIN_MODEL_DISTANCE = 0.01
     VISUAL_HEBREW_NAME = 'ISO-8859-8'
@@ -30,10 +59,12 @@ class HebrewProber(CharSetProber):
     def reset(self):
         self._final_char_logical_score = 0
         self._final_char_visual_score = 0
-        self._prev = ' '
-        self._before_prev = ' '
-        self._logical_prober = None
-        self._visual_prober = None
+        # The two last characters seen in the previous buffer, initialized
+        # to space in order to simulate a word delimiter at the beginning of
+        # the data
+        self._prev = self.SPACE
+        self._before_prev = self.SPACE
+        # These probers are owned by the group prober.
 
     def set_model_probers(self, logical_prober, visual_prober):
         self._logical_prober = logical_prober
@@ -41,91 +72,91 @@ class HebrewProber(CharSetProber):
 
     def is_final(self, c):
         return c in [self.FINAL_KAF, self.FINAL_MEM, self.FINAL_NUN,
-                    self.FINAL_PE, self.FINAL_TSADI]
+                     self.FINAL_PE, self.FINAL_TSADI]
 
     def is_non_final(self, c):
+        # The normal Tsadi is not a good Non-Final letter due to words like
+        # 'lechotet' (to chat) containing an apostrophe after the tsadi. This
+        # apostrophe is converted to a space in filter_high_byte_only causing
+        # the Non-Final tsadi to appear at an end of a word even though this
+        # is not the case in the original text.
+        # The letters Pe and Kaf rarely display a related behavior of not
+        # being a good Non-Final letter. Words like 'Pop', 'Winamp' and
+        # 'Mubarak' for example legally end with a Non-Final Pe or Kaf.
+        # However, the benefit of these letters as Non-Final letters
+        # outweighs the damage since these words are quite rare.
         return c in [self.NORMAL_KAF, self.NORMAL_MEM, self.NORMAL_NUN,
-                    self.NORMAL_PE, self.NORMAL_TSADI]
+                     self.NORMAL_PE]
 
     def feed(self, byte_str):
-        if self._state == ProbingState.NOT_ME:
-            return self._state
-
-        for c in byte_str:
-            if c >= 128:
-                # If we got a non-ascii character, check if it's a final or non-final letter
-                if self.is_final(c):
-                    # If the previous character was a non-final letter, this is logical
-                    if self._prev == ' ':
-                        self._final_char_logical_score += 0
-                        self._final_char_visual_score += 0
-                    elif self.is_non_final(self._prev):
-                        self._final_char_logical_score += 1
-                        self._final_char_visual_score -= 1
-                    else:
-                        self._final_char_logical_score += 0
-                        self._final_char_visual_score += 0
-                elif self.is_non_final(c):
-                    # If the previous character was a final letter, this is visual
-                    if self._prev == ' ':
-                        self._final_char_logical_score += 0
-                        self._final_char_visual_score += 0
-                    elif self.is_final(self._prev):
-                        self._final_char_logical_score -= 1
-                        self._final_char_visual_score += 1
-                    else:
-                        self._final_char_logical_score += 0
-                        self._final_char_visual_score += 0
-
-            self._before_prev = self._prev
-            self._prev = c
-
-        return self._state
-
-    def get_charset_name(self):
-        # If we have both probers and one is significantly more confident,
-        # use its charset name
-        finalsub = abs(self._final_char_logical_score - self._final_char_visual_score)
+        return self.feed_filtered(self.filter_high_byte_only(byte_str))
+
+    def feed_chunk(self, chunk):
+        return self.feed_filtered(chunk.filtered(self.filter_high_byte_only))
+
+    def feed_filtered(self, byte_str):
+        """
+        Update the final letter scores from ``byte_str``, which has already
+        been passed through ``filter_high_byte_only``.  The last two
+        characters of the previous buffer are put in front of it, so words
+        spanning buffers are scored exactly once.
+        """
+        if self.state == ProbingState.NOT_ME:
+            # Both model probers say it's not them. No reason to continue.
+            return ProbingState.NOT_ME
+        if not byte_str:
+            return ProbingState.DETECTING
+
+        window = bytes((self._before_prev, self._prev)) + byte_str
+        word_ends = b''.join(WORD_END_PATTERN.findall(window))
+        non_final_ends = len(word_ends) - len(word_ends.translate(None, NON_FINAL_LETTERS))
+        self._final_char_logical_score += len(word_ends) - non_final_ends
+        self._final_char_visual_score += non_final_ends + len(WORD_START_PATTERN.findall(window))
+        self._before_prev, self._prev = window[-2], window[-1]
+
+        # Forever detecting, till the end or until both model probers return
+        # ProbingState.NOT_ME (handled above)
+        return ProbingState.DETECTING
+
+    @property
+    def charset_name(self):
+        # Make the decision: is it Logical or Visual?
+        # If the final letter score distance is dominant enough, rely on it.
+        finalsub = self._final_char_logical_score - self._final_char_visual_score
         if finalsub >= self.MIN_FINAL_CHAR_DISTANCE:
-            if self._final_char_logical_score > self._final_char_visual_score:
-                return self.LOGICAL_HEBREW_NAME
+            return self.LOGICAL_HEBREW_NAME
+        if finalsub <= -self.MIN_FINAL_CHAR_DISTANCE:
             return self.VISUAL_HEBREW_NAME
 
-        # If we don't have a clear winner, use the one with higher confidence
-        if self._logical_prober and self._visual_prober:
-            logical_conf = self._logical_prober.get_confidence()
-            visual_conf = self._visual_prober.get_confidence()
-            diff = abs(logical_conf - visual_conf)
-            if diff >= self.MIN_MODEL_DISTANCE:
-                if logical_conf > visual_conf:
-                    return self.LOGICAL_HEBREW_NAME
-                return self.VISUAL_HEBREW_NAME
-
-        # Still no clear winner, return logical Hebrew by default
+        # It's not dominant enough, try to rely on the model scores instead.
+        modelsub = self._logical_prober.get_confidence() - self._visual_prober.get_confidence()
+        if modelsub > self.MIN_MODEL_DISTANCE:
+            return self.LOGICAL_HEBREW_NAME
+        if modelsub < -self.MIN_MODEL_DISTANCE:
+            return self.VISUAL_HEBREW_NAME
+
+        # Still no good, back to final letter distance, maybe it'll save the
+        # day.
+        if finalsub < 0:
+            return self.VISUAL_HEBREW_NAME
+
+        # (finalsub > 0 - Logical) or (don't know what to do) default to
+        # Logical.
         return self.LOGICAL_HEBREW_NAME
 
-    def get_state(self):
-        # Assume we're good unless both model probers say otherwise
-        if (self._logical_prober and self._visual_prober and
-            self._logical_prober.get_state() == ProbingState.NOT_ME and
-            self._visual_prober.get_state() == ProbingState.NOT_ME):
+    @property
+    def language(self):
+        return 'Hebrew'
+
+    @property
+    def state(self):
+        # Remain active as long as any of the model probers are active.
+        if (self._logical_prober.state == ProbingState.NOT_ME and
+                self._visual_prober.state == ProbingState.NOT_ME):
             return ProbingState.NOT_ME
         return ProbingState.DETECTING
 
     def get_confidence(self):
-        # If we have a clear winner from final letters analysis, use that
-        finalsub = abs(self._final_char_logical_score - self._final_char_visual_score)
-        if finalsub >= self.MIN_FINAL_CHAR_DISTANCE:
-            return 0.95
-
-        # If we have both probers and one is significantly more confident,
-        # use its confidence
-        if self._logical_prober and self._visual_prober:
-            logical_conf = self._logical_prober.get_confidence()
-            visual_conf = self._visual_prober.get_confidence()
-            diff = abs(logical_conf - visual_conf)
-            if diff >= self.MIN_MODEL_DISTANCE:
-                return max(logical_conf, visual_conf)
-
-        # No clear winner, return a moderate confidence
-        return 0.5
\ No newline at end of file
+        # The model probers report the confidence, under the name this
+        # prober decides on
+        return 0.0
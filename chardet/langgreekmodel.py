@@ -1,6 +1,138 @@
 from chardet.sbcharsetprober import SingleByteCharSetModel
-GREEK_LANG_MODEL = {60: {60: 2, 55: 1, 58: 2, 36: 1, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 1, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 0, 20: 0, 21: 0, 3: 0, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 0, 9: 0, 8: 0, 14: 0, 7: 0, 2: 0, 12: 0, 28: 0, 23: 0, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}, 55: {60: 0, 55: 2, 58: 2, 36: 1, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 0, 20: 0, 21: 0, 3: 0, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 0, 10: 0, 6: 1, 30: 0, 4: 0, 9: 0, 8: 0, 14: 0, 7: 0, 2: 0, 12: 1, 28: 0, 23: 0, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}, 58: {60: 2, 55: 1, 58: 1, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 2, 18: 0, 22: 0, 15: 0, 1: 0, 29: 0, 20: 0, 21: 0, 3: 0, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 1, 9: 0, 8: 0, 14: 0, 7: 0, 2: 0, 12: 0, 28: 0, 23: 0, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}, 36: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 0, 20: 0, 21: 0, 3: 0, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 0, 9: 0, 8: 0, 14: 0, 7: 0, 2: 0, 12: 0, 28: 0, 23: 0, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}, 61: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 0, 20: 1, 21: 2, 3: 0, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 2, 10: 0, 6: 0, 30: 0, 4: 0, 9: 1, 8: 2, 14: 0, 7: 0, 2: 0, 12: 0, 28: 0, 23: 0, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}, 46: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 2, 20: 2, 21: 0, 3: 0, 32: 0, 13: 0, 25: 0, 5: 0, 11: 2, 16: 2, 10: 0, 6: 3, 30: 2, 4: 0, 9: 2, 8: 2, 14: 0, 7: 1, 2: 2, 12: 0, 28: 2, 23: 3, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}, 54: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 0, 20: 0, 21: 0, 3: 0, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 2, 10: 2, 6: 2, 30: 0, 4: 0, 9: 2, 8: 0, 14: 0, 7: 2, 2: 3, 12: 0, 28: 0, 23: 2, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}, 31: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 2, 43: 2, 41: 1, 34: 0, 40: 0, 52: 2, 47: 2, 44: 2, 53: 2, 38: 2, 49: 2, 59: 1, 39: 0, 35: 2, 48: 2, 37: 2, 33: 2, 45: 2, 56: 2, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 0, 20: 2, 21: 0, 3: 0, 32: 0, 13: 0, 25: 1, 5: 0, 11: 2, 16: 3, 10: 2, 6: 3, 30: 2, 4: 0, 9: 3, 8: 3, 14: 2, 7: 2, 2: 0, 12: 3, 28: 2, 23: 0, 42: 0, 24: 0, 19: 0, 26: 2, 27: 0}, 51: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 2, 51: 0, 43: 0, 41: 0, 34: 1, 40: 1, 52: 0, 47: 1, 44: 0, 53: 1, 38: 0, 49: 0, 59: 0, 39: 2, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 2, 18: 2, 22: 2, 15: 0, 1: 2, 29: 0, 20: 0, 21: 0, 3: 2, 32: 0, 13: 0, 25: 0, 5: 2, 11: 0, 16: 2, 10: 0, 6: 0, 30: 0, 4: 2, 9: 0, 8: 2, 14: 0, 7: 0, 2: 0, 12: 0, 28: 0, 23: 0, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}, 43: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 1, 51: 0, 43: 2, 41: 0, 34: 2, 40: 1, 52: 0, 47: 2, 44: 1, 53: 1, 38: 0, 49: 0, 59: 0, 39: 1, 35: 0, 48: 2, 37: 0, 33: 0, 45: 2, 56: 0, 50: 1, 57: 2, 17: 0, 18: 0, 22: 0, 15: 2, 1: 2, 29: 0, 20: 0, 21: 0, 3: 2, 32: 0, 13: 0, 25: 0, 5: 3, 11: 0, 16: 2, 10: 0, 6: 2, 30: 0, 4: 0, 9: 0, 8: 2, 14: 0, 7: 0, 2: 0, 12: 0, 28: 0, 23: 0, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}, 41: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 2, 40: 2, 52: 0, 47: 2, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 2, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 2, 17: 0, 18: 0, 22: 2, 15: 2, 1: 0, 29: 0, 20: 0, 21: 0, 3: 3, 32: 0, 13: 2, 25: 0, 5: 3, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 2, 9: 0, 8: 2, 14: 0, 7: 0, 2: 0, 12: 2, 28: 0, 23: 0, 42: 0, 24: 2, 19: 1, 26: 2, 27: 2}, 34: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 2, 51: 0, 43: 2, 41: 2, 34: 0, 40: 0, 52: 0, 47: 2, 44: 2, 53: 2, 38: 2, 49: 2, 59: 1, 39: 0, 35: 2, 48: 2, 37: 2, 33: 2, 45: 2, 56: 0, 50: 2, 57: 2, 17: 3, 18: 0, 22: 0, 15: 3, 1: 0, 29: 0, 20: 3, 21: 2, 3: 1, 32: 0, 13: 0, 25: 1, 5: 2, 11: 3, 16: 3, 10: 2, 6: 3, 30: 2, 4: 0, 9: 3, 8: 2, 14: 0, 7: 2, 2: 2, 12: 2, 28: 2, 23: 0, 42: 0, 24: 0, 19: 0, 26: 1, 27: 0}, 40: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 1, 41: 0, 34: 0, 40: 0, 52: 2, 47: 0, 44: 2, 53: 0, 38: 2, 49: 2, 59: 0, 39: 0, 35: 2, 48: 2, 37: 2, 33: 2, 45: 1, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 0, 20: 0, 21: 0, 3: 0, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 2, 10: 0, 6: 1, 30: 0, 4: 0, 9: 0, 8: 0, 14: 0, 7: 0, 2: 0, 12: 0, 28: 0, 23: 1, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}, 52: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 2, 51: 0, 43: 0, 41: 0, 34: 2, 40: 2, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 2, 35: 0, 48: 1, 37: 0, 33: 0, 45: 1, 56: 0, 50: 0, 57: 0, 17: 0, 18: 2, 22: 0, 15: 0, 1: 3, 29: 0, 20: 0, 21: 0, 3: 2, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 0, 9: 0, 8: 0, 14: 0, 7: 0, 2: 0, 12: 2, 28: 0, 23: 0, 42: 0, 24: 0, 19: 0, 26: 2, 27: 0}, 47: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 2, 51: 1, 43: 1, 41: 2, 34: 2, 40: 2, 52: 0, 47: 0, 44: 2, 53: 2, 38: 2, 49: 2, 59: 0, 39: 2, 35: 0, 48: 2, 37: 2, 33: 2, 45: 0, 56: 2, 50: 0, 57: 2, 17: 0, 18: 0, 22: 0, 15: 0, 1: 2, 29: 0, 20: 0, 21: 2, 3: 0, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 0, 10: 0, 6: 1, 30: 0, 4: 2, 9: 0, 8: 0, 14: 0, 7: 2, 2: 1, 12: 0, 28: 0, 23: 0, 42: 0, 24: 1, 19: 0, 26: 0, 27: 0}, 44: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 2, 51: 0, 43: 0, 41: 1, 34: 2, 40: 2, 52: 0, 47: 0, 44: 0, 53: 0, 38: 1, 49: 0, 59: 0, 39: 2, 35: 0, 48: 2, 37: 0, 33: 1, 45: 2, 56: 0, 50: 0, 57: 1, 17: 3, 18: 0, 22: 0, 15: 0, 1: 3, 29: 0, 20: 0, 21: 0, 3: 2, 32: 0, 13: 0, 25: 0, 5: 2, 11: 0, 16: 2, 10: 0, 6: 0, 30: 0, 4: 2, 9: 0, 8: 2, 14: 0, 7: 0, 2: 0, 12: 2, 28: 0, 23: 0, 42: 0, 24: 0, 19: 2, 26: 2, 27: 2}, 53: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 2, 51: 0, 43: 0, 41: 0, 34: 2, 40: 2, 52: 0, 47: 2, 44: 0, 53: 2, 38: 0, 49: 0, 59: 0, 39: 2, 35: 0, 48: 0, 37: 2, 33: 0, 45: 2, 56: 0, 50: 0, 57: 2, 17: 2, 18: 2, 22: 0, 15: 2, 1: 2, 29: 0, 20: 0, 21: 0, 3: 2, 32: 0, 13: 0, 25: 0, 5: 1, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 2, 9: 0, 8: 0, 14: 0, 7: 0, 2: 0, 12: 2, 28: 0, 23: 0, 42: 0, 24: 0, 19: 2, 26: 2, 27: 0}, 38: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 2, 51: 2, 43: 0, 41: 0, 34: 2, 40: 2, 52: 0, 47: 2, 44: 0, 53: 0, 38: 2, 49: 0, 59: 0, 39: 2, 35: 2, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 2, 18: 2, 22: 2, 15: 2, 1: 2, 29: 0, 20: 0, 21: 0, 3: 3, 32: 0, 13: 2, 25: 0, 5: 3, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 2, 9: 3, 8: 0, 14: 0, 7: 0, 2: 0, 12: 2, 28: 0, 23: 0, 42: 0, 24: 0, 19: 2, 26: 0, 27: 0}, 49: {60: 2, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 2, 51: 0, 43: 0, 41: 0, 34: 2, 40: 2, 52: 0, 47: 2, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 2, 35: 0, 48: 0, 37: 0, 33: 2, 45: 0, 56: 0, 50: 0, 57: 2, 17: 0, 18: 2, 22: 0, 15: 2, 1: 2, 29: 0, 20: 0, 21: 0, 3: 1, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 2, 9: 0, 8: 0, 14: 0, 7: 0, 2: 0, 12: 0, 28: 0, 23: 0, 42: 0, 24: 1, 19: 2, 26: 0, 27: 0}, 59: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 1, 40: 1, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 1, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 2, 22: 0, 15: 0, 1: 2, 29: 0, 20: 0, 21: 0, 3: 2, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 0, 9: 0, 8: 0, 14: 0, 7: 0, 2: 0, 12: 0, 28: 0, 23: 0, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}, 39: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 1, 43: 2, 41: 2, 34: 2, 40: 1, 52: 2, 47: 2, 44: 2, 53: 2, 38: 2, 49: 2, 59: 0, 39: 0, 35: 2, 48: 2, 37: 2, 33: 2, 45: 2, 56: 2, 50: 2, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 0, 20: 0, 21: 2, 3: 0, 32: 0, 13: 0, 25: 0, 5: 3, 11: 2, 16: 2, 10: 2, 6: 2, 30: 0, 4: 0, 9: 2, 8: 2, 14: 0, 7: 0, 2: 2, 12: 2, 28: 1, 23: 1, 42: 0, 24: 0, 19: 0, 26: 2, 27: 0}, 35: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 2, 51: 0, 43: 0, 41: 0, 34: 2, 40: 0, 52: 0, 47: 2, 44: 0, 53: 2, 38: 1, 49: 0, 59: 0, 39: 2, 35: 0, 48: 2, 37: 0, 33: 1, 45: 0, 56: 0, 50: 1, 57: 2, 17: 2, 18: 1, 22: 1, 15: 2, 1: 3, 29: 0, 20: 0, 21: 0, 3: 3, 32: 0, 13: 2, 25: 0, 5: 2, 11: 0, 16: 2, 10: 0, 6: 2, 30: 0, 4: 3, 9: 0, 8: 3, 14: 0, 7: 0, 2: 0, 12: 2, 28: 0, 23: 2, 42: 0, 24: 2, 19: 2, 26: 0, 27: 3}, 48: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 2, 51: 0, 43: 1, 41: 1, 34: 2, 40: 2, 52: 0, 47: 2, 44: 0, 53: 0, 38: 0, 49: 2, 59: 0, 39: 2, 35: 0, 48: 2, 37: 0, 33: 1, 45: 1, 56: 0, 50: 1, 57: 1, 17: 0, 18: 0, 22: 0, 15: 2, 1: 0, 29: 0, 20: 0, 21: 0, 3: 0, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 1, 9: 0, 8: 0, 14: 0, 7: 0, 2: 0, 12: 3, 28: 0, 23: 0, 42: 0, 24: 2, 19: 0, 26: 2, 27: 0}, 37: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 2, 51: 0, 43: 0, 41: 1, 34: 2, 40: 2, 52: 0, 47: 2, 44: 2, 53: 0, 38: 2, 49: 0, 59: 0, 39: 2, 35: 0, 48: 0, 37: 2, 33: 2, 45: 2, 56: 0, 50: 2, 57: 2, 17: 0, 18: 0, 22: 2, 15: 2, 1: 2, 29: 2, 20: 0, 21: 0, 3: 3, 32: 0, 13: 3, 25: 0, 5: 2, 11: 2, 16: 0, 10: 0, 6: 0, 30: 0, 4: 2, 9: 2, 8: 0, 14: 0, 7: 0, 2: 3, 12: 3, 28: 0, 23: 2, 42: 0, 24: 2, 19: 0, 26: 2, 27: 2}, 33: {60: 0, 55: 1, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 2, 51: 0, 43: 0, 41: 0, 34: 2, 40: 2, 52: 0, 47: 2, 44: 2, 53: 0, 38: 0, 49: 0, 59: 0, 39: 2, 35: 0, 48: 2, 37: 0, 33: 1, 45: 1, 56: 0, 50: 0, 57: 2, 17: 2, 18: 2, 22: 0, 15: 2, 1: 3, 29: 0, 20: 0, 21: 0, 3: 2, 32: 0, 13: 2, 25: 0, 5: 2, 11: 0, 16: 0, 10: 2, 6: 0, 30: 0, 4: 3, 9: 0, 8: 2, 14: 0, 7: 2, 2: 0, 12: 2, 28: 0, 23: 0, 42: 0, 24: 0, 19: 2, 26: 2, 27: 3}, 45: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 2, 41: 0, 34: 1, 40: 2, 52: 2, 47: 0, 44: 0, 53: 1, 38: 2, 49: 2, 59: 0, 39: 0, 35: 2, 48: 1, 37: 2, 33: 2, 45: 0, 56: 0, 50: 1, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 0, 20: 0, 21: 0, 3: 0, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 2, 10: 0, 6: 0, 30: 0, 4: 0, 9: 3, 8: 0, 14: 0, 7: 0, 2: 0, 12: 0, 28: 0, 23: 0, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}, 56: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 1, 51: 0, 43: 0, 41: 0, 34: 0, 40: 1, 52: 0, 47: 2, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 2, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 2, 29: 0, 20: 0, 21: 0, 3: 2, 32: 0, 13: 0, 25: 0, 5: 2, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 2, 9: 0, 8: 0, 14: 0, 7: 0, 2: 2, 12: 2, 28: 0, 23: 0, 42: 0, 24: 0, 19: 0, 26: 1, 27: 1}, 50: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 1, 51: 0, 43: 0, 41: 0, 34: 2, 40: 2, 52: 0, 47: 2, 44: 0, 53: 0, 38: 0, 49: 1, 59: 0, 39: 1, 35: 0, 48: 2, 37: 0, 33: 0, 45: 0, 56: 0, 50: 1, 57: 1, 17: 2, 18: 0, 22: 0, 15: 0, 1: 2, 29: 0, 20: 0, 21: 0, 3: 2, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 2, 9: 0, 8: 3, 14: 0, 7: 0, 2: 2, 12: 0, 28: 0, 23: 0, 42: 0, 24: 2, 19: 0, 26: 0, 27: 0}, 57: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 1, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 1, 38: 0, 49: 2, 59: 0, 39: 0, 35: 0, 48: 2, 37: 2, 33: 2, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 0, 20: 0, 21: 0, 3: 0, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 0, 9: 0, 8: 2, 14: 2, 7: 2, 2: 0, 12: 0, 28: 0, 23: 1, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}, 17: {60: 0, 55: 0, 58: 0, 36: 2, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 3, 20: 3, 21: 3, 3: 3, 32: 3, 13: 0, 25: 3, 5: 2, 11: 3, 16: 3, 10: 3, 6: 3, 30: 3, 4: 0, 9: 3, 8: 3, 14: 3, 7: 3, 2: 3, 12: 0, 28: 3, 23: 3, 42: 3, 24: 2, 19: 0, 26: 0, 27: 0}, 18: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 3, 29: 2, 20: 3, 21: 2, 3: 3, 32: 2, 13: 0, 25: 3, 5: 0, 11: 3, 16: 3, 10: 3, 6: 3, 30: 3, 4: 3, 9: 3, 8: 3, 14: 3, 7: 3, 2: 3, 12: 0, 28: 3, 23: 3, 42: 3, 24: 2, 19: 0, 26: 0, 27: 0}, 22: {60: 0, 55: 0, 58: 0, 36: 1, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 0, 20: 3, 21: 3, 3: 0, 32: 0, 13: 0, 25: 3, 5: 0, 11: 3, 16: 2, 10: 3, 6: 3, 30: 2, 4: 0, 9: 3, 8: 3, 14: 3, 7: 3, 2: 3, 12: 0, 28: 2, 23: 3, 42: 2, 24: 0, 19: 0, 26: 0, 27: 0}, 15: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 3, 29: 2, 20: 3, 21: 3, 3: 3, 32: 3, 13: 3, 25: 3, 5: 0, 11: 3, 16: 3, 10: 3, 6: 3, 30: 3, 4: 3, 9: 3, 8: 3, 14: 3, 7: 3, 2: 3, 12: 0, 28: 1, 23: 3, 42: 2, 24: 3, 19: 0, 26: 0, 27: 0}, 1: {60: 0, 55: 0, 58: 0, 36: 2, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 2, 22: 0, 15: 3, 1: 0, 29: 3, 20: 3, 21: 3, 3: 2, 32: 3, 13: 1, 25: 3, 5: 3, 11: 3, 16: 3, 10: 3, 6: 3, 30: 3, 4: 2, 9: 3, 8: 3, 14: 3, 7: 3, 2: 3, 12: 3, 28: 3, 23: 3, 42: 2, 24: 0, 19: 2, 26: 2, 27: 0}, 29: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 3, 18: 2, 22: 3, 15: 2, 1: 3, 29: 0, 20: 2, 21: 2, 3: 3, 32: 0, 13: 2, 25: 0, 5: 3, 11: 0, 16: 3, 10: 0, 6: 0, 30: 0, 4: 3, 9: 0, 8: 3, 14: 0, 7: 0, 2: 0, 12: 0, 28: 0, 23: 0, 42: 0, 24: 2, 19: 2, 26: 2, 27: 2}, 20: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 3, 18: 3, 22: 3, 15: 3, 1: 3, 29: 0, 20: 3, 21: 0, 3: 3, 32: 0, 13: 3, 25: 0, 5: 3, 11: 3, 16: 3, 10: 3, 6: 3, 30: 3, 4: 3, 9: 0, 8: 3, 14: 0, 7: 0, 2: 0, 12: 2, 28: 0, 23: 3, 42: 0, 24: 3, 19: 3, 26: 2, 27: 3}, 21: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 2, 18: 3, 22: 3, 15: 3, 1: 3, 29: 0, 20: 0, 21: 0, 3: 3, 32: 0, 13: 3, 25: 0, 5: 3, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 3, 9: 0, 8: 3, 14: 0, 7: 0, 2: 0, 12: 3, 28: 0, 23: 0, 42: 0, 24: 3, 19: 3, 26: 3, 27: 3}, 3: {60: 0, 55: 0, 58: 0, 36: 2, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 3, 18: 0, 22: 0, 15: 3, 1: 2, 29: 3, 20: 3, 21: 3, 3: 2, 32: 2, 13: 0, 25: 3, 5: 3, 11: 3, 16: 3, 10: 3, 6: 3, 30: 3, 4: 2, 9: 3, 8: 3, 14: 3, 7: 3, 2: 3, 12: 3, 28: 3, 23: 3, 42: 2, 24: 3, 19: 2, 26: 3, 27: 2}, 32: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 2, 18: 2, 22: 2, 15: 2, 1: 2, 29: 0, 20: 0, 21: 0, 3: 3, 32: 0, 13: 3, 25: 0, 5: 2, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 3, 9: 0, 8: 0, 14: 0, 7: 0, 2: 0, 12: 1, 28: 0, 23: 0, 42: 0, 24: 3, 19: 2, 26: 0, 27: 2}, 13: {60: 0, 55: 0, 58: 0, 36: 2, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 0, 20: 3, 21: 2, 3: 0, 32: 0, 13: 0, 25: 3, 5: 0, 11: 3, 16: 3, 10: 3, 6: 3, 30: 2, 4: 0, 9: 2, 8: 3, 14: 3, 7: 3, 2: 3, 12: 0, 28: 2, 23: 3, 42: 2, 24: 0, 19: 0, 26: 0, 27: 0}, 25: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 2, 18: 3, 22: 3, 15: 2, 1: 3, 29: 0, 20: 0, 21: 0, 3: 3, 32: 0, 13: 3, 25: 0, 5: 3, 11: 0, 16: 1, 10: 3, 6: 2, 30: 0, 4: 3, 9: 0, 8: 3, 14: 0, 7: 0, 2: 0, 12: 3, 28: 0, 23: 0, 42: 0, 24: 3, 19: 3, 26: 3, 27: 3}, 5: {60: 0, 55: 1, 58: 0, 36: 2, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 1, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 3, 18: 3, 22: 3, 15: 0, 1: 3, 29: 3, 20: 3, 21: 3, 3: 3, 32: 2, 13: 3, 25: 3, 5: 0, 11: 3, 16: 3, 10: 3, 6: 3, 30: 3, 4: 3, 9: 3, 8: 3, 14: 3, 7: 3, 2: 3, 12: 0, 28: 2, 23: 3, 42: 2, 24: 3, 19: 3, 26: 0, 27: 3}, 11: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 3, 18: 3, 22: 3, 15: 3, 1: 3, 29: 0, 20: 0, 21: 3, 3: 3, 32: 0, 13: 3, 25: 2, 5: 3, 11: 3, 16: 3, 10: 3, 6: 2, 30: 0, 4: 3, 9: 2, 8: 3, 14: 0, 7: 0, 2: 3, 12: 3, 28: 2, 23: 2, 42: 0, 24: 3, 19: 3, 26: 3, 27: 3}, 16: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 3, 18: 3, 22: 3, 15: 3, 1: 3, 29: 1, 20: 2, 21: 1, 3: 3, 32: 0, 13: 3, 25: 2, 5: 3, 11: 2, 16: 3, 10: 2, 6: 2, 30: 0, 4: 3, 9: 3, 8: 0, 14: 0, 7: 0, 2: 3, 12: 3, 28: 2, 23: 0, 42: 0, 24: 3, 19: 3, 26: 3, 27: 3}, 10: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 1, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 3, 18: 3, 22: 3, 15: 3, 1: 3, 29: 3, 20: 0, 21: 0, 3: 3, 32: 0, 13: 3, 25: 0, 5: 3, 11: 0, 16: 0, 10: 3, 6: 3, 30: 0, 4: 3, 9: 3, 8: 0, 14: 0, 7: 0, 2: 0, 12: 2, 28: 3, 23: 0, 42: 2, 24: 3, 19: 3, 26: 2, 27: 2}, 6: {60: 0, 55: 0, 58: 0, 36: 2, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 3, 18: 3, 22: 3, 15: 3, 1: 3, 29: 0, 20: 0, 21: 3, 3: 3, 32: 2, 13: 3, 25: 3, 5: 3, 11: 0, 16: 1, 10: 0, 6: 2, 30: 0, 4: 3, 9: 0, 8: 0, 14: 0, 7: 3, 2: 3, 12: 3, 28: 0, 23: 0, 42: 0, 24: 3, 19: 3, 26: 3, 27: 3}, 30: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 2, 18: 3, 22: 3, 15: 2, 1: 3, 29: 0, 20: 0, 21: 0, 3: 3, 32: 0, 13: 3, 25: 0, 5: 2, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 3, 9: 0, 8: 0, 14: 0, 7: 0, 2: 3, 12: 2, 28: 0, 23: 0, 42: 0, 24: 3, 19: 2, 26: 3, 27: 1}, 4: {60: 0, 55: 0, 58: 0, 36: 2, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 2, 22: 3, 15: 3, 1: 2, 29: 3, 20: 3, 21: 3, 3: 3, 32: 0, 13: 3, 25: 3, 5: 3, 11: 3, 16: 3, 10: 3, 6: 3, 30: 2, 4: 2, 9: 3, 8: 3, 14: 3, 7: 3, 2: 3, 12: 3, 28: 3, 23: 3, 42: 2, 24: 2, 19: 1, 26: 3, 27: 2}, 9: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 3, 18: 3, 22: 3, 15: 3, 1: 3, 29: 0, 20: 0, 21: 0, 3: 3, 32: 0, 13: 3, 25: 0, 5: 3, 11: 0, 16: 3, 10: 0, 6: 2, 30: 0, 4: 3, 9: 0, 8: 3, 14: 2, 7: 0, 2: 3, 12: 3, 28: 0, 23: 2, 42: 0, 24: 3, 19: 3, 26: 2, 27: 3}, 8: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 3, 18: 3, 22: 3, 15: 3, 1: 3, 29: 2, 20: 3, 21: 2, 3: 3, 32: 0, 13: 3, 25: 3, 5: 3, 11: 3, 16: 1, 10: 3, 6: 3, 30: 2, 4: 3, 9: 2, 8: 2, 14: 0, 7: 2, 2: 3, 12: 3, 28: 3, 23: 3, 42: 0, 24: 3, 19: 3, 26: 3, 27: 3}, 14: {60: 0, 55: 0, 58: 0, 36: 2, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 0, 20: 0, 21: 0, 3: 0, 32: 0, 13: 0, 25: 0, 5: 0, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 0, 9: 0, 8: 0, 14: 0, 7: 0, 2: 0, 12: 0, 28: 0, 23: 0, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}, 7: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 2, 18: 2, 22: 3, 15: 3, 1: 3, 29: 3, 20: 0, 21: 2, 3: 3, 32: 0, 13: 3, 25: 3, 5: 3, 11: 3, 16: 2, 10: 3, 6: 0, 30: 0, 4: 3, 9: 3, 8: 0, 14: 0, 7: 3, 2: 3, 12: 3, 28: 3, 23: 3, 42: 0, 24: 3, 19: 3, 26: 3, 27: 2}, 2: {60: 0, 55: 2, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 3, 18: 3, 22: 3, 15: 3, 1: 3, 29: 0, 20: 0, 21: 0, 3: 3, 32: 2, 13: 3, 25: 0, 5: 3, 11: 2, 16: 2, 10: 3, 6: 0, 30: 0, 4: 3, 9: 0, 8: 3, 14: 0, 7: 3, 2: 3, 12: 3, 28: 2, 23: 0, 42: 0, 24: 3, 19: 3, 26: 3, 27: 3}, 12: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 2, 18: 2, 22: 3, 15: 2, 1: 3, 29: 2, 20: 3, 21: 2, 3: 2, 32: 2, 13: 2, 25: 3, 5: 2, 11: 3, 16: 3, 10: 3, 6: 3, 30: 3, 4: 3, 9: 3, 8: 3, 14: 3, 7: 3, 2: 3, 12: 0, 28: 2, 23: 3, 42: 2, 24: 2, 19: 2, 26: 0, 27: 2}, 28: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 3, 18: 3, 22: 3, 15: 3, 1: 3, 29: 0, 20: 0, 21: 0, 3: 3, 32: 0, 13: 2, 25: 2, 5: 3, 11: 0, 16: 2, 10: 0, 6: 1, 30: 0, 4: 3, 9: 0, 8: 3, 14: 0, 7: 0, 2: 3, 12: 3, 28: 1, 23: 0, 42: 0, 24: 3, 19: 3, 26: 2, 27: 2}, 23: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 3, 18: 2, 22: 3, 15: 3, 1: 3, 29: 0, 20: 0, 21: 0, 3: 3, 32: 0, 13: 2, 25: 2, 5: 3, 11: 0, 16: 2, 10: 2, 6: 3, 30: 0, 4: 3, 9: 0, 8: 3, 14: 0, 7: 0, 2: 3, 12: 3, 28: 0, 23: 2, 42: 0, 24: 3, 19: 3, 26: 3, 27: 3}, 42: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 2, 18: 2, 22: 1, 15: 2, 1: 2, 29: 0, 20: 0, 21: 0, 3: 3, 32: 0, 13: 3, 25: 0, 5: 2, 11: 0, 16: 0, 10: 0, 6: 0, 30: 0, 4: 2, 9: 0, 8: 0, 14: 0, 7: 0, 2: 2, 12: 1, 28: 0, 23: 0, 42: 0, 24: 2, 19: 0, 26: 0, 27: 0}, 24: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 1, 18: 0, 22: 2, 15: 0, 1: 0, 29: 2, 20: 3, 21: 2, 3: 0, 32: 0, 13: 0, 25: 3, 5: 2, 11: 0, 16: 2, 10: 3, 6: 3, 30: 0, 4: 0, 9: 3, 8: 3, 14: 3, 7: 3, 2: 3, 12: 0, 28: 2, 23: 2, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}, 19: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 3, 20: 3, 21: 3, 3: 1, 32: 2, 13: 2, 25: 2, 5: 2, 11: 3, 16: 3, 10: 3, 6: 3, 30: 1, 4: 2, 9: 3, 8: 3, 14: 3, 7: 3, 2: 3, 12: 0, 28: 2, 23: 3, 42: 2, 24: 0, 19: 0, 26: 0, 27: 0}, 26: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 2, 29: 2, 20: 2, 21: 1, 3: 3, 32: 0, 13: 2, 25: 3, 5: 0, 11: 3, 16: 3, 10: 3, 6: 3, 30: 2, 4: 3, 9: 3, 8: 3, 14: 3, 7: 3, 2: 3, 12: 0, 28: 2, 23: 2, 42: 2, 24: 2, 19: 0, 26: 0, 27: 0}, 27: {60: 0, 55: 0, 58: 0, 36: 0, 61: 0, 46: 0, 54: 0, 31: 0, 51: 0, 43: 0, 41: 0, 34: 0, 40: 0, 52: 0, 47: 0, 44: 0, 53: 0, 38: 0, 49: 0, 59: 0, 39: 0, 35: 0, 48: 0, 37: 0, 33: 0, 45: 0, 56: 0, 50: 0, 57: 0, 17: 0, 18: 0, 22: 0, 15: 0, 1: 0, 29: 1, 20: 0, 21: 3, 3: 0, 32: 0, 13: 1, 25: 2, 5: 2, 11: 0, 16: 2, 10: 3, 6: 3, 30: 1, 4: 0, 9: 2, 8: 3, 14: 3, 7: 3, 2: 3, 12: 0, 28: 1, 23: 1, 42: 0, 24: 0, 19: 0, 26: 0, 27: 0}}
-WINDOWS_1253_GREEK_CHAR_TO_ORDER = {0: 255, 1: 255, 2: 255, 3: 255, 4: 255, 5: 255, 6: 255, 7: 255, 8: 255, 9: 255, 10: 254, 11: 255, 12: 255, 13: 254, 14: 255, 15: 255, 16: 255, 17: 255, 18: 255, 19: 255, 20: 255, 21: 255, 22: 255, 23: 255, 24: 255, 25: 255, 26: 255, 27: 255, 28: 255, 29: 255, 30: 255, 31: 255, 32: 253, 33: 253, 34: 253, 35: 253, 36: 253, 37: 253, 38: 253, 39: 253, 40: 253, 41: 253, 42: 253, 43: 253, 44: 253, 45: 253, 46: 253, 47: 253, 48: 252, 49: 252, 50: 252, 51: 252, 52: 252, 53: 252, 54: 252, 55: 252, 56: 252, 57: 252, 58: 253, 59: 253, 60: 253, 61: 253, 62: 253, 63: 253, 64: 253, 65: 82, 66: 100, 67: 104, 68: 94, 69: 98, 70: 101, 71: 116, 72: 102, 73: 111, 74: 187, 75: 117, 76: 92, 77: 88, 78: 113, 79: 85, 80: 79, 81: 118, 82: 105, 83: 83, 84: 67, 85: 114, 86: 119, 87: 95, 88: 99, 89: 109, 90: 188, 91: 253, 92: 253, 93: 253, 94: 253, 95: 253, 96: 253, 97: 72, 98: 70, 99: 80, 100: 81, 101: 60, 102: 96, 103: 93, 104: 89, 105: 68, 106: 120, 107: 97, 108: 77, 109: 86, 110: 69, 111: 55, 112: 78, 113: 115, 114: 65, 115: 66, 116: 58, 117: 76, 118: 106, 119: 103, 120: 87, 121: 107, 122: 112, 123: 253, 124: 253, 125: 253, 126: 253, 127: 253, 128: 255, 129: 255, 130: 255, 131: 255, 132: 255, 133: 255, 134: 255, 135: 255, 136: 255, 137: 255, 138: 255, 139: 255, 140: 255, 141: 255, 142: 255, 143: 255, 144: 255, 145: 255, 146: 255, 147: 255, 148: 255, 149: 255, 150: 255, 151: 255, 152: 255, 153: 255, 154: 255, 155: 255, 156: 255, 157: 255, 158: 255, 159: 255, 160: 253, 161: 233, 162: 61, 163: 253, 164: 253, 165: 253, 166: 253, 167: 253, 168: 253, 169: 253, 170: 253, 171: 253, 172: 253, 173: 74, 174: 253, 175: 253, 176: 253, 177: 253, 178: 253, 179: 253, 180: 247, 181: 253, 182: 253, 183: 36, 184: 46, 185: 71, 186: 73, 187: 253, 188: 54, 189: 253, 190: 108, 191: 123, 192: 110, 193: 31, 194: 51, 195: 43, 196: 41, 197: 34, 198: 91, 199: 40, 200: 52, 201: 47, 202: 44, 203: 53, 204: 38, 205: 49, 206: 59, 207: 39, 208: 35, 209: 48, 210: 250, 211: 37, 212: 33, 213: 45, 214: 56, 215: 50, 216: 84, 217: 57, 218: 120, 219: 121, 220: 17, 221: 18, 222: 22, 223: 15, 224: 124, 225: 1, 226: 29, 227: 20, 228: 21, 229: 3, 230: 32, 231: 13, 232: 25, 233: 5, 234: 11, 235: 16, 236: 10, 237: 6, 238: 30, 239: 4, 240: 9, 241: 8, 242: 14, 243: 7, 244: 2, 245: 12, 246: 28, 247: 23, 248: 42, 249: 24, 250: 64, 251: 75, 252: 19, 253: 26, 254: 27, 255: 253}
-WINDOWS_1253_GREEK_MODEL = SingleByteCharSetModel(charset_name='windows-1253', language='Greek', char_to_order_map=WINDOWS_1253_GREEK_CHAR_TO_ORDER, language_model=GREEK_LANG_MODEL, typical_positive_ratio=0.982851, keep_ascii_letters=False, alphabet='ΆΈΉΊΌΎΏΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩάέήίαβγδεζηθικλμνξοπρςστυφχψωόύώ')
-ISO_8859_7_GREEK_CHAR_TO_ORDER = {0: 255, 1: 255, 2: 255, 3: 255, 4: 255, 5: 255, 6: 255, 7: 255, 8: 255, 9: 255, 10: 254, 11: 255, 12: 255, 13: 254, 14: 255, 15: 255, 16: 255, 17: 255, 18: 255, 19: 255, 20: 255, 21: 255, 22: 255, 23: 255, 24: 255, 25: 255, 26: 255, 27: 255, 28: 255, 29: 255, 30: 255, 31: 255, 32: 253, 33: 253, 34: 253, 35: 253, 36: 253, 37: 253, 38: 253, 39: 253, 40: 253, 41: 253, 42: 253, 43: 253, 44: 253, 45: 253, 46: 253, 47: 253, 48: 252, 49: 252, 50: 252, 51: 252, 52: 252, 53: 252, 54: 252, 55: 252, 56: 252, 57: 252, 58: 253, 59: 253, 60: 253, 61: 253, 62: 253, 63: 253, 64: 253, 65: 82, 66: 100, 67: 104, 68: 94, 69: 98, 70: 101, 71: 116, 72: 102, 73: 111, 74: 187, 75: 117, 76: 92, 77: 88, 78: 113, 79: 85, 80: 79, 81: 118, 82: 105, 83: 83, 84: 67, 85: 114, 86: 119, 87: 95, 88: 99, 89: 109, 90: 188, 91: 253, 92: 253, 93: 253, 94: 253, 95: 253, 96: 253, 97: 72, 98: 70, 99: 80, 100: 81, 101: 60, 102: 96, 103: 93, 104: 89, 105: 68, 106: 120, 107: 97, 108: 77, 109: 86, 110: 69, 111: 55, 112: 78, 113: 115, 114: 65, 115: 66, 116: 58, 117: 76, 118: 106, 119: 103, 120: 87, 121: 107, 122: 112, 123: 253, 124: 253, 125: 253, 126: 253, 127: 253, 128: 255, 129: 255, 130: 255, 131: 255, 132: 255, 133: 255, 134: 255, 135: 255, 136: 255, 137: 255, 138: 255, 139: 255, 140: 255, 141: 255, 142: 255, 143: 255, 144: 255, 145: 255, 146: 255, 147: 255, 148: 255, 149: 255, 150: 255, 151: 255, 152: 255, 153: 255, 154: 255, 155: 255, 156: 255, 157: 255, 158: 255, 159: 255, 160: 253, 161: 233, 162: 90, 163: 253, 164: 253, 165: 253, 166: 253, 167: 253, 168: 253, 169: 253, 170: 253, 171: 253, 172: 253, 173: 74, 174: 253, 175: 253, 176: 253, 177: 253, 178: 253, 179: 253, 180: 247, 181: 248, 182: 61, 183: 36, 184: 46, 185: 71, 186: 73, 187: 253, 188: 54, 189: 253, 190: 108, 191: 123, 192: 110, 193: 31, 194: 51, 195: 43, 196: 41, 197: 34, 198: 91, 199: 40, 200: 52, 201: 47, 202: 44, 203: 53, 204: 38, 205: 49, 206: 59, 207: 39, 208: 35, 209: 48, 210: 250, 211: 37, 212: 33, 213: 45, 214: 56, 215: 50, 216: 84, 217: 57, 218: 120, 219: 121, 220: 17, 221: 18, 222: 22, 223: 15, 224: 124, 225: 1, 226: 29, 227: 20, 228: 21, 229: 3, 230: 32, 231: 13, 232: 25, 233: 5, 234: 11, 235: 16, 236: 10, 237: 6, 238: 30, 239: 4, 240: 9, 241: 8, 242: 14, 243: 7, 244: 2, 245: 12, 246: 28, 247: 23, 248: 42, 249: 24, 250: 64, 251: 75, 252: 19, 253: 26, 254: 27, 255: 253}
-ISO_8859_7_GREEK_MODEL = SingleByteCharSetModel(charset_name='ISO-8859-7', language='Greek', char_to_order_map=ISO_8859_7_GREEK_CHAR_TO_ORDER, language_model=GREEK_LANG_MODEL, typical_positive_ratio=0.982851, keep_ascii_letters=False, alphabet='ΆΈΉΊΌΎΏΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩάέήίαβγδεζηθικλμνξοπρςστυφχψωόύώ')
\ No newline at end of file
+
+
+# 3: Positive
+# 2: Likely
+# 1: Unlikely
+# 0: Negative
+#
+# Flattened 64x64 matrix: the byte at 64 * first + second is the likelihood of
+# the character of order ``second`` following the one of order ``first``
+GREEK_LANG_MODEL = bytes.fromhex(
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # None
+    '00000302020303030303030303010303030002020303000300030200030303000300000002000000000002000000000000000000000000000000000000000000'  # 'α'
+    '00030303030300030300030203030003020303030000030003000303020000000200000000000000000000000000000000000000000000020000000000000000'  # 'τ'
+    '00020302020303030303030303000303030300020303000303030302030303000200000002000000000002000000000000000000000000000000000000000000'  # 'ε'
+    '00020303020303030303030303030303030002010303030302030302030302000000000002000000000002000000000000000000000000000000000000000000'  # 'ο'
+    '00030303030003030303030300030300030303030303030303030003020303000200010002000000000002000000000000000000000000010000000000000000'  # 'ι'
+    '00030303030302030000000003030003010303030003030003030303000000000200000002000000000000000000000000000000000000000000000000000000'  # 'ν'
+    '00030303030300030003030303030003020202030002030303030302030300000000000000000000000000000000000000000000000000000000000000000000'  # 'σ'
+    '00030303030303020202030303030003010303030302030303030303030202000000000000000000000000000000000000000000000000000000000000000000'  # 'ρ'
+    '00030303030302000300000003030203030303030000030203000203000000000000000000000000000000000000000000000000000000000000000000000000'  # 'π'
+    '00030003030303000003030002030003000303030000030003000202030300000000010000000000000002000000000000000000000000000000000000000000'  # 'μ'
+    '00030303030302000302030303030003030303030003030203020303020000000000000000000000000000000000000000000000000000000000000000000000'  # 'κ'
+    '00030302030203030303030300020302030202020302030302030002020203000200000000000000000002000000000000000000000000000000000000000000'  # 'υ'
+    '00000300000003030302030300000300030000000302000300030000020002000000000002000000000002000000000000000000000000000000000000000000'  # 'η'
+    '00000000000000000000000000000000000000000000000000000000000000000000000002000000000000000000000000000000000000000000000000000000'  # 'ς'
+    '00030303030003030303030300030300030000000303000303030000010203000300000000000000000002000000000000000000000000000000000000000000'  # 'ί'
+    '00030303030302000003020203030003030303030201030003020303020100000000000000000000000000000000000000000000000000000000000000000000'  # 'λ'
+    '00000303000203030303030300000300030000000303000302030000030303000300000002000000000003000000000000000000000000000000000000000000'  # 'ά'
+    '00030303030003030303030300000300030000000302000302030000030203000200000000000000000003000000000000000000000000000000000000000000'  # 'έ'
+    '00000301020203030303030300020300030000000303000300020000020301000200000000000000000002000000000000000000000000000000000000000000'  # 'ό'
+    '00030003030303000300030302030003030303030300030303000203000003000000000000000000000000000000000000000000000000000000000000000000'  # 'γ'
+    '00030003030300000300000003030003000203030000030003000303000000000000000000000000000000000000000000000000000000000000000000000000'  # 'δ'
+    '00000300000003030303030300000300020000000303000300030000020002000000000001000000000002000000000000000000000000000000000000000000'  # 'ή'
+    '00030303030303000300020003020003020302030000030203020303000000000000000000000000000000000000000000000000000000000000000000000000'  # 'χ'
+    '00000300000203030303030000000300020100000302020200030000020200000000000000000000000000000000000000000000000000000000000000000000'  # 'ω'
+    '00030003030302000300030003030002010203030000030003000303000000000000000000000000000000000000000000000000000000000000000000000000'  # 'θ'
+    '00020303030003030303030300020300030000000201000202030000020202000000000000000000000002000000000000000000000000000000000000000000'  # 'ύ'
+    '00000300000203030302030000010300020000000003000100020000010101000000000000000000000000000000000000000000000000000000000000000000'  # 'ώ'
+    '00030303030301000300000003020003020303030000030003020202010000000000000000000000000000000000000000000000000000000000000000000000'  # 'φ'
+    '00030003030300000300000000020002030302020202030002000202000000000000000000000000000000000000000000000000000000000000000000000000'  # 'β'
+    '00030303030200000000000002030002000203020000030003000301000000000000000000000000000000000000000000000000000000000000000000000000'  # 'ξ'
+    '00000000000003020303020203000200030000000200000000010200020002000002000200020200000100020202000202020002020200000200000100000000'  # 'Α'
+    '00020003030200000000000001030002000202020000020003000002000000000000000000000000000000000000000000000000000000000000000000000000'  # 'ζ'
+    '00030002030200020200020002020002000202020000000000000203000000020001020000000002020000000201000202000000000000010002000000000000'  # 'Τ'
+    '00000201000203020203020302000003030300000302000000010100020002020002000200020200000200020202000202020200000200000002000100000000'  # 'Ε'
+    '00030003030202000300000002020002020201020000010202000003000000020001020000000102000000000000000202000100000200000002000000000000'  # 'Π'
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # '·'
+    '00020303020200000002000203030002000000000000020202000202000200020002020000020202020100000202000200000200000000000002000000000000'  # 'Σ'
+    '00020003020300000003000002020002000202020000020000000000000000020000020200000202020000000000000200000002000000000000000000000000'  # 'Μ'
+    '00000200000302000202020202000000020000000002000100000200010000000002020200020200010200020202000202020201020200000200000000000000'  # 'Ο'
+    '00000000000001000000000000000000020000000000000100000000000000000002000200020200000000010201000002020000020000000000000000000000'  # 'Η'
+    '00000003020300000200000002020002000000010000020002000202000000000000020000000002020000000000000200000000000000000002000000000000'  # 'Δ'
+    '00020203020200000000000001030002000202000000010002000000000000000000000000000000000000000000000000000000000000000000000000000000'  # 'ψ'
+    '00020002000302000200000000000002020000000000000000000000000000010000020000000001010000020102000202000100000100000002000000000000'  # 'Γ'
+    '00030002020200000200000002000000020300020000000000000202000000020001020000000102020100000002000002000000000000000001000000000000'  # 'Κ'
+    '00000000000000000003000000000000020000000000000000000000000000000002010200020200020000020000000001020100020100000000000000000000'  # 'Υ'
+    '00000200000003010202000200000000020000000200000300000000020202000000000000000000000000000000000000000000000000000000000000000000'  # 'Έ'
+    '00020100020001020000000000000000000000000002000001000000000000020002020000020202020200010200000002020001000200000202000000000000'  # 'Ι'
+    '00000000010000000000000003000002000000000000000002000200000000020001020000000002020100010001000202020100000000000001000000000000'  # 'Ρ'
+    '00020001020000000000000000000002000002020000000001000000000000020002020000000002020000000000000200000000000000000002000002000000'  # 'Ν'
+    '00020202020000000300000000000000000200000000000002000000000000010000020000000001020000000000000202010100000000000001000000000000'  # 'Χ'
+    '00020002020200000200000000000000020202000000020000000000000000020000010000000002010000000000000100000000000100000000000000000000'  # 'Β'
+    '00030002000000000000000002000000000002000000000000000200000000020000020000000002020000000001000001000000000000000000000000000000'  # 'Θ'
+    '00020002020100000000000002000002000202020000000000000200000000020000020000020002020000000002000200000000000200000002000000000000'  # 'Λ'
+    '00000300000002020002020000000000020000000000000200000000000000000000000000000000000000000000000000000000000000000000000000000000'  # 'Ό'
+    '00000000000001000000000001000000000000000000000000000000000000000000000001000000000000000000000000000000000000020000020000000000'  # 'o'
+    '00020202020200000000000002000000000000000000000000000101000000010000000000000002010000000000000200000000000000000000000000000000'  # 'Φ'
+    '00000000000000020200000000000200000000000000000100000000000000000002000000020000000000010000000002020000000100000000000000000000'  # 'Ω'
+    '00000000010000000000000000000000000200000000000000000000000000000000000000000000000000000000000000000000000000010000010002000000'  # 't'
+    '00020002000000000000000000000000000002000000000000000000000000000000010000000001010000000000000000000000000000000000000000000000'  # 'Ξ'
+    '00000000000000000000000000000000000000000000000000000000000000000000000001000000000000000000000000000100000000010000020002000000'  # 'e'
+    '00000000000000000201000000000000020000000102000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # 'Ά'
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # None
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # None
+)
+
+# 255: Undefined characters that did not exist in training text
+# 254: Carriage/Return
+# 253: symbol (punctuation) that does not belong to word
+# 252: 0 - 9
+# 251: Control characters
+
+# Character Mapping Table(s), indexed by byte value:
+WINDOWS_1253_GREEK_CHAR_TO_ORDER = bytes.fromhex(
+    'fffffffffffffffffffffefffffeffff'  # '\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f'
+    'ffffffffffffffffffffffffffffffff'  # '\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f'
+    'fdfdfdfdfdfdfdfdfdfdfdfdfdfdfdfd'  # ' !"#$%&\'()*+,-./'
+    'fcfcfcfcfcfcfcfcfcfcfdfdfdfdfdfd'  # '0123456789:;<=>?'
+    'fd5264685e626574666fbb755c587155'  # '@ABCDEFGHIJKLMNO'
+    '4f7669534372775f636dbcfdfdfdfdfd'  # 'PQRSTUVWXYZ[\\]^_'
+    'fd484650513c605d594478614d564537'  # '`abcdefghijklmno'
+    '4e7341423a4c6a67576b70fdfdfdfdfd'  # 'pqrstuvwxyz{|}~\x7f'
+    'ffffffffffffffffffffffffffffffff'  # '€�‚ƒ„…†‡�‰�‹����'
+    'ffffffffffffffffffffffffffffffff'  # '�‘’“”•–—�™�›����'
+    'fde93dfdfdfdfdfdfdfdfdfdfd4afdfd'  # '\xa0΅Ά£¤¥¦§¨©�«¬\xad®―'
+    'fdfdfdfdf7fdfd242e4749fd36fd6c7b'  # '°±²³΄µ¶·ΈΉΊ»Ό½ΎΏ'
+    '6e1f332b29225b28342f2c3526313b27'  # 'ΐΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟ'
+    '2330fa25212d3832543978791112160f'  # 'ΠΡ�ΣΤΥΦΧΨΩΪΫάέήί'
+    '7c011d141503200d19050b100a061e04'  # 'ΰαβγδεζηθικλμνξο'
+    '09080e07020c1c172a18404b131a1bfd'  # 'πρςστυφχψωϊϋόύώ�'
+)
+
+WINDOWS_1253_GREEK_MODEL = SingleByteCharSetModel(charset_name='windows-1253',
+                                                  language='Greek',
+                                                  char_to_order_map=WINDOWS_1253_GREEK_CHAR_TO_ORDER,
+                                                  language_model=GREEK_LANG_MODEL,
+                                                  typical_positive_ratio=0.982851,
+                                                  keep_ascii_letters=False,
+                                                  alphabet='ΆΈΉΊΌΎΏΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩάέήίαβγδεζηθικλμνξοπρςστυφχψωόύώ')
+
+ISO_8859_7_GREEK_CHAR_TO_ORDER = bytes.fromhex(
+    'fffffffffffffffffffffefffffeffff'  # '\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f'
+    'ffffffffffffffffffffffffffffffff'  # '\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f'
+    'fdfdfdfdfdfdfdfdfdfdfdfdfdfdfdfd'  # ' !"#$%&\'()*+,-./'
+    'fcfcfcfcfcfcfcfcfcfcfdfdfdfdfdfd'  # '0123456789:;<=>?'
+    'fd5264685e626574666fbb755c587155'  # '@ABCDEFGHIJKLMNO'
+    '4f7669534372775f636dbcfdfdfdfdfd'  # 'PQRSTUVWXYZ[\\]^_'
+    'fd484650513c605d594478614d564537'  # '`abcdefghijklmno'
+    '4e7341423a4c6a67576b70fdfdfdfdfd'  # 'pqrstuvwxyz{|}~\x7f'
+    'ffffffffffffffffffffffffffffffff'  # '\x80\x81\x82\x83\x84\x85\x86\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\x8f'
+    'ffffffffffffffffffffffffffffffff'  # '\x90\x91\x92\x93\x94\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f'
+    'fde95afdfdfdfdfdfdfdfdfdfd4afdfd'  # '\xa0‘’£€₯¦§¨©ͺ«¬\xad�―'
+    'fdfdfdfdf7f83d242e4749fd36fd6c7b'  # '°±²³΄΅Ά·ΈΉΊ»Ό½ΎΏ'
+    '6e1f332b29225b28342f2c3526313b27'  # 'ΐΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟ'
+    '2330fa25212d3832543978791112160f'  # 'ΠΡ�ΣΤΥΦΧΨΩΪΫάέήί'
+    '7c011d141503200d19050b100a061e04'  # 'ΰαβγδεζηθικλμνξο'
+    '09080e07020c1c172a18404b131a1bfd'  # 'πρςστυφχψωϊϋόύώ�'
+)
+
+ISO_8859_7_GREEK_MODEL = SingleByteCharSetModel(charset_name='ISO-8859-7',
+                                                language='Greek',
+                                                char_to_order_map=ISO_8859_7_GREEK_CHAR_TO_ORDER,
+                                                language_model=GREEK_LANG_MODEL,
+                                                typical_positive_ratio=0.982851,
+                                                keep_ascii_letters=False,
+                                                alphabet='ΆΈΉΊΌΎΏΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩάέήίαβγδεζηθικλμνξοπρςστυφχψωόύώ')
+
@@ -1,4 +1,111 @@
 from chardet.sbcharsetprober import SingleByteCharSetModel
-HEBREW_LANG_MODEL = {50: {50: 0, 60: 1, 61: 1, 42: 1, 53: 1, 56: 2, 54: 2, 49: 0, 51: 2, 43: 1, 44: 2, 63: 1, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 1, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 0, 11: 0, 6: 1, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 1, 7: 0, 10: 1, 5: 0, 32: 0, 52: 1, 47: 0, 46: 1, 58: 0, 40: 1}, 60: {50: 1, 60: 1, 61: 0, 42: 1, 53: 1, 56: 1, 54: 0, 49: 1, 51: 1, 43: 1, 44: 2, 63: 1, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 1, 8: 0, 20: 0, 16: 0, 3: 1, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 0, 11: 0, 6: 1, 23: 0, 12: 1, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 0, 32: 0, 52: 0, 47: 0, 46: 1, 58: 0, 40: 1}, 61: {50: 1, 60: 0, 61: 1, 42: 1, 53: 1, 56: 1, 54: 1, 49: 2, 51: 1, 43: 1, 44: 0, 63: 1, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 1, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 0, 11: 0, 6: 0, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 0, 32: 1, 52: 1, 47: 0, 46: 1, 58: 0, 40: 1}, 42: {50: 1, 60: 1, 61: 2, 42: 1, 53: 1, 56: 2, 54: 2, 49: 1, 51: 2, 43: 2, 44: 2, 63: 1, 34: 1, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 0, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 0, 11: 0, 6: 0, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 1, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 0, 32: 1, 52: 2, 47: 0, 46: 1, 58: 0, 40: 1}, 53: {50: 1, 60: 2, 61: 1, 42: 1, 53: 0, 56: 1, 54: 2, 49: 2, 51: 1, 43: 2, 44: 2, 63: 1, 34: 0, 55: 1, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 0, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 0, 11: 0, 6: 0, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 0, 32: 0, 52: 1, 47: 0, 46: 0, 58: 0, 40: 0}, 56: {50: 1, 60: 1, 61: 1, 42: 2, 53: 2, 56: 2, 54: 1, 49: 1, 51: 0, 43: 1, 44: 1, 63: 1, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 0, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 0, 11: 0, 6: 0, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 0, 32: 0, 52: 1, 47: 0, 46: 1, 58: 0, 40: 1}, 54: {50: 1, 60: 1, 61: 1, 42: 1, 53: 1, 56: 1, 54: 1, 49: 1, 51: 0, 43: 1, 44: 2, 63: 1, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 1, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 0, 11: 0, 6: 0, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 0, 32: 0, 52: 2, 47: 0, 46: 1, 58: 0, 40: 1}, 49: {50: 1, 60: 1, 61: 1, 42: 1, 53: 1, 56: 1, 54: 2, 49: 1, 51: 2, 43: 1, 44: 1, 63: 1, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 0, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 0, 11: 0, 6: 0, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 0, 32: 0, 52: 1, 47: 0, 46: 1, 58: 0, 40: 1}, 51: {50: 2, 60: 1, 61: 1, 42: 2, 53: 1, 56: 1, 54: 1, 49: 2, 51: 1, 43: 1, 44: 1, 63: 1, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 0, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 0, 11: 0, 6: 0, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 0, 32: 0, 52: 2, 47: 0, 46: 1, 58: 0, 40: 1}, 43: {50: 1, 60: 1, 61: 0, 42: 2, 53: 1, 56: 1, 54: 1, 49: 1, 51: 1, 43: 1, 44: 2, 63: 1, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 0, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 0, 11: 0, 6: 0, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 0, 32: 0, 52: 1, 47: 0, 46: 2, 58: 0, 40: 2}, 44: {50: 1, 60: 1, 61: 0, 42: 2, 53: 2, 56: 1, 54: 0, 49: 1, 51: 1, 43: 1, 44: 1, 63: 1, 34: 1, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 0, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 0, 11: 0, 6: 0, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 0, 32: 0, 52: 2, 47: 0, 46: 1, 58: 0, 40: 1}, 63: {50: 1, 60: 1, 61: 1, 42: 1, 53: 1, 56: 1, 54: 1, 49: 0, 51: 1, 43: 2, 44: 1, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 0, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 0, 11: 0, 6: 0, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 0, 32: 0, 52: 1, 47: 0, 46: 0, 58: 0, 40: 0}, 34: {50: 1, 60: 0, 61: 1, 42: 0, 53: 1, 56: 0, 54: 1, 49: 1, 51: 0, 43: 1, 44: 1, 63: 0, 34: 2, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 2, 8: 1, 20: 1, 16: 1, 3: 1, 2: 1, 24: 1, 14: 1, 22: 1, 1: 2, 25: 0, 15: 1, 4: 1, 11: 0, 6: 2, 23: 0, 12: 1, 19: 1, 13: 1, 26: 0, 18: 1, 27: 0, 21: 1, 17: 1, 7: 1, 10: 1, 5: 1, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 55: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 1, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 1, 8: 0, 20: 0, 16: 0, 3: 1, 2: 1, 24: 0, 14: 0, 22: 0, 1: 2, 25: 0, 15: 0, 4: 1, 11: 0, 6: 1, 23: 1, 12: 1, 19: 1, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 1, 10: 1, 5: 0, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 48: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 1, 8: 0, 20: 0, 16: 0, 3: 0, 2: 1, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 1, 4: 1, 11: 0, 6: 1, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 0, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 39: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 0, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 1, 4: 1, 11: 0, 6: 0, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 1, 17: 1, 7: 0, 10: 0, 5: 0, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 57: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 0, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 0, 11: 0, 6: 0, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 0, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 30: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 1, 31: 0, 29: 0, 35: 1, 62: 0, 28: 0, 38: 0, 45: 0, 9: 2, 8: 2, 20: 2, 16: 2, 3: 2, 2: 2, 24: 2, 14: 2, 22: 2, 1: 2, 25: 2, 15: 2, 4: 2, 11: 1, 6: 2, 23: 0, 12: 2, 19: 2, 13: 2, 26: 0, 18: 2, 27: 0, 21: 2, 17: 2, 7: 2, 10: 2, 5: 2, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 59: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 1, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 1, 20: 1, 16: 0, 3: 0, 2: 0, 24: 1, 14: 0, 22: 0, 1: 1, 25: 0, 15: 1, 4: 2, 11: 0, 6: 2, 23: 0, 12: 1, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 1, 10: 1, 5: 0, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 41: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 2, 20: 1, 16: 2, 3: 1, 2: 1, 24: 1, 14: 1, 22: 1, 1: 1, 25: 1, 15: 1, 4: 2, 11: 0, 6: 2, 23: 0, 12: 2, 19: 1, 13: 0, 26: 0, 18: 1, 27: 0, 21: 2, 17: 1, 7: 2, 10: 2, 5: 1, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 33: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 1, 59: 0, 41: 0, 33: 1, 37: 0, 36: 1, 31: 0, 29: 1, 35: 0, 62: 0, 28: 1, 38: 0, 45: 0, 9: 1, 8: 2, 20: 2, 16: 2, 3: 1, 2: 1, 24: 2, 14: 1, 22: 1, 1: 3, 25: 1, 15: 2, 4: 2, 11: 2, 6: 2, 23: 2, 12: 2, 19: 2, 13: 1, 26: 0, 18: 2, 27: 1, 21: 2, 17: 2, 7: 2, 10: 2, 5: 2, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 37: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 1, 31: 1, 29: 1, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 2, 8: 2, 20: 1, 16: 2, 3: 2, 2: 1, 24: 1, 14: 2, 22: 1, 1: 3, 25: 2, 15: 1, 4: 2, 11: 2, 6: 1, 23: 2, 12: 2, 19: 1, 13: 2, 26: 1, 18: 1, 27: 1, 21: 1, 17: 1, 7: 2, 10: 2, 5: 2, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 36: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 1, 31: 1, 29: 1, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 2, 8: 2, 20: 1, 16: 2, 3: 2, 2: 1, 24: 1, 14: 2, 22: 1, 1: 2, 25: 2, 15: 1, 4: 2, 11: 2, 6: 2, 23: 2, 12: 2, 19: 2, 13: 1, 26: 1, 18: 1, 27: 2, 21: 1, 17: 1, 7: 2, 10: 2, 5: 2, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 31: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 1, 59: 0, 41: 0, 33: 0, 37: 0, 36: 1, 31: 0, 29: 2, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 2, 8: 2, 20: 2, 16: 2, 3: 2, 2: 1, 24: 2, 14: 2, 22: 2, 1: 3, 25: 1, 15: 2, 4: 2, 11: 2, 6: 2, 23: 2, 12: 2, 19: 2, 13: 2, 26: 2, 18: 2, 27: 1, 21: 2, 17: 2, 7: 2, 10: 2, 5: 2, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 29: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 1, 29: 2, 35: 0, 62: 0, 28: 1, 38: 0, 45: 0, 9: 2, 8: 2, 20: 2, 16: 2, 3: 3, 2: 2, 24: 2, 14: 2, 22: 1, 1: 2, 25: 2, 15: 2, 4: 2, 11: 2, 6: 2, 23: 2, 12: 2, 19: 1, 13: 2, 26: 1, 18: 2, 27: 1, 21: 2, 17: 2, 7: 2, 10: 2, 5: 2, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 35: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 1, 62: 0, 28: 0, 38: 0, 45: 0, 9: 2, 8: 2, 20: 1, 16: 2, 3: 2, 2: 1, 24: 1, 14: 1, 22: 1, 1: 1, 25: 1, 15: 2, 4: 2, 11: 2, 6: 2, 23: 2, 12: 2, 19: 2, 13: 2, 26: 1, 18: 2, 27: 1, 21: 2, 17: 2, 7: 2, 10: 2, 5: 2, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 62: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 1, 20: 1, 16: 1, 3: 1, 2: 1, 24: 1, 14: 1, 22: 0, 1: 1, 25: 0, 15: 1, 4: 2, 11: 1, 6: 1, 23: 1, 12: 1, 19: 1, 13: 1, 26: 0, 18: 1, 27: 0, 21: 1, 17: 1, 7: 1, 10: 1, 5: 1, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 28: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 3, 59: 0, 41: 1, 33: 3, 37: 2, 36: 2, 31: 3, 29: 3, 35: 2, 62: 1, 28: 0, 38: 2, 45: 1, 9: 2, 8: 2, 20: 1, 16: 2, 3: 1, 2: 2, 24: 1, 14: 1, 22: 1, 1: 2, 25: 2, 15: 2, 4: 2, 11: 1, 6: 2, 23: 1, 12: 2, 19: 1, 13: 2, 26: 1, 18: 1, 27: 1, 21: 1, 17: 1, 7: 2, 10: 2, 5: 2, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 38: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 2, 37: 2, 36: 2, 31: 2, 29: 2, 35: 1, 62: 1, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 0, 2: 2, 24: 0, 14: 0, 22: 0, 1: 1, 25: 0, 15: 0, 4: 0, 11: 0, 6: 0, 23: 0, 12: 0, 19: 0, 13: 1, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 0, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 45: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 2, 37: 1, 36: 2, 31: 1, 29: 2, 35: 1, 62: 0, 28: 0, 38: 0, 45: 0, 9: 1, 8: 0, 20: 1, 16: 0, 3: 1, 2: 2, 24: 0, 14: 1, 22: 0, 1: 1, 25: 0, 15: 0, 4: 0, 11: 1, 6: 1, 23: 0, 12: 1, 19: 0, 13: 1, 26: 0, 18: 1, 27: 0, 21: 0, 17: 0, 7: 1, 10: 0, 5: 1, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 9: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 1, 55: 1, 48: 1, 39: 0, 57: 0, 30: 0, 59: 2, 41: 2, 33: 2, 37: 2, 36: 2, 31: 2, 29: 2, 35: 2, 62: 1, 28: 0, 38: 0, 45: 0, 9: 2, 8: 3, 20: 3, 16: 3, 3: 3, 2: 3, 24: 3, 14: 3, 22: 3, 1: 3, 25: 3, 15: 3, 4: 3, 11: 3, 6: 3, 23: 3, 12: 3, 19: 3, 13: 2, 26: 3, 18: 3, 27: 1, 21: 3, 17: 3, 7: 3, 10: 3, 5: 3, 32: 0, 52: 0, 47: 0, 46: 1, 58: 0, 40: 1}, 8: {50: 0, 60: 0, 61: 1, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 1, 55: 1, 48: 0, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 2, 37: 2, 36: 2, 31: 2, 29: 2, 35: 2, 62: 1, 28: 3, 38: 0, 45: 0, 9: 3, 8: 3, 20: 3, 16: 3, 3: 3, 2: 3, 24: 3, 14: 3, 22: 3, 1: 3, 25: 2, 15: 3, 4: 3, 11: 2, 6: 3, 23: 3, 12: 3, 19: 3, 13: 3, 26: 1, 18: 3, 27: 2, 21: 3, 17: 3, 7: 3, 10: 3, 5: 3, 32: 1, 52: 0, 47: 0, 46: 1, 58: 0, 40: 1}, 20: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 1, 55: 2, 48: 0, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 1, 37: 1, 36: 1, 31: 2, 29: 2, 35: 1, 62: 0, 28: 2, 38: 0, 45: 0, 9: 2, 8: 3, 20: 2, 16: 3, 3: 3, 2: 3, 24: 3, 14: 2, 22: 2, 1: 3, 25: 1, 15: 1, 4: 3, 11: 3, 6: 3, 23: 3, 12: 3, 19: 2, 13: 3, 26: 2, 18: 2, 27: 1, 21: 1, 17: 1, 7: 3, 10: 3, 5: 3, 32: 0, 52: 1, 47: 0, 46: 1, 58: 0, 40: 0}, 16: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 2, 37: 2, 36: 2, 31: 2, 29: 2, 35: 2, 62: 1, 28: 2, 38: 0, 45: 0, 9: 3, 8: 3, 20: 3, 16: 3, 3: 3, 2: 3, 24: 1, 14: 2, 22: 2, 1: 3, 25: 2, 15: 2, 4: 3, 11: 3, 6: 3, 23: 2, 12: 3, 19: 2, 13: 3, 26: 2, 18: 3, 27: 0, 21: 2, 17: 3, 7: 3, 10: 3, 5: 3, 32: 0, 52: 0, 47: 0, 46: 1, 58: 0, 40: 1}, 3: {50: 0, 60: 0, 61: 1, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 1, 55: 0, 48: 1, 39: 0, 57: 0, 30: 1, 59: 1, 41: 2, 33: 2, 37: 2, 36: 2, 31: 3, 29: 2, 35: 1, 62: 1, 28: 2, 38: 0, 45: 0, 9: 3, 8: 3, 20: 3, 16: 3, 3: 3, 2: 3, 24: 3, 14: 3, 22: 3, 1: 3, 25: 1, 15: 3, 4: 3, 11: 3, 6: 3, 23: 3, 12: 3, 19: 3, 13: 3, 26: 0, 18: 3, 27: 1, 21: 3, 17: 3, 7: 3, 10: 3, 5: 3, 32: 1, 52: 1, 47: 0, 46: 1, 58: 0, 40: 2}, 2: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 1, 63: 0, 34: 1, 55: 1, 48: 1, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 2, 37: 1, 36: 1, 31: 2, 29: 2, 35: 3, 62: 0, 28: 3, 38: 0, 45: 0, 9: 3, 8: 3, 20: 3, 16: 3, 3: 3, 2: 3, 24: 3, 14: 3, 22: 3, 1: 3, 25: 3, 15: 3, 4: 3, 11: 3, 6: 3, 23: 3, 12: 3, 19: 3, 13: 3, 26: 3, 18: 3, 27: 3, 21: 3, 17: 3, 7: 3, 10: 3, 5: 3, 32: 1, 52: 0, 47: 0, 46: 1, 58: 0, 40: 2}, 24: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 1, 48: 0, 39: 0, 57: 0, 30: 2, 59: 0, 41: 1, 33: 1, 37: 2, 36: 2, 31: 2, 29: 2, 35: 1, 62: 1, 28: 2, 38: 0, 45: 0, 9: 3, 8: 2, 20: 2, 16: 2, 3: 3, 2: 3, 24: 2, 14: 2, 22: 1, 1: 3, 25: 1, 15: 3, 4: 3, 11: 2, 6: 3, 23: 2, 12: 2, 19: 1, 13: 2, 26: 1, 18: 1, 27: 0, 21: 2, 17: 3, 7: 3, 10: 1, 5: 2, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 1}, 14: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 1, 55: 1, 48: 0, 39: 0, 57: 0, 30: 2, 59: 1, 41: 2, 33: 2, 37: 2, 36: 2, 31: 2, 29: 2, 35: 2, 62: 1, 28: 0, 38: 0, 45: 0, 9: 2, 8: 3, 20: 2, 16: 3, 3: 3, 2: 3, 24: 3, 14: 2, 22: 2, 1: 3, 25: 1, 15: 2, 4: 3, 11: 3, 6: 3, 23: 2, 12: 3, 19: 3, 13: 1, 26: 2, 18: 2, 27: 2, 21: 3, 17: 3, 7: 3, 10: 3, 5: 3, 32: 0, 52: 1, 47: 0, 46: 1, 58: 0, 40: 1}, 22: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 1, 55: 0, 48: 0, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 2, 37: 1, 36: 1, 31: 2, 29: 1, 35: 1, 62: 1, 28: 1, 38: 0, 45: 0, 9: 3, 8: 3, 20: 3, 16: 1, 3: 3, 2: 3, 24: 2, 14: 3, 22: 2, 1: 3, 25: 1, 15: 2, 4: 3, 11: 2, 6: 2, 23: 2, 12: 3, 19: 2, 13: 3, 26: 2, 18: 3, 27: 1, 21: 2, 17: 2, 7: 3, 10: 2, 5: 3, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 1}, 1: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 1, 55: 1, 48: 1, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 2, 37: 2, 36: 1, 31: 2, 29: 2, 35: 2, 62: 1, 28: 2, 38: 0, 45: 0, 9: 3, 8: 3, 20: 3, 16: 3, 3: 3, 2: 3, 24: 3, 14: 3, 22: 3, 1: 3, 25: 3, 15: 3, 4: 3, 11: 3, 6: 3, 23: 3, 12: 3, 19: 3, 13: 3, 26: 3, 18: 3, 27: 3, 21: 3, 17: 3, 7: 3, 10: 3, 5: 3, 32: 1, 52: 0, 47: 0, 46: 1, 58: 0, 40: 2}, 25: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 2, 35: 0, 62: 0, 28: 1, 38: 0, 45: 0, 9: 1, 8: 0, 20: 0, 16: 0, 3: 1, 2: 0, 24: 0, 14: 1, 22: 0, 1: 0, 25: 0, 15: 0, 4: 1, 11: 0, 6: 1, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 1, 5: 0, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 1}, 15: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 2, 37: 2, 36: 2, 31: 2, 29: 2, 35: 1, 62: 1, 28: 3, 38: 0, 45: 0, 9: 3, 8: 3, 20: 2, 16: 3, 3: 3, 2: 3, 24: 3, 14: 3, 22: 2, 1: 3, 25: 3, 15: 3, 4: 3, 11: 3, 6: 3, 23: 3, 12: 3, 19: 3, 13: 2, 26: 3, 18: 3, 27: 1, 21: 2, 17: 2, 7: 3, 10: 3, 5: 3, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 4: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 1, 55: 1, 48: 0, 39: 0, 57: 0, 30: 3, 59: 0, 41: 0, 33: 2, 37: 2, 36: 2, 31: 2, 29: 2, 35: 2, 62: 1, 28: 2, 38: 0, 45: 0, 9: 3, 8: 3, 20: 3, 16: 3, 3: 3, 2: 3, 24: 3, 14: 3, 22: 3, 1: 3, 25: 3, 15: 3, 4: 3, 11: 3, 6: 3, 23: 2, 12: 3, 19: 3, 13: 3, 26: 2, 18: 3, 27: 2, 21: 3, 17: 3, 7: 3, 10: 3, 5: 3, 32: 1, 52: 0, 47: 0, 46: 1, 58: 0, 40: 1}, 11: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 1, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 1, 8: 1, 20: 1, 16: 0, 3: 1, 2: 1, 24: 1, 14: 1, 22: 0, 1: 1, 25: 0, 15: 1, 4: 1, 11: 1, 6: 1, 23: 0, 12: 1, 19: 0, 13: 1, 26: 0, 18: 1, 27: 1, 21: 1, 17: 1, 7: 1, 10: 1, 5: 1, 32: 0, 52: 0, 47: 0, 46: 1, 58: 0, 40: 2}, 6: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 1, 48: 0, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 2, 37: 2, 36: 2, 31: 2, 29: 2, 35: 2, 62: 1, 28: 2, 38: 0, 45: 0, 9: 3, 8: 3, 20: 3, 16: 3, 3: 3, 2: 3, 24: 3, 14: 3, 22: 3, 1: 3, 25: 2, 15: 3, 4: 3, 11: 3, 6: 3, 23: 3, 12: 3, 19: 3, 13: 3, 26: 0, 18: 3, 27: 2, 21: 3, 17: 3, 7: 3, 10: 3, 5: 3, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 1}, 23: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 1, 55: 0, 48: 1, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 1, 8: 1, 20: 1, 16: 1, 3: 1, 2: 1, 24: 0, 14: 1, 22: 1, 1: 1, 25: 0, 15: 1, 4: 1, 11: 1, 6: 1, 23: 0, 12: 1, 19: 1, 13: 1, 26: 1, 18: 1, 27: 0, 21: 0, 17: 1, 7: 1, 10: 1, 5: 1, 32: 1, 52: 0, 47: 0, 46: 1, 58: 0, 40: 2}, 12: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 2, 37: 2, 36: 2, 31: 2, 29: 2, 35: 1, 62: 1, 28: 2, 38: 0, 45: 0, 9: 3, 8: 3, 20: 3, 16: 3, 3: 3, 2: 3, 24: 3, 14: 3, 22: 3, 1: 3, 25: 2, 15: 3, 4: 3, 11: 3, 6: 3, 23: 3, 12: 3, 19: 3, 13: 3, 26: 2, 18: 3, 27: 2, 21: 3, 17: 3, 7: 3, 10: 3, 5: 3, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 19: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 1, 55: 1, 48: 0, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 2, 37: 1, 36: 2, 31: 2, 29: 1, 35: 1, 62: 2, 28: 2, 38: 0, 45: 0, 9: 2, 8: 3, 20: 3, 16: 3, 3: 3, 2: 3, 24: 1, 14: 3, 22: 3, 1: 3, 25: 2, 15: 3, 4: 3, 11: 2, 6: 3, 23: 2, 12: 3, 19: 2, 13: 3, 26: 3, 18: 3, 27: 0, 21: 2, 17: 3, 7: 3, 10: 1, 5: 3, 32: 0, 52: 0, 47: 0, 46: 1, 58: 0, 40: 1}, 13: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 1, 39: 0, 57: 0, 30: 1, 59: 1, 41: 2, 33: 2, 37: 2, 36: 2, 31: 2, 29: 2, 35: 2, 62: 1, 28: 0, 38: 0, 45: 0, 9: 2, 8: 3, 20: 3, 16: 3, 3: 3, 2: 3, 24: 3, 14: 1, 22: 3, 1: 3, 25: 2, 15: 2, 4: 3, 11: 3, 6: 3, 23: 2, 12: 3, 19: 3, 13: 2, 26: 1, 18: 2, 27: 2, 21: 3, 17: 3, 7: 3, 10: 3, 5: 3, 32: 0, 52: 0, 47: 0, 46: 1, 58: 0, 40: 1}, 26: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 1, 8: 0, 20: 0, 16: 0, 3: 0, 2: 1, 24: 0, 14: 1, 22: 0, 1: 0, 25: 0, 15: 1, 4: 1, 11: 0, 6: 1, 23: 0, 12: 0, 19: 1, 13: 0, 26: 1, 18: 1, 27: 0, 21: 0, 17: 1, 7: 1, 10: 1, 5: 0, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 1}, 18: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 1, 48: 0, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 2, 37: 1, 36: 2, 31: 1, 29: 2, 35: 1, 62: 1, 28: 2, 38: 0, 45: 0, 9: 3, 8: 2, 20: 3, 16: 2, 3: 3, 2: 3, 24: 2, 14: 3, 22: 3, 1: 3, 25: 2, 15: 3, 4: 3, 11: 2, 6: 2, 23: 3, 12: 3, 19: 3, 13: 3, 26: 2, 18: 2, 27: 2, 21: 3, 17: 3, 7: 3, 10: 3, 5: 3, 32: 0, 52: 0, 47: 0, 46: 1, 58: 0, 40: 0}, 27: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 1, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 1, 8: 0, 20: 0, 16: 0, 3: 0, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 1, 11: 0, 6: 0, 23: 0, 12: 0, 19: 1, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 1, 10: 0, 5: 1, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 1}, 21: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 1, 48: 0, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 2, 37: 2, 36: 1, 31: 2, 29: 2, 35: 1, 62: 1, 28: 2, 38: 0, 45: 0, 9: 3, 8: 3, 20: 2, 16: 3, 3: 3, 2: 3, 24: 1, 14: 3, 22: 2, 1: 3, 25: 1, 15: 1, 4: 3, 11: 2, 6: 3, 23: 2, 12: 3, 19: 1, 13: 3, 26: 2, 18: 3, 27: 2, 21: 2, 17: 3, 7: 3, 10: 0, 5: 3, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 17: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 1, 55: 1, 48: 0, 39: 0, 57: 0, 30: 2, 59: 0, 41: 0, 33: 2, 37: 2, 36: 1, 31: 2, 29: 2, 35: 2, 62: 1, 28: 2, 38: 0, 45: 0, 9: 3, 8: 3, 20: 2, 16: 3, 3: 3, 2: 3, 24: 2, 14: 3, 22: 3, 1: 3, 25: 1, 15: 1, 4: 3, 11: 2, 6: 3, 23: 2, 12: 3, 19: 3, 13: 3, 26: 2, 18: 3, 27: 2, 21: 3, 17: 2, 7: 3, 10: 3, 5: 3, 32: 0, 52: 1, 47: 0, 46: 1, 58: 0, 40: 1}, 7: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 1, 55: 2, 48: 1, 39: 0, 57: 0, 30: 2, 59: 0, 41: 1, 33: 2, 37: 2, 36: 2, 31: 2, 29: 2, 35: 2, 62: 1, 28: 0, 38: 0, 45: 0, 9: 3, 8: 3, 20: 3, 16: 3, 3: 3, 2: 3, 24: 3, 14: 3, 22: 3, 1: 3, 25: 3, 15: 3, 4: 3, 11: 3, 6: 3, 23: 3, 12: 3, 19: 3, 13: 3, 26: 2, 18: 3, 27: 3, 21: 3, 17: 3, 7: 3, 10: 3, 5: 3, 32: 0, 52: 0, 47: 0, 46: 1, 58: 0, 40: 2}, 10: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 1, 55: 0, 48: 0, 39: 0, 57: 0, 30: 1, 59: 0, 41: 0, 33: 1, 37: 1, 36: 1, 31: 1, 29: 1, 35: 1, 62: 1, 28: 2, 38: 3, 45: 2, 9: 3, 8: 3, 20: 3, 16: 3, 3: 3, 2: 3, 24: 2, 14: 3, 22: 3, 1: 3, 25: 3, 15: 3, 4: 3, 11: 3, 6: 3, 23: 2, 12: 3, 19: 2, 13: 3, 26: 2, 18: 3, 27: 1, 21: 2, 17: 3, 7: 3, 10: 3, 5: 3, 32: 0, 52: 0, 47: 0, 46: 1, 58: 0, 40: 1}, 5: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 1, 55: 0, 48: 1, 39: 1, 57: 0, 30: 2, 59: 0, 41: 0, 33: 2, 37: 2, 36: 2, 31: 2, 29: 2, 35: 1, 62: 1, 28: 2, 38: 0, 45: 0, 9: 3, 8: 3, 20: 3, 16: 2, 3: 3, 2: 3, 24: 2, 14: 3, 22: 2, 1: 3, 25: 2, 15: 3, 4: 3, 11: 3, 6: 3, 23: 3, 12: 3, 19: 2, 13: 3, 26: 2, 18: 3, 27: 1, 21: 2, 17: 3, 7: 3, 10: 3, 5: 3, 32: 1, 52: 1, 47: 0, 46: 0, 58: 0, 40: 2}, 32: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 1, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 1, 8: 1, 20: 1, 16: 1, 3: 1, 2: 1, 24: 0, 14: 1, 22: 0, 1: 1, 25: 0, 15: 1, 4: 1, 11: 0, 6: 1, 23: 0, 12: 0, 19: 1, 13: 1, 26: 0, 18: 1, 27: 0, 21: 1, 17: 0, 7: 1, 10: 1, 5: 1, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 52: {50: 1, 60: 0, 61: 1, 42: 1, 53: 1, 56: 1, 54: 0, 49: 0, 51: 1, 43: 2, 44: 2, 63: 1, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 0, 2: 1, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 0, 11: 0, 6: 1, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 1, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 47: {50: 1, 60: 1, 61: 1, 42: 1, 53: 1, 56: 1, 54: 1, 49: 1, 51: 1, 43: 1, 44: 1, 63: 1, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 2, 8: 1, 20: 1, 16: 1, 3: 1, 2: 1, 24: 1, 14: 1, 22: 1, 1: 1, 25: 0, 15: 1, 4: 1, 11: 0, 6: 1, 23: 0, 12: 1, 19: 1, 13: 1, 26: 0, 18: 1, 27: 0, 21: 1, 17: 1, 7: 1, 10: 1, 5: 1, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 46: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 1, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 1, 8: 1, 20: 1, 16: 0, 3: 0, 2: 0, 24: 0, 14: 0, 22: 0, 1: 1, 25: 0, 15: 1, 4: 1, 11: 0, 6: 1, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 1, 17: 0, 7: 1, 10: 0, 5: 0, 32: 0, 52: 0, 47: 0, 46: 0, 58: 0, 40: 0}, 58: {50: 0, 60: 0, 61: 0, 42: 0, 53: 0, 56: 0, 54: 0, 49: 0, 51: 0, 43: 0, 44: 0, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 0, 8: 0, 20: 0, 16: 0, 3: 0, 2: 0, 24: 0, 14: 0, 22: 0, 1: 0, 25: 0, 15: 0, 4: 0, 11: 0, 6: 0, 23: 0, 12: 0, 19: 0, 13: 0, 26: 0, 18: 0, 27: 0, 21: 0, 17: 0, 7: 0, 10: 0, 5: 0, 32: 0, 52: 0, 47: 0, 46: 0, 58: 2, 40: 0}, 40: {50: 1, 60: 1, 61: 1, 42: 1, 53: 1, 56: 0, 54: 1, 49: 0, 51: 1, 43: 1, 44: 1, 63: 0, 34: 0, 55: 0, 48: 0, 39: 0, 57: 0, 30: 0, 59: 0, 41: 0, 33: 0, 37: 0, 36: 0, 31: 0, 29: 0, 35: 0, 62: 0, 28: 0, 38: 0, 45: 0, 9: 1, 8: 0, 20: 0, 16: 0, 3: 1, 2: 1, 24: 1, 14: 0, 22: 0, 1: 1, 25: 0, 15: 1, 4: 1, 11: 0, 6: 1, 23: 0, 12: 1, 19: 0, 13: 0, 26: 0, 18: 1, 27: 0, 21: 0, 17: 0, 7: 1, 10: 1, 5: 1, 32: 0, 52: 0, 47: 0, 46: 1, 58: 0, 40: 2}}
-WINDOWS_1255_HEBREW_CHAR_TO_ORDER = {0: 255, 1: 255, 2: 255, 3: 255, 4: 255, 5: 255, 6: 255, 7: 255, 8: 255, 9: 255, 10: 254, 11: 255, 12: 255, 13: 254, 14: 255, 15: 255, 16: 255, 17: 255, 18: 255, 19: 255, 20: 255, 21: 255, 22: 255, 23: 255, 24: 255, 25: 255, 26: 255, 27: 255, 28: 255, 29: 255, 30: 255, 31: 255, 32: 253, 33: 253, 34: 253, 35: 253, 36: 253, 37: 253, 38: 253, 39: 253, 40: 253, 41: 253, 42: 253, 43: 253, 44: 253, 45: 253, 46: 253, 47: 253, 48: 252, 49: 252, 50: 252, 51: 252, 52: 252, 53: 252, 54: 252, 55: 252, 56: 252, 57: 252, 58: 253, 59: 253, 60: 253, 61: 253, 62: 253, 63: 253, 64: 253, 65: 69, 66: 91, 67: 79, 68: 80, 69: 92, 70: 89, 71: 97, 72: 90, 73: 68, 74: 111, 75: 112, 76: 82, 77: 73, 78: 95, 79: 85, 80: 78, 81: 121, 82: 86, 83: 71, 84: 67, 85: 102, 86: 107, 87: 84, 88: 114, 89: 103, 90: 115, 91: 253, 92: 253, 93: 253, 94: 253, 95: 253, 96: 253, 97: 50, 98: 74, 99: 60, 100: 61, 101: 42, 102: 76, 103: 70, 104: 64, 105: 53, 106: 105, 107: 93, 108: 56, 109: 65, 110: 54, 111: 49, 112: 66, 113: 110, 114: 51, 115: 43, 116: 44, 117: 63, 118: 81, 119: 77, 120: 98, 121: 75, 122: 108, 123: 253, 124: 253, 125: 253, 126: 253, 127: 253, 128: 124, 129: 202, 130: 203, 131: 204, 132: 205, 133: 40, 134: 58, 135: 206, 136: 207, 137: 208, 138: 209, 139: 210, 140: 211, 141: 212, 142: 213, 143: 214, 144: 215, 145: 83, 146: 52, 147: 47, 148: 46, 149: 72, 150: 32, 151: 94, 152: 216, 153: 113, 154: 217, 155: 109, 156: 218, 157: 219, 158: 220, 159: 221, 160: 34, 161: 116, 162: 222, 163: 118, 164: 100, 165: 223, 166: 224, 167: 117, 168: 119, 169: 104, 170: 125, 171: 225, 172: 226, 173: 87, 174: 99, 175: 227, 176: 106, 177: 122, 178: 123, 179: 228, 180: 55, 181: 229, 182: 230, 183: 101, 184: 231, 185: 232, 186: 120, 187: 233, 188: 48, 189: 39, 190: 57, 191: 234, 192: 30, 193: 59, 194: 41, 195: 88, 196: 33, 197: 37, 198: 36, 199: 31, 200: 29, 201: 35, 202: 235, 203: 62, 204: 28, 205: 236, 206: 126, 207: 237, 208: 238, 209: 38, 210: 45, 211: 239, 212: 240, 213: 241, 214: 242, 215: 243, 216: 127, 217: 244, 218: 245, 219: 246, 220: 247, 221: 248, 222: 249, 223: 250, 224: 9, 225: 8, 226: 20, 227: 16, 228: 3, 229: 2, 230: 24, 231: 14, 232: 22, 233: 1, 234: 25, 235: 15, 236: 4, 237: 11, 238: 6, 239: 23, 240: 12, 241: 19, 242: 13, 243: 26, 244: 18, 245: 27, 246: 21, 247: 17, 248: 7, 249: 10, 250: 5, 251: 251, 252: 252, 253: 128, 254: 96, 255: 253}
-WINDOWS_1255_HEBREW_MODEL = SingleByteCharSetModel(charset_name='windows-1255', language='Hebrew', char_to_order_map=WINDOWS_1255_HEBREW_CHAR_TO_ORDER, language_model=HEBREW_LANG_MODEL, typical_positive_ratio=0.984004, keep_ascii_letters=False, alphabet='אבגדהוזחטיךכלםמןנסעףפץצקרשתװױײ')
\ No newline at end of file
+
+
+# 3: Positive
+# 2: Likely
+# 1: Unlikely
+# 0: Negative
+#
+# Flattened 64x64 matrix: the byte at 64 * first + second is the likelihood of
+# the character of order ``second`` following the one of order ``first``
+HEBREW_LANG_MODEL = bytes.fromhex(
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # None
+    '00030303030303030303030303030303030303030303030303030303020202020102010201020000020000000000010001000000000000010000000000000100'  # 'י'
+    '00030303030303030303030303030303030303030303030303030303030202020102010301010000020000000100010001000000000000010000000000000000'  # 'ו'
+    '00030303030303030303030303030303030303030303030303010001020201030102010102020000020200000000010001000000010000000000000100010100'  # 'ה'
+    '00030303030303030303030303030303030303030303030203030202020203020102010202020000010000000000010000000000000000010000000000000100'  # 'ל'
+    '00030303030303030303030303030303020303020302020302020201020202020102010102020001020000000000000001000000010000000000000000000100'  # 'ת'
+    '00030303030303030303030303030303030303030303030303020002020202020002000202020000010000000000000000000000000000010000000000000100'  # 'מ'
+    '00030303030303030303030303030303030303030303030303030203000202020002010202020000020100000000010001000000000000020000000000000100'  # 'ר'
+    '00030303030303030303030203030303030303030303030303020102030202020102010202020000010000000000010000000000000000010000000000010100'  # 'ב'
+    '00030303030303030302030303020303030303030303030303030301000200020002010202020000010200000000010001000000000000010000000200000100'  # 'א'
+    '00030303030303030303030303030303030303020302030202030201020101010001010101010300010000000002010000000000000000000000000000000100'  # 'ש'
+    '00010101010101010101010101010101000101000101000001000001000000000000010000000000020000000000010000000000000000000000000000000000'  # 'ם'
+    '00030303030303030303030303030303030303030303030303020202020202020002000102020000000000000000000000000000000000000000000000000100'  # 'נ'
+    '00030303030303030302030303020102030302030303030203020102000201020002000202020000010200000000010001000000000000000000000100000100'  # 'ע'
+    '00030303030303030302030303010202030302030203020203010202000202020002010202020000010200000000010000000000010000010000000100000100'  # 'ח'
+    '00030303030303030303030303020303030203030202020303030301030202020002000102020000000000000000000000000000000000000000000000000100'  # 'כ'
+    '00030303030303030303030303030202030303020302020201020200020202020002000202020000010000000000010000000000000000000000000000000100'  # 'ד'
+    '00030303030303030303030203030301030203030203030202010202020202020002010201020000010000000000010000000000010000010000000000000100'  # 'ק'
+    '00030303030302030203030203030303020302030303030302020202020202010002000102010000000000000000010000000000000000010000000000000100'  # 'פ'
+    '00030303030303030302010203030303030303020302030201020300020102020002010102010000010000000000010000000000000000010000000000000200'  # 'ס'
+    '00030303030303030302030303030201030102020201020303010201020202020001010101010000000000000000010000000000010000020000000000000000'  # 'ג'
+    '00030303030303030303000203030301030303010202020201010202020202020002000101020000000000000000000000000000000000010000000000000100'  # 'צ'
+    '00030303030302030303020203030302010203020302020202010201010102020002010101010000010000000000000000000000000000000000000000000100'  # 'ט'
+    '00010101010101010101010101010101010101010100010000000100000000000100010000000000020000000000010001000000000000000000000000000000'  # 'ן'
+    '00030303030203030203010202020203020301010202010202010100020202020001000102020000010100000000000000000000000000010000000000000100'  # 'ז'
+    '00000001010001000001010000000100000000000000000000000000010202000000000000000000010000000000000000000000000000000000000000000000'  # 'ך'
+    '00000100010001010001010000000101000101010000000000000100000000000000000000000000010000000000000000000000000000000000000000000000'  # 'ף'
+    '00000000010100010001000000000000000000010000000000000000000000000000000000000000010000000000000000000000000000010000000000000000'  # 'ץ'
+    '00020201020202020202020102020102020101010101010101020101000303030003000202020200000100000001000000000000000000000000000000000100'  # 'ּ'
+    '00020203020202020202020202020202020202010202010202020101010200010000000000000000000000000000000000000000000000000000000000000000'  # 'ָ'
+    '00020202020202020202020102020202020202020202020002020000000000000000000101000000000000000000000000000000000000000000000000000000'  # 'ְ'
+    '00030102020202020202020202020202020202020202020202010201000201000000000001000000000000000000000000000000000000000000000000000000'  # 'ַ'
+    '00010101010101010101010000010101010001010101000000000000000000000000000000000000000000000000000000000000000001000000000000000000'  # '–'
+    '00030101020202020201020202010102020202020202010202010001010101000001000001000000000000000000000000000000000000000000000000000000'  # 'ִ'
+    '00020101010102010102010001010101010101010101010001000000000000000000020000000000000000010100000000010100000101000000000000010000'  # '\xa0'
+    '00010102020202020202020202020102020202020102010201010101000000000000000100000000000000000000000000000000000000000000000000000000'  # 'ֹ'
+    '00020102020202020202020202010201020101020101010201020102000100010000000001000000000000000000000000000000000000000000000000000000'  # 'ֶ'
+    '00030102020201020202020202020201020101010101010201020101000100010000000001000000000000000000000000000000000000000000000000000000'  # 'ֵ'
+    '00010200000000000000000000010000000000000000000000000000000202020002000102020000000000000000000000000000000000000000000000000100'  # 'ׁ'
+    '00000000010000000000000000000001000100000001000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # '½'
+    '00010101010101010001010001000001000001000000000001000000000000000000000000000000020001010100010000000101000101000000000001010000'  # '…'
+    '00010101020102020200020002000101020101010102010001010000000000000000000000000000000000000000000000000000000000000000000000000000'  # 'ֲ'
+    '00000000000000000000000000000000000001000000000000000000000000000100010000000000010001020200010000010102020102000200000001020001'  # 'e'
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000020002010200020000010101010101000100000001000001'  # 's'
+    '00000000000000000000000000000000000000000000000000000000000000000000010000000000010002010100010000010101020200000100000001000001'  # 't'
+    '00010201000101010001000101010100000001000100000000000000000202010002000102010000000000000000000000000000000000000000000000000000'  # 'ׂ'
+    '00010000010001010101000000000001000000000101000000000000000000000000000000000000000000000100000000000000000000000000000000000000'  # '”'
+    '00010101010101010102010001010101010101010101010001000000000000000000000000000000000001010100000000010101000101000100000001010001'  # '“'
+    '00000100010001000001000000000001000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # '¼'
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000010001010100010000010102010102000100000001010001'  # 'o'
+    '00000001000001000000010000000000000100000000000000000000000000000000000000000000010001010200010000000002010102000200000001010001'  # 'a'
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000010002010100010000020201020101000100000001010001'  # 'r'
+    '00000100000101000000000000000000000000000000000000000000000000000000000000000000000001020200000000000101000100000100000000010001'  # '’'
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000001020200000000020101010002010100000002010001'  # 'i'
+    '00000001000000000000000000000000000000000000000000000000000000000000000000000000010001010200010000010100020101000100000001010001'  # 'n'
+    '00020101010001010001010001000000000000010000000100000000000000000000000000000000000000010000000000000000000000000000000000000000'  # '´'
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000010002010100010000010100010201000200000001010001'  # 'l'
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # '¾'
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000020000000000'  # '†'
+    '00010000020002010100010001000001000000000100000001000000000001000000000000000000000000000000000000000000000000000000000000000000'  # 'ֱ'
+    '00000001000001000001000001000000000000000000000000000000000000000000000000000000010001010200010000010101000100000100000001000001'  # 'c'
+    '00000001000000000000000000000000000000000000000000000000000000000100000000000000010001010000010000020101010101000100000000010001'  # 'd'
+    '00010101020101010100010101010101010101010101000101000000000000000000000000000000000000000000000000000000000000000000000000000000'  # 'ֻ'
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000001020100000000000101010101000100000001010000'  # 'u'
+)
+
+# 255: Undefined characters that did not exist in training text
+# 254: Carriage/Return
+# 253: symbol (punctuation) that does not belong to word
+# 252: 0 - 9
+# 251: Control characters
+
+# Character Mapping Table(s), indexed by byte value:
+WINDOWS_1255_HEBREW_CHAR_TO_ORDER = bytes.fromhex(
+    'fffffffffffffffffffffefffffeffff'  # '\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f'
+    'ffffffffffffffffffffffffffffffff'  # '\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f'
+    'fdfdfdfdfdfdfdfdfdfdfdfdfdfdfdfd'  # ' !"#$%&\'()*+,-./'
+    'fcfcfcfcfcfcfcfcfcfcfdfdfdfdfdfd'  # '0123456789:;<=>?'
+    'fd455b4f505c59615a446f7052495f55'  # '@ABCDEFGHIJKLMNO'
+    '4e79564743666b54726773fdfdfdfdfd'  # 'PQRSTUVWXYZ[\\]^_'
+    'fd324a3c3d2a4c464035695d38413631'  # '`abcdefghijklmno'
+    '426e332b2c3f514d624b6cfdfdfdfdfd'  # 'pqrstuvwxyz{|}~\x7f'
+    '7ccacbcccd283acecfd0d1d2d3d4d5d6'  # '€�‚ƒ„…†‡ˆ‰�‹����'
+    'd753342f2e48205ed871d96ddadbdcdd'  # '�‘’“”•–—˜™�›����'
+    '2274de7664dfe07577687de1e25763e3'  # '\xa0¡¢£₪¥¦§¨©×«¬\xad®¯'
+    '6a7a7be437e5e665e7e878e9302739ea'  # '°±²³´µ¶·¸¹÷»¼½¾¿'
+    '1e3b29582125241f1d23eb3e1cec7eed'  # 'ְֱֲֳִֵֶַָֹ�ֻּֽ־ֿ'
+    'ee262deff0f1f2f37ff4f5f6f7f8f9fa'  # '׀ׁׂ׃װױײ׳״�������'
+    '090814100302180e1601190f040b0617'  # 'אבגדהוזחטיךכלםמן'
+    '0c130d1a121b1511070a05fbfc8060fd'  # 'נסעףפץצקרשת��\u200e\u200f�'
+)
+
+WINDOWS_1255_HEBREW_MODEL = SingleByteCharSetModel(charset_name='windows-1255',
+                                                   language='Hebrew',
+                                                   char_to_order_map=WINDOWS_1255_HEBREW_CHAR_TO_ORDER,
+                                                   language_model=HEBREW_LANG_MODEL,
+                                                   typical_positive_ratio=0.984004,
+                                                   keep_ascii_letters=False,
+                                                   alphabet='אבגדהוזחטיךכלםמןנסעףפץצקרשתװױײ')
+
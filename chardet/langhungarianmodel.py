@@ -1,6 +1,138 @@
 from chardet.sbcharsetprober import SingleByteCharSetModel
-HUNGARIAN_LANG_MODEL = {28: {28: 0, 40: 1, 54: 1, 45: 2, 32: 1, 50: 1, 49: 2, 38: 1, 39: 2, 53: 1, 36: 2, 41: 2, 34: 1, 35: 2, 47: 1, 46: 2, 43: 2, 33: 2, 37: 2, 57: 1, 48: 1, 55: 1, 52: 2, 2: 0, 18: 1, 26: 1, 17: 2, 1: 1, 27: 1, 12: 1, 20: 1, 9: 1, 22: 1, 7: 2, 6: 2, 13: 2, 4: 2, 8: 0, 23: 2, 10: 2, 5: 1, 3: 1, 21: 1, 19: 1, 62: 1, 16: 0, 11: 3, 51: 1, 44: 0, 61: 1, 58: 0, 59: 0, 60: 0, 63: 0, 14: 0, 15: 0, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 40: {28: 2, 40: 1, 54: 1, 45: 1, 32: 2, 50: 0, 49: 0, 38: 0, 39: 1, 53: 1, 36: 1, 41: 1, 34: 0, 35: 1, 47: 2, 46: 0, 43: 1, 33: 1, 37: 1, 57: 1, 48: 1, 55: 0, 52: 0, 2: 2, 18: 0, 26: 0, 17: 0, 1: 3, 27: 0, 12: 0, 20: 0, 9: 2, 22: 1, 7: 0, 6: 1, 13: 0, 4: 0, 8: 2, 23: 1, 10: 2, 5: 0, 3: 0, 21: 3, 19: 0, 62: 0, 16: 1, 11: 0, 51: 1, 44: 1, 61: 1, 58: 1, 59: 1, 60: 1, 63: 1, 14: 2, 15: 2, 30: 1, 25: 1, 24: 1, 31: 1, 29: 1, 42: 1, 56: 1}, 54: {28: 1, 40: 1, 54: 1, 45: 1, 32: 1, 50: 0, 49: 0, 38: 1, 39: 2, 53: 1, 36: 1, 41: 1, 34: 1, 35: 0, 47: 1, 46: 1, 43: 1, 33: 2, 37: 1, 57: 1, 48: 0, 55: 1, 52: 1, 2: 2, 18: 0, 26: 0, 17: 0, 1: 1, 27: 0, 12: 0, 20: 1, 9: 1, 22: 0, 7: 0, 6: 1, 13: 0, 4: 0, 8: 2, 23: 0, 10: 1, 5: 3, 3: 0, 21: 1, 19: 0, 62: 0, 16: 1, 11: 1, 51: 1, 44: 1, 61: 1, 58: 0, 59: 0, 60: 0, 63: 0, 14: 1, 15: 1, 30: 1, 25: 1, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 45: {28: 2, 40: 1, 54: 0, 45: 1, 32: 2, 50: 1, 49: 1, 38: 1, 39: 2, 53: 1, 36: 1, 41: 0, 34: 1, 35: 1, 47: 2, 46: 0, 43: 1, 33: 1, 37: 1, 57: 1, 48: 1, 55: 1, 52: 1, 2: 2, 18: 0, 26: 0, 17: 0, 1: 3, 27: 0, 12: 0, 20: 0, 9: 1, 22: 0, 7: 0, 6: 0, 13: 0, 4: 0, 8: 1, 23: 0, 10: 2, 5: 0, 3: 0, 21: 2, 19: 0, 62: 0, 16: 1, 11: 1, 51: 1, 44: 1, 61: 1, 58: 1, 59: 1, 60: 1, 63: 1, 14: 1, 15: 1, 30: 1, 25: 1, 24: 1, 31: 1, 29: 1, 42: 1, 56: 0}, 32: {28: 1, 40: 1, 54: 1, 45: 1, 32: 1, 50: 1, 49: 2, 38: 1, 39: 1, 53: 1, 36: 2, 41: 2, 34: 2, 35: 2, 47: 1, 46: 1, 43: 2, 33: 2, 37: 2, 57: 1, 48: 1, 55: 1, 52: 1, 2: 1, 18: 1, 26: 1, 17: 2, 1: 1, 27: 1, 12: 3, 20: 1, 9: 1, 22: 1, 7: 1, 6: 2, 13: 2, 4: 2, 8: 0, 23: 1, 10: 2, 5: 2, 3: 1, 21: 2, 19: 1, 62: 1, 16: 0, 11: 3, 51: 1, 44: 1, 61: 0, 58: 1, 59: 1, 60: 0, 63: 1, 14: 0, 15: 0, 30: 0, 25: 0, 24: 1, 31: 0, 29: 0, 42: 0, 56: 0}, 50: {28: 1, 40: 0, 54: 0, 45: 0, 32: 1, 50: 1, 49: 0, 38: 1, 39: 1, 53: 1, 36: 1, 41: 1, 34: 1, 35: 1, 47: 1, 46: 0, 43: 1, 33: 0, 37: 1, 57: 1, 48: 0, 55: 1, 52: 0, 2: 2, 18: 0, 26: 0, 17: 0, 1: 2, 27: 1, 12: 0, 20: 0, 9: 2, 22: 1, 7: 0, 6: 1, 13: 0, 4: 0, 8: 2, 23: 0, 10: 2, 5: 0, 3: 0, 21: 1, 19: 0, 62: 0, 16: 0, 11: 0, 51: 1, 44: 1, 61: 0, 58: 1, 59: 1, 60: 0, 63: 1, 14: 1, 15: 1, 30: 0, 25: 0, 24: 2, 31: 1, 29: 1, 42: 1, 56: 1}, 49: {28: 2, 40: 1, 54: 1, 45: 1, 32: 2, 50: 1, 49: 1, 38: 1, 39: 1, 53: 1, 36: 1, 41: 1, 34: 1, 35: 1, 47: 1, 46: 1, 43: 1, 33: 1, 37: 1, 57: 1, 48: 1, 55: 2, 52: 1, 2: 2, 18: 0, 26: 0, 17: 0, 1: 2, 27: 0, 12: 0, 20: 0, 9: 1, 22: 0, 7: 0, 6: 1, 13: 0, 4: 0, 8: 2, 23: 0, 10: 2, 5: 0, 3: 0, 21: 1, 19: 0, 62: 0, 16: 2, 11: 0, 51: 1, 44: 1, 61: 1, 58: 1, 59: 1, 60: 1, 63: 1, 14: 1, 15: 1, 30: 0, 25: 1, 24: 1, 31: 1, 29: 1, 42: 1, 56: 0}, 38: {28: 2, 40: 1, 54: 1, 45: 0, 32: 1, 50: 0, 49: 0, 38: 0, 39: 1, 53: 0, 36: 0, 41: 1, 34: 0, 35: 0, 47: 1, 46: 0, 43: 1, 33: 1, 37: 1, 57: 1, 48: 0, 55: 1, 52: 0, 2: 3, 18: 0, 26: 0, 17: 0, 1: 2, 27: 0, 12: 0, 20: 0, 9: 2, 22: 1, 7: 0, 6: 1, 13: 1, 4: 0, 8: 3, 23: 0, 10: 1, 5: 0, 3: 0, 21: 2, 19: 0, 62: 0, 16: 1, 11: 0, 51: 2, 44: 2, 61: 1, 58: 1, 59: 1, 60: 1, 63: 1, 14: 2, 15: 1, 30: 2, 25: 1, 24: 1, 31: 1, 29: 1, 42: 1, 56: 1}, 39: {28: 2, 40: 1, 54: 1, 45: 1, 32: 1, 50: 1, 49: 1, 38: 1, 39: 2, 53: 1, 36: 2, 41: 2, 34: 1, 35: 2, 47: 1, 46: 1, 43: 1, 33: 2, 37: 1, 57: 1, 48: 1, 55: 0, 52: 2, 2: 0, 18: 1, 26: 1, 17: 2, 1: 0, 27: 1, 12: 2, 20: 1, 9: 0, 22: 1, 7: 1, 6: 2, 13: 2, 4: 1, 8: 0, 23: 1, 10: 2, 5: 2, 3: 2, 21: 0, 19: 1, 62: 0, 16: 0, 11: 1, 51: 1, 44: 1, 61: 0, 58: 1, 59: 1, 60: 1, 63: 1, 14: 0, 15: 0, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 53: {28: 2, 40: 0, 54: 1, 45: 1, 32: 2, 50: 0, 49: 0, 38: 1, 39: 1, 53: 1, 36: 1, 41: 1, 34: 1, 35: 1, 47: 1, 46: 0, 43: 0, 33: 1, 37: 1, 57: 1, 48: 0, 55: 0, 52: 1, 2: 2, 18: 0, 26: 0, 17: 0, 1: 2, 27: 0, 12: 0, 20: 0, 9: 1, 22: 0, 7: 0, 6: 0, 13: 0, 4: 0, 8: 1, 23: 0, 10: 0, 5: 0, 3: 0, 21: 2, 19: 0, 62: 0, 16: 0, 11: 0, 51: 1, 44: 1, 61: 0, 58: 1, 59: 1, 60: 1, 63: 1, 14: 2, 15: 1, 30: 0, 25: 2, 24: 2, 31: 1, 29: 0, 42: 1, 56: 0}, 36: {28: 2, 40: 1, 54: 1, 45: 1, 32: 2, 50: 1, 49: 0, 38: 1, 39: 2, 53: 1, 36: 1, 41: 1, 34: 1, 35: 1, 47: 2, 46: 0, 43: 1, 33: 1, 37: 1, 57: 1, 48: 1, 55: 1, 52: 0, 2: 2, 18: 0, 26: 0, 17: 0, 1: 2, 27: 1, 12: 0, 20: 1, 9: 3, 22: 0, 7: 0, 6: 1, 13: 1, 4: 1, 8: 2, 23: 0, 10: 2, 5: 0, 3: 0, 21: 1, 19: 1, 62: 0, 16: 1, 11: 0, 51: 1, 44: 1, 61: 1, 58: 1, 59: 2, 60: 1, 63: 1, 14: 2, 15: 2, 30: 1, 25: 1, 24: 2, 31: 1, 29: 2, 42: 1, 56: 0}, 41: {28: 2, 40: 1, 54: 1, 45: 1, 32: 2, 50: 1, 49: 1, 38: 1, 39: 2, 53: 1, 36: 1, 41: 2, 34: 1, 35: 1, 47: 2, 46: 0, 43: 1, 33: 1, 37: 2, 57: 1, 48: 1, 55: 1, 52: 1, 2: 2, 18: 0, 26: 0, 17: 0, 1: 3, 27: 0, 12: 0, 20: 0, 9: 2, 22: 1, 7: 0, 6: 1, 13: 0, 4: 0, 8: 2, 23: 0, 10: 0, 5: 0, 3: 0, 21: 2, 19: 0, 62: 0, 16: 1, 11: 0, 51: 2, 44: 1, 61: 1, 58: 1, 59: 1, 60: 1, 63: 1, 14: 2, 15: 1, 30: 1, 25: 1, 24: 1, 31: 0, 29: 1, 42: 0, 56: 0}, 34: {28: 2, 40: 1, 54: 0, 45: 0, 32: 2, 50: 1, 49: 0, 38: 1, 39: 2, 53: 1, 36: 1, 41: 1, 34: 1, 35: 1, 47: 1, 46: 1, 43: 1, 33: 1, 37: 1, 57: 1, 48: 1, 55: 1, 52: 1, 2: 3, 18: 0, 26: 1, 17: 0, 1: 3, 27: 0, 12: 0, 20: 0, 9: 3, 22: 0, 7: 0, 6: 0, 13: 1, 4: 1, 8: 3, 23: 0, 10: 1, 5: 0, 3: 0, 21: 2, 19: 0, 62: 0, 16: 1, 11: 0, 51: 2, 44: 1, 61: 1, 58: 1, 59: 1, 60: 1, 63: 1, 14: 2, 15: 2, 30: 1, 25: 1, 24: 1, 31: 1, 29: 1, 42: 0, 56: 1}, 35: {28: 2, 40: 1, 54: 1, 45: 2, 32: 2, 50: 1, 49: 1, 38: 1, 39: 1, 53: 1, 36: 1, 41: 1, 34: 1, 35: 1, 47: 1, 46: 1, 43: 1, 33: 1, 37: 2, 57: 1, 48: 1, 55: 2, 52: 1, 2: 3, 18: 0, 26: 0, 17: 0, 1: 3, 27: 0, 12: 0, 20: 0, 9: 2, 22: 0, 7: 0, 6: 0, 13: 0, 4: 1, 8: 2, 23: 0, 10: 0, 5: 0, 3: 0, 21: 1, 19: 0, 62: 0, 16: 2, 11: 0, 51: 1, 44: 1, 61: 1, 58: 1, 59: 1, 60: 1, 63: 1, 14: 1, 15: 2, 30: 1, 25: 1, 24: 1, 31: 0, 29: 0, 42: 1, 56: 0}, 47: {28: 1, 40: 1, 54: 1, 45: 1, 32: 1, 50: 1, 49: 1, 38: 1, 39: 1, 53: 1, 36: 2, 41: 2, 34: 2, 35: 2, 47: 1, 46: 1, 43: 2, 33: 2, 37: 2, 57: 1, 48: 1, 55: 1, 52: 1, 2: 0, 18: 1, 26: 1, 17: 1, 1: 1, 27: 1, 12: 1, 20: 1, 9: 1, 22: 1, 7: 2, 6: 2, 13: 1, 4: 1, 8: 1, 23: 1, 10: 2, 5: 1, 3: 2, 21: 1, 19: 0, 62: 1, 16: 0, 11: 1, 51: 1, 44: 1, 61: 0, 58: 1, 59: 0, 60: 0, 63: 0, 14: 0, 15: 0, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 46: {28: 1, 40: 1, 54: 1, 45: 1, 32: 1, 50: 1, 49: 1, 38: 1, 39: 1, 53: 1, 36: 1, 41: 1, 34: 0, 35: 1, 47: 1, 46: 1, 43: 2, 33: 1, 37: 1, 57: 1, 48: 1, 55: 0, 52: 1, 2: 2, 18: 0, 26: 0, 17: 0, 1: 2, 27: 1, 12: 0, 20: 1, 9: 2, 22: 0, 7: 0, 6: 1, 13: 0, 4: 1, 8: 2, 23: 0, 10: 2, 5: 1, 3: 0, 21: 1, 19: 0, 62: 0, 16: 1, 11: 0, 51: 2, 44: 1, 61: 1, 58: 1, 59: 1, 60: 0, 63: 1, 14: 3, 15: 2, 30: 0, 25: 1, 24: 1, 31: 0, 29: 1, 42: 1, 56: 0}, 43: {28: 2, 40: 1, 54: 1, 45: 1, 32: 2, 50: 1, 49: 1, 38: 1, 39: 2, 53: 1, 36: 1, 41: 1, 34: 1, 35: 1, 47: 2, 46: 1, 43: 1, 33: 2, 37: 2, 57: 1, 48: 1, 55: 1, 52: 1, 2: 2, 18: 0, 26: 0, 17: 0, 1: 2, 27: 0, 12: 0, 20: 1, 9: 2, 22: 0, 7: 0, 6: 0, 13: 0, 4: 0, 8: 2, 23: 0, 10: 0, 5: 0, 3: 0, 21: 1, 19: 0, 62: 0, 16: 1, 11: 0, 51: 2, 44: 1, 61: 1, 58: 2, 59: 1, 60: 1, 63: 1, 14: 2, 15: 2, 30: 1, 25: 2, 24: 1, 31: 1, 29: 1, 42: 0, 56: 0}, 33: {28: 2, 40: 1, 54: 1, 45: 1, 32: 2, 50: 1, 49: 1, 38: 1, 39: 2, 53: 1, 36: 1, 41: 1, 34: 1, 35: 1, 47: 2, 46: 1, 43: 1, 33: 2, 37: 2, 57: 1, 48: 1, 55: 1, 52: 3, 2: 2, 18: 0, 26: 1, 17: 0, 1: 2, 27: 0, 12: 0, 20: 1, 9: 2, 22: 0, 7: 1, 6: 1, 13: 1, 4: 0, 8: 2, 23: 1, 10: 0, 5: 0, 3: 1, 21: 1, 19: 1, 62: 0, 16: 1, 11: 3, 51: 2, 44: 1, 61: 1, 58: 1, 59: 1, 60: 1, 63: 1, 14: 2, 15: 1, 30: 1, 25: 1, 24: 1, 31: 1, 29: 1, 42: 1, 56: 1}, 37: {28: 2, 40: 1, 54: 1, 45: 1, 32: 2, 50: 1, 49: 1, 38: 1, 39: 2, 53: 1, 36: 1, 41: 1, 34: 1, 35: 1, 47: 2, 46: 1, 43: 2, 33: 1, 37: 2, 57: 1, 48: 1, 55: 1, 52: 1, 2: 2, 18: 0, 26: 0, 17: 0, 1: 2, 27: 0, 12: 0, 20: 1, 9: 2, 22: 0, 7: 0, 6: 0, 13: 0, 4: 0, 8: 2, 23: 0, 10: 1, 5: 1, 3: 0, 21: 2, 19: 0, 62: 0, 16: 1, 11: 1, 51: 2, 44: 2, 61: 1, 58: 1, 59: 1, 60: 1, 63: 1, 14: 2, 15: 1, 30: 1, 25: 1, 24: 2, 31: 1, 29: 1, 42: 1, 56: 1}, 57: {28: 1, 40: 1, 54: 1, 45: 1, 32: 1, 50: 1, 49: 1, 38: 1, 39: 1, 53: 1, 36: 1, 41: 1, 34: 1, 35: 1, 47: 1, 46: 1, 43: 1, 33: 2, 37: 1, 57: 0, 48: 1, 55: 0, 52: 1, 2: 0, 18: 1, 26: 1, 17: 1, 1: 1, 27: 0, 12: 2, 20: 0, 9: 0, 22: 1, 7: 1, 6: 1, 13: 1, 4: 1, 8: 0, 23: 1, 10: 1, 5: 1, 3: 1, 21: 0, 19: 0, 62: 0, 16: 0, 11: 1, 51: 0, 44: 0, 61: 1, 58: 0, 59: 0, 60: 0, 63: 0, 14: 0, 15: 0, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 48: {28: 2, 40: 0, 54: 0, 45: 1, 32: 2, 50: 1, 49: 0, 38: 0, 39: 2, 53: 1, 36: 1, 41: 0, 34: 1, 35: 1, 47: 1, 46: 1, 43: 1, 33: 1, 37: 1, 57: 1, 48: 1, 55: 1, 52: 0, 2: 3, 18: 0, 26: 0, 17: 0, 1: 2, 27: 0, 12: 0, 20: 0, 9: 2, 22: 0, 7: 0, 6: 1, 13: 0, 4: 0, 8: 2, 23: 0, 10: 0, 5: 0, 3: 0, 21: 1, 19: 0, 62: 0, 16: 0, 11: 0, 51: 2, 44: 2, 61: 1, 58: 1, 59: 1, 60: 0, 63: 1, 14: 2, 15: 2, 30: 1, 25: 0, 24: 1, 31: 0, 29: 0, 42: 0, 56: 0}, 55: {28: 2, 40: 1, 54: 1, 45: 1, 32: 2, 50: 1, 49: 1, 38: 1, 39: 1, 53: 1, 36: 1, 41: 1, 34: 1, 35: 1, 47: 1, 46: 1, 43: 1, 33: 1, 37: 1, 57: 1, 48: 1, 55: 0, 52: 2, 2: 1, 18: 0, 26: 0, 17: 1, 1: 1, 27: 0, 12: 0, 20: 0, 9: 0, 22: 0, 7: 0, 6: 0, 13: 0, 4: 0, 8: 1, 23: 1, 10: 0, 5: 0, 3: 0, 21: 0, 19: 1, 62: 0, 16: 0, 11: 0, 51: 1, 44: 1, 61: 1, 58: 1, 59: 1, 60: 1, 63: 1, 14: 0, 15: 0, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 52: {28: 2, 40: 1, 54: 0, 45: 1, 32: 2, 50: 1, 49: 1, 38: 1, 39: 2, 53: 1, 36: 1, 41: 1, 34: 1, 35: 1, 47: 2, 46: 1, 43: 1, 33: 2, 37: 1, 57: 1, 48: 1, 55: 1, 52: 1, 2: 1, 18: 0, 26: 0, 17: 0, 1: 1, 27: 0, 12: 0, 20: 0, 9: 1, 22: 0, 7: 0, 6: 0, 13: 0, 4: 1, 8: 1, 23: 0, 10: 1, 5: 2, 3: 0, 21: 1, 19: 0, 62: 0, 16: 0, 11: 0, 51: 2, 44: 1, 61: 1, 58: 1, 59: 1, 60: 1, 63: 1, 14: 1, 15: 1, 30: 0, 25: 0, 24: 1, 31: 1, 29: 1, 42: 0, 56: 0}, 2: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 1, 18: 3, 26: 3, 17: 3, 1: 2, 27: 2, 12: 3, 20: 3, 9: 3, 22: 3, 7: 3, 6: 3, 13: 3, 4: 3, 8: 2, 23: 3, 10: 3, 5: 3, 3: 3, 21: 3, 19: 3, 62: 1, 16: 2, 11: 3, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 1, 15: 1, 30: 1, 25: 1, 24: 1, 31: 1, 29: 1, 42: 0, 56: 0}, 18: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 3, 26: 1, 17: 1, 1: 3, 27: 1, 12: 1, 20: 1, 9: 3, 22: 2, 7: 2, 6: 2, 13: 1, 4: 2, 8: 3, 23: 1, 10: 3, 5: 2, 3: 1, 21: 3, 19: 1, 62: 0, 16: 1, 11: 1, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 2, 25: 3, 24: 2, 31: 2, 29: 2, 42: 2, 56: 1}, 26: {28: 0, 40: 0, 54: 1, 45: 0, 32: 0, 50: 0, 49: 1, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 2, 18: 1, 26: 2, 17: 1, 1: 3, 27: 1, 12: 1, 20: 3, 9: 3, 22: 1, 7: 2, 6: 1, 13: 1, 4: 1, 8: 3, 23: 1, 10: 2, 5: 3, 3: 2, 21: 2, 19: 1, 62: 0, 16: 1, 11: 2, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 2, 15: 2, 30: 2, 25: 1, 24: 1, 31: 1, 29: 1, 42: 0, 56: 0}, 17: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 2, 26: 1, 17: 2, 1: 3, 27: 1, 12: 1, 20: 2, 9: 3, 22: 3, 7: 2, 6: 1, 13: 2, 4: 3, 8: 3, 23: 1, 10: 3, 5: 3, 3: 3, 21: 3, 19: 3, 62: 0, 16: 2, 11: 2, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 3, 25: 3, 24: 3, 31: 2, 29: 2, 42: 2, 56: 1}, 1: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 2, 18: 3, 26: 3, 17: 3, 1: 2, 27: 3, 12: 3, 20: 3, 9: 3, 22: 3, 7: 3, 6: 3, 13: 3, 4: 3, 8: 2, 23: 3, 10: 3, 5: 3, 3: 3, 21: 2, 19: 3, 62: 2, 16: 2, 11: 3, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 1, 30: 1, 25: 1, 24: 1, 31: 1, 29: 1, 42: 0, 56: 0}, 27: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 1, 26: 1, 17: 1, 1: 3, 27: 2, 12: 1, 20: 1, 9: 3, 22: 2, 7: 1, 6: 1, 13: 1, 4: 1, 8: 3, 23: 0, 10: 3, 5: 1, 3: 1, 21: 2, 19: 1, 62: 0, 16: 1, 11: 0, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 1, 25: 1, 24: 3, 31: 1, 29: 2, 42: 1, 56: 1}, 12: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 3, 26: 2, 17: 2, 1: 3, 27: 2, 12: 3, 20: 3, 9: 3, 22: 3, 7: 2, 6: 3, 13: 2, 4: 3, 8: 3, 23: 1, 10: 3, 5: 3, 3: 3, 21: 3, 19: 3, 62: 0, 16: 3, 11: 2, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 2, 25: 3, 24: 2, 31: 2, 29: 2, 42: 2, 56: 1}, 20: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 1, 26: 1, 17: 0, 1: 3, 27: 0, 12: 1, 20: 2, 9: 3, 22: 1, 7: 1, 6: 1, 13: 1, 4: 1, 8: 3, 23: 0, 10: 1, 5: 2, 3: 1, 21: 3, 19: 1, 62: 0, 16: 2, 11: 0, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 3, 25: 2, 24: 2, 31: 2, 29: 1, 42: 1, 56: 1}, 9: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 3, 26: 3, 17: 3, 1: 3, 27: 3, 12: 3, 20: 3, 9: 2, 22: 2, 7: 3, 6: 3, 13: 3, 4: 3, 8: 2, 23: 2, 10: 3, 5: 3, 3: 3, 21: 3, 19: 3, 62: 1, 16: 1, 11: 3, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 2, 30: 1, 25: 3, 24: 1, 31: 2, 29: 1, 42: 0, 56: 1}, 22: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 2, 26: 1, 17: 3, 1: 3, 27: 1, 12: 1, 20: 2, 9: 1, 22: 2, 7: 2, 6: 2, 13: 1, 4: 2, 8: 3, 23: 1, 10: 2, 5: 2, 3: 3, 21: 3, 19: 1, 62: 0, 16: 0, 11: 2, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 1, 25: 3, 24: 3, 31: 3, 29: 2, 42: 1, 56: 1}, 7: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 3, 26: 2, 17: 1, 1: 3, 27: 1, 12: 1, 20: 2, 9: 3, 22: 2, 7: 3, 6: 3, 13: 1, 4: 3, 8: 3, 23: 1, 10: 3, 5: 3, 3: 3, 21: 3, 19: 2, 62: 0, 16: 2, 11: 1, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 3, 25: 2, 24: 3, 31: 1, 29: 3, 42: 1, 56: 1}, 6: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 1, 41: 0, 34: 0, 35: 1, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 2, 26: 3, 17: 3, 1: 3, 27: 3, 12: 3, 20: 3, 9: 3, 22: 3, 7: 3, 6: 3, 13: 3, 4: 3, 8: 3, 23: 2, 10: 2, 5: 3, 3: 3, 21: 3, 19: 3, 62: 0, 16: 3, 11: 2, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 3, 25: 3, 24: 3, 31: 2, 29: 2, 42: 3, 56: 1}, 13: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 3, 26: 2, 17: 1, 1: 3, 27: 1, 12: 1, 20: 2, 9: 3, 22: 2, 7: 1, 6: 3, 13: 3, 4: 2, 8: 3, 23: 3, 10: 2, 5: 2, 3: 2, 21: 3, 19: 1, 62: 0, 16: 1, 11: 2, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 2, 25: 2, 24: 2, 31: 2, 29: 2, 42: 1, 56: 2}, 4: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 3, 26: 3, 17: 3, 1: 3, 27: 2, 12: 3, 20: 3, 9: 3, 22: 2, 7: 3, 6: 2, 13: 2, 4: 3, 8: 3, 23: 2, 10: 2, 5: 3, 3: 3, 21: 3, 19: 2, 62: 1, 16: 3, 11: 3, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 2, 25: 2, 24: 3, 31: 2, 29: 3, 42: 2, 56: 1}, 8: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 1, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 2, 18: 3, 26: 3, 17: 3, 1: 2, 27: 2, 12: 3, 20: 3, 9: 2, 22: 2, 7: 3, 6: 3, 13: 3, 4: 3, 8: 1, 23: 3, 10: 3, 5: 3, 3: 3, 21: 2, 19: 3, 62: 1, 16: 1, 11: 3, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 1, 15: 2, 30: 1, 25: 1, 24: 1, 31: 1, 29: 1, 42: 0, 56: 0}, 23: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 1, 26: 2, 17: 1, 1: 3, 27: 1, 12: 1, 20: 2, 9: 3, 22: 2, 7: 2, 6: 3, 13: 1, 4: 2, 8: 3, 23: 3, 10: 3, 5: 2, 3: 2, 21: 3, 19: 2, 62: 0, 16: 1, 11: 2, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 2, 25: 2, 24: 2, 31: 1, 29: 2, 42: 1, 56: 1}, 10: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 3, 26: 3, 17: 3, 1: 3, 27: 2, 12: 3, 20: 2, 9: 3, 22: 3, 7: 3, 6: 3, 13: 3, 4: 3, 8: 3, 23: 2, 10: 3, 5: 3, 3: 3, 21: 3, 19: 3, 62: 1, 16: 2, 11: 3, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 2, 25: 3, 24: 3, 31: 3, 29: 3, 42: 2, 56: 2}, 5: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 3, 26: 2, 17: 2, 1: 3, 27: 2, 12: 2, 20: 2, 9: 3, 22: 1, 7: 3, 6: 2, 13: 3, 4: 3, 8: 3, 23: 2, 10: 3, 5: 3, 3: 3, 21: 3, 19: 2, 62: 0, 16: 1, 11: 3, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 3, 25: 3, 24: 3, 31: 3, 29: 3, 42: 2, 56: 1}, 3: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 3, 26: 2, 17: 1, 1: 3, 27: 2, 12: 1, 20: 3, 9: 3, 22: 3, 7: 3, 6: 3, 13: 2, 4: 3, 8: 3, 23: 1, 10: 3, 5: 3, 3: 3, 21: 3, 19: 3, 62: 0, 16: 3, 11: 1, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 2, 25: 3, 24: 3, 31: 3, 29: 3, 42: 3, 56: 2}, 21: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 1, 18: 2, 26: 2, 17: 3, 1: 2, 27: 1, 12: 3, 20: 2, 9: 2, 22: 2, 7: 3, 6: 3, 13: 3, 4: 3, 8: 1, 23: 2, 10: 3, 5: 3, 3: 3, 21: 1, 19: 3, 62: 1, 16: 1, 11: 2, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 2, 15: 1, 30: 1, 25: 1, 24: 0, 31: 1, 29: 0, 42: 0, 56: 0}, 19: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 2, 26: 1, 17: 1, 1: 3, 27: 1, 12: 1, 20: 1, 9: 3, 22: 1, 7: 1, 6: 1, 13: 1, 4: 1, 8: 3, 23: 1, 10: 1, 5: 2, 3: 2, 21: 2, 19: 2, 62: 0, 16: 1, 11: 1, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 2, 25: 2, 24: 2, 31: 1, 29: 2, 42: 1, 56: 1}, 62: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 1, 18: 1, 26: 1, 17: 0, 1: 1, 27: 1, 12: 0, 20: 0, 9: 1, 22: 0, 7: 1, 6: 1, 13: 1, 4: 1, 8: 1, 23: 1, 10: 1, 5: 1, 3: 1, 21: 1, 19: 0, 62: 0, 16: 0, 11: 0, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 1, 15: 1, 30: 1, 25: 1, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 16: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 2, 26: 1, 17: 1, 1: 3, 27: 2, 12: 2, 20: 2, 9: 3, 22: 2, 7: 2, 6: 2, 13: 2, 4: 3, 8: 3, 23: 2, 10: 2, 5: 3, 3: 3, 21: 3, 19: 3, 62: 0, 16: 0, 11: 2, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 2, 25: 2, 24: 3, 31: 2, 29: 2, 42: 1, 56: 2}, 11: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 3, 18: 2, 26: 1, 17: 3, 1: 3, 27: 1, 12: 2, 20: 2, 9: 3, 22: 1, 7: 3, 6: 2, 13: 3, 4: 3, 8: 3, 23: 1, 10: 2, 5: 3, 3: 3, 21: 3, 19: 2, 62: 0, 16: 1, 11: 3, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 3, 15: 3, 30: 3, 25: 3, 24: 3, 31: 2, 29: 3, 42: 2, 56: 1}, 51: {28: 0, 40: 1, 54: 1, 45: 1, 32: 0, 50: 1, 49: 2, 38: 1, 39: 1, 53: 1, 36: 1, 41: 2, 34: 1, 35: 2, 47: 0, 46: 1, 43: 2, 33: 2, 37: 1, 57: 0, 48: 1, 55: 0, 52: 1, 2: 0, 18: 1, 26: 1, 17: 1, 1: 0, 27: 0, 12: 1, 20: 1, 9: 0, 22: 1, 7: 1, 6: 2, 13: 2, 4: 0, 8: 0, 23: 1, 10: 1, 5: 1, 3: 1, 21: 0, 19: 0, 62: 0, 16: 0, 11: 1, 51: 0, 44: 0, 61: 1, 58: 0, 59: 0, 60: 0, 63: 0, 14: 0, 15: 0, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 44: {28: 0, 40: 1, 54: 1, 45: 1, 32: 1, 50: 0, 49: 2, 38: 1, 39: 1, 53: 1, 36: 1, 41: 2, 34: 1, 35: 2, 47: 0, 46: 1, 43: 2, 33: 2, 37: 2, 57: 0, 48: 1, 55: 0, 52: 1, 2: 0, 18: 1, 26: 1, 17: 1, 1: 0, 27: 0, 12: 1, 20: 1, 9: 0, 22: 1, 7: 1, 6: 2, 13: 1, 4: 2, 8: 0, 23: 1, 10: 2, 5: 3, 3: 1, 21: 0, 19: 1, 62: 0, 16: 0, 11: 0, 51: 0, 44: 1, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 0, 15: 0, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 61: {28: 0, 40: 1, 54: 1, 45: 1, 32: 0, 50: 1, 49: 1, 38: 0, 39: 0, 53: 1, 36: 0, 41: 1, 34: 1, 35: 1, 47: 0, 46: 1, 43: 1, 33: 1, 37: 1, 57: 0, 48: 1, 55: 0, 52: 1, 2: 0, 18: 0, 26: 0, 17: 0, 1: 0, 27: 0, 12: 2, 20: 0, 9: 0, 22: 0, 7: 0, 6: 0, 13: 1, 4: 0, 8: 0, 23: 0, 10: 1, 5: 0, 3: 1, 21: 0, 19: 0, 62: 0, 16: 0, 11: 1, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 0, 15: 0, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 58: {28: 1, 40: 1, 54: 1, 45: 1, 32: 0, 50: 1, 49: 1, 38: 1, 39: 1, 53: 1, 36: 1, 41: 2, 34: 1, 35: 1, 47: 0, 46: 1, 43: 1, 33: 1, 37: 1, 57: 0, 48: 1, 55: 0, 52: 1, 2: 0, 18: 1, 26: 1, 17: 1, 1: 0, 27: 0, 12: 0, 20: 2, 9: 0, 22: 0, 7: 1, 6: 1, 13: 0, 4: 1, 8: 0, 23: 1, 10: 1, 5: 1, 3: 0, 21: 0, 19: 1, 62: 0, 16: 0, 11: 1, 51: 0, 44: 1, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 0, 15: 0, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 59: {28: 0, 40: 1, 54: 1, 45: 1, 32: 0, 50: 0, 49: 1, 38: 1, 39: 0, 53: 1, 36: 1, 41: 1, 34: 1, 35: 1, 47: 0, 46: 1, 43: 1, 33: 1, 37: 1, 57: 0, 48: 1, 55: 0, 52: 1, 2: 0, 18: 0, 26: 1, 17: 1, 1: 0, 27: 0, 12: 0, 20: 0, 9: 0, 22: 0, 7: 1, 6: 1, 13: 1, 4: 1, 8: 0, 23: 0, 10: 2, 5: 1, 3: 1, 21: 0, 19: 1, 62: 0, 16: 0, 11: 1, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 0, 15: 0, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 60: {28: 0, 40: 1, 54: 1, 45: 1, 32: 0, 50: 1, 49: 1, 38: 0, 39: 0, 53: 1, 36: 1, 41: 1, 34: 1, 35: 1, 47: 0, 46: 0, 43: 1, 33: 1, 37: 1, 57: 0, 48: 1, 55: 0, 52: 1, 2: 0, 18: 0, 26: 0, 17: 0, 1: 0, 27: 0, 12: 2, 20: 0, 9: 0, 22: 2, 7: 0, 6: 0, 13: 0, 4: 1, 8: 0, 23: 0, 10: 1, 5: 1, 3: 1, 21: 0, 19: 0, 62: 0, 16: 0, 11: 0, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 0, 15: 0, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 63: {28: 0, 40: 1, 54: 0, 45: 1, 32: 0, 50: 0, 49: 1, 38: 1, 39: 0, 53: 1, 36: 1, 41: 1, 34: 1, 35: 1, 47: 0, 46: 0, 43: 1, 33: 1, 37: 1, 57: 0, 48: 1, 55: 0, 52: 1, 2: 0, 18: 1, 26: 0, 17: 1, 1: 0, 27: 0, 12: 1, 20: 0, 9: 0, 22: 0, 7: 0, 6: 1, 13: 0, 4: 1, 8: 0, 23: 0, 10: 1, 5: 1, 3: 1, 21: 0, 19: 1, 62: 0, 16: 0, 11: 1, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 0, 15: 0, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 14: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 1, 18: 3, 26: 3, 17: 3, 1: 1, 27: 2, 12: 3, 20: 2, 9: 2, 22: 3, 7: 3, 6: 3, 13: 3, 4: 3, 8: 1, 23: 2, 10: 3, 5: 3, 3: 3, 21: 2, 19: 3, 62: 0, 16: 1, 11: 3, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 1, 15: 2, 30: 1, 25: 0, 24: 1, 31: 0, 29: 1, 42: 0, 56: 0}, 15: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 1, 18: 3, 26: 2, 17: 3, 1: 1, 27: 1, 12: 3, 20: 3, 9: 2, 22: 2, 7: 3, 6: 3, 13: 3, 4: 3, 8: 1, 23: 3, 10: 3, 5: 3, 3: 3, 21: 0, 19: 3, 62: 0, 16: 0, 11: 3, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 1, 15: 1, 30: 0, 25: 0, 24: 0, 31: 0, 29: 1, 42: 0, 56: 0}, 30: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 0, 18: 1, 26: 2, 17: 1, 1: 0, 27: 1, 12: 3, 20: 0, 9: 0, 22: 1, 7: 1, 6: 2, 13: 2, 4: 3, 8: 0, 23: 1, 10: 3, 5: 2, 3: 3, 21: 0, 19: 3, 62: 0, 16: 0, 11: 2, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 0, 15: 0, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 25: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 2, 18: 3, 26: 2, 17: 3, 1: 1, 27: 2, 12: 2, 20: 2, 9: 2, 22: 2, 7: 3, 6: 3, 13: 2, 4: 3, 8: 1, 23: 2, 10: 3, 5: 3, 3: 3, 21: 1, 19: 2, 62: 0, 16: 0, 11: 3, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 1, 15: 1, 30: 1, 25: 0, 24: 1, 31: 1, 29: 1, 42: 0, 56: 0}, 24: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 0, 18: 3, 26: 1, 17: 2, 1: 0, 27: 1, 12: 2, 20: 1, 9: 0, 22: 1, 7: 3, 6: 3, 13: 3, 4: 3, 8: 0, 23: 2, 10: 3, 5: 3, 3: 3, 21: 0, 19: 3, 62: 0, 16: 0, 11: 3, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 0, 15: 0, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 31: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 1, 18: 1, 26: 2, 17: 1, 1: 1, 27: 2, 12: 3, 20: 1, 9: 1, 22: 3, 7: 1, 6: 3, 13: 1, 4: 2, 8: 0, 23: 1, 10: 3, 5: 3, 3: 2, 21: 1, 19: 1, 62: 0, 16: 0, 11: 2, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 1, 15: 1, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 29: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 1, 18: 1, 26: 1, 17: 2, 1: 1, 27: 1, 12: 3, 20: 2, 9: 1, 22: 1, 7: 3, 6: 3, 13: 1, 4: 3, 8: 0, 23: 1, 10: 2, 5: 2, 3: 2, 21: 0, 19: 2, 62: 0, 16: 0, 11: 2, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 0, 15: 1, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}, 42: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 1, 18: 2, 26: 1, 17: 2, 1: 1, 27: 1, 12: 1, 20: 1, 9: 1, 22: 1, 7: 2, 6: 3, 13: 1, 4: 2, 8: 1, 23: 1, 10: 2, 5: 2, 3: 2, 21: 1, 19: 1, 62: 0, 16: 0, 11: 2, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 0, 15: 1, 30: 1, 25: 0, 24: 0, 31: 0, 29: 1, 42: 0, 56: 0}, 56: {28: 0, 40: 0, 54: 0, 45: 0, 32: 0, 50: 0, 49: 0, 38: 0, 39: 0, 53: 0, 36: 0, 41: 0, 34: 0, 35: 0, 47: 0, 46: 0, 43: 0, 33: 0, 37: 0, 57: 0, 48: 0, 55: 0, 52: 0, 2: 1, 18: 1, 26: 0, 17: 1, 1: 1, 27: 1, 12: 1, 20: 1, 9: 1, 22: 1, 7: 1, 6: 1, 13: 0, 4: 2, 8: 0, 23: 0, 10: 1, 5: 1, 3: 1, 21: 0, 19: 1, 62: 0, 16: 0, 11: 2, 51: 0, 44: 0, 61: 0, 58: 0, 59: 0, 60: 0, 63: 0, 14: 0, 15: 0, 30: 0, 25: 0, 24: 0, 31: 0, 29: 0, 42: 0, 56: 0}}
-WINDOWS_1250_HUNGARIAN_CHAR_TO_ORDER = {0: 255, 1: 255, 2: 255, 3: 255, 4: 255, 5: 255, 6: 255, 7: 255, 8: 255, 9: 255, 10: 254, 11: 255, 12: 255, 13: 254, 14: 255, 15: 255, 16: 255, 17: 255, 18: 255, 19: 255, 20: 255, 21: 255, 22: 255, 23: 255, 24: 255, 25: 255, 26: 255, 27: 255, 28: 255, 29: 255, 30: 255, 31: 255, 32: 253, 33: 253, 34: 253, 35: 253, 36: 253, 37: 253, 38: 253, 39: 253, 40: 253, 41: 253, 42: 253, 43: 253, 44: 253, 45: 253, 46: 253, 47: 253, 48: 252, 49: 252, 50: 252, 51: 252, 52: 252, 53: 252, 54: 252, 55: 252, 56: 252, 57: 252, 58: 253, 59: 253, 60: 253, 61: 253, 62: 253, 63: 253, 64: 253, 65: 28, 66: 40, 67: 54, 68: 45, 69: 32, 70: 50, 71: 49, 72: 38, 73: 39, 74: 53, 75: 36, 76: 41, 77: 34, 78: 35, 79: 47, 80: 46, 81: 72, 82: 43, 83: 33, 84: 37, 85: 57, 86: 48, 87: 64, 88: 68, 89: 55, 90: 52, 91: 253, 92: 253, 93: 253, 94: 253, 95: 253, 96: 253, 97: 2, 98: 18, 99: 26, 100: 17, 101: 1, 102: 27, 103: 12, 104: 20, 105: 9, 106: 22, 107: 7, 108: 6, 109: 13, 110: 4, 111: 8, 112: 23, 113: 67, 114: 10, 115: 5, 116: 3, 117: 21, 118: 19, 119: 65, 120: 62, 121: 16, 122: 11, 123: 253, 124: 253, 125: 253, 126: 253, 127: 253, 128: 161, 129: 162, 130: 163, 131: 164, 132: 165, 133: 166, 134: 167, 135: 168, 136: 169, 137: 170, 138: 171, 139: 172, 140: 173, 141: 174, 142: 175, 143: 176, 144: 177, 145: 178, 146: 179, 147: 180, 148: 78, 149: 181, 150: 69, 151: 182, 152: 183, 153: 184, 154: 185, 155: 186, 156: 187, 157: 188, 158: 189, 159: 190, 160: 191, 161: 192, 162: 193, 163: 194, 164: 195, 165: 196, 166: 197, 167: 76, 168: 198, 169: 199, 170: 200, 171: 201, 172: 202, 173: 203, 174: 204, 175: 205, 176: 81, 177: 206, 178: 207, 179: 208, 180: 209, 181: 210, 182: 211, 183: 212, 184: 213, 185: 214, 186: 215, 187: 216, 188: 217, 189: 218, 190: 219, 191: 220, 192: 221, 193: 51, 194: 83, 195: 222, 196: 80, 197: 223, 198: 224, 199: 225, 200: 226, 201: 44, 202: 227, 203: 228, 204: 229, 205: 61, 206: 230, 207: 231, 208: 232, 209: 233, 210: 234, 211: 58, 212: 235, 213: 66, 214: 59, 215: 236, 216: 237, 217: 238, 218: 60, 219: 70, 220: 63, 221: 239, 222: 240, 223: 241, 224: 84, 225: 14, 226: 75, 227: 242, 228: 71, 229: 82, 230: 243, 231: 73, 232: 244, 233: 15, 234: 85, 235: 79, 236: 86, 237: 30, 238: 77, 239: 87, 240: 245, 241: 246, 242: 247, 243: 25, 244: 74, 245: 42, 246: 24, 247: 248, 248: 249, 249: 250, 250: 31, 251: 56, 252: 29, 253: 251, 254: 252, 255: 253}
-WINDOWS_1250_HUNGARIAN_MODEL = SingleByteCharSetModel(charset_name='windows-1250', language='Hungarian', char_to_order_map=WINDOWS_1250_HUNGARIAN_CHAR_TO_ORDER, language_model=HUNGARIAN_LANG_MODEL, typical_positive_ratio=0.947368, keep_ascii_letters=True, alphabet='ABCDEFGHIJKLMNOPRSTUVZabcdefghijklmnoprstuvzÁÉÍÓÖÚÜáéíóöúüŐőŰű')
-ISO_8859_2_HUNGARIAN_CHAR_TO_ORDER = {0: 255, 1: 255, 2: 255, 3: 255, 4: 255, 5: 255, 6: 255, 7: 255, 8: 255, 9: 255, 10: 254, 11: 255, 12: 255, 13: 254, 14: 255, 15: 255, 16: 255, 17: 255, 18: 255, 19: 255, 20: 255, 21: 255, 22: 255, 23: 255, 24: 255, 25: 255, 26: 255, 27: 255, 28: 255, 29: 255, 30: 255, 31: 255, 32: 253, 33: 253, 34: 253, 35: 253, 36: 253, 37: 253, 38: 253, 39: 253, 40: 253, 41: 253, 42: 253, 43: 253, 44: 253, 45: 253, 46: 253, 47: 253, 48: 252, 49: 252, 50: 252, 51: 252, 52: 252, 53: 252, 54: 252, 55: 252, 56: 252, 57: 252, 58: 253, 59: 253, 60: 253, 61: 253, 62: 253, 63: 253, 64: 253, 65: 28, 66: 40, 67: 54, 68: 45, 69: 32, 70: 50, 71: 49, 72: 38, 73: 39, 74: 53, 75: 36, 76: 41, 77: 34, 78: 35, 79: 47, 80: 46, 81: 71, 82: 43, 83: 33, 84: 37, 85: 57, 86: 48, 87: 64, 88: 68, 89: 55, 90: 52, 91: 253, 92: 253, 93: 253, 94: 253, 95: 253, 96: 253, 97: 2, 98: 18, 99: 26, 100: 17, 101: 1, 102: 27, 103: 12, 104: 20, 105: 9, 106: 22, 107: 7, 108: 6, 109: 13, 110: 4, 111: 8, 112: 23, 113: 67, 114: 10, 115: 5, 116: 3, 117: 21, 118: 19, 119: 65, 120: 62, 121: 16, 122: 11, 123: 253, 124: 253, 125: 253, 126: 253, 127: 253, 128: 159, 129: 160, 130: 161, 131: 162, 132: 163, 133: 164, 134: 165, 135: 166, 136: 167, 137: 168, 138: 169, 139: 170, 140: 171, 141: 172, 142: 173, 143: 174, 144: 175, 145: 176, 146: 177, 147: 178, 148: 179, 149: 180, 150: 181, 151: 182, 152: 183, 153: 184, 154: 185, 155: 186, 156: 187, 157: 188, 158: 189, 159: 190, 160: 191, 161: 192, 162: 193, 163: 194, 164: 195, 165: 196, 166: 197, 167: 75, 168: 198, 169: 199, 170: 200, 171: 201, 172: 202, 173: 203, 174: 204, 175: 205, 176: 79, 177: 206, 178: 207, 179: 208, 180: 209, 181: 210, 182: 211, 183: 212, 184: 213, 185: 214, 186: 215, 187: 216, 188: 217, 189: 218, 190: 219, 191: 220, 192: 221, 193: 51, 194: 81, 195: 222, 196: 78, 197: 223, 198: 224, 199: 225, 200: 226, 201: 44, 202: 227, 203: 228, 204: 229, 205: 61, 206: 230, 207: 231, 208: 232, 209: 233, 210: 234, 211: 58, 212: 235, 213: 66, 214: 59, 215: 236, 216: 237, 217: 238, 218: 60, 219: 69, 220: 63, 221: 239, 222: 240, 223: 241, 224: 82, 225: 14, 226: 74, 227: 242, 228: 70, 229: 80, 230: 243, 231: 72, 232: 244, 233: 15, 234: 83, 235: 77, 236: 84, 237: 30, 238: 76, 239: 85, 240: 245, 241: 246, 242: 247, 243: 25, 244: 73, 245: 42, 246: 24, 247: 248, 248: 249, 249: 250, 250: 31, 251: 56, 252: 29, 253: 251, 254: 252, 255: 253}
-ISO_8859_2_HUNGARIAN_MODEL = SingleByteCharSetModel(charset_name='ISO-8859-2', language='Hungarian', char_to_order_map=ISO_8859_2_HUNGARIAN_CHAR_TO_ORDER, language_model=HUNGARIAN_LANG_MODEL, typical_positive_ratio=0.947368, keep_ascii_letters=True, alphabet='ABCDEFGHIJKLMNOPRSTUVZabcdefghijklmnoprstuvzÁÉÍÓÖÚÜáéíóöúüŐőŰű')
\ No newline at end of file
+
+
+# 3: Positive
+# 2: Likely
+# 1: Unlikely
+# 0: Negative
+#
+# Flattened 64x64 matrix: the byte at 64 * first + second is the likelihood of
+# the character of order ``second`` following the one of order ``first``
+HUNGARIAN_LANG_MODEL = bytes.fromhex(
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # None
+    '00020203030303030203030303030301020303030302030301010303000101010000000000000000000000000000000000000000000000000000000000000200'  # 'e'
+    '00020103030303030203030303030101020303030303030301010302000101010000000000000000000000000000000000000000000000000000000000000100'  # 'a'
+    '00030303030303030303030101020303030103030303030103030202000302030000000000000000000003000000000000000000000000000200000000000000'  # 't'
+    '00030303030302030303020303020303030303020303020203020302000302020000000000000000000002000000000000000000000000000100000000000100'  # 'n'
+    '00030303030302030303030302030303010203020203010203030202000303030000000000000000000002000000000000000000000000000100000000000000'  # 's'
+    '00030303030303030303020203030303030302030303030203030303000203020000000101000000000003000000000000000000000000000100000000000000'  # 'l'
+    '00030303030303030303030101010303020103020203020103020201000303010000000000000000000001000000000000000000000000000100000000000000'  # 'k'
+    '00020203030303030102030303030102010303030302020301010302000101010000000000000000000000000000000100000000000000000000000000000100'  # 'o'
+    '00030303030303030202030303030302010303030303020201030303000101020000000000000000000000000000000000000000000000000100000000000100'  # 'i'
+    '00030303030303030303030303030303020303030203030203030302000302030000000000000000000002000000000000000000000000000200000000000100'  # 'r'
+    '00030303030302030303020302030303010302020203010103030101000303020000000000000000000002000000000000000000000000000100000000000000'  # 'z'
+    '00030303030303020303030203020303030203030303030102030202000202020000000000000000000002000000000000000000000000000100000000000000'  # 'g'
+    '00030302020203010303020201030303010103010203020302020201000202020000000000000000000001000000000000000000000000000200000000000000'  # 'm'
+    '00010103030303030102030303030102010303030202030201000302000101000000000000000000000000000000000000000000000000000000000000000000'  # 'á'
+    '00010103030303030102030303030101000303030300020300000201000100000000000000000000000000000000000000000000000000000000000000000000'  # 'é'
+    '00030303030302020303020202020303000102030203020203020102000202020000000000000000000001000000000000000000000000000200000000000000'  # 'y'
+    '00030303030301020303030201020303020202030203030103030101000203020000000000000000000002000000000000000000000000000100000000000000'  # 'd'
+    '00030301020202020303030101010303010103010103020102030101000202020000000000000000000002000000000000000000000000000100000000000000'  # 'b'
+    '00030302010201010303010101010303010102020102010102020101000202010000000000000000000001000000000000000000000000000100000000000000'  # 'v'
+    '00030301010201010303010001010303020001010203010002020100000103020000000000000000000001000000000000000000000000000100000000000000'  # 'h'
+    '00020103030303030102030203030201010302030201020200010201000001010000000000000000000000000000000000000000000000000000000000000100'  # 'u'
+    '00030303020202020301020201010303000302010203020103030101000201030000000000000000000001000000000000000000000000000100000000000000'  # 'j'
+    '00030302020203020303030201010303010101020203020302020201000202010000000000000000000001000000000000000000000000000100000000000000'  # 'p'
+    '00000003030303030000030302030000000203030100010200000101000000000000000000000000000000000000000000000000000000000000000000000000'  # 'ö'
+    '00010203030303030102030302020101000303020201020201000202000101010000000000000000000000000000000000000000000000000000000000000000'  # 'ó'
+    '00030202010301020303020201010202010101010302010101010201000102010000000000000000000000000000000000010000000001000000000000000000'  # 'c'
+    '00030301010101010303030001010303010101010102020003010102000201010000000000000000000001000000000000000000000000000100000000000000'  # 'f'
+    '00010001020102020001020301020000000201010101010200000101000000000102010202020102010200020002020101020101020101010001000000010100'  # 'A'
+    '00010102030203030001020203010001000201020200010100000101000000000000000000000000000000000000000000000000000000000000000000000000'  # 'ü'
+    '00000003030202010000030203020000000101030000010100000201000000000000000000000000000000000000000000000000000000000000000000000000'  # 'í'
+    '00010102020303010001030203010101000101010101030100000202000000000000000000000000000000000000000000000000000000000000000000000000'  # 'ú'
+    '00010101020202010001020303020000000201010102010101000101010000000102020202020101010200020101010101020101010101010001010100000101'  # 'E'
+    '00020201000001010202000300010201010000010101000101010100020101010202010101020102010101010101010201010102030101010101010101010001'  # 'S'
+    '00030300010000000303010000010202010000000002000001010100020101010201010101010102010100010100010101000102010100010101010101010001'  # 'M'
+    '00030300010000000202000000000102020000000001000001010000020001000201010101020101010101010102010101010101010101020001010101010001'  # 'N'
+    '00020200010001000203020000010202010000010101000002010001020201010201010101010102010101010101000201000101000101010001010201010001'  # 'K'
+    '00020200000100000202010100000201010000000102000002010000020101010201010101020102010101020201010201010102010101010101010101010001'  # 'T'
+    '00020300000001000302010000010201010000000002010001010000020102010101000000010001010101010200000100000002000001010101010101010001'  # 'H'
+    '00000002010202010000020102020000000201010100010100000101020000000102010202010102010200010101010101010101020101000001010101000001'  # 'I'
+    '00030200000001000202020000000202010000000003010101010000020101010201000101010001010101010101000201000001000101000101010101010001'  # 'B'
+    '00030200000001000202000000000201010000000002010001010000020101000201010101020102010200010101000201010102010101010001010101010001'  # 'L'
+    '00010102020203020101020201010001000202010101010100000101000101000000000000000000000000000000000000000000000000000000000000000000'  # 'ő'
+    '00020200000000000202000000000202010000000101000001020000020101010202010101020102010100010101010201010102010101010001020101010001'  # 'R'
+    '00000001020302010000020001010000000101010100010100000100000000000102010201020101010200020101010001020000010101000000000000000000'  # 'É'
+    '00030200000000000101020100000101010000000002000001010000020101010201010101010102010001010101000201010101010100010001010101010001'  # 'D'
+    '00020200010101000202020000000302010000000101000001010001010100000101000101010101010101020101010101010102010101000001010100010001'  # 'P'
+    '00010002010102020101020101010000000101000101010100000101010000000102020202020101010200020101010101010101010101010001010000000100'  # 'O'
+    '00020300000001000202000000000202000000000001000001000000020001000201010101010002000000010201010101000102000100010001010100010001'  # 'V'
+    '00020200000001000201020000000101020000000001000001010000020100010201010101010101010101010101010101010101010101020001010101010001'  # 'G'
+    '00020200000001000202020000000101000000000001010002000001010100010100010101010101000101010100000100000101000100010101010100000001'  # 'F'
+    '00000001000102010000010101020000000101000100010100000100000000000002010201010101010200020001010001020100010101000000000000010000'  # 'Á'
+    '00010100010200000101010000000101000000000001000001000000020100010202010101010102010100010101010201010102010100010001010101010001'  # 'Z'
+    '00020200000000000101000000000201000000000002000002020000020000010201010101010101000101000101000100000001010101000001010101000001'  # 'J'
+    '00010200000301000201010100000101010000000101000000010000010001000102010001010102010100010101010100000001010101010001000000010000'  # 'C'
+    '00010100000000000100000000000000000100010000000100000000020000000201010101010101010100010101010101010101020101000001010101010001'  # 'Y'
+    '00010101020101010001010201000000000101010100010000000001000000000000000000000000000000000000000000000000000000000000000000000000'  # 'ű'
+    '00010001010101010000010102010000000101000000010100000100010000000102010101010101010100010001010101010100010101000000000000010000'  # 'U'
+    '00000000010101010000010100000000000101010200000100000100010000000001010101010101010200010101010001010100010101000000000000000000'  # 'Ó'
+    '00000001010101010000020100010000000100010000000000000100000000000001010101010100010100010001010001010000010101000000000000000000'  # 'Ö'
+    '00000001010100000000010002000000000000000000020000000000000000000001010101010000010100010001000001010100010101000000000000000000'  # 'Ú'
+    '00000001000000000000010102010000000000000000000000000000000000000001010100010000010100010001010001010100010101000000000000000000'  # 'Í'
+    '00010101010101010101010000010101000001000001000100010101000001000000000000000000000000000000000000000000000000000000000000000000'  # 'x'
+    '00000001010101000000010101000000000101010000000000000000000000000001010101010100010100010001000001010000010100000000000000000000'  # 'Ü'
+)
+
+# 255: Undefined characters that did not exist in training text
+# 254: Carriage/Return
+# 253: symbol (punctuation) that does not belong to word
+# 252: 0 - 9
+# 251: Control characters
+
+# Character Mapping Table(s), indexed by byte value:
+WINDOWS_1250_HUNGARIAN_CHAR_TO_ORDER = bytes.fromhex(
+    'fffffffffffffffffffffefffffeffff'  # '\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f'
+    'ffffffffffffffffffffffffffffffff'  # '\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f'
+    'fdfdfdfdfdfdfdfdfdfdfdfdfdfdfdfd'  # ' !"#$%&\'()*+,-./'
+    'fcfcfcfcfcfcfcfcfcfcfdfdfdfdfdfd'  # '0123456789:;<=>?'
+    'fd1c28362d203231262735242922232f'  # '@ABCDEFGHIJKLMNO'
+    '2e482b2125393040443734fdfdfdfdfd'  # 'PQRSTUVWXYZ[\\]^_'
+    'fd02121a11011b0c14091607060d0408'  # '`abcdefghijklmno'
+    '17430a05031513413e100bfdfdfdfdfd'  # 'pqrstuvwxyz{|}~\x7f'
+    'a1a2a3a4a5a6a7a8a9aaabacadaeafb0'  # '€�‚�„…†‡�‰Š‹ŚŤŽŹ'
+    'b1b2b3b44eb545b6b7b8b9babbbcbdbe'  # '�‘’“”•–—�™š›śťžź'
+    'bfc0c1c2c3c4c54cc6c7c8c9cacbcccd'  # '\xa0ˇ˘Ł¤Ą¦§¨©Ş«¬\xad®Ż'
+    '51cecfd0d1d2d3d4d5d6d7d8d9dadbdc'  # '°±˛ł´µ¶·¸ąş»Ľ˝ľż'
+    'dd3353de50dfe0e1e22ce3e4e53de6e7'  # 'ŔÁÂĂÄĹĆÇČÉĘËĚÍÎĎ'
+    'e8e9ea3aeb423becedee3c463feff0f1'  # 'ĐŃŇÓÔŐÖ×ŘŮÚŰÜÝŢß'
+    '540e4bf24752f349f40f554f561e4d57'  # 'ŕáâăäĺćçčéęëěíîď'
+    'f5f6f7194a2a18f8f9fa1f381dfbfcfd'  # 'đńňóôőö÷řůúűüýţ˙'
+)
+
+WINDOWS_1250_HUNGARIAN_MODEL = SingleByteCharSetModel(charset_name='windows-1250',
+                                                      language='Hungarian',
+                                                      char_to_order_map=WINDOWS_1250_HUNGARIAN_CHAR_TO_ORDER,
+                                                      language_model=HUNGARIAN_LANG_MODEL,
+                                                      typical_positive_ratio=0.947368,
+                                                      keep_ascii_letters=True,
+                                                      alphabet='ABCDEFGHIJKLMNOPRSTUVZabcdefghijklmnoprstuvzÁÉÍÓÖÚÜáéíóöúüŐőŰű')
+
+ISO_8859_2_HUNGARIAN_CHAR_TO_ORDER = bytes.fromhex(
+    'fffffffffffffffffffffefffffeffff'  # '\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f'
+    'ffffffffffffffffffffffffffffffff'  # '\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f'
+    'fdfdfdfdfdfdfdfdfdfdfdfdfdfdfdfd'  # ' !"#$%&\'()*+,-./'
+    'fcfcfcfcfcfcfcfcfcfcfdfdfdfdfdfd'  # '0123456789:;<=>?'
+    'fd1c28362d203231262735242922232f'  # '@ABCDEFGHIJKLMNO'
+    '2e472b2125393040443734fdfdfdfdfd'  # 'PQRSTUVWXYZ[\\]^_'
+    'fd02121a11011b0c14091607060d0408'  # '`abcdefghijklmno'
+    '17430a05031513413e100bfdfdfdfdfd'  # 'pqrstuvwxyz{|}~\x7f'
+    '9fa0a1a2a3a4a5a6a7a8a9aaabacadae'  # '\x80\x81\x82\x83\x84\x85\x86\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\x8f'
+    'afb0b1b2b3b4b5b6b7b8b9babbbcbdbe'  # '\x90\x91\x92\x93\x94\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f'
+    'bfc0c1c2c3c4c54bc6c7c8c9cacbcccd'  # '\xa0Ą˘Ł¤ĽŚ§¨ŠŞŤŹ\xadŽŻ'
+    '4fcecfd0d1d2d3d4d5d6d7d8d9dadbdc'  # '°ą˛ł´ľśˇ¸šşťź˝žż'
+    'dd3351de4edfe0e1e22ce3e4e53de6e7'  # 'ŔÁÂĂÄĹĆÇČÉĘËĚÍÎĎ'
+    'e8e9ea3aeb423becedee3c453feff0f1'  # 'ĐŃŇÓÔŐÖ×ŘŮÚŰÜÝŢß'
+    '520e4af24650f348f40f534d541e4c55'  # 'ŕáâăäĺćçčéęëěíîď'
+    'f5f6f719492a18f8f9fa1f381dfbfcfd'  # 'đńňóôőö÷řůúűüýţ˙'
+)
+
+ISO_8859_2_HUNGARIAN_MODEL = SingleByteCharSetModel(charset_name='ISO-8859-2',
+                                                    language='Hungarian',
+                                                    char_to_order_map=ISO_8859_2_HUNGARIAN_CHAR_TO_ORDER,
+                                                    language_model=HUNGARIAN_LANG_MODEL,
+                                                    typical_positive_ratio=0.947368,
+                                                    keep_ascii_letters=True,
+                                                    alphabet='ABCDEFGHIJKLMNOPRSTUVZabcdefghijklmnoprstuvzÁÉÍÓÖÚÜáéíóöúüŐőŰű')
+
@@ -1,4 +1,111 @@
 from chardet.sbcharsetprober import SingleByteCharSetModel
-THAI_LANG_MODEL = {5: {5: 2, 30: 2, 24: 2, 8: 2, 26: 2, 52: 0, 34: 1, 51: 1, 47: 0, 58: 3, 57: 2, 49: 0, 53: 0, 55: 0, 43: 2, 20: 2, 19: 3, 44: 0, 14: 2, 48: 0, 3: 2, 17: 1, 25: 2, 39: 1, 62: 1, 31: 1, 54: 0, 45: 1, 9: 2, 16: 1, 2: 3, 61: 2, 15: 3, 12: 3, 42: 2, 46: 3, 18: 2, 21: 2, 4: 3, 63: 1, 22: 2, 10: 3, 1: 3, 36: 3, 23: 3, 13: 3, 40: 0, 27: 2, 32: 2, 35: 1, 11: 2, 28: 2, 41: 1, 29: 1, 33: 2, 50: 1, 37: 3, 6: 3, 7: 3, 38: 2, 56: 0, 59: 0, 60: 0}, 30: {5: 1, 30: 0, 24: 1, 8: 1, 26: 1, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 2, 20: 0, 19: 2, 44: 0, 14: 1, 48: 0, 3: 2, 17: 1, 25: 1, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 0, 16: 2, 2: 1, 61: 0, 15: 0, 12: 2, 42: 0, 46: 0, 18: 1, 21: 1, 4: 3, 63: 0, 22: 0, 10: 3, 1: 3, 36: 0, 23: 0, 13: 2, 40: 3, 27: 1, 32: 1, 35: 0, 11: 0, 28: 0, 41: 0, 29: 1, 33: 0, 50: 0, 37: 1, 6: 2, 7: 3, 38: 1, 56: 0, 59: 0, 60: 0}, 24: {5: 0, 30: 0, 24: 2, 8: 2, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 2, 20: 2, 19: 2, 44: 0, 14: 1, 48: 0, 3: 3, 17: 0, 25: 1, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 2, 16: 2, 2: 3, 61: 0, 15: 3, 12: 3, 42: 0, 46: 0, 18: 1, 21: 0, 4: 2, 63: 0, 22: 2, 10: 3, 1: 2, 36: 3, 23: 3, 13: 2, 40: 0, 27: 3, 32: 3, 35: 2, 11: 1, 28: 0, 41: 3, 29: 0, 33: 0, 50: 0, 37: 1, 6: 3, 7: 3, 38: 3, 56: 0, 59: 0, 60: 0}, 8: {5: 3, 30: 2, 24: 3, 8: 2, 26: 2, 52: 1, 34: 2, 51: 1, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 2, 19: 2, 44: 1, 14: 3, 48: 1, 3: 3, 17: 2, 25: 2, 39: 2, 62: 1, 31: 2, 54: 0, 45: 1, 9: 2, 16: 1, 2: 2, 61: 0, 15: 2, 12: 2, 42: 2, 46: 1, 18: 3, 21: 3, 4: 2, 63: 0, 22: 0, 10: 1, 1: 3, 36: 0, 23: 2, 13: 1, 40: 0, 27: 1, 32: 1, 35: 0, 11: 3, 28: 2, 41: 1, 29: 2, 33: 2, 50: 3, 37: 0, 6: 2, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 26: {5: 2, 30: 1, 24: 0, 8: 2, 26: 3, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 2, 19: 1, 44: 1, 14: 2, 48: 0, 3: 3, 17: 1, 25: 0, 39: 0, 62: 0, 31: 1, 54: 0, 45: 0, 9: 1, 16: 1, 2: 3, 61: 0, 15: 0, 12: 1, 42: 0, 46: 0, 18: 2, 21: 1, 4: 2, 63: 0, 22: 3, 10: 3, 1: 3, 36: 3, 23: 2, 13: 1, 40: 3, 27: 1, 32: 3, 35: 2, 11: 1, 28: 1, 41: 0, 29: 1, 33: 1, 50: 0, 37: 0, 6: 2, 7: 2, 38: 0, 56: 0, 59: 0, 60: 0}, 52: {5: 0, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 0, 17: 3, 25: 0, 39: 0, 62: 0, 31: 3, 54: 0, 45: 0, 9: 1, 16: 1, 2: 0, 61: 0, 15: 2, 12: 1, 42: 0, 46: 0, 18: 0, 21: 0, 4: 0, 63: 0, 22: 1, 10: 1, 1: 1, 36: 0, 23: 1, 13: 1, 40: 0, 27: 0, 32: 1, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 34: {5: 1, 30: 0, 24: 0, 8: 1, 26: 0, 52: 0, 34: 0, 51: 0, 47: 1, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 1, 48: 0, 3: 3, 17: 2, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 2, 16: 1, 2: 1, 61: 0, 15: 0, 12: 1, 42: 0, 46: 0, 18: 0, 21: 0, 4: 2, 63: 0, 22: 0, 10: 2, 1: 3, 36: 1, 23: 3, 13: 2, 40: 0, 27: 3, 32: 3, 35: 1, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 1, 6: 3, 7: 3, 38: 0, 56: 0, 59: 0, 60: 0}, 51: {5: 0, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 1, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 0, 16: 0, 2: 0, 61: 0, 15: 1, 12: 0, 42: 0, 46: 0, 18: 1, 21: 0, 4: 2, 63: 0, 22: 0, 10: 1, 1: 1, 36: 0, 23: 1, 13: 2, 40: 3, 27: 2, 32: 1, 35: 1, 11: 1, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 1, 6: 1, 7: 2, 38: 1, 56: 0, 59: 0, 60: 0}, 47: {5: 1, 30: 1, 24: 0, 8: 0, 26: 0, 52: 0, 34: 1, 51: 0, 47: 3, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 1, 48: 0, 3: 0, 17: 1, 25: 1, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 1, 16: 0, 2: 0, 61: 0, 15: 1, 12: 0, 42: 0, 46: 0, 18: 1, 21: 2, 4: 1, 63: 0, 22: 1, 10: 2, 1: 3, 36: 0, 23: 1, 13: 1, 40: 0, 27: 0, 32: 0, 35: 0, 11: 1, 28: 1, 41: 0, 29: 1, 33: 0, 50: 1, 37: 0, 6: 2, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 58: {5: 2, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 0, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 0, 16: 0, 2: 0, 61: 0, 15: 0, 12: 0, 42: 0, 46: 0, 18: 0, 21: 1, 4: 0, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 1, 13: 2, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 57: {5: 0, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 0, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 0, 16: 0, 2: 0, 61: 0, 15: 0, 12: 0, 42: 0, 46: 0, 18: 0, 21: 0, 4: 0, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 3, 13: 1, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 49: {5: 1, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 0, 17: 2, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 2, 16: 0, 2: 0, 61: 0, 15: 0, 12: 0, 42: 1, 46: 0, 18: 0, 21: 0, 4: 1, 63: 0, 22: 0, 10: 0, 1: 3, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 1, 56: 0, 59: 0, 60: 0}, 53: {5: 0, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 0, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 0, 16: 0, 2: 0, 61: 0, 15: 0, 12: 0, 42: 0, 46: 0, 18: 0, 21: 0, 4: 0, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 2, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 3, 56: 0, 59: 0, 60: 0}, 55: {5: 0, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 3, 17: 0, 25: 0, 39: 0, 62: 0, 31: 1, 54: 0, 45: 0, 9: 0, 16: 0, 2: 0, 61: 0, 15: 0, 12: 0, 42: 0, 46: 0, 18: 0, 21: 0, 4: 0, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 1, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 43: {5: 1, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 3, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 0, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 3, 9: 0, 16: 0, 2: 1, 61: 0, 15: 0, 12: 1, 42: 0, 46: 0, 18: 1, 21: 1, 4: 0, 63: 0, 22: 3, 10: 0, 1: 3, 36: 0, 23: 1, 13: 2, 40: 0, 27: 0, 32: 0, 35: 0, 11: 1, 28: 1, 41: 0, 29: 1, 33: 1, 50: 0, 37: 0, 6: 0, 7: 0, 38: 3, 56: 0, 59: 0, 60: 0}, 20: {5: 2, 30: 2, 24: 2, 8: 3, 26: 2, 52: 0, 34: 1, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 1, 19: 2, 44: 1, 14: 2, 48: 0, 3: 1, 17: 1, 25: 1, 39: 1, 62: 0, 31: 1, 54: 0, 45: 1, 9: 2, 16: 3, 2: 2, 61: 0, 15: 2, 12: 2, 42: 0, 46: 0, 18: 2, 21: 2, 4: 1, 63: 0, 22: 0, 10: 3, 1: 2, 36: 2, 23: 3, 13: 3, 40: 1, 27: 2, 32: 3, 35: 2, 11: 2, 28: 2, 41: 1, 29: 2, 33: 2, 50: 2, 37: 2, 6: 1, 7: 3, 38: 1, 56: 0, 59: 0, 60: 0}, 19: {5: 2, 30: 1, 24: 1, 8: 0, 26: 1, 52: 0, 34: 1, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 1, 19: 1, 44: 2, 14: 1, 48: 0, 3: 2, 17: 1, 25: 1, 39: 1, 62: 0, 31: 1, 54: 0, 45: 2, 9: 1, 16: 1, 2: 3, 61: 0, 15: 2, 12: 1, 42: 0, 46: 0, 18: 3, 21: 0, 4: 3, 63: 1, 22: 2, 10: 3, 1: 3, 36: 2, 23: 3, 13: 2, 40: 1, 27: 1, 32: 3, 35: 2, 11: 1, 28: 1, 41: 1, 29: 1, 33: 1, 50: 0, 37: 2, 6: 3, 7: 3, 38: 2, 56: 0, 59: 0, 60: 0}, 44: {5: 1, 30: 0, 24: 1, 8: 0, 26: 1, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 1, 44: 0, 14: 1, 48: 0, 3: 1, 17: 2, 25: 0, 39: 0, 62: 0, 31: 1, 54: 0, 45: 0, 9: 0, 16: 0, 2: 1, 61: 0, 15: 1, 12: 1, 42: 0, 46: 0, 18: 1, 21: 0, 4: 1, 63: 0, 22: 0, 10: 2, 1: 3, 36: 0, 23: 2, 13: 1, 40: 3, 27: 2, 32: 2, 35: 3, 11: 1, 28: 1, 41: 0, 29: 1, 33: 1, 50: 0, 37: 0, 6: 2, 7: 3, 38: 0, 56: 0, 59: 0, 60: 0}, 14: {5: 1, 30: 1, 24: 3, 8: 1, 26: 1, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 2, 19: 1, 44: 0, 14: 1, 48: 3, 3: 3, 17: 2, 25: 2, 39: 1, 62: 0, 31: 2, 54: 0, 45: 0, 9: 1, 16: 3, 2: 3, 61: 1, 15: 1, 12: 2, 42: 3, 46: 1, 18: 1, 21: 0, 4: 2, 63: 0, 22: 2, 10: 3, 1: 3, 36: 3, 23: 2, 13: 3, 40: 2, 27: 1, 32: 3, 35: 1, 11: 0, 28: 1, 41: 0, 29: 1, 33: 0, 50: 0, 37: 1, 6: 3, 7: 3, 38: 2, 56: 0, 59: 0, 60: 0}, 48: {5: 0, 30: 0, 24: 0, 8: 1, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 1, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 0, 16: 0, 2: 2, 61: 0, 15: 0, 12: 0, 42: 0, 46: 0, 18: 0, 21: 0, 4: 0, 63: 0, 22: 0, 10: 0, 1: 2, 36: 0, 23: 3, 13: 3, 40: 0, 27: 0, 32: 2, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 3, 56: 0, 59: 0, 60: 0}, 3: {5: 3, 30: 2, 24: 3, 8: 1, 26: 2, 52: 0, 34: 1, 51: 1, 47: 0, 58: 0, 57: 0, 49: 1, 53: 0, 55: 0, 43: 0, 20: 3, 19: 3, 44: 2, 14: 3, 48: 3, 3: 2, 17: 2, 25: 2, 39: 2, 62: 0, 31: 2, 54: 1, 45: 1, 9: 2, 16: 2, 2: 2, 61: 1, 15: 2, 12: 3, 42: 1, 46: 0, 18: 2, 21: 2, 4: 3, 63: 1, 22: 2, 10: 3, 1: 3, 36: 3, 23: 3, 13: 3, 40: 3, 27: 3, 32: 3, 35: 2, 11: 3, 28: 2, 41: 3, 29: 3, 33: 3, 50: 2, 37: 1, 6: 3, 7: 3, 38: 2, 56: 0, 59: 0, 60: 0}, 17: {5: 3, 30: 2, 24: 2, 8: 1, 26: 1, 52: 1, 34: 1, 51: 1, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 1, 19: 2, 44: 1, 14: 3, 48: 0, 3: 3, 17: 3, 25: 2, 39: 2, 62: 0, 31: 1, 54: 1, 45: 1, 9: 1, 16: 0, 2: 3, 61: 0, 15: 2, 12: 3, 42: 0, 46: 0, 18: 2, 21: 2, 4: 2, 63: 1, 22: 0, 10: 3, 1: 3, 36: 2, 23: 2, 13: 2, 40: 0, 27: 2, 32: 3, 35: 2, 11: 2, 28: 2, 41: 1, 29: 2, 33: 2, 50: 0, 37: 1, 6: 2, 7: 2, 38: 0, 56: 0, 59: 0, 60: 0}, 25: {5: 2, 30: 0, 24: 1, 8: 0, 26: 1, 52: 0, 34: 0, 51: 1, 47: 0, 58: 1, 57: 3, 49: 1, 53: 0, 55: 0, 43: 0, 20: 1, 19: 1, 44: 1, 14: 1, 48: 0, 3: 2, 17: 0, 25: 1, 39: 1, 62: 1, 31: 1, 54: 0, 45: 0, 9: 1, 16: 0, 2: 3, 61: 0, 15: 3, 12: 1, 42: 0, 46: 1, 18: 2, 21: 1, 4: 2, 63: 0, 22: 1, 10: 3, 1: 1, 36: 0, 23: 2, 13: 3, 40: 0, 27: 0, 32: 1, 35: 0, 11: 1, 28: 2, 41: 0, 29: 1, 33: 2, 50: 0, 37: 3, 6: 1, 7: 2, 38: 1, 56: 0, 59: 0, 60: 0}, 39: {5: 1, 30: 0, 24: 0, 8: 1, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 2, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 1, 16: 2, 2: 0, 61: 0, 15: 3, 12: 0, 42: 0, 46: 0, 18: 1, 21: 0, 4: 0, 63: 0, 22: 1, 10: 1, 1: 0, 36: 0, 23: 2, 13: 0, 40: 0, 27: 1, 32: 0, 35: 3, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 3, 7: 1, 38: 0, 56: 0, 59: 0, 60: 0}, 62: {5: 0, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 1, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 0, 16: 0, 2: 1, 61: 0, 15: 0, 12: 0, 42: 0, 46: 0, 18: 0, 21: 0, 4: 0, 63: 0, 22: 0, 10: 1, 1: 0, 36: 0, 23: 0, 13: 1, 40: 2, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 2, 7: 1, 38: 0, 56: 0, 59: 0, 60: 0}, 31: {5: 1, 30: 1, 24: 1, 8: 1, 26: 1, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 1, 20: 1, 19: 1, 44: 0, 14: 2, 48: 1, 3: 3, 17: 2, 25: 0, 39: 1, 62: 0, 31: 1, 54: 0, 45: 0, 9: 1, 16: 2, 2: 3, 61: 2, 15: 2, 12: 2, 42: 0, 46: 0, 18: 1, 21: 1, 4: 2, 63: 1, 22: 0, 10: 3, 1: 3, 36: 0, 23: 3, 13: 2, 40: 1, 27: 3, 32: 1, 35: 2, 11: 1, 28: 1, 41: 0, 29: 1, 33: 1, 50: 0, 37: 1, 6: 0, 7: 1, 38: 3, 56: 0, 59: 0, 60: 0}, 54: {5: 0, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 1, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 1, 44: 0, 14: 1, 48: 0, 3: 0, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 2, 45: 0, 9: 0, 16: 0, 2: 1, 61: 0, 15: 2, 12: 0, 42: 0, 46: 0, 18: 1, 21: 0, 4: 1, 63: 0, 22: 0, 10: 2, 1: 0, 36: 0, 23: 1, 13: 1, 40: 0, 27: 1, 32: 1, 35: 0, 11: 0, 28: 1, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 2, 38: 0, 56: 0, 59: 0, 60: 0}, 45: {5: 0, 30: 0, 24: 1, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 3, 48: 0, 3: 0, 17: 0, 25: 0, 39: 0, 62: 0, 31: 1, 54: 0, 45: 0, 9: 0, 16: 0, 2: 1, 61: 0, 15: 0, 12: 0, 42: 0, 46: 0, 18: 0, 21: 0, 4: 0, 63: 0, 22: 0, 10: 3, 1: 3, 36: 0, 23: 1, 13: 0, 40: 0, 27: 0, 32: 0, 35: 2, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 1, 56: 0, 59: 0, 60: 0}, 9: {5: 2, 30: 2, 24: 2, 8: 2, 26: 2, 52: 0, 34: 1, 51: 1, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 1, 20: 2, 19: 2, 44: 1, 14: 2, 48: 1, 3: 3, 17: 2, 25: 2, 39: 1, 62: 0, 31: 3, 54: 0, 45: 1, 9: 2, 16: 1, 2: 2, 61: 2, 15: 2, 12: 2, 42: 1, 46: 1, 18: 3, 21: 3, 4: 3, 63: 0, 22: 1, 10: 3, 1: 3, 36: 0, 23: 3, 13: 3, 40: 0, 27: 3, 32: 3, 35: 3, 11: 2, 28: 2, 41: 2, 29: 2, 33: 2, 50: 1, 37: 1, 6: 3, 7: 2, 38: 1, 56: 0, 59: 0, 60: 0}, 16: {5: 3, 30: 1, 24: 2, 8: 3, 26: 2, 52: 0, 34: 2, 51: 0, 47: 2, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 2, 19: 2, 44: 1, 14: 2, 48: 1, 3: 3, 17: 3, 25: 1, 39: 1, 62: 0, 31: 1, 54: 0, 45: 1, 9: 2, 16: 0, 2: 2, 61: 0, 15: 1, 12: 3, 42: 1, 46: 0, 18: 2, 21: 1, 4: 2, 63: 0, 22: 2, 10: 3, 1: 3, 36: 0, 23: 2, 13: 3, 40: 1, 27: 2, 32: 2, 35: 3, 11: 2, 28: 1, 41: 1, 29: 2, 33: 2, 50: 2, 37: 1, 6: 3, 7: 2, 38: 3, 56: 0, 59: 0, 60: 0}, 2: {5: 3, 30: 2, 24: 2, 8: 3, 26: 2, 52: 0, 34: 2, 51: 1, 47: 0, 58: 0, 57: 0, 49: 3, 53: 0, 55: 0, 43: 3, 20: 2, 19: 2, 44: 3, 14: 3, 48: 1, 3: 2, 17: 2, 25: 3, 39: 2, 62: 1, 31: 2, 54: 1, 45: 1, 9: 3, 16: 2, 2: 3, 61: 0, 15: 2, 12: 3, 42: 2, 46: 2, 18: 2, 21: 2, 4: 3, 63: 1, 22: 3, 10: 3, 1: 3, 36: 0, 23: 3, 13: 3, 40: 2, 27: 3, 32: 3, 35: 3, 11: 3, 28: 3, 41: 1, 29: 2, 33: 1, 50: 0, 37: 3, 6: 3, 7: 3, 38: 3, 56: 0, 59: 0, 60: 0}, 61: {5: 0, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 2, 44: 0, 14: 2, 48: 0, 3: 0, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 1, 16: 0, 2: 0, 61: 0, 15: 0, 12: 0, 42: 0, 46: 2, 18: 0, 21: 0, 4: 0, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 15: {5: 2, 30: 3, 24: 1, 8: 3, 26: 1, 52: 0, 34: 1, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 2, 19: 2, 44: 1, 14: 2, 48: 0, 3: 1, 17: 2, 25: 2, 39: 1, 62: 0, 31: 0, 54: 0, 45: 1, 9: 1, 16: 3, 2: 1, 61: 0, 15: 1, 12: 1, 42: 0, 46: 0, 18: 2, 21: 1, 4: 3, 63: 2, 22: 3, 10: 3, 1: 3, 36: 2, 23: 3, 13: 3, 40: 2, 27: 3, 32: 2, 35: 3, 11: 2, 28: 1, 41: 1, 29: 2, 33: 1, 50: 0, 37: 2, 6: 3, 7: 3, 38: 2, 56: 0, 59: 0, 60: 0}, 12: {5: 3, 30: 2, 24: 1, 8: 3, 26: 2, 52: 0, 34: 1, 51: 1, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 1, 20: 2, 19: 1, 44: 1, 14: 1, 48: 0, 3: 3, 17: 2, 25: 1, 39: 1, 62: 0, 31: 1, 54: 1, 45: 0, 9: 3, 16: 3, 2: 3, 61: 0, 15: 3, 12: 1, 42: 0, 46: 0, 18: 2, 21: 2, 4: 2, 63: 0, 22: 2, 10: 3, 1: 3, 36: 0, 23: 3, 13: 2, 40: 0, 27: 0, 32: 2, 35: 0, 11: 3, 28: 2, 41: 1, 29: 1, 33: 2, 50: 1, 37: 0, 6: 3, 7: 3, 38: 1, 56: 0, 59: 0, 60: 0}, 42: {5: 1, 30: 0, 24: 1, 8: 0, 26: 1, 52: 0, 34: 0, 51: 0, 47: 1, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 1, 44: 0, 14: 1, 48: 0, 3: 2, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 0, 16: 0, 2: 2, 61: 0, 15: 0, 12: 2, 42: 1, 46: 2, 18: 1, 21: 0, 4: 0, 63: 0, 22: 0, 10: 2, 1: 3, 36: 0, 23: 2, 13: 0, 40: 3, 27: 0, 32: 0, 35: 2, 11: 0, 28: 1, 41: 0, 29: 1, 33: 1, 50: 0, 37: 0, 6: 0, 7: 0, 38: 1, 56: 0, 59: 0, 60: 0}, 46: {5: 0, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 2, 57: 1, 49: 2, 53: 0, 55: 0, 43: 3, 20: 0, 19: 1, 44: 0, 14: 1, 48: 0, 3: 0, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 1, 9: 1, 16: 2, 2: 2, 61: 0, 15: 0, 12: 0, 42: 1, 46: 0, 18: 0, 21: 0, 4: 0, 63: 0, 22: 2, 10: 2, 1: 3, 36: 0, 23: 0, 13: 1, 40: 0, 27: 0, 32: 0, 35: 0, 11: 1, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 2, 56: 0, 59: 0, 60: 0}, 18: {5: 2, 30: 0, 24: 0, 8: 2, 26: 1, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 3, 19: 3, 44: 3, 14: 0, 48: 0, 3: 3, 17: 2, 25: 1, 39: 0, 62: 0, 31: 0, 54: 0, 45: 2, 9: 3, 16: 1, 2: 3, 61: 0, 15: 1, 12: 2, 42: 0, 46: 0, 18: 0, 21: 2, 4: 3, 63: 0, 22: 2, 10: 3, 1: 3, 36: 3, 23: 3, 13: 3, 40: 2, 27: 3, 32: 3, 35: 3, 11: 2, 28: 0, 41: 1, 29: 0, 33: 1, 50: 0, 37: 0, 6: 3, 7: 1, 38: 2, 56: 0, 59: 0, 60: 0}, 21: {5: 3, 30: 0, 24: 0, 8: 1, 26: 0, 52: 0, 34: 0, 51: 0, 47: 2, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 1, 19: 3, 44: 0, 14: 0, 48: 0, 3: 3, 17: 0, 25: 1, 39: 0, 62: 0, 31: 1, 54: 0, 45: 0, 9: 3, 16: 2, 2: 3, 61: 0, 15: 3, 12: 2, 42: 0, 46: 0, 18: 0, 21: 0, 4: 3, 63: 0, 22: 1, 10: 3, 1: 3, 36: 0, 23: 1, 13: 1, 40: 0, 27: 0, 32: 1, 35: 1, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 3, 6: 3, 7: 3, 38: 2, 56: 0, 59: 0, 60: 0}, 4: {5: 3, 30: 1, 24: 2, 8: 3, 26: 1, 52: 0, 34: 1, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 3, 19: 2, 44: 1, 14: 2, 48: 1, 3: 3, 17: 3, 25: 1, 39: 1, 62: 0, 31: 1, 54: 1, 45: 1, 9: 3, 16: 3, 2: 3, 61: 0, 15: 2, 12: 2, 42: 1, 46: 0, 18: 2, 21: 2, 4: 3, 63: 0, 22: 2, 10: 3, 1: 3, 36: 2, 23: 2, 13: 3, 40: 0, 27: 3, 32: 3, 35: 0, 11: 3, 28: 1, 41: 1, 29: 2, 33: 2, 50: 1, 37: 1, 6: 2, 7: 2, 38: 0, 56: 0, 59: 0, 60: 0}, 63: {5: 0, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 0, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 0, 16: 0, 2: 0, 61: 0, 15: 2, 12: 0, 42: 0, 46: 0, 18: 0, 21: 0, 4: 0, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 22: {5: 3, 30: 1, 24: 2, 8: 1, 26: 2, 52: 0, 34: 3, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 3, 19: 3, 44: 1, 14: 3, 48: 1, 3: 2, 17: 3, 25: 2, 39: 1, 62: 0, 31: 2, 54: 0, 45: 1, 9: 3, 16: 2, 2: 2, 61: 0, 15: 2, 12: 2, 42: 0, 46: 0, 18: 3, 21: 3, 4: 2, 63: 1, 22: 1, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 3, 28: 2, 41: 1, 29: 2, 33: 2, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 10: {5: 3, 30: 0, 24: 1, 8: 3, 26: 3, 52: 0, 34: 1, 51: 0, 47: 3, 58: 0, 57: 0, 49: 2, 53: 0, 55: 3, 43: 3, 20: 3, 19: 3, 44: 0, 14: 2, 48: 0, 3: 3, 17: 3, 25: 1, 39: 0, 62: 0, 31: 2, 54: 0, 45: 0, 9: 3, 16: 3, 2: 0, 61: 0, 15: 2, 12: 3, 42: 2, 46: 0, 18: 3, 21: 0, 4: 0, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 3, 7: 3, 38: 0, 56: 0, 59: 0, 60: 0}, 1: {5: 3, 30: 2, 24: 3, 8: 3, 26: 3, 52: 0, 34: 3, 51: 1, 47: 2, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 3, 20: 3, 19: 3, 44: 1, 14: 3, 48: 2, 3: 3, 17: 3, 25: 2, 39: 1, 62: 1, 31: 3, 54: 1, 45: 1, 9: 3, 16: 3, 2: 3, 61: 0, 15: 3, 12: 3, 42: 2, 46: 3, 18: 3, 21: 3, 4: 2, 63: 1, 22: 3, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 3, 28: 2, 41: 1, 29: 2, 33: 2, 50: 1, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 36: {5: 2, 30: 1, 24: 3, 8: 2, 26: 1, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 1, 53: 0, 55: 0, 43: 0, 20: 1, 19: 1, 44: 1, 14: 1, 48: 0, 3: 3, 17: 1, 25: 1, 39: 1, 62: 0, 31: 1, 54: 0, 45: 1, 9: 1, 16: 0, 2: 2, 61: 0, 15: 2, 12: 1, 42: 0, 46: 0, 18: 1, 21: 3, 4: 1, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 3, 28: 2, 41: 1, 29: 2, 33: 2, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 23: {5: 3, 30: 1, 24: 2, 8: 3, 26: 3, 52: 0, 34: 3, 51: 0, 47: 2, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 3, 19: 3, 44: 1, 14: 3, 48: 3, 3: 3, 17: 3, 25: 2, 39: 2, 62: 0, 31: 3, 54: 1, 45: 2, 9: 3, 16: 2, 2: 2, 61: 0, 15: 2, 12: 3, 42: 3, 46: 2, 18: 2, 21: 3, 4: 1, 63: 1, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 3, 28: 1, 41: 1, 29: 1, 33: 0, 50: 0, 37: 0, 6: 3, 7: 2, 38: 2, 56: 0, 59: 0, 60: 0}, 13: {5: 3, 30: 2, 24: 2, 8: 0, 26: 1, 52: 0, 34: 1, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 2, 19: 1, 44: 0, 14: 2, 48: 0, 3: 1, 17: 2, 25: 2, 39: 1, 62: 0, 31: 2, 54: 0, 45: 0, 9: 2, 16: 3, 2: 2, 61: 0, 15: 1, 12: 2, 42: 1, 46: 0, 18: 2, 21: 1, 4: 2, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 2, 28: 2, 41: 1, 29: 1, 33: 1, 50: 1, 37: 0, 6: 3, 7: 3, 38: 0, 56: 0, 59: 0, 60: 0}, 40: {5: 3, 30: 0, 24: 0, 8: 3, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 1, 19: 0, 44: 0, 14: 0, 48: 0, 3: 0, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 1, 16: 0, 2: 0, 61: 0, 15: 0, 12: 0, 42: 0, 46: 0, 18: 0, 21: 0, 4: 0, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 3, 7: 3, 38: 0, 56: 0, 59: 0, 60: 0}, 27: {5: 0, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 1, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 1, 19: 0, 44: 0, 14: 0, 48: 0, 3: 2, 17: 3, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 2, 16: 0, 2: 0, 61: 0, 15: 0, 12: 0, 42: 0, 46: 0, 18: 0, 21: 0, 4: 3, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 3, 7: 3, 38: 0, 56: 0, 59: 0, 60: 0}, 32: {5: 3, 30: 2, 24: 3, 8: 3, 26: 0, 52: 0, 34: 0, 51: 0, 47: 2, 58: 0, 57: 0, 49: 0, 53: 0, 55: 1, 43: 3, 20: 3, 19: 3, 44: 1, 14: 2, 48: 1, 3: 2, 17: 2, 25: 2, 39: 2, 62: 0, 31: 1, 54: 0, 45: 1, 9: 3, 16: 1, 2: 2, 61: 0, 15: 2, 12: 1, 42: 1, 46: 2, 18: 1, 21: 1, 4: 1, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 1, 28: 0, 41: 1, 29: 0, 33: 1, 50: 0, 37: 0, 6: 3, 7: 2, 38: 1, 56: 0, 59: 0, 60: 0}, 35: {5: 3, 30: 0, 24: 0, 8: 2, 26: 1, 52: 0, 34: 0, 51: 0, 47: 2, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 1, 20: 2, 19: 2, 44: 0, 14: 1, 48: 0, 3: 2, 17: 0, 25: 3, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 2, 16: 0, 2: 1, 61: 0, 15: 3, 12: 1, 42: 0, 46: 0, 18: 0, 21: 0, 4: 0, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 1, 28: 1, 41: 1, 29: 0, 33: 0, 50: 0, 37: 0, 6: 3, 7: 3, 38: 0, 56: 0, 59: 0, 60: 0}, 11: {5: 3, 30: 3, 24: 3, 8: 2, 26: 3, 52: 3, 34: 3, 51: 2, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 1, 20: 3, 19: 3, 44: 1, 14: 3, 48: 1, 3: 3, 17: 3, 25: 3, 39: 2, 62: 1, 31: 3, 54: 1, 45: 3, 9: 3, 16: 2, 2: 3, 61: 0, 15: 3, 12: 3, 42: 2, 46: 0, 18: 3, 21: 3, 4: 3, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 28: {5: 3, 30: 2, 24: 2, 8: 1, 26: 2, 52: 0, 34: 1, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 2, 19: 3, 44: 2, 14: 3, 48: 0, 3: 3, 17: 3, 25: 2, 39: 3, 62: 0, 31: 2, 54: 2, 45: 0, 9: 2, 16: 2, 2: 2, 61: 0, 15: 3, 12: 2, 42: 0, 46: 0, 18: 3, 21: 3, 4: 1, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 41: {5: 2, 30: 1, 24: 2, 8: 0, 26: 1, 52: 1, 34: 1, 51: 1, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 3, 19: 2, 44: 0, 14: 2, 48: 0, 3: 3, 17: 1, 25: 3, 39: 0, 62: 0, 31: 1, 54: 1, 45: 1, 9: 1, 16: 2, 2: 2, 61: 0, 15: 3, 12: 0, 42: 1, 46: 0, 18: 2, 21: 0, 4: 2, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 29: {5: 2, 30: 0, 24: 1, 8: 0, 26: 3, 52: 0, 34: 3, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 3, 19: 1, 44: 0, 14: 0, 48: 0, 3: 3, 17: 2, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 0, 16: 1, 2: 0, 61: 0, 15: 0, 12: 0, 42: 0, 46: 0, 18: 3, 21: 3, 4: 0, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 33: {5: 1, 30: 2, 24: 0, 8: 0, 26: 0, 52: 0, 34: 1, 51: 1, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 3, 19: 1, 44: 0, 14: 3, 48: 0, 3: 0, 17: 1, 25: 3, 39: 0, 62: 0, 31: 0, 54: 2, 45: 0, 9: 3, 16: 0, 2: 3, 61: 0, 15: 1, 12: 3, 42: 0, 46: 0, 18: 1, 21: 2, 4: 0, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 50: {5: 0, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 0, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 0, 16: 0, 2: 0, 61: 0, 15: 0, 12: 0, 42: 0, 46: 0, 18: 0, 21: 0, 4: 0, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 37: {5: 2, 30: 1, 24: 2, 8: 2, 26: 3, 52: 0, 34: 0, 51: 0, 47: 1, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 1, 19: 2, 44: 0, 14: 1, 48: 0, 3: 3, 17: 3, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 2, 16: 1, 2: 0, 61: 0, 15: 0, 12: 2, 42: 0, 46: 0, 18: 1, 21: 0, 4: 1, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 1, 28: 0, 41: 0, 29: 0, 33: 1, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 6: {5: 2, 30: 1, 24: 2, 8: 3, 26: 2, 52: 0, 34: 1, 51: 1, 47: 0, 58: 0, 57: 0, 49: 1, 53: 0, 55: 0, 43: 0, 20: 1, 19: 2, 44: 1, 14: 2, 48: 1, 3: 3, 17: 1, 25: 2, 39: 2, 62: 1, 31: 1, 54: 0, 45: 0, 9: 3, 16: 3, 2: 2, 61: 0, 15: 2, 12: 3, 42: 0, 46: 0, 18: 2, 21: 1, 4: 3, 63: 0, 22: 1, 10: 0, 1: 3, 36: 2, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 3, 28: 2, 41: 1, 29: 2, 33: 2, 50: 1, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 7: {5: 2, 30: 1, 24: 2, 8: 3, 26: 2, 52: 0, 34: 1, 51: 1, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 1, 19: 2, 44: 1, 14: 2, 48: 0, 3: 3, 17: 2, 25: 2, 39: 2, 62: 0, 31: 1, 54: 1, 45: 0, 9: 3, 16: 2, 2: 2, 61: 0, 15: 1, 12: 3, 42: 1, 46: 0, 18: 2, 21: 2, 4: 3, 63: 0, 22: 0, 10: 0, 1: 3, 36: 2, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 2, 28: 2, 41: 1, 29: 2, 33: 2, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 38: {5: 2, 30: 1, 24: 1, 8: 0, 26: 1, 52: 0, 34: 1, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 2, 19: 1, 44: 1, 14: 1, 48: 0, 3: 1, 17: 1, 25: 1, 39: 0, 62: 0, 31: 1, 54: 1, 45: 0, 9: 2, 16: 0, 2: 1, 61: 1, 15: 1, 12: 1, 42: 0, 46: 0, 18: 1, 21: 1, 4: 2, 63: 1, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 2, 28: 2, 41: 1, 29: 1, 33: 1, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 0, 59: 0, 60: 0}, 56: {5: 0, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 0, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 0, 16: 0, 2: 0, 61: 0, 15: 0, 12: 0, 42: 0, 46: 0, 18: 0, 21: 0, 4: 0, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 2, 59: 1, 60: 1}, 59: {5: 0, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 0, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 0, 16: 0, 2: 0, 61: 0, 15: 0, 12: 0, 42: 0, 46: 0, 18: 0, 21: 0, 4: 0, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 1, 59: 1, 60: 3}, 60: {5: 0, 30: 0, 24: 0, 8: 0, 26: 0, 52: 0, 34: 0, 51: 0, 47: 0, 58: 0, 57: 0, 49: 0, 53: 0, 55: 0, 43: 0, 20: 0, 19: 0, 44: 0, 14: 0, 48: 0, 3: 0, 17: 0, 25: 0, 39: 0, 62: 0, 31: 0, 54: 0, 45: 0, 9: 0, 16: 0, 2: 0, 61: 0, 15: 0, 12: 0, 42: 0, 46: 0, 18: 0, 21: 0, 4: 0, 63: 0, 22: 0, 10: 0, 1: 0, 36: 0, 23: 0, 13: 0, 40: 0, 27: 0, 32: 0, 35: 0, 11: 0, 28: 0, 41: 0, 29: 0, 33: 0, 50: 0, 37: 0, 6: 0, 7: 0, 38: 0, 56: 2, 59: 1, 60: 0}}
-TIS_620_THAI_CHAR_TO_ORDER = {0: 255, 1: 255, 2: 255, 3: 255, 4: 255, 5: 255, 6: 255, 7: 255, 8: 255, 9: 255, 10: 254, 11: 255, 12: 255, 13: 254, 14: 255, 15: 255, 16: 255, 17: 255, 18: 255, 19: 255, 20: 255, 21: 255, 22: 255, 23: 255, 24: 255, 25: 255, 26: 255, 27: 255, 28: 255, 29: 255, 30: 255, 31: 255, 32: 253, 33: 253, 34: 253, 35: 253, 36: 253, 37: 253, 38: 253, 39: 253, 40: 253, 41: 253, 42: 253, 43: 253, 44: 253, 45: 253, 46: 253, 47: 253, 48: 252, 49: 252, 50: 252, 51: 252, 52: 252, 53: 252, 54: 252, 55: 252, 56: 252, 57: 252, 58: 253, 59: 253, 60: 253, 61: 253, 62: 253, 63: 253, 64: 253, 65: 182, 66: 106, 67: 107, 68: 100, 69: 183, 70: 184, 71: 185, 72: 101, 73: 94, 74: 186, 75: 187, 76: 108, 77: 109, 78: 110, 79: 111, 80: 188, 81: 189, 82: 190, 83: 89, 84: 95, 85: 112, 86: 113, 87: 191, 88: 192, 89: 193, 90: 194, 91: 253, 92: 253, 93: 253, 94: 253, 95: 253, 96: 253, 97: 64, 98: 72, 99: 73, 100: 114, 101: 74, 102: 115, 103: 116, 104: 102, 105: 81, 106: 201, 107: 117, 108: 90, 109: 103, 110: 78, 111: 82, 112: 96, 113: 202, 114: 91, 115: 79, 116: 84, 117: 104, 118: 105, 119: 97, 120: 98, 121: 92, 122: 203, 123: 253, 124: 253, 125: 253, 126: 253, 127: 253, 128: 209, 129: 210, 130: 211, 131: 212, 132: 213, 133: 88, 134: 214, 135: 215, 136: 216, 137: 217, 138: 218, 139: 219, 140: 220, 141: 118, 142: 221, 143: 222, 144: 223, 145: 224, 146: 99, 147: 85, 148: 83, 149: 225, 150: 226, 151: 227, 152: 228, 153: 229, 154: 230, 155: 231, 156: 232, 157: 233, 158: 234, 159: 235, 160: 236, 161: 5, 162: 30, 163: 237, 164: 24, 165: 238, 166: 75, 167: 8, 168: 26, 169: 52, 170: 34, 171: 51, 172: 119, 173: 47, 174: 58, 175: 57, 176: 49, 177: 53, 178: 55, 179: 43, 180: 20, 181: 19, 182: 44, 183: 14, 184: 48, 185: 3, 186: 17, 187: 25, 188: 39, 189: 62, 190: 31, 191: 54, 192: 45, 193: 9, 194: 16, 195: 2, 196: 61, 197: 15, 198: 239, 199: 12, 200: 42, 201: 46, 202: 18, 203: 21, 204: 76, 205: 4, 206: 66, 207: 63, 208: 22, 209: 10, 210: 1, 211: 36, 212: 23, 213: 13, 214: 40, 215: 27, 216: 32, 217: 35, 218: 86, 219: 240, 220: 241, 221: 242, 222: 243, 223: 244, 224: 11, 225: 28, 226: 41, 227: 29, 228: 33, 229: 245, 230: 50, 231: 37, 232: 6, 233: 7, 234: 67, 235: 77, 236: 38, 237: 93, 238: 246, 239: 247, 240: 68, 241: 56, 242: 59, 243: 65, 244: 69, 245: 60, 246: 70, 247: 80, 248: 71, 249: 87, 250: 248, 251: 249, 252: 250, 253: 251, 254: 252, 255: 253}
-TIS_620_THAI_MODEL = SingleByteCharSetModel(charset_name='TIS-620', language='Thai', char_to_order_map=TIS_620_THAI_CHAR_TO_ORDER, language_model=THAI_LANG_MODEL, typical_positive_ratio=0.926386, keep_ascii_letters=False, alphabet='กขฃคฅฆงจฉชซฌญฎฏฐฑฒณดตถทธนบปผฝพฟภมยรฤลฦวศษสหฬอฮฯะัาำิีึืฺุู฿เแโใไๅๆ็่้๊๋์ํ๎๏๐๑๒๓๔๕๖๗๘๙๚๛')
\ No newline at end of file
+
+
+# 3: Positive
+# 2: Likely
+# 1: Unlikely
+# 0: Negative
+#
+# Flattened 64x64 matrix: the byte at 64 * first + second is the likelihood of
+# the character of order ``second`` following the one of order ``first``
+THAI_LANG_MODEL = bytes.fromhex(
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # None
+    '00000303020300000303000303000303030303030303030003020300020202030002030000000001000102030101030202000101000001000000000000000101'  # 'า'
+    '00030302030303030303030303030302020202020202030302030203030202020301020300030302020102030301020001030001000001000000000000000101'  # 'ร'
+    '00030202030303030102030303030302020202030302020303020203020302020303010203010202030301000201000003010201000001000000000000010001'  # 'น'
+    '00030303030302020303030302030202030302020302020202010103010201010302010002010001000101000101000001000100000001000000000000000000'  # 'อ'
+    '00030302030203030202030203030203010102030202020302020202020102010202010103030201000102020001030000000101000000000002030000020101'  # 'ก'
+    '00030203030200000303000303000202030102020101010002020200020201010002010002000002000100000100000001010101000000000000000000000100'  # '่'
+    '00030203030200000303000203000201020202020102000002020200020201010002010002000002000101000100000000000001000001000000000000000000'  # '้'
+    '00030203020302000202010302010302010203020203000203020201020202020102020000000002000102000101010001000301010000000000000000000100'  # 'ง'
+    '00030203030203020202030202030202010203020203010302020203020202030302010300010101000201010101010001000101000000000000000000020000'  # 'ม'
+    '00000003000303030303000003000202030303030300000001010300000000020000010000000000000002030000000300020000000000030000000000000000'  # 'ั'
+    '00000303030300000203000003000303020303030303000003030300000003030000030000000002000002010103000001000002030001000000000000000100'  # 'เ'
+    '00030303020303030303030301020103030202010202020301010200020102010202010000000101000100010100000000000101000001000000000000000000'  # 'ว'
+    '00000201020303030002000202000201030202010201000002020100020102020001010000000001000101000000000000000100000000000000000000000000'  # 'ี'
+    '00030303020103030101030002030101030201010200020203020101010101020300000103010201020003000000010003000000000000000000000000010000'  # 'ท'
+    '00030101030203030301030201030201030202020201030301020103010203000201010302020201020100000101000000000000000000000000000000000002'  # 'ล'
+    '00030203020303020302030203030201000302020201020202010202010201010202020300010301010101000101000201000200000000000000000000000000'  # 'ย'
+    '00030303020302020101030203020302000302020102000202020102020202010302010202010002000100000101000000000001010001000000000000000001'  # 'บ'
+    '00030303030203010203030202030001010200030302020300010103000000000301000303000200020100000302000000000000000000000000000000000000'  # 'ส'
+    '00030302030203030001030101020102010103010100020301010101010101010301010202020201010100000202000000000000000000000000000000000001'  # 'ต'
+    '00020201010201030302030202030202030102020102000302010202020202010302010202020101010100000101000000000200000000000000000000000000'  # 'ด'
+    '00030303030303030103030002010003020000030100010100010000000000010100000100030200000000000000000200000000000000000000000000000000'  # 'ห'
+    '00000202020300000103000302000302020303030303010002020200020201020002030000000001000100000101000001000000000000000000000000000001'  # 'ะ'
+    '00000203010303020303000303000302020302030303000002020300010101030000030000000202000103000102020203000000000001000000000000000001'  # 'ิ'
+    '00020303020003030202030103020103020001020200020302010003000000000300000203010300000300020000000000000000000000000000000000000000'  # 'ค'
+    '00010302020201020001030101030103000002010101010201010100020100010102000000030101000000000100010000010001000000000003010000000100'  # 'ป'
+    '00030303020202020201030101010200010102010201030200000301010101010301000203000000030000000100000000000000000000000000000000000000'  # 'จ'
+    '00000002030003030002000000000000000300000100000000000000000000000000010000000000000000000000000000000000000000000000000000000000'  # 'ื'
+    '00000203010300000102000002000303020303030203000002020200000002020000010000000003000000000200000000000000000002000000000000000000'  # 'แ'
+    '00000003000200000000000000000000010203010303000001000300000000000000030000000000000000000000000000000000000000000000000000000000'  # 'ใ'
+    '00030102030102030100030002020100020101020001000001010101000100000100000000010100030000020000000000000000000000000000000000000000'  # 'ข'
+    '00030303020100010101030102020202020201010101000301000103010101010101000200010301010000010000000001000000000000000000000000020001'  # 'พ'
+    '00000202010303020303000101000202010201030301000003020000000002010001000000000102000101030101020201000000000000010000000000000000'  # 'ุ'
+    '00000300000100000003000003000301000101010302000000030000000002000000010000000000000000000000000000000001000002000000000000000000'  # 'ไ'
+    '00030103020103030102020001020100010200000000000300000003000000000300000101010000000000000000000100000000000000000000000000000000'  # 'ช'
+    '00000102000303030202000101000103000000020200000000030100010000000000000000000000000100010000000200000000000000000000000000000000'  # 'ู'
+    '00000203010200000201000301000102000101010103000003010100020201010002000000000001000100000101000000010000000000000000000000000000'  # 'ำ'
+    '00000003010200000202000102000100010301020100000002000300000001000001000000000000000000000000000100000000000000000000000000000000'  # '็'
+    '00000101020200000002000201000101000101010201000001010100020101010001010000000000000100000100000000000000000001000000000000010001'  # '์'
+    '00000002000103010101010000000003020001000000010200000001000000000000000300000000000000000000000000000000000000000000000000000000'  # 'ผ'
+    '00000000000303030301000000000000000000000100000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # 'ึ'
+    '00000203020200000001000000000203020102020300000002030100000001010000010000000000000001000001000000000001010001000000000000000000'  # 'โ'
+    '00030202000100000000020002000100000001010000000201000100010100000001000200000100030001000000020100000000000000000000000000000000'  # 'ศ'
+    '00030100000100000000000101020000000001000001030100000000010100000001000000000300000000000003000000000000000300000000000000000000'  # 'ณ'
+    '00030101010102030000020101010101000201010000000201000102010100010201000300000000030000000000000000000000000000000000000000000000'  # 'ถ'
+    '00030100000000000000030000000300000000000000000101000000000000010000000200000100000000000000000000000000000000000000000000000000'  # 'ภ'
+    '00030200000000000001020100010100020000010000020000000000000000000000000000000200000001030001000000020000000000000001020000000000'  # 'ษ'
+    '00030000010102000001020100010101000101000002010100010000010101000000010000000000000000000000000300000100000000000000000000000000'  # 'ญ'
+    '00020201000000000100000000030000000000000000000300000000000000000200000000000300000000000000000000000000000000000000000000000000'  # 'ธ'
+    '00030000010100000002000000000000000200000000000000000000000000000000000000000100000001000000000000000000000000000000000000000000'  # 'ฐ'
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # 'ๆ'
+    '00010001020001020000010100020001000001000000000100000002000000000100000100010100030000000000000000000000000000000000000000000000'  # 'ซ'
+    '00010000000000000001010001010002010300000000010100000000000000030100000000000000000000000000000000000000000000000000000000000000'  # 'ฉ'
+    '00000000000000000000000000000000000000000000000200000000000000000000000000000300000000000000000000000000000000000000000000000000'  # 'ฑ'
+    '00000100010000020000020000010102000001010000000100000001010000000100010000000000000000000000000000000000000002000000000000000000'  # 'ฟ'
+    '00000003000000000000000000000000000000000000000100000000000000010000000000000000000000000000000000000000000000000000000000000000'  # 'ฒ'
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000200000101000000'  # '๑'
+    '00000000000000000000000000010000000000000000000300000000000000000000000000000000000000000000000000000000000000000000000000000000'  # 'ฏ'
+    '00000000000200000000000000020000000000000001000100000000000000000000000000000000000000000000000000000000000000000000000000000000'  # 'ฎ'
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000100000103000000'  # '๒'
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000200000100000000'  # '๕'
+    '00000000000000000001000000000200000000020000000000000000000000000000000000000000000000000000020000000000000000000000000000000000'  # 'ฤ'
+    '00000101000002010000010000010000000000000000000000000000000000000000000000000000020000000000000000000000000000000000000000000000'  # 'ฝ'
+    '00000000000000000000000000000002000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # 'ฯ'
+)
+
+# 255: Undefined characters that did not exist in training text
+# 254: Carriage/Return
+# 253: symbol (punctuation) that does not belong to word
+# 252: 0 - 9
+# 251: Control characters
+
+# Character Mapping Table(s), indexed by byte value:
+TIS_620_THAI_CHAR_TO_ORDER = bytes.fromhex(
+    'fffffffffffffffffffffefffffeffff'  # '\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f'
+    'ffffffffffffffffffffffffffffffff'  # '\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f'
+    'fdfdfdfdfdfdfdfdfdfdfdfdfdfdfdfd'  # ' !"#$%&\'()*+,-./'
+    'fcfcfcfcfcfcfcfcfcfcfdfdfdfdfdfd'  # '0123456789:;<=>?'
+    'fdb66a6b64b7b8b9655ebabb6c6d6e6f'  # '@ABCDEFGHIJKLMNO'
+    'bcbdbe595f7071bfc0c1c2fdfdfdfdfd'  # 'PQRSTUVWXYZ[\\]^_'
+    'fd404849724a73746651c9755a674e52'  # '`abcdefghijklmno'
+    '60ca5b4f54686961625ccbfdfdfdfdfd'  # 'pqrstuvwxyz{|}~\x7f'
+    'd1d2d3d4d558d6d7d8d9dadbdc76ddde'  # '\x80\x81\x82\x83\x84\x85\x86\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\x8f'
+    'dfe0635553e1e2e3e4e5e6e7e8e9eaeb'  # '\x90\x91\x92\x93\x94\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f'
+    'ec051eed18ee4b081a342233772f3a39'  # '�กขฃคฅฆงจฉชซฌญฎฏ'
+    '3135372b14132c0e30031119273e1f36'  # 'ฐฑฒณดตถทธนบปผฝพฟ'
+    '2d0910023d0fef0c2a2e12154c04423f'  # 'ภมยรฤลฦวศษสหฬอฮฯ'
+    '160a0124170d281b202356f0f1f2f3f4'  # 'ะัาำิีึืฺุู����฿'
+    '0b1c291d21f532250607434d265df6f7'  # 'เแโใไๅๆ็่้๊๋์ํ๎๏'
+    '44383b41453c46504757f8f9fafbfcfd'  # '๐๑๒๓๔๕๖๗๘๙๚๛����'
+)
+
+TIS_620_THAI_MODEL = SingleByteCharSetModel(charset_name='TIS-620',
+                                            language='Thai',
+                                            char_to_order_map=TIS_620_THAI_CHAR_TO_ORDER,
+                                            language_model=THAI_LANG_MODEL,
+                                            typical_positive_ratio=0.926386,
+                                            keep_ascii_letters=False,
+                                            alphabet='กขฃคฅฆงจฉชซฌญฎฏฐฑฒณดตถทธนบปผฝพฟภมยรฤลฦวศษสหฬอฮฯะัาำิีึืฺุู฿เแโใไๅๆ็่้๊๋์ํ๎๏๐๑๒๓๔๕๖๗๘๙๚๛')
+
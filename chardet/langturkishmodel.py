@@ -1,4 +1,111 @@
 from chardet.sbcharsetprober import SingleByteCharSetModel
-TURKISH_LANG_MODEL = {23: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 0, 49: 0, 20: 0, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 3, 21: 0, 28: 0, 12: 2, 2: 3, 18: 0, 27: 1, 25: 1, 3: 1, 24: 0, 10: 2, 5: 1, 13: 1, 4: 1, 15: 0, 26: 0, 7: 1, 8: 1, 9: 1, 14: 1, 32: 0, 57: 0, 58: 0, 11: 3, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 1, 61: 0, 34: 0, 17: 0, 30: 0, 41: 0, 6: 0, 40: 0, 19: 0}, 37: {23: 0, 37: 0, 47: 2, 39: 0, 29: 0, 52: 2, 36: 0, 45: 0, 53: 0, 60: 0, 16: 1, 49: 0, 20: 0, 46: 0, 42: 0, 48: 1, 44: 0, 35: 1, 31: 0, 51: 0, 38: 1, 62: 0, 43: 1, 56: 0, 1: 2, 21: 0, 28: 2, 12: 0, 2: 3, 18: 0, 27: 0, 25: 0, 3: 0, 24: 0, 10: 0, 5: 0, 13: 1, 4: 1, 15: 0, 26: 0, 7: 0, 8: 0, 9: 0, 14: 2, 32: 0, 57: 0, 58: 0, 11: 0, 22: 1, 63: 0, 54: 0, 50: 1, 55: 0, 59: 0, 33: 0, 61: 0, 34: 1, 17: 0, 30: 0, 41: 0, 6: 0, 40: 1, 19: 1}, 47: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 1, 36: 0, 45: 0, 53: 0, 60: 0, 16: 0, 49: 1, 20: 0, 46: 1, 42: 0, 48: 1, 44: 1, 35: 0, 31: 0, 51: 0, 38: 1, 62: 0, 43: 1, 56: 0, 1: 3, 21: 0, 28: 2, 12: 0, 2: 3, 18: 0, 27: 0, 25: 0, 3: 0, 24: 2, 10: 1, 5: 2, 13: 2, 4: 2, 15: 1, 26: 0, 7: 2, 8: 0, 9: 0, 14: 3, 32: 0, 57: 0, 58: 0, 11: 0, 22: 2, 63: 0, 54: 0, 50: 1, 55: 0, 59: 0, 33: 1, 61: 0, 34: 1, 17: 0, 30: 0, 41: 1, 6: 3, 40: 0, 19: 0}, 39: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 1, 36: 0, 45: 0, 53: 0, 60: 0, 16: 1, 49: 0, 20: 0, 46: 0, 42: 0, 48: 1, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 2, 21: 0, 28: 2, 12: 0, 2: 2, 18: 0, 27: 0, 25: 0, 3: 0, 24: 0, 10: 0, 5: 1, 13: 3, 4: 0, 15: 1, 26: 0, 7: 0, 8: 0, 9: 0, 14: 1, 32: 0, 57: 0, 58: 0, 11: 0, 22: 1, 63: 0, 54: 1, 50: 0, 55: 0, 59: 0, 33: 1, 61: 0, 34: 0, 17: 0, 30: 1, 41: 0, 6: 1, 40: 1, 19: 0}, 29: {23: 0, 37: 0, 47: 0, 39: 0, 29: 1, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 3, 49: 0, 20: 1, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 3, 21: 0, 28: 0, 12: 2, 2: 3, 18: 0, 27: 1, 25: 0, 3: 1, 24: 1, 10: 0, 5: 3, 13: 3, 4: 3, 15: 0, 26: 0, 7: 0, 8: 1, 9: 1, 14: 1, 32: 1, 57: 0, 58: 0, 11: 2, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 0, 30: 0, 41: 0, 6: 3, 40: 0, 19: 0}, 52: {23: 0, 37: 1, 47: 1, 39: 1, 29: 1, 52: 2, 36: 0, 45: 2, 53: 1, 60: 0, 16: 0, 49: 0, 20: 1, 46: 1, 42: 1, 48: 2, 44: 1, 35: 1, 31: 1, 51: 1, 38: 1, 62: 0, 43: 2, 56: 0, 1: 0, 21: 1, 28: 1, 12: 1, 2: 0, 18: 1, 27: 0, 25: 0, 3: 2, 24: 1, 10: 0, 5: 0, 13: 1, 4: 2, 15: 1, 26: 0, 7: 2, 8: 1, 9: 1, 14: 1, 32: 0, 57: 0, 58: 0, 11: 1, 22: 1, 63: 0, 54: 0, 50: 1, 55: 2, 59: 0, 33: 0, 61: 0, 34: 2, 17: 0, 30: 1, 41: 1, 6: 2, 40: 0, 19: 2}, 36: {23: 1, 37: 0, 47: 1, 39: 0, 29: 0, 52: 1, 36: 2, 45: 0, 53: 0, 60: 0, 16: 2, 49: 0, 20: 0, 46: 2, 42: 1, 48: 1, 44: 1, 35: 1, 31: 0, 51: 1, 38: 2, 62: 0, 43: 0, 56: 0, 1: 3, 21: 0, 28: 1, 12: 0, 2: 3, 18: 0, 27: 0, 25: 0, 3: 0, 24: 1, 10: 1, 5: 0, 13: 3, 4: 2, 15: 0, 26: 1, 7: 0, 8: 1, 9: 1, 14: 3, 32: 0, 57: 0, 58: 1, 11: 0, 22: 2, 63: 0, 54: 1, 50: 2, 55: 0, 59: 1, 33: 2, 61: 0, 34: 0, 17: 0, 30: 1, 41: 1, 6: 2, 40: 2, 19: 1}, 45: {23: 0, 37: 1, 47: 0, 39: 0, 29: 0, 52: 2, 36: 2, 45: 1, 53: 1, 60: 0, 16: 2, 49: 1, 20: 0, 46: 1, 42: 1, 48: 1, 44: 0, 35: 2, 31: 0, 51: 1, 38: 2, 62: 0, 43: 0, 56: 0, 1: 3, 21: 0, 28: 2, 12: 0, 2: 3, 18: 0, 27: 0, 25: 0, 3: 2, 24: 0, 10: 1, 5: 0, 13: 2, 4: 0, 15: 1, 26: 1, 7: 1, 8: 0, 9: 0, 14: 3, 32: 0, 57: 0, 58: 0, 11: 0, 22: 2, 63: 0, 54: 1, 50: 1, 55: 0, 59: 0, 33: 1, 61: 0, 34: 1, 17: 0, 30: 2, 41: 1, 6: 0, 40: 2, 19: 1}, 53: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 1, 36: 0, 45: 0, 53: 0, 60: 0, 16: 2, 49: 0, 20: 0, 46: 0, 42: 0, 48: 1, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 2, 21: 0, 28: 2, 12: 0, 2: 2, 18: 0, 27: 0, 25: 0, 3: 0, 24: 0, 10: 0, 5: 2, 13: 2, 4: 0, 15: 0, 26: 0, 7: 0, 8: 0, 9: 0, 14: 2, 32: 0, 57: 0, 58: 0, 11: 0, 22: 2, 63: 0, 54: 1, 50: 0, 55: 0, 59: 0, 33: 2, 61: 0, 34: 1, 17: 0, 30: 0, 41: 0, 6: 0, 40: 1, 19: 1}, 60: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 0, 49: 0, 20: 1, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 0, 21: 1, 28: 0, 12: 1, 2: 0, 18: 0, 27: 0, 25: 0, 3: 1, 24: 0, 10: 0, 5: 0, 13: 0, 4: 1, 15: 0, 26: 0, 7: 0, 8: 1, 9: 0, 14: 0, 32: 0, 57: 0, 58: 0, 11: 0, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 0, 30: 0, 41: 0, 6: 0, 40: 0, 19: 0}, 16: {23: 0, 37: 0, 47: 0, 39: 0, 29: 3, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 0, 49: 0, 20: 2, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 2, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 2, 21: 3, 28: 0, 12: 3, 2: 1, 18: 3, 27: 3, 25: 3, 3: 3, 24: 2, 10: 3, 5: 0, 13: 0, 4: 3, 15: 0, 26: 1, 7: 3, 8: 3, 9: 3, 14: 0, 32: 3, 57: 0, 58: 0, 11: 2, 22: 1, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 2, 30: 0, 41: 1, 6: 3, 40: 0, 19: 0}, 49: {23: 0, 37: 0, 47: 0, 39: 0, 29: 2, 52: 0, 36: 1, 45: 1, 53: 0, 60: 0, 16: 0, 49: 0, 20: 1, 46: 0, 42: 2, 48: 0, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 1, 56: 0, 1: 0, 21: 3, 28: 0, 12: 2, 2: 0, 18: 0, 27: 0, 25: 0, 3: 2, 24: 0, 10: 1, 5: 0, 13: 0, 4: 2, 15: 1, 26: 1, 7: 1, 8: 1, 9: 1, 14: 0, 32: 0, 57: 0, 58: 0, 11: 2, 22: 0, 63: 0, 54: 0, 50: 0, 55: 2, 59: 0, 33: 0, 61: 0, 34: 1, 17: 1, 30: 1, 41: 0, 6: 2, 40: 0, 19: 0}, 20: {23: 1, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 1, 16: 3, 49: 0, 20: 2, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 1, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 3, 21: 2, 28: 0, 12: 3, 2: 3, 18: 0, 27: 1, 25: 1, 3: 2, 24: 2, 10: 2, 5: 2, 13: 3, 4: 3, 15: 0, 26: 1, 7: 3, 8: 0, 9: 2, 14: 3, 32: 0, 57: 0, 58: 0, 11: 2, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 3, 61: 0, 34: 0, 17: 0, 30: 0, 41: 0, 6: 3, 40: 0, 19: 0}, 46: {23: 0, 37: 1, 47: 0, 39: 0, 29: 0, 52: 1, 36: 1, 45: 1, 53: 0, 60: 0, 16: 2, 49: 0, 20: 0, 46: 1, 42: 0, 48: 0, 44: 1, 35: 1, 31: 0, 51: 1, 38: 2, 62: 0, 43: 1, 56: 0, 1: 3, 21: 0, 28: 2, 12: 0, 2: 3, 18: 0, 27: 1, 25: 0, 3: 0, 24: 2, 10: 1, 5: 1, 13: 3, 4: 2, 15: 1, 26: 1, 7: 1, 8: 0, 9: 0, 14: 3, 32: 0, 57: 0, 58: 1, 11: 1, 22: 2, 63: 0, 54: 1, 50: 1, 55: 0, 59: 0, 33: 0, 61: 0, 34: 1, 17: 0, 30: 0, 41: 1, 6: 2, 40: 1, 19: 1}, 42: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 1, 36: 0, 45: 1, 53: 0, 60: 0, 16: 2, 49: 1, 20: 0, 46: 0, 42: 0, 48: 2, 44: 1, 35: 1, 31: 0, 51: 1, 38: 1, 62: 0, 43: 0, 56: 0, 1: 3, 21: 0, 28: 2, 12: 0, 2: 2, 18: 0, 27: 0, 25: 0, 3: 0, 24: 0, 10: 0, 5: 3, 13: 3, 4: 0, 15: 1, 26: 0, 7: 0, 8: 0, 9: 0, 14: 2, 32: 0, 57: 0, 58: 0, 11: 0, 22: 2, 63: 0, 54: 2, 50: 1, 55: 0, 59: 0, 33: 2, 61: 0, 34: 1, 17: 0, 30: 1, 41: 2, 6: 1, 40: 1, 19: 1}, 48: {23: 0, 37: 0, 47: 2, 39: 0, 29: 0, 52: 2, 36: 1, 45: 1, 53: 0, 60: 0, 16: 2, 49: 0, 20: 0, 46: 1, 42: 1, 48: 1, 44: 0, 35: 1, 31: 0, 51: 0, 38: 1, 62: 0, 43: 0, 56: 0, 1: 2, 21: 0, 28: 2, 12: 0, 2: 3, 18: 0, 27: 0, 25: 0, 3: 0, 24: 0, 10: 1, 5: 0, 13: 2, 4: 0, 15: 2, 26: 0, 7: 0, 8: 0, 9: 0, 14: 2, 32: 0, 57: 0, 58: 2, 11: 0, 22: 2, 63: 0, 54: 1, 50: 2, 55: 0, 59: 0, 33: 0, 61: 0, 34: 2, 17: 0, 30: 1, 41: 1, 6: 0, 40: 2, 19: 1}, 44: {23: 0, 37: 0, 47: 1, 39: 0, 29: 0, 52: 1, 36: 0, 45: 0, 53: 0, 60: 0, 16: 3, 49: 0, 20: 0, 46: 0, 42: 0, 48: 1, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 1, 56: 0, 1: 3, 21: 1, 28: 1, 12: 0, 2: 2, 18: 0, 27: 0, 25: 0, 3: 0, 24: 0, 10: 1, 5: 2, 13: 2, 4: 0, 15: 1, 26: 0, 7: 0, 8: 0, 9: 0, 14: 2, 32: 0, 57: 0, 58: 0, 11: 1, 22: 2, 63: 0, 54: 0, 50: 1, 55: 0, 59: 0, 33: 1, 61: 0, 34: 1, 17: 1, 30: 1, 41: 0, 6: 2, 40: 1, 19: 1}, 35: {23: 0, 37: 0, 47: 1, 39: 0, 29: 0, 52: 1, 36: 1, 45: 1, 53: 0, 60: 0, 16: 3, 49: 1, 20: 1, 46: 0, 42: 0, 48: 1, 44: 0, 35: 0, 31: 0, 51: 1, 38: 1, 62: 0, 43: 1, 56: 0, 1: 3, 21: 0, 28: 2, 12: 0, 2: 3, 18: 0, 27: 0, 25: 0, 3: 0, 24: 0, 10: 1, 5: 1, 13: 2, 4: 1, 15: 0, 26: 0, 7: 0, 8: 0, 9: 1, 14: 2, 32: 0, 57: 0, 58: 0, 11: 0, 22: 1, 63: 0, 54: 2, 50: 2, 55: 0, 59: 0, 33: 3, 61: 0, 34: 1, 17: 0, 30: 0, 41: 0, 6: 3, 40: 2, 19: 1}, 31: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 1, 16: 2, 49: 0, 20: 1, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 2, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 3, 21: 2, 28: 0, 12: 1, 2: 3, 18: 2, 27: 2, 25: 0, 3: 1, 24: 1, 10: 2, 5: 2, 13: 3, 4: 3, 15: 0, 26: 2, 7: 2, 8: 0, 9: 2, 14: 2, 32: 1, 57: 1, 58: 1, 11: 2, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 1, 30: 0, 41: 0, 6: 3, 40: 0, 19: 0}, 51: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 1, 36: 1, 45: 0, 53: 0, 60: 0, 16: 1, 49: 0, 20: 0, 46: 1, 42: 0, 48: 1, 44: 0, 35: 0, 31: 0, 51: 1, 38: 1, 62: 0, 43: 0, 56: 0, 1: 3, 21: 0, 28: 1, 12: 0, 2: 3, 18: 0, 27: 2, 25: 0, 3: 0, 24: 0, 10: 1, 5: 1, 13: 3, 4: 2, 15: 0, 26: 1, 7: 0, 8: 0, 9: 0, 14: 2, 32: 0, 57: 0, 58: 0, 11: 0, 22: 2, 63: 0, 54: 1, 50: 1, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 0, 30: 1, 41: 1, 6: 2, 40: 0, 19: 1}, 38: {23: 1, 37: 1, 47: 1, 39: 0, 29: 0, 52: 2, 36: 0, 45: 0, 53: 0, 60: 0, 16: 3, 49: 0, 20: 3, 46: 0, 42: 0, 48: 1, 44: 1, 35: 0, 31: 0, 51: 1, 38: 1, 62: 0, 43: 0, 56: 0, 1: 3, 21: 0, 28: 2, 12: 0, 2: 3, 18: 0, 27: 0, 25: 0, 3: 0, 24: 0, 10: 0, 5: 2, 13: 2, 4: 0, 15: 2, 26: 0, 7: 0, 8: 0, 9: 1, 14: 3, 32: 0, 57: 0, 58: 0, 11: 1, 22: 2, 63: 0, 54: 1, 50: 1, 55: 0, 59: 1, 33: 2, 61: 0, 34: 1, 17: 0, 30: 1, 41: 1, 6: 3, 40: 2, 19: 1}, 62: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 0, 49: 0, 20: 0, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 0, 21: 0, 28: 0, 12: 0, 2: 0, 18: 0, 27: 0, 25: 0, 3: 0, 24: 0, 10: 0, 5: 0, 13: 0, 4: 0, 15: 0, 26: 0, 7: 0, 8: 0, 9: 0, 14: 0, 32: 0, 57: 0, 58: 0, 11: 0, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 0, 30: 0, 41: 0, 6: 0, 40: 0, 19: 0}, 43: {23: 0, 37: 0, 47: 1, 39: 0, 29: 0, 52: 2, 36: 0, 45: 1, 53: 1, 60: 0, 16: 2, 49: 0, 20: 0, 46: 2, 42: 0, 48: 2, 44: 1, 35: 1, 31: 0, 51: 1, 38: 2, 62: 0, 43: 0, 56: 0, 1: 3, 21: 0, 28: 2, 12: 0, 2: 2, 18: 0, 27: 0, 25: 0, 3: 0, 24: 1, 10: 1, 5: 1, 13: 3, 4: 0, 15: 2, 26: 0, 7: 0, 8: 0, 9: 0, 14: 3, 32: 0, 57: 0, 58: 1, 11: 0, 22: 2, 63: 0, 54: 1, 50: 2, 55: 1, 59: 1, 33: 0, 61: 0, 34: 1, 17: 0, 30: 1, 41: 1, 6: 0, 40: 2, 19: 1}, 56: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 0, 49: 0, 20: 0, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 0, 56: 2, 1: 2, 21: 1, 28: 0, 12: 0, 2: 2, 18: 0, 27: 0, 25: 0, 3: 2, 24: 1, 10: 0, 5: 0, 13: 1, 4: 1, 15: 0, 26: 0, 7: 1, 8: 1, 9: 0, 14: 2, 32: 0, 57: 0, 58: 0, 11: 0, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 1, 30: 0, 41: 0, 6: 1, 40: 0, 19: 0}, 1: {23: 3, 37: 0, 47: 1, 39: 0, 29: 3, 52: 0, 36: 1, 45: 1, 53: 0, 60: 0, 16: 0, 49: 0, 20: 3, 46: 1, 42: 0, 48: 1, 44: 0, 35: 0, 31: 3, 51: 0, 38: 1, 62: 0, 43: 0, 56: 2, 1: 2, 21: 3, 28: 0, 12: 3, 2: 2, 18: 3, 27: 3, 25: 3, 3: 3, 24: 3, 10: 3, 5: 0, 13: 2, 4: 3, 15: 1, 26: 3, 7: 3, 8: 3, 9: 3, 14: 3, 32: 3, 57: 2, 58: 0, 11: 3, 22: 0, 63: 1, 54: 0, 50: 0, 55: 0, 59: 0, 33: 1, 61: 1, 34: 1, 17: 3, 30: 0, 41: 0, 6: 3, 40: 0, 19: 1}, 21: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 1, 45: 0, 53: 0, 60: 1, 16: 2, 49: 0, 20: 2, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 1, 51: 0, 38: 0, 62: 0, 43: 1, 56: 0, 1: 3, 21: 2, 28: 0, 12: 3, 2: 3, 18: 0, 27: 3, 25: 1, 3: 3, 24: 2, 10: 3, 5: 3, 13: 3, 4: 3, 15: 0, 26: 3, 7: 1, 8: 2, 9: 2, 14: 2, 32: 1, 57: 0, 58: 1, 11: 3, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 1, 61: 0, 34: 0, 17: 0, 30: 1, 41: 0, 6: 2, 40: 0, 19: 0}, 28: {23: 0, 37: 1, 47: 1, 39: 1, 29: 2, 52: 0, 36: 2, 45: 2, 53: 1, 60: 0, 16: 0, 49: 0, 20: 2, 46: 1, 42: 1, 48: 2, 44: 1, 35: 1, 31: 2, 51: 2, 38: 2, 62: 0, 43: 3, 56: 0, 1: 1, 21: 1, 28: 2, 12: 2, 2: 1, 18: 1, 27: 2, 25: 2, 3: 3, 24: 1, 10: 3, 5: 0, 13: 2, 4: 3, 15: 2, 26: 2, 7: 3, 8: 3, 9: 3, 14: 1, 32: 0, 57: 1, 58: 0, 11: 2, 22: 1, 63: 1, 54: 0, 50: 0, 55: 1, 59: 0, 33: 0, 61: 1, 34: 2, 17: 2, 30: 2, 41: 1, 6: 3, 40: 0, 19: 2}, 12: {23: 1, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 2, 16: 3, 49: 0, 20: 3, 46: 0, 42: 0, 48: 0, 44: 0, 35: 1, 31: 1, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 3, 21: 2, 28: 1, 12: 3, 2: 3, 18: 1, 27: 3, 25: 3, 3: 2, 24: 3, 10: 2, 5: 3, 13: 3, 4: 3, 15: 1, 26: 2, 7: 3, 8: 2, 9: 2, 14: 3, 32: 1, 57: 0, 58: 1, 11: 3, 22: 1, 63: 1, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 1, 30: 0, 41: 0, 6: 2, 40: 0, 19: 0}, 2: {23: 2, 37: 0, 47: 2, 39: 0, 29: 3, 52: 1, 36: 0, 45: 0, 53: 0, 60: 0, 16: 1, 49: 0, 20: 3, 46: 1, 42: 0, 48: 1, 44: 1, 35: 0, 31: 3, 51: 0, 38: 1, 62: 0, 43: 1, 56: 0, 1: 3, 21: 3, 28: 0, 12: 3, 2: 2, 18: 3, 27: 3, 25: 3, 3: 3, 24: 3, 10: 3, 5: 0, 13: 2, 4: 3, 15: 1, 26: 3, 7: 3, 8: 3, 9: 3, 14: 3, 32: 3, 57: 2, 58: 0, 11: 3, 22: 1, 63: 1, 54: 0, 50: 0, 55: 0, 59: 0, 33: 1, 61: 0, 34: 1, 17: 3, 30: 0, 41: 0, 6: 3, 40: 0, 19: 0}, 18: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 2, 49: 0, 20: 2, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 2, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 3, 21: 1, 28: 0, 12: 3, 2: 3, 18: 2, 27: 1, 25: 1, 3: 1, 24: 1, 10: 1, 5: 3, 13: 3, 4: 3, 15: 0, 26: 2, 7: 1, 8: 3, 9: 3, 14: 1, 32: 2, 57: 0, 58: 0, 11: 1, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 1, 61: 0, 34: 0, 17: 1, 30: 0, 41: 0, 6: 1, 40: 0, 19: 0}, 27: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 3, 49: 0, 20: 0, 46: 0, 42: 0, 48: 0, 44: 0, 35: 1, 31: 1, 51: 0, 38: 2, 62: 0, 43: 0, 56: 0, 1: 3, 21: 1, 28: 0, 12: 1, 2: 3, 18: 0, 27: 2, 25: 1, 3: 2, 24: 3, 10: 2, 5: 3, 13: 3, 4: 2, 15: 0, 26: 1, 7: 2, 8: 2, 9: 3, 14: 3, 32: 1, 57: 0, 58: 0, 11: 1, 22: 0, 63: 1, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 0, 30: 0, 41: 0, 6: 2, 40: 0, 19: 0}, 25: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 2, 49: 0, 20: 0, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 3, 21: 0, 28: 0, 12: 2, 2: 3, 18: 0, 27: 1, 25: 2, 3: 2, 24: 3, 10: 3, 5: 3, 13: 3, 4: 3, 15: 1, 26: 1, 7: 3, 8: 3, 9: 2, 14: 3, 32: 2, 57: 1, 58: 0, 11: 1, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 0, 30: 0, 41: 0, 6: 3, 40: 0, 19: 0}, 3: {23: 2, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 1, 16: 3, 49: 0, 20: 3, 46: 0, 42: 1, 48: 0, 44: 0, 35: 1, 31: 2, 51: 0, 38: 1, 62: 0, 43: 0, 56: 0, 1: 3, 21: 2, 28: 0, 12: 3, 2: 3, 18: 2, 27: 3, 25: 1, 3: 3, 24: 2, 10: 3, 5: 3, 13: 3, 4: 3, 15: 1, 26: 3, 7: 3, 8: 3, 9: 3, 14: 3, 32: 2, 57: 1, 58: 1, 11: 3, 22: 1, 63: 1, 54: 0, 50: 0, 55: 1, 59: 0, 33: 2, 61: 0, 34: 0, 17: 3, 30: 0, 41: 1, 6: 2, 40: 0, 19: 0}, 24: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 1, 16: 2, 49: 0, 20: 2, 46: 0, 42: 0, 48: 1, 44: 0, 35: 0, 31: 1, 51: 0, 38: 0, 62: 0, 43: 0, 56: 1, 1: 3, 21: 1, 28: 1, 12: 3, 2: 3, 18: 2, 27: 1, 25: 1, 3: 2, 24: 1, 10: 2, 5: 2, 13: 3, 4: 2, 15: 0, 26: 1, 7: 2, 8: 3, 9: 2, 14: 3, 32: 2, 57: 0, 58: 2, 11: 1, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 1, 61: 0, 34: 0, 17: 1, 30: 0, 41: 0, 6: 3, 40: 0, 19: 0}, 10: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 3, 49: 0, 20: 2, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 3, 51: 0, 38: 1, 62: 0, 43: 0, 56: 1, 1: 3, 21: 2, 28: 0, 12: 2, 2: 3, 18: 1, 27: 2, 25: 2, 3: 3, 24: 2, 10: 2, 5: 3, 13: 3, 4: 3, 15: 0, 26: 3, 7: 2, 8: 2, 9: 2, 14: 3, 32: 0, 57: 0, 58: 1, 11: 3, 22: 0, 63: 1, 54: 0, 50: 0, 55: 0, 59: 0, 33: 3, 61: 0, 34: 1, 17: 3, 30: 1, 41: 0, 6: 3, 40: 0, 19: 1}, 5: {23: 0, 37: 0, 47: 0, 39: 0, 29: 3, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 0, 49: 0, 20: 2, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 1, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 0, 21: 3, 28: 0, 12: 3, 2: 1, 18: 3, 27: 3, 25: 2, 3: 3, 24: 2, 10: 3, 5: 1, 13: 1, 4: 3, 15: 0, 26: 2, 7: 3, 8: 3, 9: 3, 14: 2, 32: 2, 57: 0, 58: 0, 11: 3, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 1, 61: 0, 34: 0, 17: 2, 30: 0, 41: 0, 6: 3, 40: 0, 19: 0}, 13: {23: 1, 37: 0, 47: 0, 39: 0, 29: 3, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 0, 49: 0, 20: 3, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 3, 51: 0, 38: 0, 62: 0, 43: 1, 56: 0, 1: 2, 21: 3, 28: 0, 12: 3, 2: 2, 18: 3, 27: 3, 25: 3, 3: 3, 24: 3, 10: 3, 5: 0, 13: 2, 4: 3, 15: 1, 26: 2, 7: 3, 8: 3, 9: 3, 14: 2, 32: 2, 57: 1, 58: 0, 11: 3, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 3, 30: 0, 41: 0, 6: 3, 40: 0, 19: 1}, 4: {23: 1, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 1, 53: 0, 60: 2, 16: 3, 49: 0, 20: 3, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 2, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 3, 21: 2, 28: 1, 12: 3, 2: 3, 18: 1, 27: 2, 25: 3, 3: 2, 24: 2, 10: 3, 5: 3, 13: 3, 4: 3, 15: 1, 26: 3, 7: 2, 8: 3, 9: 3, 14: 3, 32: 2, 57: 0, 58: 2, 11: 3, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 1, 61: 0, 34: 0, 17: 2, 30: 0, 41: 0, 6: 1, 40: 0, 19: 0}, 15: {23: 0, 37: 0, 47: 1, 39: 0, 29: 0, 52: 2, 36: 1, 45: 1, 53: 1, 60: 0, 16: 3, 49: 2, 20: 0, 46: 2, 42: 1, 48: 2, 44: 1, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 3, 21: 0, 28: 2, 12: 0, 2: 3, 18: 0, 27: 0, 25: 0, 3: 1, 24: 2, 10: 1, 5: 3, 13: 3, 4: 2, 15: 2, 26: 0, 7: 1, 8: 0, 9: 0, 14: 3, 32: 0, 57: 0, 58: 2, 11: 0, 22: 2, 63: 0, 54: 1, 50: 2, 55: 0, 59: 0, 33: 3, 61: 0, 34: 1, 17: 0, 30: 2, 41: 2, 6: 3, 40: 2, 19: 2}, 26: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 3, 49: 0, 20: 1, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 3, 21: 1, 28: 0, 12: 1, 2: 3, 18: 0, 27: 1, 25: 1, 3: 2, 24: 3, 10: 1, 5: 3, 13: 3, 4: 2, 15: 0, 26: 2, 7: 2, 8: 1, 9: 1, 14: 3, 32: 0, 57: 0, 58: 1, 11: 1, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 3, 61: 0, 34: 0, 17: 1, 30: 0, 41: 0, 6: 3, 40: 0, 19: 0}, 7: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 1, 36: 0, 45: 0, 53: 0, 60: 2, 16: 3, 49: 0, 20: 2, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 2, 51: 1, 38: 0, 62: 0, 43: 0, 56: 1, 1: 3, 21: 1, 28: 0, 12: 3, 2: 3, 18: 0, 27: 2, 25: 3, 3: 2, 24: 2, 10: 3, 5: 3, 13: 3, 4: 3, 15: 0, 26: 2, 7: 3, 8: 3, 9: 3, 14: 3, 32: 2, 57: 0, 58: 1, 11: 2, 22: 0, 63: 1, 54: 0, 50: 0, 55: 0, 59: 0, 33: 2, 61: 0, 34: 0, 17: 3, 30: 0, 41: 0, 6: 2, 40: 0, 19: 0}, 8: {23: 1, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 1, 45: 0, 53: 0, 60: 0, 16: 3, 49: 0, 20: 3, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 2, 51: 0, 38: 0, 62: 0, 43: 0, 56: 1, 1: 3, 21: 2, 28: 1, 12: 3, 2: 3, 18: 0, 27: 2, 25: 2, 3: 2, 24: 3, 10: 3, 5: 3, 13: 3, 4: 3, 15: 0, 26: 3, 7: 3, 8: 3, 9: 3, 14: 3, 32: 2, 57: 0, 58: 1, 11: 2, 22: 1, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 2, 61: 0, 34: 0, 17: 2, 30: 0, 41: 0, 6: 3, 40: 0, 19: 1}, 9: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 1, 16: 3, 49: 0, 20: 2, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 2, 51: 0, 38: 0, 62: 0, 43: 0, 56: 1, 1: 3, 21: 3, 28: 0, 12: 3, 2: 3, 18: 2, 27: 2, 25: 2, 3: 2, 24: 2, 10: 3, 5: 3, 13: 3, 4: 3, 15: 0, 26: 2, 7: 3, 8: 3, 9: 3, 14: 3, 32: 3, 57: 0, 58: 2, 11: 2, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 3, 61: 0, 34: 0, 17: 2, 30: 0, 41: 0, 6: 3, 40: 0, 19: 0}, 14: {23: 3, 37: 0, 47: 0, 39: 0, 29: 3, 52: 0, 36: 0, 45: 1, 53: 0, 60: 1, 16: 0, 49: 0, 20: 3, 46: 2, 42: 0, 48: 1, 44: 0, 35: 0, 31: 3, 51: 0, 38: 0, 62: 0, 43: 1, 56: 2, 1: 2, 21: 3, 28: 0, 12: 3, 2: 2, 18: 2, 27: 3, 25: 3, 3: 3, 24: 2, 10: 3, 5: 0, 13: 3, 4: 3, 15: 0, 26: 3, 7: 3, 8: 3, 9: 3, 14: 3, 32: 2, 57: 2, 58: 0, 11: 3, 22: 0, 63: 1, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 3, 30: 1, 41: 0, 6: 3, 40: 0, 19: 0}, 32: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 3, 49: 0, 20: 1, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 3, 21: 0, 28: 0, 12: 3, 2: 3, 18: 0, 27: 0, 25: 0, 3: 0, 24: 1, 10: 1, 5: 3, 13: 2, 4: 3, 15: 0, 26: 1, 7: 1, 8: 2, 9: 3, 14: 3, 32: 1, 57: 0, 58: 0, 11: 0, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 2, 61: 0, 34: 0, 17: 0, 30: 0, 41: 0, 6: 1, 40: 0, 19: 0}, 57: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 0, 49: 0, 20: 0, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 0, 51: 1, 38: 0, 62: 0, 43: 0, 56: 0, 1: 1, 21: 0, 28: 0, 12: 0, 2: 2, 18: 0, 27: 0, 25: 1, 3: 0, 24: 0, 10: 1, 5: 0, 13: 0, 4: 1, 15: 0, 26: 0, 7: 0, 8: 1, 9: 0, 14: 1, 32: 0, 57: 2, 58: 0, 11: 0, 22: 0, 63: 1, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 1, 30: 0, 41: 0, 6: 0, 40: 0, 19: 0}, 58: {23: 0, 37: 0, 47: 0, 39: 0, 29: 1, 52: 0, 36: 0, 45: 0, 53: 0, 60: 1, 16: 0, 49: 0, 20: 1, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 0, 21: 1, 28: 0, 12: 2, 2: 1, 18: 0, 27: 0, 25: 0, 3: 2, 24: 2, 10: 1, 5: 0, 13: 0, 4: 2, 15: 0, 26: 0, 7: 1, 8: 2, 9: 1, 14: 0, 32: 0, 57: 0, 58: 0, 11: 2, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 1, 30: 0, 41: 0, 6: 2, 40: 0, 19: 0}, 11: {23: 1, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 1, 16: 3, 49: 0, 20: 1, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 1, 51: 0, 38: 0, 62: 0, 43: 1, 56: 1, 1: 3, 21: 1, 28: 0, 12: 2, 2: 3, 18: 0, 27: 2, 25: 2, 3: 2, 24: 1, 10: 2, 5: 3, 13: 3, 4: 3, 15: 0, 26: 1, 7: 2, 8: 1, 9: 2, 14: 3, 32: 0, 57: 0, 58: 1, 11: 3, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 3, 61: 0, 34: 0, 17: 2, 30: 0, 41: 0, 6: 3, 40: 0, 19: 0}, 22: {23: 2, 37: 2, 47: 1, 39: 2, 29: 3, 52: 1, 36: 2, 45: 2, 53: 1, 60: 0, 16: 0, 49: 0, 20: 3, 46: 2, 42: 2, 48: 2, 44: 1, 35: 1, 31: 3, 51: 2, 38: 2, 62: 0, 43: 2, 56: 1, 1: 1, 21: 2, 28: 1, 12: 2, 2: 2, 18: 3, 27: 2, 25: 2, 3: 3, 24: 2, 10: 3, 5: 0, 13: 2, 4: 3, 15: 2, 26: 2, 7: 3, 8: 3, 9: 3, 14: 0, 32: 2, 57: 0, 58: 0, 11: 3, 22: 2, 63: 1, 54: 0, 50: 0, 55: 2, 59: 1, 33: 0, 61: 0, 34: 2, 17: 2, 30: 2, 41: 1, 6: 3, 40: 1, 19: 2}, 63: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 0, 49: 0, 20: 0, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 0, 21: 0, 28: 0, 12: 0, 2: 1, 18: 0, 27: 0, 25: 0, 3: 0, 24: 0, 10: 0, 5: 0, 13: 2, 4: 0, 15: 0, 26: 0, 7: 0, 8: 0, 9: 0, 14: 2, 32: 0, 57: 0, 58: 0, 11: 0, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 0, 30: 0, 41: 0, 6: 0, 40: 0, 19: 0}, 54: {23: 0, 37: 0, 47: 1, 39: 1, 29: 0, 52: 0, 36: 1, 45: 1, 53: 1, 60: 0, 16: 0, 49: 0, 20: 0, 46: 0, 42: 1, 48: 1, 44: 0, 35: 0, 31: 0, 51: 1, 38: 1, 62: 0, 43: 2, 56: 0, 1: 0, 21: 1, 28: 0, 12: 1, 2: 0, 18: 0, 27: 1, 25: 0, 3: 3, 24: 0, 10: 1, 5: 0, 13: 0, 4: 2, 15: 1, 26: 0, 7: 2, 8: 0, 9: 1, 14: 0, 32: 2, 57: 0, 58: 0, 11: 0, 22: 0, 63: 0, 54: 0, 50: 0, 55: 2, 59: 0, 33: 0, 61: 0, 34: 1, 17: 0, 30: 0, 41: 0, 6: 2, 40: 0, 19: 1}, 50: {23: 0, 37: 0, 47: 1, 39: 1, 29: 2, 52: 0, 36: 1, 45: 2, 53: 0, 60: 0, 16: 0, 49: 0, 20: 1, 46: 1, 42: 2, 48: 2, 44: 1, 35: 0, 31: 0, 51: 1, 38: 1, 62: 0, 43: 2, 56: 0, 1: 0, 21: 2, 28: 1, 12: 2, 2: 0, 18: 1, 27: 1, 25: 1, 3: 2, 24: 0, 10: 2, 5: 0, 13: 0, 4: 3, 15: 2, 26: 2, 7: 3, 8: 1, 9: 2, 14: 0, 32: 1, 57: 0, 58: 0, 11: 0, 22: 1, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 2, 17: 2, 30: 1, 41: 0, 6: 2, 40: 0, 19: 1}, 55: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 2, 36: 0, 45: 0, 53: 0, 60: 0, 16: 1, 49: 0, 20: 0, 46: 0, 42: 0, 48: 1, 44: 0, 35: 0, 31: 0, 51: 0, 38: 1, 62: 0, 43: 0, 56: 0, 1: 2, 21: 0, 28: 2, 12: 0, 2: 2, 18: 0, 27: 1, 25: 0, 3: 0, 24: 0, 10: 0, 5: 1, 13: 1, 4: 1, 15: 0, 26: 0, 7: 0, 8: 0, 9: 1, 14: 2, 32: 0, 57: 0, 58: 0, 11: 0, 22: 1, 63: 0, 54: 0, 50: 1, 55: 0, 59: 0, 33: 0, 61: 0, 34: 1, 17: 0, 30: 1, 41: 1, 6: 0, 40: 0, 19: 1}, 59: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 1, 45: 0, 53: 0, 60: 0, 16: 1, 49: 0, 20: 0, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 0, 56: 0, 1: 2, 21: 0, 28: 0, 12: 0, 2: 2, 18: 0, 27: 0, 25: 0, 3: 0, 24: 0, 10: 0, 5: 0, 13: 2, 4: 0, 15: 1, 26: 0, 7: 0, 8: 0, 9: 0, 14: 2, 32: 0, 57: 0, 58: 0, 11: 0, 22: 1, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 0, 30: 0, 41: 0, 6: 1, 40: 1, 19: 0}, 33: {23: 0, 37: 0, 47: 0, 39: 0, 29: 3, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 0, 49: 0, 20: 1, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 2, 51: 0, 38: 1, 62: 0, 43: 0, 56: 0, 1: 0, 21: 3, 28: 0, 12: 2, 2: 0, 18: 2, 27: 1, 25: 3, 3: 3, 24: 0, 10: 3, 5: 0, 13: 0, 4: 3, 15: 0, 26: 1, 7: 3, 8: 2, 9: 3, 14: 0, 32: 2, 57: 0, 58: 0, 11: 2, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 0, 34: 0, 17: 1, 30: 0, 41: 0, 6: 3, 40: 0, 19: 0}, 61: {23: 0, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 0, 16: 0, 49: 0, 20: 0, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 0, 51: 0, 38: 0, 62: 0, 43: 0, 56: 1, 1: 2, 21: 0, 28: 0, 12: 0, 2: 2, 18: 0, 27: 0, 25: 0, 3: 0, 24: 1, 10: 0, 5: 0, 13: 1, 4: 1, 15: 0, 26: 0, 7: 0, 8: 0, 9: 0, 14: 1, 32: 0, 57: 0, 58: 0, 11: 0, 22: 1, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 0, 61: 1, 34: 0, 17: 0, 30: 0, 41: 0, 6: 1, 40: 0, 19: 0}, 34: {23: 0, 37: 1, 47: 1, 39: 0, 29: 0, 52: 2, 36: 1, 45: 1, 53: 0, 60: 0, 16: 3, 49: 1, 20: 0, 46: 1, 42: 1, 48: 2, 44: 1, 35: 1, 31: 1, 51: 1, 38: 1, 62: 0, 43: 0, 56: 1, 1: 3, 21: 1, 28: 2, 12: 1, 2: 3, 18: 0, 27: 2, 25: 2, 3: 1, 24: 2, 10: 1, 5: 2, 13: 3, 4: 2, 15: 2, 26: 0, 7: 0, 8: 3, 9: 1, 14: 3, 32: 0, 57: 0, 58: 0, 11: 1, 22: 2, 63: 0, 54: 1, 50: 2, 55: 0, 59: 0, 33: 2, 61: 0, 34: 2, 17: 0, 30: 2, 41: 1, 6: 1, 40: 2, 19: 1}, 17: {23: 0, 37: 0, 47: 1, 39: 0, 29: 0, 52: 0, 36: 0, 45: 0, 53: 0, 60: 1, 16: 1, 49: 0, 20: 1, 46: 0, 42: 0, 48: 0, 44: 0, 35: 0, 31: 1, 51: 0, 38: 0, 62: 0, 43: 0, 56: 1, 1: 3, 21: 0, 28: 0, 12: 1, 2: 3, 18: 1, 27: 2, 25: 0, 3: 1, 24: 1, 10: 2, 5: 3, 13: 2, 4: 3, 15: 0, 26: 2, 7: 2, 8: 3, 9: 2, 14: 3, 32: 1, 57: 1, 58: 0, 11: 0, 22: 0, 63: 0, 54: 0, 50: 0, 55: 0, 59: 0, 33: 1, 61: 0, 34: 0, 17: 2, 30: 0, 41: 0, 6: 2, 40: 0, 19: 0}, 30: {23: 0, 37: 2, 47: 1, 39: 0, 29: 0, 52: 2, 36: 1, 45: 0, 53: 1, 60: 0, 16: 3, 49: 0, 20: 1, 46: 2, 42: 2, 48: 1, 44: 1, 35: 0, 31: 1, 51: 0, 38: 2, 62: 0, 43: 2, 56: 0, 1: 3, 21: 0, 28: 2, 12: 0, 2: 2, 18: 0, 27: 0, 25: 0, 3: 0, 24: 3, 10: 1, 5: 2, 13: 3, 4: 0, 15: 1, 26: 0, 7: 1, 8: 0, 9: 0, 14: 3, 32: 0, 57: 0, 58: 0, 11: 0, 22: 2, 63: 0, 54: 2, 50: 2, 55: 0, 59: 0, 33: 1, 61: 0, 34: 2, 17: 0, 30: 1, 41: 2, 6: 2, 40: 2, 19: 1}, 41: {23: 0, 37: 0, 47: 1, 39: 1, 29: 1, 52: 0, 36: 2, 45: 2, 53: 0, 60: 0, 16: 0, 49: 0, 20: 2, 46: 1, 42: 1, 48: 2, 44: 0, 35: 1, 31: 1, 51: 1, 38: 1, 62: 0, 43: 2, 56: 0, 1: 1, 21: 2, 28: 1, 12: 2, 2: 1, 18: 0, 27: 3, 25: 2, 3: 2, 24: 2, 10: 2, 5: 0, 13: 1, 4: 3, 15: 1, 26: 1, 7: 3, 8: 3, 9: 2, 14: 0, 32: 0, 57: 1, 58: 0, 11: 2, 22: 0, 63: 0, 54: 0, 50: 0, 55: 1, 59: 1, 33: 0, 61: 0, 34: 1, 17: 1, 30: 2, 41: 0, 6: 3, 40: 0, 19: 1}, 6: {23: 2, 37: 0, 47: 0, 39: 0, 29: 0, 52: 0, 36: 1, 45: 0, 53: 0, 60: 2, 16: 3, 49: 0, 20: 3, 46: 1, 42: 0, 48: 0, 44: 0, 35: 0, 31: 2, 51: 0, 38: 0, 62: 0, 43: 2, 56: 1, 1: 3, 21: 2, 28: 1, 12: 3, 2: 3, 18: 3, 27: 3, 25: 2, 3: 3, 24: 3, 10: 3, 5: 3, 13: 3, 4: 3, 15: 0, 26: 3, 7: 3, 8: 3, 9: 3, 14: 3, 32: 3, 57: 1, 58: 1, 11: 3, 22: 0, 63: 1, 54: 0, 50: 0, 55: 0, 59: 0, 33: 2, 61: 0, 34: 0, 17: 3, 30: 0, 41: 0, 6: 3, 40: 0, 19: 0}, 40: {23: 0, 37: 0, 47: 1, 39: 1, 29: 1, 52: 0, 36: 1, 45: 2, 53: 1, 60: 0, 16: 0, 49: 0, 20: 2, 46: 1, 42: 1, 48: 2, 44: 2, 35: 1, 31: 1, 51: 0, 38: 1, 62: 0, 43: 2, 56: 1, 1: 0, 21: 2, 28: 0, 12: 2, 2: 0, 18: 3, 27: 0, 25: 2, 3: 3, 24: 2, 10: 1, 5: 0, 13: 1, 4: 3, 15: 2, 26: 0, 7: 3, 8: 2, 9: 2, 14: 1, 32: 3, 57: 0, 58: 0, 11: 2, 22: 0, 63: 0, 54: 0, 50: 0, 55: 1, 59: 0, 33: 0, 61: 0, 34: 2, 17: 1, 30: 2, 41: 0, 6: 2, 40: 1, 19: 2}, 19: {23: 0, 37: 0, 47: 1, 39: 0, 29: 0, 52: 2, 36: 1, 45: 0, 53: 0, 60: 0, 16: 3, 49: 2, 20: 0, 46: 1, 42: 1, 48: 1, 44: 1, 35: 1, 31: 0, 51: 1, 38: 1, 62: 0, 43: 1, 56: 0, 1: 3, 21: 1, 28: 2, 12: 0, 2: 3, 18: 0, 27: 2, 25: 1, 3: 1, 24: 0, 10: 2, 5: 2, 13: 3, 4: 0, 15: 0, 26: 1, 7: 3, 8: 0, 9: 0, 14: 3, 32: 0, 57: 0, 58: 0, 11: 0, 22: 2, 63: 0, 54: 1, 50: 2, 55: 0, 59: 0, 33: 1, 61: 1, 34: 2, 17: 0, 30: 1, 41: 1, 6: 1, 40: 1, 19: 1}}
-ISO_8859_9_TURKISH_CHAR_TO_ORDER = {0: 255, 1: 255, 2: 255, 3: 255, 4: 255, 5: 255, 6: 255, 7: 255, 8: 255, 9: 255, 10: 255, 11: 255, 12: 255, 13: 255, 14: 255, 15: 255, 16: 255, 17: 255, 18: 255, 19: 255, 20: 255, 21: 255, 22: 255, 23: 255, 24: 255, 25: 255, 26: 255, 27: 255, 28: 255, 29: 255, 30: 255, 31: 255, 32: 255, 33: 255, 34: 255, 35: 255, 36: 255, 37: 255, 38: 255, 39: 255, 40: 255, 41: 255, 42: 255, 43: 255, 44: 255, 45: 255, 46: 255, 47: 255, 48: 255, 49: 255, 50: 255, 51: 255, 52: 255, 53: 255, 54: 255, 55: 255, 56: 255, 57: 255, 58: 255, 59: 255, 60: 255, 61: 255, 62: 255, 63: 255, 64: 255, 65: 23, 66: 37, 67: 47, 68: 39, 69: 29, 70: 52, 71: 36, 72: 45, 73: 53, 74: 60, 75: 16, 76: 49, 77: 20, 78: 46, 79: 42, 80: 48, 81: 69, 82: 44, 83: 35, 84: 31, 85: 51, 86: 38, 87: 62, 88: 65, 89: 43, 90: 56, 91: 255, 92: 255, 93: 255, 94: 255, 95: 255, 96: 255, 97: 1, 98: 21, 99: 28, 100: 12, 101: 2, 102: 18, 103: 27, 104: 25, 105: 3, 106: 24, 107: 10, 108: 5, 109: 13, 110: 4, 111: 15, 112: 26, 113: 64, 114: 7, 115: 8, 116: 9, 117: 14, 118: 32, 119: 57, 120: 58, 121: 11, 122: 22, 123: 255, 124: 255, 125: 255, 126: 255, 127: 255, 128: 180, 129: 179, 130: 178, 131: 177, 132: 176, 133: 175, 134: 174, 135: 173, 136: 172, 137: 171, 138: 170, 139: 169, 140: 168, 141: 167, 142: 166, 143: 165, 144: 164, 145: 163, 146: 162, 147: 161, 148: 160, 149: 159, 150: 101, 151: 158, 152: 157, 153: 156, 154: 155, 155: 154, 156: 153, 157: 152, 158: 151, 159: 106, 160: 150, 161: 149, 162: 148, 163: 147, 164: 146, 165: 145, 166: 144, 167: 100, 168: 143, 169: 142, 170: 141, 171: 140, 172: 139, 173: 138, 174: 137, 175: 136, 176: 94, 177: 80, 178: 93, 179: 135, 180: 105, 181: 134, 182: 133, 183: 63, 184: 132, 185: 131, 186: 130, 187: 129, 188: 128, 189: 127, 190: 126, 191: 125, 192: 124, 193: 104, 194: 73, 195: 99, 196: 79, 197: 85, 198: 123, 199: 54, 200: 122, 201: 98, 202: 92, 203: 121, 204: 120, 205: 91, 206: 103, 207: 119, 208: 68, 209: 118, 210: 117, 211: 97, 212: 116, 213: 115, 214: 50, 215: 90, 216: 114, 217: 113, 218: 112, 219: 111, 220: 55, 221: 41, 222: 40, 223: 86, 224: 89, 225: 70, 226: 59, 227: 78, 228: 71, 229: 82, 230: 88, 231: 33, 232: 77, 233: 66, 234: 84, 235: 83, 236: 110, 237: 75, 238: 61, 239: 96, 240: 30, 241: 67, 242: 109, 243: 74, 244: 87, 245: 102, 246: 34, 247: 95, 248: 81, 249: 108, 250: 76, 251: 72, 252: 17, 253: 6, 254: 19, 255: 107}
-ISO_8859_9_TURKISH_MODEL = SingleByteCharSetModel(charset_name='ISO-8859-9', language='Turkish', char_to_order_map=ISO_8859_9_TURKISH_CHAR_TO_ORDER, language_model=TURKISH_LANG_MODEL, typical_positive_ratio=0.97029, keep_ascii_letters=True, alphabet='ABCDEFGHIJKLMNOPRSTUVYZabcdefghijklmnoprstuvyzÂÇÎÖÛÜâçîöûüĞğİıŞş')
\ No newline at end of file
+
+
+# 3: Positive
+# 2: Likely
+# 1: Unlikely
+# 0: Negative
+#
+# Flattened 64x64 matrix: the byte at 64 * first + second is the likelihood of
+# the character of order ``second`` following the one of order ``first``
+TURKISH_LANG_MODEL = bytes.fromhex(
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # None
+    '00020203030003030303030303020301000303010303000303030303000300030301010001000100000000000001010101000000000000000202000000010001'  # 'a'
+    '00030203030003030303030303020301010303000303010203030303000300030301010000000100000000010100010201000000010000000002000000000001'  # 'e'
+    '00030303030302030303030303030301030302000302010202010303000000020202000100000100000101000000000000000000000000010001010001000001'  # 'i'
+    '00030302030301020303030303030301030201000302000102030302010000020201000000000000000000000001000000000000000000000000020002000000'  # 'n'
+    '00000103030103030303030303010200000203000203000002020203000300010201000000000000000000000000000000000000000000000000000000000000'  # 'l'
+    '00030303030303030303030303030300030303000302000203020303010000020302000001000000000000020000010000000000000000000101010002000001'  # 'ı'
+    '00030302030302030303030203030300030300000201000002030202000000020202000000000000000000000000000000000001010000000100010002000001'  # 'r'
+    '00030302030303030303030203030300030200010302010103020302010000020202000001000000000000000000000000000000000000000100010000000000'  # 's'
+    '00030302030303030303030203030300030202000203000002020202000000020303000000000000000000000000000000000000000000000100020001000000'  # 't'
+    '00030303030303020202020302030300030301010202000002020302000001030003010000000100000000000000000000000000000000000100010000000001'  # 'k'
+    '00030302030303020102020302030300030200000101000101020102000000010003000000000000000000010000000000000000000000000100010001000000'  # 'y'
+    '00030302030302030202020303030301030101000302010103030203010000010100000100000000000000000000000000000000000000000000010002000001'  # 'd'
+    '00020203030003030303030303020201000303010303000103030203000300030200000000000000000000010000000000000000000000000001000000000000'  # 'm'
+    '00020203030003030303030303030300000302000303000302030303000301030200000000000000000000010001020001000000000000000202000001000001'  # 'u'
+    '00030301020303010000010000030302030000020000020002000000020002000003010001000000020201000101020102020200020101000000020000000000'  # 'o'
+    '00020103030003030303030203000000000203000203010002030103000300020300000000000000000100000000000000000000000000000000000000000000'  # 'K'
+    '00030301030302020302020001020300010201000100000001000202000000010101000000000000000000000000000100000000000000000101000001000000'  # 'ü'
+    '00030301030301010303010103030100020102000201000001010201000000020201000000000000000000000000000000000000000000000000000000000000'  # 'f'
+    '00030301000201030000020000030300030000010001020000010102020001000001020101000100010101010100010101020201020001000000000000010000'  # 'ş'
+    '00030302030203030002020203030300030000000202000102010101000000010003000000000000000000000000000000000000000000000000000001000000'  # 'M'
+    '00030303030302010202030303030200020000000202000002010303000001010101000001000000000000010000000000000000000000000000010001000000'  # 'b'
+    '00010203030003030303030302020002000203020302020202020202010302030200020102020202010102020102020102000002010100020100000100000001'  # 'z'
+    '00030301010100010101020302010100000000000000000000010001000000000001000000000000000000000000000000000000000000000000000000000000'  # 'A'
+    '00030302020203020302020103030300020102000201000001010101010000010201000000000000000000000000000001000000000000000100020001000000'  # 'j'
+    '00030302030303030302030102030301020000000000000003020101000000000200000000000000000000000000000000000000000000000001000000000000'  # 'h'
+    '00030302020303020101010101030300030100000101000003010201000000000003000000000000000000000000000000000000000000000000010000000000'  # 'p'
+    '00030302020302020203020101030300030000000001000003010102000000010100000100000200000000000000000000000000000000000000000000000001'  # 'g'
+    '00010103030003030303030202020102000201020201010001020202020202020000020102010201000101030102010102000002000100010001000000010001'  # 'c'
+    '00030301030303000101000202030100030000000100000001000001000100000100000000000000000000000000000000000000000000000000000000000000'  # 'E'
+    '00030200000202010000010000030301030000010100020003000000020001010001020001020200020202020100020101000200020102000000000000000000'  # 'ğ'
+    '00030301030203020002020201030200020102000102000001000202000000020100000000000000000000000000000000000000000000000001010001000000'  # 'T'
+    '00030300030301010203010003020300030000000100000001000100000000000102000000000000000000000000000000000000000000000000000000000000'  # 'v'
+    '00000003030003030203030202000000000102000103000000030101000300020200000000000100000000000000000000000000000000000000000000000000'  # 'ç'
+    '00030301020201000301010101030302030000010001020002020002020002010002020101010100020101000101010102010201020001000100000000000000'  # 'ö'
+    '00030300010103000001010000020200030000010100010000000000020000000003010001000100020000010001000101010201010002000000000000000000'  # 'S'
+    '00030300020002000101010000030300020000010000020101000100010001000002000102000200020101000100020101000201010001000000010100000000'  # 'G'
+    '00020300010000000000000000010200010000010000010000000000020000000000010100000100010000010000000201000100020000000000000000000000'  # 'B'
+    '00030300000203000001000100020302030000010300020100000000020001000002010000010100020100000100000101000101020001000000000100000000'  # 'V'
+    '00020200000101000000000000030101010000000000010000000000020001000001000000000000010000000000000001000000010001000000000000000000'  # 'D'
+    '00000003030002030202010202010102000103020202000002020000000102010300020101000101010001020202010102000000000100010100000000000000'  # 'Ş'
+    '00010102030003030302020202010001000100010202000002020103010102010000010102000101000001020002010102000001000000010001000100000000'  # 'İ'
+    '00030200000301000000000000030201020000010000020000000000020001000002010100000100010200000101000002010101010002000000000000000000'  # 'O'
+    '00030200000100000000010000030302020000010000020001000000020001000000010100000200020100000101020102000201020101010000010100000000'  # 'Y'
+    '00030200000202000000010100020201030100010001020000000000010001000001010000000000010000010000000101000100010000000000000000000000'  # 'R'
+    '00030302000000010000010000020301020000010000020000000100020002000001010202010200020101000001010001010101020101000000000000000000'  # 'H'
+    '00030300020102010000010100030301020000010000020002000101020000000000010101010200010100010101010000000101010001000000010000000000'  # 'N'
+    '00030300020203020000010000020301000000000000020002000000020000000001010000000100000100010100010001010100010000000000000000000000'  # 'C'
+    '00020300000000000000010000020202020000010000020000000000020001000000020101000100020101000001010201000200020001000000020000000000'  # 'P'
+    '00000002020002010101010202000001000100000103000000000100000201000000010001000000000002010001000000000000000000020000000000000000'  # 'L'
+    '00000002030002030102020002000002000201010102010000010201010201000100020001000101000002020102010102000001000000000000000000000000'  # 'Ö'
+    '00030300020102000000010000030200010000010000020000000102010001000000000001000100000100000000010001000101010001000000000000000000'  # 'U'
+    '00000002020002020101000101010101000001020101010001000000010101010000020100010101000101020102010102000101020100020000000000000000'  # 'F'
+    '00020200000200000000000000020200020000010000020000000000020000000002010000000000010000000000000001000000010001000000000000000000'  # 'I'
+    '00000003020002020001010001000001000000010001000000000001000000000200010001000101000001020001000101000001000100020000000000000000'  # 'Ç'
+    '00020200010100000001000000010200010000010000010000000001020001000000010000000100000100000000000001000100020000000000000000000000'  # 'Ü'
+    '00020202010001010100000000010200000100000001000001000000000000000000000000000000000000000000000000000000000000000200000000000000'  # 'Z'
+    '00010200010000000100010000000100000100000000000000010000000000000000000000000000000000000000000000000001000000000002000000000001'  # 'w'
+    '00000102020002010201010202000000000100000101000002000000000100000000000000000000000000000000000000000000000000000000000001000000'  # 'x'
+    '00020200000001000000000000020201010000000000010000000000000000000000000001000000010000000000000000000000000000000000000000000000'  # 'â'
+    '00000001010000000100000001000000000000000101000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # 'J'
+    '00020200010001000000000000010100000000000000010001000000000000000000000000000000000000000000000000000000000000000100000000010000'  # 'î'
+    '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # 'W'
+    '00000100000000000000000000020200000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # '·'
+)
+
+# 255: Undefined characters that did not exist in training text
+# 254: Carriage/Return
+# 253: symbol (punctuation) that does not belong to word
+# 252: 0 - 9
+# 251: Control characters
+
+# Character Mapping Table(s), indexed by byte value:
+ISO_8859_9_TURKISH_CHAR_TO_ORDER = bytes.fromhex(
+    'ffffffffffffffffffffffffffffffff'  # '\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f'
+    'ffffffffffffffffffffffffffffffff'  # '\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f'
+    'ffffffffffffffffffffffffffffffff'  # ' !"#$%&\'()*+,-./'
+    'ffffffffffffffffffffffffffffffff'  # '0123456789:;<=>?'
+    'ff17252f271d34242d353c1031142e2a'  # '@ABCDEFGHIJKLMNO'
+    '30452c231f33263e412b38ffffffffff'  # 'PQRSTUVWXYZ[\\]^_'
+    'ff01151c0c02121b1903180a050d040f'  # '`abcdefghijklmno'
+    '1a400708090e20393a0b16ffffffffff'  # 'pqrstuvwxyz{|}~\x7f'
+    'b4b3b2b1b0afaeadacabaaa9a8a7a6a5'  # '\x80\x81\x82\x83\x84\x85\x86\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\x8f'
+    'a4a3a2a1a09f659e9d9c9b9a9998976a'  # '\x90\x91\x92\x93\x94\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f'
+    '96959493929190648f8e8d8c8b8a8988'  # '\xa0¡¢£¤¥¦§¨©ª«¬\xad®¯'
+    '5e505d876986853f84838281807f7e7d'  # '°±²³´µ¶·¸¹º»¼½¾¿'
+    '7c6849634f557b367a625c79785b6777'  # 'ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏ'
+    '447675617473325a7271706f37292856'  # 'ĞÑÒÓÔÕÖ×ØÙÚÛÜİŞß'
+    '59463b4e475258214d4254536e4b3d60'  # 'àáâãäåæçèéêëìíîï'
+    '1e436d4a5766225f516c4c481106136b'  # 'ğñòóôõö÷øùúûüışÿ'
+)
+
+ISO_8859_9_TURKISH_MODEL = SingleByteCharSetModel(charset_name='ISO-8859-9',
+                                                  language='Turkish',
+                                                  char_to_order_map=ISO_8859_9_TURKISH_CHAR_TO_ORDER,
+                                                  language_model=TURKISH_LANG_MODEL,
+                                                  typical_positive_ratio=0.97029,
+                                                  keep_ascii_letters=True,
+                                                  alphabet='ABCDEFGHIJKLMNOPRSTUVYZabcdefghijklmnoprstuvyzÂÇÎÖÛÜâçîöûüĞğİıŞş')
+
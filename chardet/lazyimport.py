@@ -0,0 +1,30 @@
+"""
+Module attributes that are only imported when they are first used, so that
+``import chardet`` does not have to load every prober, language model and
+frequency table up front.
+"""
+import importlib
+import sys
+
+
+def lazy_attributes(module_name, sources):
+    """
+    Returns a module-level ``__getattr__`` for the module ``module_name``.
+
+    ``sources`` maps the names of sibling modules to the attributes to take
+    from them.  The first time one of those attributes is looked up on
+    ``module_name``, its sibling is imported and the value is stored on
+    ``module_name``, so later lookups are ordinary attribute accesses.
+    """
+    package = module_name.rpartition(".")[0]
+    source_of = {name: source for source, names in sources.items() for name in names}
+
+    def __getattr__(name):
+        source = source_of.get(name)
+        if source is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f".{source}", package), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
@@ -10,7 +10,7 @@ class MultiByteCharSetProber(CharSetProber):
         super().__init__(lang_filter=lang_filter)
         self.distribution_analyzer = None
         self.coding_sm = None
-        self._last_char = [0, 0]
+        self._last_char = bytearray(b'\0\0')
 
     def reset(self):
         super().reset()
@@ -18,25 +18,30 @@ class MultiByteCharSetProber(CharSetProber):
             self.coding_sm.reset()
         if self.distribution_analyzer:
             self.distribution_analyzer.reset()
-        self._last_char = [0, 0]
+        self._last_char = bytearray(b'\0\0')
         self._state = ProbingState.DETECTING
 
     def feed(self, byte_str):
-        for i in range(len(byte_str)):
-            coding_state = self.coding_sm.next_state(byte_str[i])
-            if coding_state == MachineState.ERROR:
-                self._state = ProbingState.NOT_ME
-                break
-            elif coding_state == MachineState.ITS_ME:
-                self._state = ProbingState.FOUND_IT
-                break
-            elif coding_state == MachineState.START:
-                char_len = self.coding_sm.get_current_charlen()
-                if i == 0:
-                    self._last_char[1] = byte_str[0]
-                    self.distribution_analyzer.feed(self._last_char, char_len)
-                else:
-                    self.distribution_analyzer.feed(byte_str[i-1:i+1], char_len)
+        return self.feed_run(byte_str, self.coding_sm.run(byte_str))
+
+    def feed_run(self, byte_str, run):
+        """
+        Update the prober from ``run``, the result of running ``coding_sm``
+        over ``byte_str``.
+        """
+        # Characters are fed as pairs of ints, so nothing is allocated per
+        # character; the first may end with the last byte of the previous
+        # buffer
+        feed_pair = self.distribution_analyzer.feed_pair
+        last_byte = self._last_char[0]
+        for i, char_len in zip(run.char_ends, run.char_lens):
+            feed_pair(byte_str[i - 1] if i else last_byte, byte_str[i], char_len)
+        if run.state == MachineState.ERROR:
+            self.logger.debug('%s %s prober hit error at byte %s',
+                              self.charset_name, self.language, run.stop)
+            self._state = ProbingState.NOT_ME
+        elif run.state == MachineState.ITS_ME:
+            self._state = ProbingState.FOUND_IT
 
         self._last_char[0] = byte_str[-1]
 
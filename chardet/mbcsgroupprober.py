@@ -1,5 +1,6 @@
 from .big5prober import Big5Prober
 from .charsetgroupprober import CharSetGroupProber
+from .codingstatemachine import ProductStateMachine
 from .cp949prober import CP949Prober
 from .eucjpprober import EUCJPProber
 from .euckrprober import EUCKRProber
@@ -11,7 +12,38 @@ from .utf8prober import UTF8Prober
 
 class MBCSGroupProber(CharSetGroupProber):
 
-    def __init__(self, lang_filter=None):
+    def __init__(self, lang_filter=None, fused=True):
         super().__init__(lang_filter=lang_filter)
         self.probers = [UTF8Prober(), SJISProber(), EUCJPProber(), GB2312Prober(), EUCKRProber(), CP949Prober(), Big5Prober(), EUCTWProber(), JOHABProber()]
-        self.reset()
\ No newline at end of file
+        # Run the state machines of all active probers in a single pass
+        self._product_sm = ProductStateMachine() if fused else None
+        self._runs = {}
+        self.reset()
+
+    def feed(self, byte_str):
+        if self._product_sm is None:
+            return super().feed(byte_str)
+        probers = [prober for prober in self.probers
+                   if prober and prober.active
+                   and not getattr(prober, 'codec_active', False)]
+        saved = [(prober.coding_sm._curr_state, prober.coding_sm._curr_char_len)
+                 for prober in probers]
+        runs = self._product_sm.run([prober.coding_sm for prober in probers],
+                                    byte_str)
+        self._runs = dict(zip(probers, runs))
+        try:
+            return super().feed(byte_str)
+        finally:
+            # Probers the group stopped before reaching must look as if
+            # their state machine never saw this chunk
+            for prober, (state, char_len) in zip(probers, saved):
+                if prober in self._runs:
+                    prober.coding_sm._curr_state = state
+                    prober.coding_sm._curr_char_len = char_len
+            self._runs = {}
+
+    def feed_prober(self, prober, byte_str):
+        run = self._runs.pop(prober, None)
+        if run is None:
+            return prober.feed(byte_str)
+        return prober.feed_run(byte_str, run)
@@ -0,0 +1,138 @@
+"""
+A bounded, least-recently-used cache of ``detect`` and ``detect_all``
+results, keyed on a hash of the bytes that were actually examined, for
+callers that see the same documents over and over.
+"""
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple(
+    "CacheInfo",
+    ["hits", "misses", "evictions", "entries", "size", "max_entries", "max_size"],
+)
+
+
+class ResultCache:
+    """
+    Maps a digest of the examined input to the result found for it.  Both
+    the number of entries and their approximate total size in bytes are
+    bounded, and the least recently used entries are evicted first.
+
+    Results are copied on the way in and on the way out, so callers are free
+    to modify what they get back.
+    """
+
+    DEFAULT_MAX_ENTRIES = 1024
+    DEFAULT_MAX_SIZE = 4 * 1024 * 1024
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_size=DEFAULT_MAX_SIZE):
+        if max_entries < 1 or max_size < 1:
+            raise ValueError(
+                f"max_entries and max_size must be positive, got {max_entries} and {max_size}"
+            )
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+        # hashlib is imported here rather than with chardet, as it loads
+        # OpenSSL
+        from hashlib import blake2b
+
+        self._blake2b = blake2b
+
+    def __len__(self):
+        return len(self._entries)
+
+    def make_key(self, kind, windows, *options):
+        """
+        Returns the cache key for running ``kind`` of detection over the
+        ``windows`` of a document with ``options``.  Window lengths are part
+        of the key because the detector is fed one window at a time.
+        """
+        digest = self._blake2b(digest_size=16)
+        for window in windows:
+            digest.update(window)
+        lengths = tuple(len(window) for window in windows)
+        return (kind, digest.digest(), lengths) + options
+
+    def get(self, key):
+        """
+        Returns a copy of the result cached under ``key``, or ``None``.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return _copy(value[0])
+
+    def put(self, key, result):
+        """
+        Cache a copy of ``result`` under ``key``, evicting the least recently
+        used entries until the cache is back within its bounds.
+        """
+        result = _copy(result)
+        size = _size_of(key, result)
+        if size > self.max_size:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            self._entries[key] = (result, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def info(self):
+        """
+        Returns the hit, miss and eviction counts along with the current and
+        maximum number of entries and size, as a ``CacheInfo``.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._size,
+                self.max_entries,
+                self.max_size,
+            )
+
+    def clear(self):
+        """
+        Drop every entry and zero the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = self._misses = self._evictions = 0
+
+
+def _copy(result):
+    if isinstance(result, list):
+        return [dict(item) for item in result]
+    return dict(result)
+
+
+def _size_of(key, result):
+    """
+    Roughly how many bytes an entry holds on to, not counting the strings
+    that are shared with the probers.
+    """
+    items = result if isinstance(result, list) else [result]
+    return (
+        sys.getsizeof(key)
+        + sys.getsizeof(key[1])
+        + sum(sys.getsizeof(item) for item in items)
+    )
@@ -0,0 +1,91 @@
+"""
+Helpers for detecting the encoding of very large inputs from a bounded
+sample of them, so that the time taken does not grow with the input size.
+"""
+SAMPLE_STRATEGIES = ("head", "spread")
+# How many windows the 'spread' strategy takes: head, middle and tail
+SPREAD_WINDOWS = 3
+# Window boundaries are kept at multiples of this, so UTF-16 and UTF-32 code
+# units are never split
+ALIGNMENT = 4
+# How far to look for a safe window boundary before giving up on finding one
+MAX_ALIGN_SEARCH = 4096
+# Bytes a window may end with.  ISO-2022 text shifts back to ASCII before each
+# line break, so a window starting after one is read in the right mode too
+BOUNDARY_BYTES = b"\x00\t\n\x0b\x0c\r "
+
+
+def is_boundary(buf, pos):
+    """
+    Whether a window of ``buf`` may start or end at ``pos`` without cutting a
+    character in two.  Only ``pos`` just after a NUL or whitespace byte
+    counts: ISO-2022 and HZ build two-byte characters out of 0x21-0x7E, so
+    any printable byte may be half of one.  UTF-16 and UTF-32 only need
+    ``pos`` to be aligned, which the fallback in ``align_forward`` and
+    ``align_backward`` still guarantees.
+    """
+    return pos % ALIGNMENT == 0 and buf[pos - 1] in BOUNDARY_BYTES
+
+
+def align_forward(buf, pos, limit):
+    """
+    Returns the first boundary at or after ``pos`` and before ``limit``, or
+    ``pos`` rounded up to the alignment if there is none close by.
+    """
+    aligned = -(-pos // ALIGNMENT) * ALIGNMENT
+    for candidate in range(aligned, min(limit, aligned + MAX_ALIGN_SEARCH), ALIGNMENT):
+        if is_boundary(buf, candidate):
+            return candidate
+    return aligned
+
+
+def align_backward(buf, pos, limit):
+    """
+    Returns the last boundary at or before ``pos`` and after ``limit``, or
+    ``pos`` rounded down to the alignment if there is none close by.
+    """
+    aligned = pos // ALIGNMENT * ALIGNMENT
+    for candidate in range(aligned, max(limit, aligned - MAX_ALIGN_SEARCH), -ALIGNMENT):
+        if is_boundary(buf, candidate):
+            return candidate
+    return aligned
+
+
+def sample(buf, max_bytes, strategy="head"):
+    """
+    Returns a list of ``memoryview`` windows of ``buf`` that hold at most
+    ``max_bytes`` bytes between them.
+
+    ``'head'`` takes the first ``max_bytes`` bytes.  ``'spread'`` splits the
+    budget between ``SPREAD_WINDOWS`` evenly spaced windows running from the
+    head to the tail of ``buf``, moving the inner window boundaries so they
+    do not split multi-byte characters.
+    """
+    if strategy not in SAMPLE_STRATEGIES:
+        raise ValueError(
+            f"Unknown sampling strategy {strategy!r}, expected one of {SAMPLE_STRATEGIES}"
+        )
+    if max_bytes < 1:
+        raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+    view = memoryview(buf).cast("B")
+    size = len(view)
+    if size <= max_bytes:
+        return [view]
+    if strategy == "head":
+        return [view[:max_bytes]]
+    window_size = max_bytes // SPREAD_WINDOWS
+    if window_size < ALIGNMENT * 2:
+        return [view[:max_bytes]]
+    windows = []
+    last_end = 0
+    for index in range(SPREAD_WINDOWS):
+        start = index * (size - window_size) // (SPREAD_WINDOWS - 1)
+        end = start + window_size
+        if index:
+            start = align_forward(view, max(start, last_end), end)
+        if index < SPREAD_WINDOWS - 1:
+            end = align_backward(view, end, start)
+        if end > start:
+            windows.append(view[start:end])
+            last_end = end
+    return windows
@@ -1,7 +1,105 @@
-from collections import namedtuple
+from collections import Counter, namedtuple
 from .charsetprober import CharSetProber
 from .enums import CharacterCategory, ProbingState, SequenceLikelihood
 SingleByteCharSetModel = namedtuple('SingleByteCharSetModel', ['charset_name', 'language', 'char_to_order_map', 'language_model', 'typical_positive_ratio', 'keep_ascii_letters', 'alphabet'])
+SAMPLE_CLASS = 0
+LETTER_CLASS = 1
+OTHER_CLASS = 2
+# Maps every order to whether it is one of the SAMPLE_SIZE most frequent
+# letters, some other letter, or a non-letter (digit, symbol, control, ...)
+ORDER_CLASSES = bytes(SAMPLE_CLASS if order < 64 else
+                      LETTER_CLASS if order < CharacterCategory.CONTROL else
+                      OTHER_CLASS for order in range(256))
+# Category stored in pair tables for pairs that are not counted at all
+NOT_COUNTED = SequenceLikelihood.get_num_categories()
+_COMPILED_TABLES = {}
+
+
+def _cached_table(model, kind, build):
+    cached = _COMPILED_TABLES.get((id(model), kind))
+    if cached is None or cached[0] is not model:
+        cached = (model, build(model))
+        _COMPILED_TABLES[(id(model), kind)] = cached
+    return cached[1]
+
+
+def _build_model_tables(model):
+    char_to_order_map = model.char_to_order_map
+    order_table = bytes(char_to_order_map.get(char, CharacterCategory.UNDEFINED)
+                        for char in range(256))
+    sample_size = SingleByteCharSetProber.SAMPLE_SIZE
+    seq_table = bytearray(sample_size * sample_size)
+    for first, row in model.language_model.items():
+        if first < sample_size:
+            for second, category in row.items():
+                if second < sample_size:
+                    seq_table[first * sample_size + second] = category
+    return order_table, bytes(seq_table)
+
+
+def _build_pair_table(model, is_reversed):
+    order_table, seq_table = compile_model(model)
+    sample_size = SingleByteCharSetProber.SAMPLE_SIZE
+    not_counted = bytes((NOT_COUNTED,)) * 256
+    rows = []
+    for order in range(sample_size):
+        row = bytearray(not_counted)
+        for other in range(sample_size):
+            if is_reversed:
+                row[other] = seq_table[other * sample_size + order]
+            else:
+                row[other] = seq_table[order * sample_size + other]
+        rows.append(bytes(row))
+    # The block for a first byte is its row applied to the orders of every
+    # possible second byte, which is exactly what translate computes
+    return b''.join(order_table.translate(rows[order])
+                    if order < sample_size else not_counted
+                    for order in order_table)
+
+
+def compile_model(model):
+    """
+    Return the ``(order_table, seq_table)`` pair used to score ``model`` in
+    bulk.  ``order_table`` is a 256-byte ``bytes.translate`` table from byte
+    to order and ``seq_table`` is the flattened 64x64 language model.
+
+    The bundled models already store their tables in this form.  Models
+    that use dicts, as models did before, are converted on first use and
+    the result is cached for the lifetime of the model.
+    """
+    if isinstance(model.char_to_order_map, bytes) and isinstance(model.language_model, bytes):
+        return model.char_to_order_map, model.language_model
+    return _cached_table(model, 'model', _build_model_tables)
+
+
+def compile_pair_table(model, is_reversed=False):
+    """
+    Return a 65536-byte table mapping a byte pair, keyed like
+    ``CharSetProber.count_pairs``, directly to its ``SequenceLikelihood``
+    category under ``model``, or to ``NOT_COUNTED`` when either byte is not
+    one of the ``SAMPLE_SIZE`` most frequent letters.  The reversed table is
+    the transpose, so a reversed prober can share the forward histogram.
+    """
+    if is_reversed:
+        return _cached_table(model, 'reversed_pairs',
+                             lambda model: _build_pair_table(model, True))
+    return _cached_table(model, 'pairs',
+                         lambda model: _build_pair_table(model, False))
+
+
+class BigramHistogram:
+    """
+    Byte and adjacent byte-pair counts of one chunk.  ``SBCSGroupProber``
+    builds one per chunk and filter so that each ``SingleByteCharSetProber``
+    can score it with table lookups instead of rescanning the chunk.
+    """
+
+    def __init__(self, buf):
+        self.size = len(buf)
+        self.byte_counts = Counter(buf)
+        self.pair_counts = CharSetProber.count_pairs(buf)
+        self.first = buf[0] if buf else None
+        self.last = buf[-1] if buf else None
 
 class SingleByteCharSetProber(CharSetProber):
     SAMPLE_SIZE = 64
@@ -31,70 +129,128 @@ class SingleByteCharSetProber(CharSetProber):
         self._control_char = 0
         self._freq_char = 0
 
-    def get_charset_name(self):
-        if self._name_prober:
-            return self._name_prober.get_charset_name()
-        return self._model.charset_name
-
     @property
     def charset_name(self):
+        if self._name_prober:
+            return self._name_prober.charset_name
         return self._model.charset_name
 
     @property
     def language(self):
+        if self._name_prober:
+            return self._name_prober.language
         return self._model.language
 
+    @property
+    def chunk_filter(self):
+        """
+        The filter every chunk goes through before it is scored.
+        """
+        if self._model.keep_ascii_letters:
+            return self.remove_xml_tags
+        return self.filter_international_words
+
     def feed(self, byte_str):
-        if not self._model.keep_ascii_letters:
-            byte_str = self.filter_international_words(byte_str)
-            if not byte_str:
-                return self.state
-        byte_str = self.filter_with_english_letters(byte_str)
+        byte_str = self.chunk_filter(byte_str)
         if not byte_str:
             return self.state
 
-        char_len = len(byte_str)
-        if char_len > 0:
-            if not self._model.char_to_order_map or not self._model.language_model:
-                self._state = ProbingState.NOT_ME
-                return self.state
-
-            for i, c in enumerate(byte_str):
-                order = self._model.char_to_order_map.get(c, CharacterCategory.UNDEFINED)
-                if order < CharacterCategory.CONTROL:
-                    self._control_char += 1
-                elif order == CharacterCategory.SAME_CLASS_WORD:
-                    self._freq_char += 1
-
-                if order < len(self._model.language_model):
-                    if i > 0:
-                        last_order = self._last_order
-                        if last_order < len(self._model.language_model):
-                            self._total_seqs += 1
-                            if not self._reversed:
-                                lm_cat = self._model.language_model[last_order][order]
-                                self._seq_counters[lm_cat] += 1
-                            else:
-                                lm_cat = self._model.language_model[order][last_order]
-                                self._seq_counters[lm_cat] += 1
-                    self._last_order = order
-
-            charset_name = self.charset_name
+        order_table, seq_table = compile_model(self._model)
+        orders = byte_str.translate(order_table)
+        self.score_orders(orders, seq_table)
+
+        return self._check_shortcuts()
+
+    def score_orders(self, orders, seq_table):
+        """
+        Update the counters from a whole chunk already translated to orders.
+
+        Characters are tallied with ``bytes.count`` over their order class and
+        every pair of adjacent sample characters, including the one spanning
+        the previous chunk, is counted in bulk and then looked up once per
+        distinct pair in ``seq_table``.
+        """
+        classes = orders.translate(ORDER_CLASSES)
+        freq_char = classes.count(SAMPLE_CLASS)
+        self._freq_char += freq_char
+        self._total_char += freq_char + classes.count(LETTER_CLASS)
+
+        sample_size = self.SAMPLE_SIZE
+        seq_counters = self._seq_counters
+        pairs = self.count_pairs(bytes((self._last_order,)) + orders)
+        for pair, count in pairs.items():
+            first, second = pair >> 8, pair & 0xFF
+            if first < sample_size and second < sample_size:
+                if self._reversed:
+                    first, second = second, first
+                seq_counters[seq_table[first * sample_size + second]] += count
+                self._total_seqs += count
+        self._last_order = orders[-1]
+
+    def feed_histogram(self, histogram):
+        """
+        Update the prober from a ``BigramHistogram`` of a chunk that has
+        already been through ``chunk_filter``.  The result is the same as
+        feeding that chunk, but the cost only depends on the number of
+        distinct bytes and pairs in it.
+        """
+        if not histogram.size:
+            return self.state
+        order_table, seq_table = compile_model(self._model)
+        pair_table = compile_pair_table(self._model, self._reversed)
+
+        for byte, count in histogram.byte_counts.items():
+            order = order_table[byte]
+            if order < CharacterCategory.CONTROL:
+                self._total_char += count
+                if order < self.SAMPLE_SIZE:
+                    self._freq_char += count
+
+        categories = [0] * (NOT_COUNTED + 1)
+        for pair, count in histogram.pair_counts.items():
+            categories[pair_table[pair]] += count
+        # The pair spanning the end of the previous chunk
+        first_order = order_table[histogram.first]
+        if self._last_order < self.SAMPLE_SIZE and first_order < self.SAMPLE_SIZE:
+            if self._reversed:
+                category = seq_table[first_order * self.SAMPLE_SIZE + self._last_order]
+            else:
+                category = seq_table[self._last_order * self.SAMPLE_SIZE + first_order]
+            categories[category] += 1
+        for category in range(NOT_COUNTED):
+            self._seq_counters[category] += categories[category]
+            self._total_seqs += categories[category]
+        self._last_order = order_table[histogram.last]
+
+        return self._check_shortcuts()
+
+    def _check_shortcuts(self):
+        charset_name = self._model.charset_name
+        if self.state == ProbingState.DETECTING:
             if self._total_seqs > self.SB_ENOUGH_REL_THRESHOLD:
-                cf = self.get_confidence()
-                if cf > self.POSITIVE_SHORTCUT_THRESHOLD:
+                confidence = self.get_confidence()
+                if confidence > self.POSITIVE_SHORTCUT_THRESHOLD:
+                    self.logger.debug('%s confidence = %s, we have a winner',
+                                      charset_name, confidence)
                     self._state = ProbingState.FOUND_IT
-                elif cf < self.NEGATIVE_SHORTCUT_THRESHOLD:
+                elif confidence < self.NEGATIVE_SHORTCUT_THRESHOLD:
+                    self.logger.debug('%s confidence = %s, below negative '
+                                      'shortcut threshold %s', charset_name,
+                                      confidence,
+                                      self.NEGATIVE_SHORTCUT_THRESHOLD)
                     self._state = ProbingState.NOT_ME
-
         return self.state
 
     def get_confidence(self):
         r = 0.01
         if self._total_seqs > 0:
-            r = ((1.0 * self._seq_counters[SequenceLikelihood.POSITIVE]) / self._total_seqs
-                 / self._model.typical_positive_ratio)
-            r = r * (self._total_seqs / self.SAMPLE_SIZE)
+            r = ((self._seq_counters[SequenceLikelihood.POSITIVE] +
+                  0.25 * self._seq_counters[SequenceLikelihood.LIKELY]) /
+                 self._total_seqs / self._model.typical_positive_ratio)
+            # The more control characters (proportionally to the size of the
+            # text), the less confident we become in the current charset.
+            r = r * (self._total_char - self._control_char) / self._total_char
+            r = r * self._freq_char / self._total_char
             if r >= 1.0:
                 r = 0.99
         return r
\ No newline at end of file
@@ -1,20 +1,69 @@
+import sys
 from .charsetgroupprober import CharSetGroupProber
+from .charsetprober import FilteredChunk
 from .hebrewprober import HebrewProber
-from .langbulgarianmodel import ISO_8859_5_BULGARIAN_MODEL, WINDOWS_1251_BULGARIAN_MODEL
-from .langgreekmodel import ISO_8859_7_GREEK_MODEL, WINDOWS_1253_GREEK_MODEL
-from .langhebrewmodel import WINDOWS_1255_HEBREW_MODEL
-from .langrussianmodel import IBM855_RUSSIAN_MODEL, IBM866_RUSSIAN_MODEL, ISO_8859_5_RUSSIAN_MODEL, KOI8_R_RUSSIAN_MODEL, MACCYRILLIC_RUSSIAN_MODEL, WINDOWS_1251_RUSSIAN_MODEL
-from .langthaimodel import TIS_620_THAI_MODEL
-from .langturkishmodel import ISO_8859_9_TURKISH_MODEL
-from .sbcharsetprober import SingleByteCharSetProber
+from .lazyimport import lazy_attributes
+from .sbcharsetprober import BigramHistogram, SingleByteCharSetProber
+
+# The language models are only loaded once an SBCSGroupProber is created,
+# from the model bundle if there is one, and their modules are only imported
+# when there is no bundle or when they are looked up here
+_MODEL_MODULES = {
+    'langbulgarianmodel': ('ISO_8859_5_BULGARIAN_MODEL', 'WINDOWS_1251_BULGARIAN_MODEL'),
+    'langgreekmodel': ('ISO_8859_7_GREEK_MODEL', 'WINDOWS_1253_GREEK_MODEL'),
+    'langhebrewmodel': ('WINDOWS_1255_HEBREW_MODEL',),
+    'langrussianmodel': ('IBM855_RUSSIAN_MODEL', 'IBM866_RUSSIAN_MODEL', 'ISO_8859_5_RUSSIAN_MODEL', 'KOI8_R_RUSSIAN_MODEL', 'MACCYRILLIC_RUSSIAN_MODEL', 'WINDOWS_1251_RUSSIAN_MODEL'),
+    'langthaimodel': ('TIS_620_THAI_MODEL',),
+    'langturkishmodel': ('ISO_8859_9_TURKISH_MODEL',),
+}
+__getattr__ = lazy_attributes(__name__, _MODEL_MODULES)
+
+def _load_models():
+    """
+    Returns the single-byte models the group uses, by name, taken from the
+    model bundle if there is one and imported from their modules otherwise.
+    """
+    from .bundle import load_bundle
+    bundle = load_bundle()
+    module = sys.modules[__name__]
+    return {name: bundle.single_byte_model(name) if bundle is not None else getattr(module, name)
+            for names in _MODEL_MODULES.values() for name in names}
 
 class SBCSGroupProber(CharSetGroupProber):
 
     def __init__(self):
+        models = _load_models()
         super().__init__()
         hebrew_prober = HebrewProber()
-        logical_hebrew_prober = SingleByteCharSetProber(WINDOWS_1255_HEBREW_MODEL, is_reversed=False, name_prober=hebrew_prober)
-        visual_hebrew_prober = SingleByteCharSetProber(WINDOWS_1255_HEBREW_MODEL, is_reversed=True, name_prober=hebrew_prober)
+        logical_hebrew_prober = SingleByteCharSetProber(models['WINDOWS_1255_HEBREW_MODEL'], is_reversed=False, name_prober=hebrew_prober)
+        visual_hebrew_prober = SingleByteCharSetProber(models['WINDOWS_1255_HEBREW_MODEL'], is_reversed=True, name_prober=hebrew_prober)
         hebrew_prober.set_model_probers(logical_hebrew_prober, visual_hebrew_prober)
-        self.probers = [SingleByteCharSetProber(WINDOWS_1251_RUSSIAN_MODEL), SingleByteCharSetProber(KOI8_R_RUSSIAN_MODEL), SingleByteCharSetProber(ISO_8859_5_RUSSIAN_MODEL), SingleByteCharSetProber(MACCYRILLIC_RUSSIAN_MODEL), SingleByteCharSetProber(IBM866_RUSSIAN_MODEL), SingleByteCharSetProber(IBM855_RUSSIAN_MODEL), SingleByteCharSetProber(ISO_8859_7_GREEK_MODEL), SingleByteCharSetProber(WINDOWS_1253_GREEK_MODEL), SingleByteCharSetProber(ISO_8859_5_BULGARIAN_MODEL), SingleByteCharSetProber(WINDOWS_1251_BULGARIAN_MODEL), SingleByteCharSetProber(TIS_620_THAI_MODEL), SingleByteCharSetProber(ISO_8859_9_TURKISH_MODEL), hebrew_prober, logical_hebrew_prober, visual_hebrew_prober]
-        self.reset()
\ No newline at end of file
+        self._chunk = None
+        self._histograms = {}
+        self.probers = [SingleByteCharSetProber(models['WINDOWS_1251_RUSSIAN_MODEL']), SingleByteCharSetProber(models['KOI8_R_RUSSIAN_MODEL']), SingleByteCharSetProber(models['ISO_8859_5_RUSSIAN_MODEL']), SingleByteCharSetProber(models['MACCYRILLIC_RUSSIAN_MODEL']), SingleByteCharSetProber(models['IBM866_RUSSIAN_MODEL']), SingleByteCharSetProber(models['IBM855_RUSSIAN_MODEL']), SingleByteCharSetProber(models['ISO_8859_7_GREEK_MODEL']), SingleByteCharSetProber(models['WINDOWS_1253_GREEK_MODEL']), SingleByteCharSetProber(models['ISO_8859_5_BULGARIAN_MODEL']), SingleByteCharSetProber(models['WINDOWS_1251_BULGARIAN_MODEL']), SingleByteCharSetProber(models['TIS_620_THAI_MODEL']), SingleByteCharSetProber(models['ISO_8859_9_TURKISH_MODEL']), hebrew_prober, logical_hebrew_prober, visual_hebrew_prober]
+        self.reset()
+
+    def feed(self, byte_str):
+        return self.feed_chunk(FilteredChunk(byte_str))
+
+    def feed_chunk(self, chunk):
+        # Every SingleByteCharSetProber sharing a filter scores the same
+        # histogram, so the chunk is only filtered and scanned once per filter
+        self._chunk = chunk
+        self._histograms = {}
+        try:
+            return super().feed(chunk.byte_str)
+        finally:
+            self._chunk = None
+            self._histograms = {}
+
+    def feed_prober(self, prober, byte_str):
+        if not isinstance(prober, SingleByteCharSetProber):
+            return prober.feed_chunk(self._chunk)
+        chunk_filter = prober.chunk_filter
+        filtered = self._chunk.filtered(chunk_filter)
+        histogram = self._histograms.get(chunk_filter)
+        if histogram is None:
+            histogram = BigramHistogram(filtered)
+            self._histograms[chunk_filter] = histogram
+        return prober.feed_histogram(histogram)
\ No newline at end of file
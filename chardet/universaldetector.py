@@ -11,12 +11,19 @@ import codecs
 import logging
 import re
 from .charsetgroupprober import CharSetGroupProber
+from .charsetprober import FilteredChunk
 from .enums import InputState, LanguageFilter, ProbingState
-from .escprober import EscCharSetProber
-from .latin1prober import Latin1Prober
-from .mbcsgroupprober import MBCSGroupProber
-from .sbcsgroupprober import SBCSGroupProber
-from .utf1632prober import UTF1632Prober
+from .lazyimport import lazy_attributes
+
+# The probers, and the state machines, models and tables behind them, are only
+# imported once a document needs them, or when they are looked up here
+__getattr__ = lazy_attributes(__name__, {
+    'escprober': ('EscCharSetProber',),
+    'latin1prober': ('Latin1Prober',),
+    'mbcsgroupprober': ('MBCSGroupProber',),
+    'sbcsgroupprober': ('SBCSGroupProber',),
+    'utf1632prober': ('UTF1632Prober',),
+})
 
 class UniversalDetector:
     """
@@ -52,12 +59,47 @@ class UniversalDetector:
         self.lang_filter = lang_filter
         self.logger = logging.getLogger(__name__)
         self._has_win_bytes = None
+        self._filter_passes_saved = 0
+        self._bytes_examined = 0
+        self._probers_touched = False
+        self._charset_probers_fed = False
         self.reset()
 
     @property
     def input_state(self):
         return self._input_state
 
+    @property
+    def has_win_bytes(self):
+        return self._has_win_bytes
+
+    @property
+    def charset_probers(self):
+        """
+        The charset probers fed the current document, or an empty list if it
+        never got as far as them.  Probers kept from earlier documents, or
+        built by ``preload``, are left out until they are fed.
+        """
+        if not self._charset_probers_fed:
+            return []
+        return self._charset_probers
+
+    @property
+    def bytes_examined(self):
+        """
+        How many bytes of the current document were fed in before a verdict
+        was reached.
+        """
+        return self._bytes_examined
+
+    @property
+    def filter_passes_saved(self):
+        """
+        How many times a prober was handed a filtered view of a chunk that
+        another prober had already computed, since the last ``reset``.
+        """
+        return self._filter_passes_saved
+
     def reset(self):
         """
         Reset the UniversalDetector and all of its probers back to their
@@ -69,16 +111,22 @@ class UniversalDetector:
         self._got_data = False
         self._has_win_bytes = False
         self._input_state = InputState.PURE_ASCII
-        self._last_char = None
-        if self._esc_charset_prober:
-            self._esc_charset_prober.reset()
+        self._last_char = b''
+        self._filter_passes_saved = 0
+        self._bytes_examined = 0
+        self._charset_probers_fed = False
+        # Every document reaches the UTF-16/32 prober, but the others are only
+        # reset if the last document reached them, so that reusing a
+        # detector for plain ASCII documents stays cheap
         if self._utf1632_prober:
             self._utf1632_prober.reset()
+        if not self._probers_touched:
+            return
+        self._probers_touched = False
+        if self._esc_charset_prober:
+            self._esc_charset_prober.reset()
         for prober in self._charset_probers:
             prober.reset()
-        self._esc_charset_prober = None
-        self._utf1632_prober = None
-        self._charset_probers = []
 
     def feed(self, byte_str):
         """
@@ -97,71 +145,128 @@ class UniversalDetector:
         if self.done:
             return
 
-        if not len(byte_str):
+        if not byte_str:
             return
 
+        self._bytes_examined += len(byte_str)
+
+        if not isinstance(byte_str, bytearray):
+            byte_str = bytearray(byte_str)
+
+        # First check for known BOMs, since these are guaranteed to be correct
         if not self._got_data:
-            self._got_data = True
+            # If the data starts with BOM, we know it is UTF
             if byte_str.startswith(codecs.BOM_UTF8):
+                # EF BB BF  UTF-8 with BOM
                 self.result = {'encoding': 'UTF-8-SIG', 'confidence': 1.0, 'language': ''}
-                self.done = True
-                return
-            if byte_str.startswith(codecs.BOM_UTF32_LE):
-                self.result = {'encoding': 'UTF-32', 'confidence': 1.0, 'language': ''}
-                self.done = True
-                return
-            if byte_str.startswith(codecs.BOM_UTF32_BE):
+            elif byte_str.startswith((codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)):
+                # FF FE 00 00  UTF-32, little-endian BOM
+                # 00 00 FE FF  UTF-32, big-endian BOM
                 self.result = {'encoding': 'UTF-32', 'confidence': 1.0, 'language': ''}
-                self.done = True
-                return
-            if byte_str.startswith(codecs.BOM_UTF16_LE):
-                self.result = {'encoding': 'UTF-16', 'confidence': 1.0, 'language': ''}
-                self.done = True
-                return
-            if byte_str.startswith(codecs.BOM_UTF16_BE):
+            elif byte_str.startswith(b'\xFE\xFF\x00\x00'):
+                # FE FF 00 00  UCS-4, unusual octet order BOM (3412)
+                self.result = {'encoding': 'X-ISO-10646-UCS-4-3412', 'confidence': 1.0, 'language': ''}
+            elif byte_str.startswith(b'\x00\x00\xFF\xFE'):
+                # 00 00 FF FE  UCS-4, unusual octet order BOM (2143)
+                self.result = {'encoding': 'X-ISO-10646-UCS-4-2143', 'confidence': 1.0, 'language': ''}
+            elif byte_str.startswith((codecs.BOM_LE, codecs.BOM_BE)):
+                # FF FE  UTF-16, little endian BOM
+                # FE FF  UTF-16, big endian BOM
                 self.result = {'encoding': 'UTF-16', 'confidence': 1.0, 'language': ''}
+
+            self._got_data = True
+            if self.result['encoding'] is not None:
                 self.done = True
                 return
 
-        # If none of the above BOMs matched and we see a high byte
+        # If none of those matched and we've only see ASCII so far, check
+        # for high bytes and escape sequences
         if self._input_state == InputState.PURE_ASCII:
             if self.HIGH_BYTE_DETECTOR.search(byte_str):
                 self._input_state = InputState.HIGH_BYTE
-            elif self.ESC_DETECTOR.search(byte_str):
+            elif self.ESC_DETECTOR.search(self._last_char + byte_str):
                 self._input_state = InputState.ESC_ASCII
 
         self._last_char = byte_str[-1:]
+        if self._input_state != InputState.PURE_ASCII:
+            self._probers_touched = True
+
+        # next we will look to see if it is appears to be either a UTF-16 or
+        # UTF-32 encoding.  Text in those is often nothing but ASCII and
+        # zero bytes, so this happens whatever the input state.
+        if not self._utf1632_prober:
+            from .utf1632prober import UTF1632Prober
+            self._utf1632_prober = UTF1632Prober()
+        if self._utf1632_prober.state == ProbingState.DETECTING:
+            if self._utf1632_prober.feed(byte_str) == ProbingState.FOUND_IT:
+                self.result = {'encoding': self._utf1632_prober.charset_name,
+                               'confidence': self._utf1632_prober.get_confidence(),
+                               'language': ''}
+                self.done = True
+                return
 
+        # If we've seen escape sequences, use the EscCharSetProber, which
+        # uses a simple state machine to check for known escape sequences in
+        # HZ and ISO-2022 encodings, since those are the only encodings that
+        # use such sequences.
         if self._input_state == InputState.ESC_ASCII:
             if not self._esc_charset_prober:
-                self._esc_charset_prober = EscCharSetProber()
+                from .escprober import EscCharSetProber
+                self._esc_charset_prober = EscCharSetProber(self.lang_filter)
             if self._esc_charset_prober.feed(byte_str) == ProbingState.FOUND_IT:
                 self.result = {'encoding': self._esc_charset_prober.charset_name,
-                             'confidence': self._esc_charset_prober.get_confidence(),
-                             'language': self._esc_charset_prober.language}
+                               'confidence': self._esc_charset_prober.get_confidence(),
+                               'language': self._esc_charset_prober.language}
                 self.done = True
+        # If we've seen high bytes (i.e., those with values greater than 127),
+        # we need to do more complicated checks using all our multi-byte and
+        # single-byte probers that are left.  The single-byte probers
+        # use character bigram distributions to determine the encoding, whereas
+        # the multi-byte probers use a combination of character unigram and
+        # bigram distributions.
         elif self._input_state == InputState.HIGH_BYTE:
-            if not self._utf1632_prober:
-                self._utf1632_prober = UTF1632Prober()
             if not self._charset_probers:
-                self._charset_probers = [MBCSGroupProber(self.lang_filter),
-                                       SBCSGroupProber(),
-                                       Latin1Prober()]
+                self._charset_probers = self._build_charset_probers()
+            self._charset_probers_fed = True
+            # Probers that filter the chunk the same way share one pass
+            chunk = FilteredChunk(byte_str)
+            for prober in self._charset_probers:
+                if prober.feed_chunk(chunk) == ProbingState.FOUND_IT:
+                    self.result = {'encoding': prober.charset_name,
+                                   'confidence': prober.get_confidence(),
+                                   'language': prober.language}
+                    self.done = True
+                    break
+            self._filter_passes_saved += chunk.passes_saved
             if self.WIN_BYTE_DETECTOR.search(byte_str):
                 self._has_win_bytes = True
 
-            for prober in [self._utf1632_prober] + self._charset_probers:
-                if prober.feed(byte_str) == ProbingState.FOUND_IT:
-                    charset_name = prober.charset_name
-                    if charset_name.startswith('UTF-16'):
-                        charset_name = 'UTF-16'
-                    elif charset_name.startswith('UTF-32'):
-                        charset_name = 'UTF-32'
-                    self.result = {'encoding': charset_name,
-                                 'confidence': prober.get_confidence(),
-                                 'language': prober.language}
-                    self.done = True
-                    break
+    def _build_charset_probers(self):
+        from .latin1prober import Latin1Prober
+        from .mbcsgroupprober import MBCSGroupProber
+        from .sbcsgroupprober import SBCSGroupProber
+        charset_probers = [MBCSGroupProber(self.lang_filter)]
+        # If we're checking non-CJK encodings, use single-byte prober
+        if self.lang_filter & LanguageFilter.NON_CJK:
+            charset_probers.append(SBCSGroupProber())
+        charset_probers.append(Latin1Prober())
+        return charset_probers
+
+    def preload(self):
+        """
+        Build every prober now instead of when the first document that needs
+        it arrives.  Worth doing for a detector that will be ``reset`` and
+        reused for many documents.  The charset probers built here only show
+        up in ``charset_probers`` once a document is fed to them.
+        """
+        from .escprober import EscCharSetProber
+        from .utf1632prober import UTF1632Prober
+        if not self._esc_charset_prober:
+            self._esc_charset_prober = EscCharSetProber(self.lang_filter)
+        if not self._utf1632_prober:
+            self._utf1632_prober = UTF1632Prober()
+        if not self._charset_probers:
+            self._charset_probers = self._build_charset_probers()
 
     def close(self):
         """
@@ -171,56 +276,60 @@ class UniversalDetector:
         :returns:  The ``result`` attribute, a ``dict`` with the keys
                    `encoding`, `confidence`, and `language`.
         """
+        # Don't bother with checks if we're already done
         if self.done:
             return self.result
+        self.done = True
 
         if not self._got_data:
             self.logger.debug('no data received!')
-            return self.result
 
-        if self._input_state == InputState.PURE_ASCII:
-            self.result = {'encoding': 'ascii',
-                          'confidence': 1.0,
-                          'language': ''}
-            return self.result
+        # Default to ASCII if it is all we've seen so far
+        elif self._input_state == InputState.PURE_ASCII:
+            self.result = {'encoding': 'ascii', 'confidence': 1.0, 'language': ''}
 
-        if self._input_state == InputState.HIGH_BYTE:
-            probers = [self._utf1632_prober] if self._utf1632_prober else []
-            probers.extend(self._charset_probers)
+        # If we have seen non-ASCII, return the best that met MINIMUM_THRESHOLD
+        elif self._input_state == InputState.HIGH_BYTE:
+            prober_confidence = None
+            max_prober_confidence = 0.0
             max_prober = None
-            max_confidence = 0.0
-            for prober in probers:
+            for prober in self._charset_probers:
                 if not prober:
                     continue
-                prober.close()
-                confidence = prober.get_confidence()
-                if confidence > max_confidence:
-                    max_confidence = confidence
+                prober_confidence = prober.get_confidence()
+                if prober_confidence > max_prober_confidence:
+                    max_prober_confidence = prober_confidence
                     max_prober = prober
-
-            if max_prober and max_confidence > self.MINIMUM_THRESHOLD:
+            if max_prober and (max_prober_confidence > self.MINIMUM_THRESHOLD):
                 charset_name = max_prober.charset_name
-                lower_charset_name = charset_name.lower()
+                lower_charset_name = max_prober.charset_name.lower()
                 confidence = max_prober.get_confidence()
-                # Use Windows encoding name instead of ISO
-                if lower_charset_name in self.ISO_WIN_MAP and self._has_win_bytes:
-                    charset_name = self.ISO_WIN_MAP[lower_charset_name]
-                    confidence = confidence * 0.9  # Penalize for using Windows charset
-                # Normalize UTF-16/32 names
-                if lower_charset_name.startswith('utf-16'):
-                    charset_name = 'UTF-16'
-                elif lower_charset_name.startswith('utf-32'):
-                    charset_name = 'UTF-32'
+                # Use Windows encoding name instead of ISO-8859 if we saw any
+                # extra Windows-specific bytes
+                if lower_charset_name.startswith('iso-8859'):
+                    if self._has_win_bytes:
+                        charset_name = self.ISO_WIN_MAP.get(lower_charset_name, charset_name)
                 self.result = {'encoding': charset_name,
-                             'confidence': confidence,
-                             'language': max_prober.language}
-
-        if self._input_state == InputState.ESC_ASCII and self._esc_charset_prober:
-            self._esc_charset_prober.close()
-            confidence = self._esc_charset_prober.get_confidence()
-            if confidence > self.MINIMUM_THRESHOLD:
-                self.result = {'encoding': self._esc_charset_prober.charset_name,
-                             'confidence': confidence,
-                             'language': self._esc_charset_prober.language}
+                               'confidence': confidence,
+                               'language': max_prober.language}
 
+        # Log all prober confidences if none met MINIMUM_THRESHOLD
+        if self.logger.getEffectiveLevel() <= logging.DEBUG:
+            if self.result['encoding'] is None:
+                self._probers_touched = True
+                self.logger.debug('no probers hit minimum threshold')
+                for group_prober in self.charset_probers:
+                    if not group_prober:
+                        continue
+                    if isinstance(group_prober, CharSetGroupProber):
+                        for prober in group_prober.probers:
+                            self.logger.debug('%s %s confidence = %s',
+                                              prober.charset_name,
+                                              prober.language,
+                                              prober.get_confidence())
+                    else:
+                        self.logger.debug('%s %s confidence = %s',
+                                          group_prober.charset_name,
+                                          group_prober.language,
+                                          group_prober.get_confidence())
         return self.result
\ No newline at end of file
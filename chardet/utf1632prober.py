@@ -1,15 +1,66 @@
+import re
+
 from .charsetprober import CharSetProber
 from .enums import ProbingState
 
+# bytes.translate tables flagging zero bytes and the bytes that make a UTF-32
+# code point a surrogate, and the bytes that can follow 00 in a code point up
+# to 0010FFFF
+ZERO_FLAGS = bytes(byte == 0 for byte in range(256))
+SURROGATE_FLAGS = bytes(0xD8 <= byte <= 0xDF for byte in range(256))
+PLANE_BYTES = bytes(range(0x11))
+# The high byte of a UTF-16 code unit as 'h' if it starts the first half of a
+# surrogate pair, 'l' if it starts the second half and 'o' otherwise
+SURROGATE_CLASSES = bytes(
+    ord("h") if 0xD8 <= byte <= 0xDB else ord("l") if 0xDC <= byte <= 0xDF else ord("o")
+    for byte in range(256)
+)
+# A first half that is not followed by a second half, or a second half that
+# does not follow a first half
+UNPAIRED_SURROGATE_PATTERN = re.compile(b"h[ho]|(?<!h)l")
+
+
+def _flagged_together(first, second):
+    """
+    Returns whether the ``bytes`` of 0/1 flags ``first`` and ``second`` have
+    a 1 at the same offset.  As big integers, that is a nonzero ``&``.
+    """
+    return bool(int.from_bytes(first, "big") & int.from_bytes(second, "big"))
+
+
+def _check_surrogates(high_bytes, invalid, pending):
+    """
+    Runs the UTF-16 surrogate checks over the high bytes of a run of code
+    units, given whether the text is already ``invalid`` and whether the
+    unit before the run was a ``pending`` first half.  Returns both again.
+    """
+    classes = high_bytes.translate(SURROGATE_CLASSES)
+    if pending:
+        classes = b"h" + classes
+    if not invalid and classes.count(b"o") != len(classes):
+        invalid = UNPAIRED_SURROGATE_PATTERN.search(classes) is not None
+    # Whatever came before, a first half leaves a pair open and a second half
+    # closes it
+    return invalid, classes.rstrip(b"o").endswith(b"h")
+
+
 class UTF1632Prober(CharSetProber):
     """
     This class simply looks for occurrences of zero bytes, and infers
     whether the file is UTF16 or UTF32 (low-endian or big-endian)
-    For instance, files looking like ( \x00 \x00 \x00 [nonzero] )+
-    have a good probability to be UTF32BE.  Files looking like ( \x00 [nonzero] )+
+    For instance, files looking like ( \\0 \\0 \\0 [nonzero] )+
+    have a good probability to be UTF32BE.  Files looking like ( \\0 [nonzero] )+
     may be guessed to be UTF16BE, and inversely for little-endian varieties.
+
+    Every buffer is looked at in bulk: zero bytes are counted with
+    ``bytes.count`` over a strided slice for each position modulo 4, and the
+    code units are checked a column at a time.  A quad split between buffers
+    is checked once the buffer that completes it arrives.
     """
+
+    # how many logical characters to scan before feeling confident of prediction
     MIN_CHARS_FOR_DETECTION = 20
+    # a fixed constant ratio of expected zeros or non-zeros in modulo-position.
     EXPECTED_RATIO = 0.94
 
     def __init__(self):
@@ -27,147 +78,183 @@ class UTF1632Prober(CharSetProber):
         self.first_half_surrogate_pair_detected_16le = False
         self.reset()
 
-    def validate_utf32_characters(self, quad):
-        """
-        Validate if the quad of bytes is valid UTF-32.
-
-        UTF-32 is valid in the range 0x00000000 - 0x0010FFFF
-        excluding 0x0000D800 - 0x0000DFFF
-
-        https://en.wikipedia.org/wiki/UTF-32
-        """
-        value = (quad[0] << 24) | (quad[1] << 16) | (quad[2] << 8) | quad[3]
-        if value > 0x0010FFFF:
-            return False
-        if 0xD800 <= value <= 0xDFFF:
-            return False
-        return True
-
-    def validate_utf16_characters(self, pair):
-        """
-        Validate if the pair of bytes is  valid UTF-16.
-
-        UTF-16 is valid in the range 0x0000 - 0xFFFF excluding 0xD800 - 0xFFFF
-        with an exception for surrogate pairs, which must be in the range
-        0xD800-0xDBFF followed by 0xDC00-0xDFFF
-
-        https://en.wikipedia.org/wiki/UTF-16
-        """
-        value = (pair[0] << 8) | pair[1]
-        if 0xD800 <= value <= 0xDBFF:
-            return True  # First half of surrogate pair
-        if 0xDC00 <= value <= 0xDFFF:
-            return True  # Second half of surrogate pair
-        if value >= 0xD800 and value <= 0xDFFF:
-            return False  # Invalid surrogate value
-        return True
-
     def reset(self):
-        """
-        Reset the prober to its initial state.
-        """
         super().reset()
         self.position = 0
         self.zeros_at_mod = [0] * 4
         self.nonzeros_at_mod = [0] * 4
         self._state = ProbingState.DETECTING
-        self.quad = [0, 0, 0, 0]
         self.invalid_utf16be = False
         self.invalid_utf16le = False
         self.invalid_utf32be = False
         self.invalid_utf32le = False
         self.first_half_surrogate_pair_detected_16be = False
         self.first_half_surrogate_pair_detected_16le = False
-        self._charset_name = None
+        self.quad = [0, 0, 0, 0]
 
-    def feed(self, byte_str):
+    @property
+    def charset_name(self):
+        if self.is_likely_utf32be():
+            return "utf-32be"
+        if self.is_likely_utf32le():
+            return "utf-32le"
+        if self.is_likely_utf16be():
+            return "utf-16be"
+        if self.is_likely_utf16le():
+            return "utf-16le"
+        # default to something valid
+        return "utf-16"
+
+    @property
+    def language(self):
+        return ""
+
+    def approx_32bit_chars(self):
+        return max(1.0, self.position / 4.0)
+
+    def approx_16bit_chars(self):
+        return max(1.0, self.position / 2.0)
+
+    def is_likely_utf32be(self):
+        approx_chars = self.approx_32bit_chars()
+        return approx_chars >= self.MIN_CHARS_FOR_DETECTION and (
+            self.zeros_at_mod[0] / approx_chars > self.EXPECTED_RATIO
+            and self.zeros_at_mod[1] / approx_chars > self.EXPECTED_RATIO
+            and self.zeros_at_mod[2] / approx_chars > self.EXPECTED_RATIO
+            and self.nonzeros_at_mod[3] / approx_chars > self.EXPECTED_RATIO
+            and not self.invalid_utf32be
+        )
+
+    def is_likely_utf32le(self):
+        approx_chars = self.approx_32bit_chars()
+        return approx_chars >= self.MIN_CHARS_FOR_DETECTION and (
+            self.nonzeros_at_mod[0] / approx_chars > self.EXPECTED_RATIO
+            and self.zeros_at_mod[1] / approx_chars > self.EXPECTED_RATIO
+            and self.zeros_at_mod[2] / approx_chars > self.EXPECTED_RATIO
+            and self.zeros_at_mod[3] / approx_chars > self.EXPECTED_RATIO
+            and not self.invalid_utf32le
+        )
+
+    def is_likely_utf16be(self):
+        approx_chars = self.approx_16bit_chars()
+        return approx_chars >= self.MIN_CHARS_FOR_DETECTION and (
+            (self.nonzeros_at_mod[1] + self.nonzeros_at_mod[3]) / approx_chars
+            > self.EXPECTED_RATIO
+            and (self.zeros_at_mod[0] + self.zeros_at_mod[2]) / approx_chars
+            > self.EXPECTED_RATIO
+            and not self.invalid_utf16be
+        )
+
+    def is_likely_utf16le(self):
+        approx_chars = self.approx_16bit_chars()
+        return approx_chars >= self.MIN_CHARS_FOR_DETECTION and (
+            (self.nonzeros_at_mod[0] + self.nonzeros_at_mod[2]) / approx_chars
+            > self.EXPECTED_RATIO
+            and (self.zeros_at_mod[1] + self.zeros_at_mod[3]) / approx_chars
+            > self.EXPECTED_RATIO
+            and not self.invalid_utf16le
+        )
+
+    def validate_utf32_characters(self, quads):
+        """
+        Validate if the quads of bytes in ``quads`` are valid UTF-32.
+
+        UTF-32 is valid in the range 0x00000000 - 0x0010FFFF
+        excluding 0x0000D800 - 0x0000DFFF
+
+        https://en.wikipedia.org/wiki/UTF-32
         """
-        Feed a chunk of bytes to the prober and update its state.
+        first, second, third, fourth = (quads[offset::4] for offset in range(4))
+        # Once the first byte of every big-endian quad is known to be 0, a
+        # surrogate is a 0 second byte with a D8-DF third byte, and the other
+        # way around for little-endian
+        if not self.invalid_utf32be:
+            self.invalid_utf32be = (
+                first.count(0) != len(first)
+                or bool(second.translate(None, PLANE_BYTES))
+                or _flagged_together(
+                    second.translate(ZERO_FLAGS), third.translate(SURROGATE_FLAGS)
+                )
+            )
+        if not self.invalid_utf32le:
+            self.invalid_utf32le = (
+                fourth.count(0) != len(fourth)
+                or bool(third.translate(None, PLANE_BYTES))
+                or _flagged_together(
+                    third.translate(ZERO_FLAGS), second.translate(SURROGATE_FLAGS)
+                )
+            )
+
+    def validate_utf16_characters(self, pairs):
         """
-        if self._state == ProbingState.NOT_ME:
-            return self._state
+        Validate if the pairs of bytes in ``pairs`` are valid UTF-16.
 
-        for byte in byte_str:
-            self.quad[self.position % 4] = byte
-            if byte == 0:
-                self.zeros_at_mod[self.position % 4] += 1
-            else:
-                self.nonzeros_at_mod[self.position % 4] += 1
-
-            if self.position % 4 == 3:  # We have a complete quad
-                # Check UTF-32BE
-                if not self.invalid_utf32be:
-                    if not self.validate_utf32_characters(self.quad):
-                        self.invalid_utf32be = True
-
-                # Check UTF-32LE
-                quad_le = self.quad[::-1]  # Reverse the quad for LE
-                if not self.invalid_utf32le:
-                    if not self.validate_utf32_characters(quad_le):
-                        self.invalid_utf32le = True
-
-            if self.position % 2 == 1:  # We have a complete pair
-                # Check UTF-16BE
-                if not self.invalid_utf16be:
-                    pair_be = self.quad[(self.position - 1) % 4:(self.position + 1) % 4]
-                    if not self.validate_utf16_characters(pair_be):
-                        self.invalid_utf16be = True
-
-                # Check UTF-16LE
-                if not self.invalid_utf16le:
-                    pair_le = self.quad[(self.position - 1) % 4:(self.position + 1) % 4][::-1]
-                    if not self.validate_utf16_characters(pair_le):
-                        self.invalid_utf16le = True
-
-            self.position += 1
-
-            # Early detection if we have enough data
-            if self.position >= self.MIN_CHARS_FOR_DETECTION:
-                # Check UTF-32BE pattern
-                if (self.zeros_at_mod[0] > 0 and self.zeros_at_mod[1] > 0 and
-                    self.zeros_at_mod[2] > 0 and not self.invalid_utf32be):
-                    ratio = min(self.zeros_at_mod[0:3]) / (self.position / 4)
-                    if ratio > self.EXPECTED_RATIO:
-                        self._charset_name = "UTF-32BE"
-                        self._state = ProbingState.FOUND_IT
-                        return self._state
-
-                # Check UTF-32LE pattern
-                if (self.zeros_at_mod[1] > 0 and self.zeros_at_mod[2] > 0 and
-                    self.zeros_at_mod[3] > 0 and not self.invalid_utf32le):
-                    ratio = min(self.zeros_at_mod[1:4]) / (self.position / 4)
-                    if ratio > self.EXPECTED_RATIO:
-                        self._charset_name = "UTF-32LE"
-                        self._state = ProbingState.FOUND_IT
-                        return self._state
-
-                # Check UTF-16BE pattern
-                if self.zeros_at_mod[0] > 0 and not self.invalid_utf16be:
-                    ratio = self.zeros_at_mod[0] / (self.position / 2)
-                    if ratio > self.EXPECTED_RATIO:
-                        self._charset_name = "UTF-16BE"
-                        self._state = ProbingState.FOUND_IT
-                        return self._state
-
-                # Check UTF-16LE pattern
-                if self.zeros_at_mod[1] > 0 and not self.invalid_utf16le:
-                    ratio = self.zeros_at_mod[1] / (self.position / 2)
-                    if ratio > self.EXPECTED_RATIO:
-                        self._charset_name = "UTF-16LE"
-                        self._state = ProbingState.FOUND_IT
-                        return self._state
+        UTF-16 is valid in the range 0x0000 - 0xFFFF excluding 0xD800 - 0xFFFF
+        with an exception for surrogate pairs, which must be in the range
+        0xD800-0xDBFF followed by 0xDC00-0xDFFF
 
-        return self._state
+        https://en.wikipedia.org/wiki/UTF-16
+        """
+        (
+            self.invalid_utf16be,
+            self.first_half_surrogate_pair_detected_16be,
+        ) = _check_surrogates(
+            pairs[0::2],
+            self.invalid_utf16be,
+            self.first_half_surrogate_pair_detected_16be,
+        )
+        (
+            self.invalid_utf16le,
+            self.first_half_surrogate_pair_detected_16le,
+        ) = _check_surrogates(
+            pairs[1::2],
+            self.invalid_utf16le,
+            self.first_half_surrogate_pair_detected_16le,
+        )
 
-    @property
-    def charset_name(self):
-        return self._charset_name
+    def feed(self, byte_str):
+        phase = self.position % 4
+        for offset in range(4):
+            column = byte_str[offset::4]
+            zeros = column.count(0)
+            mod4 = (phase + offset) % 4
+            self.zeros_at_mod[mod4] += zeros
+            self.nonzeros_at_mod[mod4] += len(column) - zeros
+        self.position += len(byte_str)
+
+        # The bytes of the quad the last buffer left unfinished come first,
+        # so every complete quad starts at a multiple of 4
+        quads = bytes(self.quad[:phase]) + byte_str
+        end = len(quads) - len(quads) % 4
+        if end:
+            complete = quads[:end]
+            self.validate_utf32_characters(complete)
+            self.validate_utf16_characters(complete)
+        for i in range(max(0, len(quads) - 4), len(quads)):
+            self.quad[i % 4] = quads[i]
+        return self.state
 
     @property
-    def language(self):
-        return ""
+    def state(self):
+        if self._state in {ProbingState.NOT_ME, ProbingState.FOUND_IT}:
+            # terminal, decided states
+            return self._state
+        if self.get_confidence() > 0.80:
+            self._state = ProbingState.FOUND_IT
+        elif self.position > 4 * 1024:
+            # if we get to 4kb into the file, and we can't conclude it's UTF,
+            # let's give up
+            self._state = ProbingState.NOT_ME
+        return self._state
 
     def get_confidence(self):
-        if self._state == ProbingState.FOUND_IT:
-            return 0.99
-        return 0.0
\ No newline at end of file
+        return (
+            0.85
+            if (
+                self.is_likely_utf16le()
+                or self.is_likely_utf16be()
+                or self.is_likely_utf32le()
+                or self.is_likely_utf32be()
+            )
+            else 0.00
+        )
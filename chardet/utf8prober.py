@@ -1,7 +1,18 @@
+import codecs
+import re
 from .charsetprober import CharSetProber
 from .codingstatemachine import CodingStateMachine
 from .enums import MachineState, ProbingState
 from .mbcssm import UTF8_SM_MODEL
+# What the strict UTF-8 codec accepts but UTF8_SM_MODEL rejects: the ESC/SO/SI
+# control bytes, and the start of plane 1 four-byte sequences, F0 90-9F.
+# Every other four-byte sequence is accepted by both
+CODEC_UNSAFE_PATTERN = re.compile(b'[\x0e\x0f\x1b]|\xf0[\x90-\x9f]')
+# Every byte that cannot start a match, so that deleting these from a chunk
+# tells whether the pattern needs to be searched for at all
+CODEC_SAFE_BYTES = bytes(range(256)).translate(None, b'\x0e\x0f\x1b\xf0')
+# Everything except the lead bytes of multi-byte sequences
+NON_LEAD_BYTES = bytes(range(0xC0))
 
 class UTF8Prober(CharSetProber):
     ONE_CHAR_PROB = 0.5
@@ -10,12 +21,14 @@ class UTF8Prober(CharSetProber):
         super().__init__()
         self.coding_sm = CodingStateMachine(UTF8_SM_MODEL)
         self._num_mb_chars = None
+        self._decoder = None
         self.reset()
 
     def reset(self):
         super().reset()
         self.coding_sm.reset()
         self._num_mb_chars = 0
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
 
     @property
     def charset_name(self):
@@ -25,19 +38,74 @@ class UTF8Prober(CharSetProber):
     def language(self):
         return ""
 
+    @property
+    def codec_active(self):
+        """
+        Whether chunks are still validated by the UTF-8 codec instead of
+        ``coding_sm``.  While this is true ``coding_sm`` is not kept in step
+        with the data, so callers must use :meth:`feed` and not
+        :meth:`feed_run`.
+        """
+        return self._decoder is not None
+
     def feed(self, byte_str):
-        for c in byte_str:
-            coding_state = self.coding_sm.next_state(c)
-            if coding_state == MachineState.ERROR:
-                self._state = ProbingState.NOT_ME
-                break
-            elif coding_state == MachineState.ITS_ME:
-                self._state = ProbingState.FOUND_IT
-                break
-            elif coding_state == MachineState.START:
-                char_len = self.coding_sm.get_current_charlen()
-                if char_len >= 2:
-                    self._num_mb_chars += 1
+        if self._decoder is not None:
+            state = self.feed_codec(byte_str)
+            if state is not None:
+                return state
+        return self.feed_run(byte_str, self.coding_sm.run(byte_str))
+
+    def feed_codec(self, byte_str):
+        """
+        Validate ``byte_str`` with the incremental UTF-8 decoder, which gives
+        the same verdict as ``coding_sm`` for any chunk in which
+        ``CODEC_UNSAFE_PATTERN`` finds nothing.  Returns ``None`` once the
+        decoder cannot decide, after handing the bytes it buffered back to
+        ``coding_sm``.
+        """
+        pending = self._decoder.getstate()[0]
+        # A plane 1 sequence may also start with a lead byte left pending
+        if ((not byte_str.translate(None, CODEC_SAFE_BYTES) or
+             CODEC_UNSAFE_PATTERN.search(byte_str) is None) and
+                CODEC_UNSAFE_PATTERN.search(pending[-1:] + byte_str[:1]) is None):
+            try:
+                self._decoder.decode(byte_str)
+            except UnicodeDecodeError:
+                pass
+            else:
+                # The decoder only rejects a sequence once it is complete, so
+                # one left unfinished at the end must already be a valid
+                # start for coding_sm
+                left_over = self._decoder.getstate()[0]
+                self.coding_sm.reset()
+                if not left_over or self.coding_sm.run(left_over).state != MachineState.ERROR:
+                    # Every multi-byte character starts with a lead byte; one
+                    # begun in the previous chunk ends here unless still
+                    # pending
+                    num_mb_chars = len(byte_str.translate(None, NON_LEAD_BYTES))
+                    if pending:
+                        num_mb_chars += 1
+                    if left_over:
+                        num_mb_chars -= 1
+                    self._num_mb_chars += num_mb_chars
+                    if self.get_confidence() > self.SHORTCUT_THRESHOLD:
+                        self._state = ProbingState.FOUND_IT
+                    return self.state
+        self._decoder = None
+        self.coding_sm.reset()
+        self.coding_sm.run(pending)
+        return None
+
+    def feed_run(self, byte_str, run):
+        """
+        Update the prober from ``run``, the result of running ``coding_sm``
+        over ``byte_str``.
+        """
+        self._num_mb_chars += sum(1 for char_len in run.char_lens if char_len >= 2)
+        if run.state == MachineState.ERROR:
+            self._state = ProbingState.NOT_ME
+        elif run.state == MachineState.ITS_ME:
+            self._state = ProbingState.FOUND_IT
 
         if self.state == ProbingState.DETECTING:
             if self.get_confidence() > self.SHORTCUT_THRESHOLD:
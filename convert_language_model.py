@@ -26,12 +26,12 @@
 Convert old style SBCS model to new
 """
 
+import importlib
 import os
 import sys
 from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
 from string import ascii_letters
 
-import chardet
 from chardet import __version__
 from chardet.metadata.languages import LANGUAGES
 from chardet.sbcharsetprober import SingleByteCharSetModel
@@ -70,66 +70,55 @@ def convert_sbcs_model(old_model, alphabet):
 
 
 def print_char_to_order(var_name, order_map, charset_name, output_file):
-    print(f"{var_name} = {{", file=output_file)
-    for char, order in sorted(order_map.items()):
-        char_bytes = bytes(bytearray((char,)))
-        try:
-            unicode_char = char_bytes.decode(charset_name)
-        except UnicodeError:
-            unicode_char = None
-        print(f"     {char!r}: {order!r},  # {unicode_char!r}", file=output_file)
-    print("}\n", file=output_file)
+    print(f"{var_name} = bytes.fromhex(", file=output_file)
+    for row_start in range(0, 256, 16):
+        row = order_map[row_start : row_start + 16]
+        unicode_chars = bytes(range(row_start, row_start + 16)).decode(
+            charset_name, errors="replace"
+        )
+        print(f"    {row.hex()!r}  # {unicode_chars!r}", file=output_file)
+    print(")\n", file=output_file)
 
 
-def print_language_model(var_name, language_model, output_file, char_ranks):
+def print_language_model(var_name, language_model, output_file, rank_chars):
     print(
-        "# 3: Positive\n# 2: Likely\n# 1: Unlikely\n# 0: Negative\n",
+        "# 3: Positive\n# 2: Likely\n# 1: Unlikely\n# 0: Negative\n#\n"
+        "# Flattened 64x64 matrix: the byte at 64 * first + second is the "
+        "likelihood of\n# the character of order ``second`` following the "
+        "one of order ``first``",
         file=output_file,
     )
-    print(f"{var_name} = {{", file=output_file)
-    for first_char, sub_dict in sorted(language_model.items()):
-        # Skip empty sub_dicts
-        if not sub_dict or first_char not in char_ranks:
-            continue
-        print(f"    {char_ranks[first_char]!r}: {{  # {first_char!r}", file=output_file)
-        for second_char, likelihood in sorted(sub_dict.items()):
-            if second_char not in char_ranks:
-                continue
-            print(
-                f"        {char_ranks[second_char]!r}: {likelihood!r},  # "
-                f"{second_char!r}",
-                file=output_file,
-            )
-        print("    },", file=output_file)
-    print("}\n", file=output_file)
+    print(f"{var_name} = bytes.fromhex(", file=output_file)
+    for first in range(64):
+        row = language_model[first * 64 : (first + 1) * 64]
+        print(f"    {row.hex()!r}  # {rank_chars.get(first)!r}", file=output_file)
+    print(")\n", file=output_file)
 
 
-def convert_models_for_lang(language):
-    """Convert old SingleByteCharSetModels for the given language"""
-    # Validate language
-    language = language.title()
-    lang_metadata = LANGUAGES.get(language)
-    if not lang_metadata:
-        raise ValueError(
-            f"Unknown language: {language}. If you are adding a model for a"
-            " new language, you must first update metadata/"
-            "languages.py"
-        )
-    lang_mod_name = f"lang{language.lower()}model"
-    if not os.path.exists(os.path.join("chardet", lang_mod_name + ".py")):
-        print(f"Skipping {language} because it does not have an old model.")
-        return
-    lang_mod = getattr(chardet, lang_mod_name)
-    print(
-        f"\n{language}\n----------------------------------------------------------------"
-    )
-    print(f"Keep ASCII Letters: {lang_metadata.use_ascii}")
-    print(f"Alphabet: {lang_metadata.alphabet}")
+def add_char_ranks(char_ranks, char_to_order_map, charset_name):
+    """Add the letters ``char_to_order_map`` gives an order below 64 to
+    ``char_ranks``"""
+    for byte_hex, order in char_to_order_map.items():
+        # order 64 was basically ignored before because of the off by one
+        # error, but it's hard to know if training took that into account
+        if order > 64:
+            continue
+        try:
+            unicode_char = bytes((byte_hex,)).decode(charset_name)
+        except UnicodeDecodeError:
+            continue
+        if unicode_char not in char_ranks:
+            char_ranks[unicode_char] = order
+        elif char_ranks[unicode_char] != order:
+            raise ValueError(f"Unstable character ranking for {unicode_char}")
 
+
+def convert_old_models(lang_mod, language, alphabet):
+    """Convert the dict based models in ``lang_mod`` to a flattened language
+    model table and SingleByteCharSetModels with char-to-order tables"""
     # Create char-to-order maps (aka char-to-rank dicts)
     charset_models = {}
     char_ranks = {}
-    order_to_chars = {}
     for var_name in dir(lang_mod):
         if not ("Model" in var_name and "LangModel" not in var_name):
             continue
@@ -138,56 +127,93 @@ def convert_models_for_lang(language):
 
         print(f"Converting charset model for {charset_name}")
         sys.stdout.flush()
-        charset_models[charset_name] = convert_sbcs_model(
-            old_model, lang_metadata.alphabet
-        )
+        sbcs_model = convert_sbcs_model(old_model, alphabet)
         # Since we don't know which charsets have which characters, we have to
         # try to reconstruct char_ranks (for letters only, since that's all
         # the old language models contain)
-        for byte_hex, order in charset_models[charset_name].char_to_order_map.items():
-            # order 64 was basically ignored before because of the off by one
-            # error, but it's hard to know if training took that into account
-            if order > 64:
-                continue
-            # Convert to bytes in Python 2 and 3
-            char = bytes(bytearray((byte_hex,)))
-            try:
-                unicode_char = char.decode(charset_name)
-            except UnicodeDecodeError:
-                continue
-            if unicode_char not in char_ranks:
-                char_ranks[unicode_char] = order
-                order_to_chars[order] = unicode_char
-            elif char_ranks[unicode_char] != order:
-                raise ValueError(f"Unstable character ranking for {unicode_char}")
+        add_char_ranks(char_ranks, sbcs_model.char_to_order_map, charset_name)
+        charset_models[charset_name] = sbcs_model._replace(
+            char_to_order_map=bytes(
+                sbcs_model.char_to_order_map.get(char, 255) for char in range(256)
+            )
+        )
+    order_to_chars = {order: char for char, order in char_ranks.items()}
 
     old_lang_model = getattr(lang_mod, f"{language.title()}LangModel")
-    language_model = {}
+    language_model = bytearray(64 * 64)
     # Preserve off-by-one error here by ignoring first column and row
     for i in range(1, 64):
         if i not in order_to_chars:
             continue
-        lang_char = order_to_chars[i]
-        language_model[lang_char] = {}
         for j in range(1, 64):
             if j not in order_to_chars:
                 continue
-            lang_char2 = order_to_chars[j]
-            language_model[lang_char][lang_char2] = old_lang_model[(i * 64) + j]
+            language_model[i * 64 + j] = old_lang_model[(i * 64) + j]
+    return bytes(language_model), charset_models, char_ranks
+
+
+def read_models(lang_mod, language):
+    """Read the flattened language model table and SingleByteCharSetModels
+    from a module this script has already written"""
+    charset_models = {}
+    char_ranks = {}
+    for var_name, value in vars(lang_mod).items():
+        if isinstance(value, SingleByteCharSetModel):
+            print(f"Reading charset model for {value.charset_name}")
+            sys.stdout.flush()
+            charset_models[value.charset_name] = value
+            add_char_ranks(
+                char_ranks, dict(enumerate(value.char_to_order_map)), value.charset_name
+            )
+    language_model = getattr(lang_mod, f"{language.upper()}_LANG_MODEL")
+    return language_model, charset_models, char_ranks
+
+
+def convert_models_for_lang(language, output_dir="."):
+    """Convert old SingleByteCharSetModels for the given language, or
+    rewrite ones already in the current format"""
+    # Validate language
+    language = language.title()
+    lang_metadata = LANGUAGES.get(language)
+    if not lang_metadata:
+        raise ValueError(
+            f"Unknown language: {language}. If you are adding a model for a"
+            " new language, you must first update metadata/"
+            "languages.py"
+        )
+    lang_mod_name = f"lang{language.lower()}model"
+    if not os.path.exists(os.path.join("chardet", lang_mod_name + ".py")):
+        print(f"Skipping {language} because it does not have an old model.")
+        return
+    lang_mod = importlib.import_module(f"chardet.{lang_mod_name}")
+    print(
+        f"\n{language}\n----------------------------------------------------------------"
+    )
+    print(f"Keep ASCII Letters: {lang_metadata.use_ascii}")
+    print(f"Alphabet: {lang_metadata.alphabet}")
+
+    upper_lang = language.upper()
+    lm_name = f"{upper_lang}_LANG_MODEL"
+    if hasattr(lang_mod, lm_name):
+        language_model, charset_models, char_ranks = read_models(lang_mod, language)
+    else:
+        language_model, charset_models, char_ranks = convert_old_models(
+            lang_mod, language, lang_metadata.alphabet
+        )
+    rank_chars = {rank: char for char, rank in char_ranks.items()}
 
     # Write output files
     print(f"Writing output file for {language}\n\n")
     sys.stdout.flush()
-    with open(f"lang{language.lower()}model.py", "w", encoding="utf-8") as output_file:
-        upper_lang = language.upper()
+    output_path = os.path.join(output_dir, f"{lang_mod_name}.py")
+    with open(output_path, "w", encoding="utf-8") as output_file:
         # print header to set encoding
         print(
             "from chardet.sbcharsetprober import SingleByteCharSetModel\n\n",
             file=output_file,
         )
 
-        lm_name = f"{upper_lang}_LANG_MODEL"
-        print_language_model(lm_name, language_model, output_file, char_ranks)
+        print_language_model(lm_name, language_model, output_file, rank_chars)
 
         print(
             "# 255: Undefined characters that did not exist in training text\n"
@@ -195,7 +221,7 @@ def convert_models_for_lang(language):
             "# 253: symbol (punctuation) that does not belong to word\n"
             "# 252: 0 - 9\n"
             "# 251: Control characters\n\n"
-            "# Character Mapping Table(s):",
+            "# Character Mapping Table(s), indexed by byte value:",
             file=output_file,
         )
         for charset_name, sbcs_model in charset_models.items():
@@ -209,9 +235,8 @@ def convert_models_for_lang(language):
             )
 
             sbcs_model_name = f"{normal_name}_{upper_lang}_MODEL"
-            sbcs_model.char_to_order_map.clear()
             sbcs_model_repr = (
-                repr(sbcs_model)
+                repr(sbcs_model._replace(char_to_order_map={}, language_model=None))
                 .replace("None", lm_name)
                 .replace("{}", char_to_order_name)
                 .replace(", ", (",\n" + " " * (len(sbcs_model_name) + 26)))
@@ -232,6 +257,12 @@ def main():
         " trained.",
         nargs="*",
     )
+    parser.add_argument(
+        "--output-dir",
+        help="Where to write the models.  Pass chardet to rewrite the models "
+        "chardet ships.",
+        default=".",
+    )
     parser.add_argument("--version", action="version", version=__version__)
     args = parser.parse_args()
 
@@ -239,7 +270,7 @@ def main():
         args.language = list(sorted(LANGUAGES.keys()))
 
     for language in args.language:
-        convert_models_for_lang(language)
+        convert_models_for_lang(language, args.output_dir)
 
 
 if __name__ == "__main__":
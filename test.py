@@ -6,8 +6,16 @@ Run chardet on a bunch of documents and see that we get the correct encodings.
 """
 
 
+import asyncio
+import codecs
+import json
+import random
+import subprocess
+import sys
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from difflib import ndiff
+from io import BytesIO
 from os import listdir
 from os.path import dirname, isdir, join, realpath, relpath, splitext
 from pprint import pformat
@@ -22,7 +30,36 @@ except ImportError:
 import pytest  # pylint: disable=import-error
 
 import chardet
+import chardet.aio
+import chardet.batch
+import chardet.bundle
+import chardet.chardistribution
+import chardet.escsm
+import chardet.eucjpprober
+import chardet.jpcntx
+import chardet.latin1prober
+import chardet.mbcsgroupprober
+import chardet.mbcssm
+import chardet.sbcsgroupprober
+from chardet.charsetprober import CharSetProber, FilteredChunk
+from chardet.cli import chardetect
+from chardet.codingstatemachine import (
+    CodingStateMachine,
+    ProductStateMachine,
+    StateMachineRun,
+)
+from chardet.enums import CharacterCategory, LanguageFilter, MachineState, ProbingState
+from chardet.escprober import EscCharSetProber
+from chardet.hebrewprober import HebrewProber
 from chardet.metadata.languages import LANGUAGES
+from chardet.sampling import sample
+from chardet.sbcharsetprober import (
+    BigramHistogram,
+    SingleByteCharSetProber,
+    compile_model,
+)
+from chardet.utf8prober import UTF8Prober
+from chardet.utf1632prober import UTF1632Prober
 
 # TODO: Restore Hungarian encodings (iso-8859-2 and windows-1250) after we
 #       retrain model.
@@ -114,6 +151,877 @@ def test_encoding_detection(file_name, encoding):
     )
 
 
+RUSSIAN_1251 = (
+    "Съешь же ещё этих мягких французских булок, да выпей чаю.\n".encode("windows-1251")
+    * 5
+)
+
+
+def sb_counters(prober):
+    return (
+        prober._seq_counters,
+        prober._total_seqs,
+        prober._total_char,
+        prober._freq_char,
+        prober._last_order,
+    )
+
+
+def score_byte_by_byte(prober, byte_str):
+    """The loop SingleByteCharSetProber.feed used to score a chunk with."""
+    order_table, seq_table = compile_model(prober._model)
+    sample_size = prober.SAMPLE_SIZE
+    for byte in prober.chunk_filter(byte_str):
+        order = order_table[byte]
+        if order < CharacterCategory.CONTROL:
+            prober._total_char += 1
+        if order < sample_size:
+            prober._freq_char += 1
+            if prober._last_order < sample_size:
+                first, second = prober._last_order, order
+                if prober._reversed:
+                    first, second = second, first
+                prober._seq_counters[seq_table[first * sample_size + second]] += 1
+                prober._total_seqs += 1
+        prober._last_order = order
+
+
+@pytest.mark.parametrize("is_reversed", [False, True])
+def test_single_byte_prober_feed_matches_byte_loop(is_reversed):
+    model = chardet.sbcsgroupprober.WINDOWS_1251_RUSSIAN_MODEL
+    bulk = SingleByteCharSetProber(model, is_reversed)
+    by_byte = SingleByteCharSetProber(model, is_reversed)
+    # Odd chunk sizes split words, so pairs span chunk boundaries
+    for i in range(0, len(RUSSIAN_1251), 7):
+        bulk.feed(RUSSIAN_1251[i : i + 7])
+        score_byte_by_byte(by_byte, RUSSIAN_1251[i : i + 7])
+        assert sb_counters(bulk) == sb_counters(by_byte)
+    assert bulk._total_seqs > 0
+    assert bulk.get_confidence() == by_byte.get_confidence()
+
+
+@pytest.mark.parametrize(
+    "model_name, is_reversed, data",
+    [
+        ("WINDOWS_1251_RUSSIAN_MODEL", False, RUSSIAN_1251),
+        ("WINDOWS_1251_RUSSIAN_MODEL", True, RUSSIAN_1251),
+        (
+            "ISO_8859_9_TURKISH_MODEL",
+            False,
+            "<p>Pijamalı hasta yağız şoföre çabucak güvendi.</p>\n".encode("iso-8859-9")
+            * 5,
+        ),
+    ],
+)
+def test_single_byte_prober_feed_histogram_matches_feed(model_name, is_reversed, data):
+    model = getattr(chardet.sbcsgroupprober, model_name)
+    by_feed = SingleByteCharSetProber(model, is_reversed)
+    by_histogram = SingleByteCharSetProber(model, is_reversed)
+    for i in range(0, len(data), 7):
+        chunk = data[i : i + 7]
+        by_feed.feed(chunk)
+        histogram = BigramHistogram(by_histogram.chunk_filter(chunk))
+        by_histogram.feed_histogram(histogram)
+        assert sb_counters(by_histogram) == sb_counters(by_feed)
+    assert by_feed._total_seqs > 0
+    # The group shares one histogram between all of its members
+    group = chardet.sbcsgroupprober.SBCSGroupProber()
+    alone = [
+        SingleByteCharSetProber(prober._model, prober._reversed)
+        for prober in group.probers
+        if isinstance(prober, SingleByteCharSetProber)
+    ]
+    for i in range(0, len(data), 7):
+        group.feed(data[i : i + 7])
+        for prober in alone:
+            prober.feed(data[i : i + 7])
+    members = [p for p in group.probers if isinstance(p, SingleByteCharSetProber)]
+    assert [sb_counters(p) for p in members] == [sb_counters(p) for p in alone]
+
+
+MBCS_MODELS = [name for name in dir(chardet.mbcssm) if name.endswith("_SM_MODEL")]
+
+
+def mixed_bytes(seed, size=400):
+    """Mostly CJK text, with a few random bytes that some machines reject."""
+    rng = random.Random(seed)
+    text = "日本語の文章、한국어 문장、中文句子。"
+    encoding = rng.choice(["shift_jis", "euc-jp", "euc-kr", "gb2312", "big5", "utf-8"])
+    data = bytearray(text.encode(encoding, "ignore") * (size // 20))
+    for _ in range(rng.randrange(4)):
+        data[rng.randrange(len(data))] = rng.randrange(256)
+    return bytes(data)
+
+
+def run_byte_by_byte(machine, buf):
+    """What CodingStateMachine.run does, one next_state call at a time."""
+    char_ends = []
+    char_lens = []
+    for i, byte in enumerate(buf):
+        state = machine.next_state(byte)
+        if state == MachineState.START:
+            char_ends.append(i)
+            char_lens.append(machine.get_current_charlen())
+        elif state in (MachineState.ERROR, MachineState.ITS_ME):
+            return StateMachineRun(state, i, char_ends, char_lens)
+    return StateMachineRun(machine._curr_state, None, char_ends, char_lens)
+
+
+@pytest.mark.parametrize("model_name", MBCS_MODELS)
+def test_state_machine_run_matches_next_state(model_name):
+    model = getattr(chardet.mbcssm, model_name)
+    for seed in range(20):
+        data = mixed_bytes(seed)
+        by_run = CodingStateMachine(model)
+        by_byte = CodingStateMachine(model)
+        for i in range(0, len(data), 13):
+            run = by_run.run(data[i : i + 13])
+            assert run == run_byte_by_byte(by_byte, data[i : i + 13])
+            assert by_run._curr_state == by_byte._curr_state
+            if run.stop is not None:
+                break
+
+
+@pytest.mark.parametrize("max_states", [255, 4])
+def test_product_state_machine_matches_separate_runs(monkeypatch, max_states):
+    # A tiny table limit sends most of each chunk down the per-machine path
+    monkeypatch.setattr(
+        chardet.codingstatemachine._ProductTable, "MAX_STATES", max_states
+    )
+    models = [getattr(chardet.mbcssm, name) for name in MBCS_MODELS]
+    product = ProductStateMachine()
+    for seed in range(20):
+        data = mixed_bytes(seed)
+        together = [CodingStateMachine(model) for model in models]
+        apart = [CodingStateMachine(model) for model in models]
+        for i in range(0, len(data), 64):
+            chunk = data[i : i + 64]
+            live = [
+                n
+                for n, machine in enumerate(apart)
+                if machine._curr_state not in (MachineState.ERROR, MachineState.ITS_ME)
+            ]
+            runs = product.run([together[n] for n in live], chunk)
+            expected = []
+            for n in live:
+                expected.append(apart[n].run(chunk))
+                if expected[-1].state == MachineState.ITS_ME:
+                    # Machines after one that claims the chunk are not run
+                    expected += [None] * (len(live) - len(expected))
+                    break
+            assert runs == expected
+            assert [m._curr_state for m in together] == [m._curr_state for m in apart]
+    # One table per subset of machines, but only the most recent are kept
+    assert len(product._tables) == ProductStateMachine.MAX_TABLES
+
+
+def test_fused_mbcs_group_matches_unfused():
+    # EUC-KR claims this document part way through, before CP949, Big5 and
+    # Johab are fed the chunk, and feeding carries on after that
+    path = join(dirname(realpath(__file__)), "tests", "EUC-KR", "acnnewswire.net.xml")
+    with open(path, "rb") as f:
+        data = f.read()
+    fused = chardet.mbcsgroupprober.MBCSGroupProber()
+    unfused = chardet.mbcsgroupprober.MBCSGroupProber(fused=False)
+    states = []
+    for i in range(0, len(data), 500):
+        states.append(fused.feed(data[i : i + 500]))
+        assert unfused.feed(data[i : i + 500]) == states[-1]
+        for a, b in zip(fused.probers, unfused.probers):
+            assert a.state == b.state
+            assert a.coding_sm._curr_state == b.coding_sm._curr_state
+            assert a.get_confidence() == b.get_confidence()
+    assert states[0] == ProbingState.DETECTING
+    assert states[-1] == ProbingState.FOUND_IT
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "déjà vu, naïve café, 日本語, 😀\n".encode("utf-8") * 3,
+        # Truncated at the end, and cut short by ASCII in the middle
+        "déjà vu 日本".encode("utf-8")[:-1],
+        b"caf\xc3 au lait \xe6\x97 ok",
+        # Overlong, surrogate and out of range sequences
+        b"ok \xc0\xaf ok",
+        b"ok \xed\xa0\x80 ok",
+        b"ok \xf4\x90\x80\x80 ok",
+        # Plane 2 sequences are accepted by both, plane 1 only by the codec
+        "plane 2 \U00020000 and plane 1 \U0001f600".encode("utf-8"),
+        # Bytes the codec accepts but the state machine does not
+        "plane 1 😀 and an \x1b escape".encode("utf-8"),
+    ],
+)
+def test_utf8_codec_path_matches_state_machine(data):
+    for size in (1, 2, 3, 5, len(data)):
+        by_codec = UTF8Prober()
+        by_state_machine = UTF8Prober()
+        by_state_machine._decoder = None
+        for i in range(0, len(data), size):
+            assert by_codec.feed(data[i : i + size]) == by_state_machine.feed(
+                data[i : i + size]
+            )
+            assert by_codec._num_mb_chars == by_state_machine._num_mb_chars
+        assert by_codec.get_confidence() == by_state_machine.get_confidence()
+
+
+def is_word_byte(byte):
+    return 65 <= byte <= 90 or 97 <= byte <= 122 or byte >= 0x80
+
+
+def international_words_by_loop(buf):
+    """filter_international_words as a loop: words with a high byte survive."""
+    filtered = bytearray()
+    word = bytearray()
+    for byte in buf:
+        if is_word_byte(byte):
+            word.append(byte)
+            continue
+        if max(word, default=0) >= 0x80:
+            filtered += word + b" "
+        word.clear()
+    if max(word, default=0) >= 0x80:
+        filtered += word
+    return bytes(filtered)
+
+
+def xml_tags_removed_by_loop(buf):
+    """The loop remove_xml_tags used to be written as."""
+    filtered = bytearray()
+    in_tag = False
+    prev = 0
+    for curr, byte in enumerate(buf):
+        if byte == ord(">"):
+            prev = curr + 1
+            in_tag = False
+        elif byte == ord("<"):
+            if curr > prev and not in_tag:
+                filtered += buf[prev:curr] + b" "
+            in_tag = True
+    if not in_tag:
+        filtered += buf[prev:]
+    return bytes(filtered)
+
+
+def high_bytes_by_loop(buf):
+    """filter_high_byte_only as a loop: each ASCII run becomes one space."""
+    filtered = bytearray()
+    for byte in buf:
+        if byte >= 0x80:
+            filtered.append(byte)
+        elif filtered[-1:] != b" ":
+            filtered += b" "
+    return bytes(filtered)
+
+
+@pytest.mark.parametrize(
+    "chunk_filter, by_loop",
+    [
+        (CharSetProber.filter_international_words, international_words_by_loop),
+        (CharSetProber.remove_xml_tags, xml_tags_removed_by_loop),
+        (CharSetProber.filter_high_byte_only, high_bytes_by_loop),
+    ],
+)
+def test_chunk_filters_match_byte_loops(chunk_filter, by_loop):
+    rng = random.Random(6)
+    # Few distinct bytes, so that tags, words and marker runs all turn up
+    alphabet = b"aZ<>/ .1\xe9\xff"
+    for size in range(40):
+        for _ in range(50):
+            buf = bytes(rng.choice(alphabet) for _ in range(size))
+            assert chunk_filter(buf) == by_loop(buf), buf
+            assert chunk_filter(memoryview(buf)) == by_loop(buf), buf
+
+
+def test_filtered_chunk_runs_each_filter_once():
+    calls = []
+
+    def upper(buf):
+        calls.append(buf)
+        return buf.upper()
+
+    chunk = FilteredChunk(b"caf\xe9 <b>ol\xe9</b>")
+    views = [chunk.filtered(upper) for _ in range(3)]
+    assert calls == [b"caf\xe9 <b>ol\xe9</b>"]
+    assert views[0] is views[1] is views[2]
+    assert chunk.filtered(CharSetProber.remove_xml_tags) == b"caf\xe9  ol\xe9 "
+    assert chunk.passes_saved == 2
+
+
+def test_detector_counts_filter_passes_saved(monkeypatch):
+    requests = []
+    filtered = FilteredChunk.filtered
+
+    def record(chunk, chunk_filter):
+        requests.append(chunk_filter)
+        return filtered(chunk, chunk_filter)
+
+    monkeypatch.setattr(FilteredChunk, "filtered", record)
+    detector = chardet.UniversalDetector()
+    detector.feed(RUSSIAN_1251)
+    # Every request beyond the first for each filter is served from the chunk
+    assert detector.filter_passes_saved == len(requests) - len(set(requests)) > 0
+    detector.close()
+    detector.reset()
+    assert detector.filter_passes_saved == 0
+
+
+@pytest.mark.parametrize("strategy, encoding", [("head", "ascii"), ("spread", "utf-8")])
+def test_detect_reports_bytes_examined(strategy, encoding):
+    # Only the tail window of a spread sample reaches the UTF-8 text
+    data = b"Nothing but plain ASCII text in here.\n" * 10000
+    data += "Zażółć gęślą jaźń, to jest polski tekst.\n".encode("utf-8") * 20
+    result = chardet.detect(data, max_bytes=4096, strategy=strategy)
+    assert result["encoding"] == encoding
+    assert 0 < result["bytes_examined"] <= 4096
+
+
+@pytest.mark.parametrize(
+    "encoding", ["utf-8", "shift_jis", "euc-jp", "iso-2022-jp", "utf-16-le"]
+)
+def test_spread_sample_does_not_split_characters(encoding):
+    text = "日本語のテキスト、本文。\n"
+    windows = sample((text * 5000).encode(encoding), 30000, "spread")
+    assert sum(len(window) for window in windows) <= 30000
+    for window in windows:
+        # ISO-2022-JP cut inside a kanji run still decodes, to the wrong text
+        assert bytes(window).decode(encoding) in text * 5000
+
+
+def test_detect_stream_stops_reading_once_done():
+    stream = BytesIO(
+        "Zażółć gęślą jaźń, to jest polski tekst.\n".encode("utf-8") * 10000
+    )
+    result = chardet.detect_stream(stream, chunk_size=1024)
+    assert result == {"encoding": "utf-8", "confidence": 0.99, "language": ""}
+    assert stream.tell() == 1024
+
+
+@pytest.mark.parametrize("max_bytes", [None, 3000])
+@pytest.mark.parametrize("strategy", ["head", "spread"])
+def test_detect_file_matches_detect(max_bytes, strategy):
+    russian = join(dirname(realpath(__file__)), "tests", "windows-1251-russian")
+    path = join(russian, "aif.ru.health.xml")
+    with open(path, "rb") as f:
+        data = f.read()
+    # Fed in one piece per window, the mapped file gives what detect does
+    whole = chardet.detect_file(
+        path, chunk_size=len(data), max_bytes=max_bytes, strategy=strategy
+    )
+    assert whole == chardet.detect(data, max_bytes=max_bytes, strategy=strategy)
+    if max_bytes is None:
+        assert whole["encoding"] == "windows-1251"
+    else:
+        assert whole["bytes_examined"] <= max_bytes
+    if strategy == "head":
+        # and in smaller chunks, what reading it as a stream does
+        chunked = chardet.detect_file(path, chunk_size=1000, max_bytes=max_bytes)
+        assert chunked == chardet.detect_stream(
+            BytesIO(data), chunk_size=1000, max_bytes=max_bytes
+        )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_detect_many_matches_detect(workers):
+    documents = [
+        "Zażółć gęślą jaźń, to jest polski tekst.\n".encode("utf-8"),
+        "Plain text with one accent: café.\n".encode("utf-16be") * 20,
+        "ひらがなの文章です。".encode("shift_jis") * 20,
+        "Ceci est un texte en français, déjà vu.\n".encode("latin-1"),
+    ] * 5
+    expected = [chardet.detect(document) for document in documents]
+    results = chardet.detect_many(documents, workers=workers, chunksize=3)
+    assert list(results) == expected
+    unordered = chardet.detect_many(documents, workers=workers, ordered=False)
+    assert [result for _, result in sorted(unordered)] == expected
+    expected = [
+        chardet.detect_all(document, ignore_threshold=True) for document in documents
+    ]
+    results = chardet.detect_many(
+        documents, workers=workers, all_encodings=True, ignore_threshold=True
+    )
+    assert list(results) == expected
+    assert expected[1] == [{"encoding": "utf-16be", "confidence": 0.85, "language": ""}]
+
+
+def test_detect_many_reads_a_bounded_distance_ahead():
+    read = []
+
+    def documents():
+        for i in range(10000):
+            read.append(i)
+            yield f"Zażółć gęślą jaźń {i}\n".encode("utf-8")
+
+    results = chardet.detect_many(documents(), workers=2, chunksize=2)
+    assert [next(results)["encoding"] for _ in range(5)] == ["utf-8"] * 5
+    in_flight = 2 * 2 * chardet.batch.CHUNKS_IN_FLIGHT
+    assert len(read) <= 5 + in_flight + 1
+    # Closing early must not leave the pool waiting for more documents
+    results.close()
+
+
+POLISH_UTF8 = "Zażółć gęślą jaźń, to jest polski tekst.\n".encode("utf-8") * 20
+ACCENTED_UTF16 = "Plain text with one accent: café.\n".encode("utf-16be") * 20
+
+
+def test_detector_pool_reuses_reset_detectors():
+    pool = chardet.DetectorPool()
+    with pool.detector() as detector:
+        detector.feed(POLISH_UTF8)
+        assert detector.close()["encoding"] == "utf-8"
+        assert detector.charset_probers
+    with pool.detector() as reused:
+        assert reused is detector
+        reused.feed(ACCENTED_UTF16)
+        assert reused.close()["encoding"] == "utf-16be"
+        # The probers fed the Polish document are not this one's
+        assert reused.charset_probers == []
+    expected = [{"encoding": "utf-16be", "confidence": 0.85, "language": ""}]
+    chardet.detect_all(POLISH_UTF8)
+    assert chardet.detect_all(ACCENTED_UTF16, ignore_threshold=True) == expected
+
+
+def test_aio_detect_stream_stops_reading_once_done():
+    async def run(data, max_bytes):
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        result = await chardet.aio.detect_stream(reader, 1024, max_bytes)
+        return result, len(await reader.read())
+
+    result, unread = asyncio.run(run(POLISH_UTF8 * 100, None))
+    assert result == chardet.detect_stream(BytesIO(POLISH_UTF8 * 100), chunk_size=1024)
+    assert result["encoding"] == "utf-8"
+    assert unread == len(POLISH_UTF8) * 100 - 1024
+    # Nothing past max_bytes is taken from the reader
+    result, unread = asyncio.run(run(b"plain ASCII\n" * 1000, 1500))
+    assert (result["encoding"], result["bytes_examined"]) == ("ascii", 1500)
+    assert unread == 12000 - 1500
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.parametrize("time_budget, offloaded", [(None, 0), (0, 1), (10, 0)])
+@pytest.mark.parametrize("max_bytes", [None, 3000])
+def test_aio_detect_stream_matches_detect_stream(time_budget, offloaded, max_bytes):
+    russian = join(dirname(realpath(__file__)), "tests", "windows-1251-russian")
+    with open(join(russian, "aif.ru.health.xml"), "rb") as f:
+        data = f.read()
+
+    async def chunks():
+        for i in range(0, len(data), 1000):
+            yield bytearray(data[i : i + 1000])
+
+    with CountingExecutor(1) as executor:
+        result = asyncio.run(
+            chardet.aio.detect_stream(
+                chunks(),
+                max_bytes=max_bytes,
+                time_budget=time_budget,
+                executor=executor,
+            )
+        )
+    expected = chardet.detect_stream(BytesIO(data), 1000, max_bytes=max_bytes)
+    assert result == expected
+    assert result["encoding"] == "windows-1251"
+    # With no time to spare chunks are offloaded, and with plenty none are
+    assert min(executor.submitted, 1) == offloaded
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_chardetect_recursive_json(tmp_path, capsys, jobs):
+    (tmp_path / "sub").mkdir()
+    documents = {
+        tmp_path / "polish.txt": POLISH_UTF8,
+        tmp_path / "sub" / "accented.txt": ACCENTED_UTF16,
+        tmp_path / "sub" / "russian.txt": RUSSIAN_1251,
+    }
+    for path, data in documents.items():
+        path.write_bytes(data)
+    missing = tmp_path / "missing.txt"
+    argv = ["-r", "--json", "-j", jobs, "--max-bytes", "512", str(tmp_path)]
+    assert chardetect.main(argv + [str(missing)]) == 1
+    out, err = capsys.readouterr()
+    results = sorted(
+        (json.loads(line) for line in out.splitlines()), key=lambda r: r["path"]
+    )
+    for result in results:
+        assert result.pop("elapsed") >= 0
+    assert results == [
+        dict(chardet.detect_file(path, max_bytes=512), path=str(path))
+        for path in sorted(documents)
+    ]
+    assert err == f"{missing}: No such file or directory\n"
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_chardetect_iter_results_returns_errors_from_workers(tmp_path, jobs):
+    present = tmp_path / "present.txt"
+    present.write_bytes(RUSSIAN_1251)
+    missing = tmp_path / "missing.txt"
+    paths = chardetect.iter_paths([str(tmp_path), str(present), str(missing)])
+    results = sorted(
+        chardetect.iter_results(paths, max_bytes=512, jobs=jobs),
+        key=lambda r: r["path"],
+    )
+    assert [(r["path"], r.get("error")) for r in results] == [
+        (str(tmp_path), "Is a directory"),
+        (str(missing), "No such file or directory"),
+        (str(present), None),
+    ]
+    assert results[2]["encoding"] == chardet.detect_file(present)["encoding"]
+
+    code = textwrap.dedent(
+        """
+        import json, sys, chardet
+
+        def loaded():
+            return sorted(m for m in sys.modules if m.endswith(("freq", "model", "sm")))
+
+        stages = [loaded()]
+        chardet.detect(b"plain ASCII")
+        stages.append(loaded())
+        chardet.detect("Zażółć gęślą jaźń".encode("windows-1250"))
+        stages.append(loaded())
+        print(json.dumps(stages))
+        """
+    )
+    stages = json.loads(
+        subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+    )
+    # High bytes bring in the state machines, but the models and frequency
+    # tables come from the bundle without importing their modules
+    assert stages == [[], [], ["chardet.mbcssm"]]
+    # Looking a name up still imports the module defining it
+    from chardet.langrussianmodel import WINDOWS_1251_RUSSIAN_MODEL
+
+    model = chardet.sbcsgroupprober.WINDOWS_1251_RUSSIAN_MODEL
+    assert model is WINDOWS_1251_RUSSIAN_MODEL
+    assert chardet.universaldetector.SBCSGroupProber().probers
+    with pytest.raises(AttributeError):
+        chardet.universaldetector.NoSuchProber
+
+
+def test_model_bundle_matches_sources(tmp_path):
+    bundle = chardet.bundle.ModelBundle()
+    tables, values, models = chardet.bundle.collect_tables()
+    for name, table in tables.items():
+        assert bundle.table(name).tolist() == table.tolist(), name
+    for name, value in values.items():
+        assert bundle.value(name) == value
+    for name, fields in models.items():
+        model = bundle.single_byte_model(name)
+        assert model.charset_name == fields["charset_name"]
+        assert model.language_model == tables[fields["language_model"]].tobytes()
+    # A damaged table is caught when the bundle is opened
+    path = tmp_path / "models.bin"
+    data = bytearray(open(chardet.bundle.BUNDLE_PATH, "rb").read())
+    data[-1] ^= 0xFF
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        chardet.bundle.ModelBundle(str(path))
+
+
+def test_model_bundle_is_up_to_date(tmp_path):
+    # Rebuild with ``python -m chardet.bundle`` if this fails
+    path = tmp_path / "models.bin"
+    chardet.bundle.write_bundle(str(path))
+    with open(chardet.bundle.BUNDLE_PATH, "rb") as shipped:
+        assert path.read_bytes() == shipped.read()
+    assert chardet.bundle.load_bundle() is not None
+
+
+def test_detect_falls_back_when_a_bundle_table_is_corrupt(tmp_path):
+    bundle = chardet.bundle.ModelBundle()
+    offset, size, _, _ = bundle._tables["BIG5_CHAR_TO_FREQ_ORDER"]
+    data = bytearray(open(chardet.bundle.BUNDLE_PATH, "rb").read())
+    data[bundle._base + offset + size // 2] ^= 0xFF
+    path = tmp_path / "models.bin"
+    path.write_bytes(data)
+    text = "這是一個繁體中文的句子，用來測試編碼偵測。" * 10
+    code = textwrap.dedent(
+        f"""
+        import json, chardet, chardet.bundle
+
+        chardet.bundle.BUNDLE_PATH = {str(path)!r}
+        result = chardet.detect({text!r}.encode("big5"))
+        print(json.dumps([result, chardet.bundle.load_bundle() is None]))
+        """
+    )
+    result, fell_back = json.loads(
+        subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+    )
+    assert fell_back
+    assert result == chardet.detect(text.encode("big5"))
+    assert result["encoding"] == "Big5"
+
+
+def test_language_models_match_convert_language_model(tmp_path, monkeypatch):
+    import convert_language_model  # pylint: disable=import-outside-toplevel
+
+    root = dirname(realpath(__file__))
+    monkeypatch.chdir(root)
+    for language in sorted(LANGUAGES):
+        convert_language_model.convert_models_for_lang(language, str(tmp_path))
+    written = sorted(path.name for path in tmp_path.iterdir())
+    assert written == sorted(
+        name for name in listdir(join(root, "chardet")) if name.endswith("model.py")
+    )
+    for name in written:
+        with open(join(root, "chardet", name), encoding="utf-8") as source:
+            assert (tmp_path / name).read_text(encoding="utf-8") == source.read()
+
+
+@pytest.mark.parametrize(
+    "analysis, encoding, text",
+    [
+        (chardet.chardistribution.Big5DistributionAnalysis, "big5", "的一是不了"),
+        (chardet.chardistribution.EUCKRDistributionAnalysis, "euc-kr", "한국어"),
+    ],
+)
+def test_distribution_analysis_uses_pair_index(analysis, encoding, text):
+    analysis = analysis()
+    for char in text:
+        analysis.feed(char.encode(encoding), 2)
+        assert analysis.get_order(char.encode(encoding)) >= 0
+    analysis.feed(b"A", 1)
+    assert analysis._total_chars == analysis._freq_chars == len(text)
+
+
+def test_context_analysis_feed_pair_matches_feed():
+    data = ("ひらがなのぶんしょう" * 30).encode("euc-jp")
+    by_bytes = chardet.jpcntx.EUCJPContextAnalysis()
+    by_pair = chardet.jpcntx.EUCJPContextAnalysis()
+    for i in range(0, len(data), 2):
+        by_bytes.feed(data[i : i + 2], 2)
+        by_pair.feed_pair(data[i], data[i + 1], 2)
+    assert by_pair._total_rel == by_bytes._total_rel > 0
+    assert by_pair._rel_sample == by_bytes._rel_sample
+    assert by_pair.get_confidence() == by_bytes.get_confidence()
+    sjis = chardet.jpcntx.SJISContextAnalysis()
+    sjis.feed_pair(0x87, 0x40, 2)
+    assert sjis.charset_name == "CP932"
+    sjis.reset()
+    assert sjis.charset_name == "SHIFT_JIS"
+
+
+@pytest.mark.parametrize("repeat", [10, 250])
+def test_context_analysis_feed_run_matches_feed_pair(monkeypatch, repeat):
+    monkeypatch.setattr(chardet.jpcntx.JapaneseContextAnalysis, "RUN_BLOCK_SIZE", 100)
+    data = ("ひらがなの文章です。" * repeat + "\nあいう").encode("euc-jp")
+    run = chardet.eucjpprober.EUCJPProber().coding_sm.run(data)
+    by_run = chardet.jpcntx.EUCJPContextAnalysis()
+    by_run.feed_run(data, run.char_ends, run.char_lens, 0)
+    by_pair = chardet.jpcntx.EUCJPContextAnalysis()
+    for i, char_len in zip(run.char_ends, run.char_lens):
+        by_pair.feed_pair(data[i - 1] if i else 0, data[i], char_len)
+    assert by_run._total_rel == by_pair._total_rel > 0
+    assert by_run._rel_sample == by_pair._rel_sample
+    assert by_run._last_char_order == by_pair._last_char_order
+    assert by_run._done == by_pair._done == (repeat == 250)
+
+
+def test_latin1_prober_counts_pairs_across_chunks():
+    data = "Déjà vu: naïve façade, ÇA VA? Ærø".encode("latin-1")
+    whole = chardet.latin1prober.Latin1Prober()
+    whole.feed(data)
+    pieces = chardet.latin1prober.Latin1Prober()
+    for i in range(0, len(data), 3):
+        pieces.feed(data[i : i + 3])
+    assert pieces._freq_counter == whole._freq_counter
+    assert sum(whole._freq_counter) == len(data)
+    assert pieces.get_confidence() == whole.get_confidence() > 0
+    assert whole.feed(b"ok \x81 ok") == ProbingState.NOT_ME
+    assert sum(whole._freq_counter) == len(data) + 3
+
+
+@pytest.mark.parametrize(
+    "text, charset_name",
+    [("שלום עולם, ", "windows-1255"), ("םולש ,םלוע ", "ISO-8859-8")],
+)
+def test_hebrew_prober_scores_final_letters(text, charset_name):
+    group = chardet.sbcsgroupprober.SBCSGroupProber()
+    hebrew = next(p for p in group.probers if isinstance(p, HebrewProber))
+    data = text.encode("windows-1255") * 5
+    for i in range(0, len(data), 3):
+        hebrew.feed(data[i : i + 3])
+    assert abs(hebrew._final_char_logical_score - hebrew._final_char_visual_score) == 10
+    assert hebrew.charset_name == charset_name
+
+
+@pytest.mark.parametrize("encoding", ["utf-16le", "utf-16be", "utf-32le", "utf-32be"])
+def test_utf1632_prober_carries_phase_across_chunks(encoding):
+    data = "plain text with a single emoji in it, \U0001F600\n".encode(encoding) * 10
+    whole = UTF1632Prober()
+    whole.feed(data)
+    pieces = UTF1632Prober()
+    for i in range(0, len(data), 3):
+        pieces.feed(data[i : i + 3])
+    assert pieces.zeros_at_mod == whole.zeros_at_mod
+    assert pieces.charset_name == whole.charset_name == encoding
+    assert not whole.invalid_utf16be and not whole.invalid_utf16le
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_utf1632_prober_validates_like_the_codecs(seed):
+    rng = random.Random(seed)
+    byteorder = rng.choice(["big", "little"])
+    # Mostly valid text, with a lone surrogate or out of range code point
+    # slipped into every other sample
+    units = [rng.choice([[0x41], [0xE9], [0xD83D, 0xDE00]]) for _ in range(40)]
+    code_points = [rng.choice([0x41, 0xE9, 0x1F600]) for _ in range(30)]
+    if seed % 2:
+        units.insert(rng.randrange(40), [rng.choice([0xD83D, 0xDE00])])
+        code_points.insert(rng.randrange(30), rng.choice([0xD800, 0xDFFF, 0x110000]))
+    utf16 = b"".join(unit.to_bytes(2, byteorder) for char in units for unit in char)
+    utf32 = b"".join(point.to_bytes(4, byteorder) for point in code_points)
+    for data, codec in [(utf16, "utf-16"), (utf32, "utf-32")]:
+        expected = []
+        for endian in ("be", "le"):
+            try:
+                data.decode(f"{codec}-{endian}")
+            except UnicodeDecodeError:
+                expected.append(True)
+            else:
+                expected.append(False)
+        flags = [f"invalid_{codec.replace('-', '')}{endian}" for endian in ("be", "le")]
+        for size in (1, 3, 5, len(data)):
+            prober = UTF1632Prober()
+            for i in range(0, len(data), size):
+                prober.feed(data[i : i + size])
+            assert [getattr(prober, flag) for flag in flags] == expected, size
+
+
+ESC_MODELS = [name for name in dir(chardet.escsm) if name.endswith("_SM_MODEL")]
+
+
+def escape_heavy_bytes(seed, size=300):
+    """Plain text with escape sequences, parts of them and stray bytes."""
+    rng = random.Random(seed)
+    tokens = [b"plain text ", b"\n", b"~~", b"\x1b", b"$", b"(", b")", b"~", b"\x80"]
+    tokens += [b"\x1b$B", b"\x1b(B", b"\x1b$)A", b"\x1b$)C", b"\x1b$*H"]
+    tokens += [b"~{", b"~}", b"\x0e", b"\x0f"]
+    data = bytearray()
+    while len(data) < size:
+        data += rng.choice(tokens)
+    return bytes(data)
+
+
+@pytest.mark.parametrize("model_name", ESC_MODELS + MBCS_MODELS)
+def test_state_machine_scan_matches_next_state(model_name):
+    model = getattr(chardet.escsm, model_name, None) or getattr(
+        chardet.mbcssm, model_name
+    )
+    for seed in range(100):
+        data = escape_heavy_bytes(seed) if seed % 2 else mixed_bytes(seed)
+        by_scan = CodingStateMachine(model)
+        by_byte = CodingStateMachine(model)
+        for i in range(0, len(data), 7):
+            chunk = data[i : i + 7]
+            state, stop = by_scan.scan(chunk)
+            expected = run_byte_by_byte(by_byte, chunk)
+            assert (state, stop) == (expected.state, expected.stop)
+            assert by_scan._curr_state == by_byte._curr_state
+            if stop is not None:
+                break
+
+
+def esc_feed_byte_by_byte(prober, byte_str):
+    """The loop EscCharSetProber.feed used to run every machine with."""
+    for byte in byte_str:
+        for coding_sm in prober.coding_sm:
+            if not coding_sm.active:
+                continue
+            coding_state = coding_sm.next_state(byte)
+            if coding_state == MachineState.ERROR:
+                coding_sm.active = False
+                prober.active_sm_count -= 1
+                if prober.active_sm_count <= 0:
+                    prober._state = ProbingState.NOT_ME
+                    return prober.state
+            elif coding_state == MachineState.ITS_ME:
+                prober._state = ProbingState.FOUND_IT
+                prober._detected_charset = coding_sm.get_coding_state_machine()
+                prober._detected_language = coding_sm.language
+                return prober.state
+    return prober.state
+
+
+def test_esc_prober_feed_matches_byte_loop():
+    for seed in range(300):
+        data = escape_heavy_bytes(seed)
+        by_scan = EscCharSetProber(LanguageFilter.ALL)
+        by_byte = EscCharSetProber(LanguageFilter.ALL)
+        for i in range(0, len(data), 11):
+            state = by_scan.feed(data[i : i + 11])
+            assert state == esc_feed_byte_by_byte(by_byte, data[i : i + 11])
+            assert by_scan.charset_name == by_byte.charset_name
+            assert by_scan.active_sm_count == by_byte.active_sm_count
+            if state != ProbingState.DETECTING:
+                break
+
+
+@pytest.mark.parametrize(
+    "text, charset_name",
+    [
+        ("~~ plain text ~{<:Ky~} more".encode("ascii") * 20, "HZ-GB-2312"),
+        ("plain text, then ロボット".encode("iso-2022-jp") * 20, "ISO-2022-JP"),
+        ("plain text, then 로봇".encode("iso-2022-kr") * 20, "ISO-2022-KR"),
+    ],
+)
+def test_esc_prober_finds_sequences_split_across_chunks(text, charset_name):
+    prober = EscCharSetProber(LanguageFilter.ALL)
+    for i in range(0, len(text), 7):
+        if prober.feed(text[i : i + 7]) == ProbingState.FOUND_IT:
+            break
+    assert prober.state == ProbingState.FOUND_IT
+    assert prober.charset_name == charset_name
+    assert prober.get_confidence() == 0.99
+    prober.reset()
+    assert prober.feed(b"plain text \x1b(Z") == ProbingState.NOT_ME
+    assert prober.charset_name is None
+
+
+def test_result_cache_returns_copies_and_evicts():
+    polish = chardet.detect(POLISH_UTF8)
+    accented = chardet.detect_all(ACCENTED_UTF16, ignore_threshold=True)
+    chardet.enable_cache(max_entries=2)
+    try:
+        first = chardet.detect(POLISH_UTF8)
+        first["encoding"] = "mutated"
+        assert chardet.detect(POLISH_UTF8) == polish
+        first = chardet.detect_all(ACCENTED_UTF16, ignore_threshold=True)
+        first[0]["encoding"] = "mutated"
+        assert chardet.detect_all(ACCENTED_UTF16, ignore_threshold=True) == accented
+        # Sampling is part of the key, and evicts the least recently used
+        sampled = chardet.detect(POLISH_UTF8, max_bytes=100)
+        assert sampled["bytes_examined"] == 100
+        assert chardet.detect(POLISH_UTF8) == polish
+        info = chardet.cache_info()
+        assert (info.hits, info.misses, info.evictions, info.entries) == (2, 4, 2, 2)
+    finally:
+        chardet.disable_cache()
+    assert chardet.cache_info() is None
+
+
+def test_detect_is_thread_safe():
+    documents = [POLISH_UTF8[:i] for i in range(50, 250)]
+    documents += [ACCENTED_UTF16[: i * 2] for i in range(50, 250)]
+    expected = [chardet.detect_all(document) for document in documents]
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(chardet.detect_all, documents)) == expected
+
+
 if HAVE_HYPOTHESIS:
 
     class JustALengthIssue(Exception):